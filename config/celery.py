@@ -44,6 +44,8 @@ app.autodiscover_tasks(
         'services.weaviate',  # Weaviate sync tasks
         'services.tagging',  # AI tagging tasks
         'core.engagement',  # Engagement tracking tasks
+        'core.uploads',  # Uploaded image derivatives
+        'core.seo',  # Sitemap shard regeneration
     ]
 )
 
@@ -66,14 +68,15 @@ app.conf.task_soft_time_limit = 240  # 4 minutes soft limit (task should handle
 # Individual tasks can override with apply_async(expires=...) for shorter timeouts
 app.conf.task_default_expires = 3600  # 1 hour default (lenient for background tasks)
 
-# Configure task queues - simplified: only Weaviate gets its own queue
+# Configure task queues - Weaviate sync and RSS AI enrichment get their own queues
 # All other tasks go to the default 'celery' queue for simpler routing
 app.conf.task_queues = (
     Queue('celery', routing_key='celery'),  # Default queue for all tasks
     Queue('weaviate', routing_key='weaviate'),  # Low-priority Weaviate sync (background)
+    Queue('rss_enrichment', routing_key='rss_enrichment'),  # AI enrichment of synced RSS items (rate limited)
 )
 
-# Route only Weaviate tasks to their own queue - everything else uses default 'celery' queue
+# Route Weaviate and RSS enrichment tasks to their own queues - everything else uses default 'celery' queue
 app.conf.task_routes = {
     # Weaviate sync tasks (low priority - background, can be delayed)
     'services.weaviate.tasks.sync_project_to_weaviate': {'queue': 'weaviate'},
@@ -95,6 +98,8 @@ app.conf.task_routes = {
     'services.weaviate.tasks.full_reindex_concepts': {'queue': 'weaviate'},
     'services.weaviate.tasks.full_reindex_micro_lessons': {'queue': 'weaviate'},
     'services.weaviate.tasks.full_reindex_learning_paths': {'queue': 'weaviate'},
+    # RSS item AI enrichment (slow, paid calls - kept off the sync path and the default queue)
+    'core.integrations.rss_tasks.enrich_rss_item_task': {'queue': 'rss_enrichment'},
 }
 
 # Periodic tasks schedule (Celery Beat)
@@ -256,6 +261,13 @@ app.conf.beat_schedule = {
             'expires': 300,  # Expires after 5 minutes
         },
     },
+    'engagement-drain-stream': {
+        'task': 'core.engagement.tasks.drain_engagement_stream',
+        'schedule': crontab(),  # Every minute
+        'options': {
+            'expires': 60,  # Expires after 1 minute
+        },
+    },
     'engagement-apply-recency-decay': {
         'task': 'core.engagement.tasks.apply_recency_decay',
         'schedule': crontab(hour=4, minute=30),  # Daily at 4:30 AM
@@ -263,6 +275,22 @@ app.conf.beat_schedule = {
             'expires': 7200,  # Expires after 2 hours
         },
     },
+    # Learning paths: precomputed content counts behind available-modality lookups
+    'learning-paths-refresh-topic-content-counts': {
+        'task': 'core.learning_paths.tasks.refresh_topic_content_counts',
+        'schedule': crontab(minute=20),  # Every hour at minute 20
+        'options': {
+            'expires': 3600,  # Expires after 1 hour
+        },
+    },
+    # Sitemap index: re-render only the shards whose rows changed
+    'seo-regenerate-sitemap-shards': {
+        'task': 'core.seo.tasks.regenerate_sitemap_shards_task',
+        'schedule': crontab(minute=40),  # Every hour at minute 40
+        'options': {
+            'expires': 3600,  # Expires after 1 hour
+        },
+    },
     # AI Taxonomy Tagging tasks
     'tagging-backfill-untagged-content': {
         'task': 'services.tagging.tasks.backfill_tags',
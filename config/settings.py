@@ -579,6 +579,20 @@ AI_OUTPUT_TOKEN_LIMIT = config('AI_OUTPUT_TOKEN_LIMIT', default=4096, cast=int)
 AI_DAILY_REQUEST_SOFT_LIMIT = config('AI_DAILY_REQUEST_SOFT_LIMIT', default=200, cast=int)  # Warn above this
 AI_DAILY_REQUEST_HARD_LIMIT = config('AI_DAILY_REQUEST_HARD_LIMIT', default=500, cast=int)  # Block above this
 
+# AI Lesson Generation (learning paths)
+# Lessons for a path are generated concurrently; each LLM call is bounded by the timeout
+LESSON_GENERATION_CONCURRENCY = config('LESSON_GENERATION_CONCURRENCY', default=5, cast=int)
+LESSON_GENERATION_TIMEOUT = config('LESSON_GENERATION_TIMEOUT', default=45, cast=int)  # seconds per lesson
+LESSON_CACHE_TTL = config('LESSON_CACHE_TTL', default=60 * 60 * 24 * 7, cast=int)  # Reuse lessons for a week
+
+# Content Moderation
+# Verdicts are cached by content hash; bump the policy version to invalidate them after policy changes.
+# Images known only by URL get the shorter TTL, since the content behind a URL can change.
+MODERATION_POLICY_VERSION = config('MODERATION_POLICY_VERSION', default='1')
+MODERATION_VERDICT_CACHE_TTL = config('MODERATION_VERDICT_CACHE_TTL', default=60 * 60 * 24 * 30, cast=int)
+MODERATION_URL_VERDICT_CACHE_TTL = config('MODERATION_URL_VERDICT_CACHE_TTL', default=60 * 60, cast=int)
+MODERATION_BATCH_SIZE = config('MODERATION_BATCH_SIZE', default=32, cast=int)  # Inputs per moderation request
+
 # RSS Agent Image Generation
 # Set to False in local development to save Gemini API token costs
 RSS_GENERATE_HERO_IMAGES = config('RSS_GENERATE_HERO_IMAGES', default=True, cast=bool)
@@ -922,6 +936,9 @@ SITE_ID = 1
 # Used in meta tags, canonical URLs, and sitemap protocol
 SITE_URL = config('SITE_URL', default=BACKEND_URL_DEFAULT)
 
+# Sitemap shards: each pre-rendered file covers this many IDs (Google allows 50,000 URLs per file)
+SITEMAP_SHARD_SIZE = config('SITEMAP_SHARD_SIZE', default=10000, cast=int)
+
 # Email Configuration (AWS SES)
 if DEBUG:
     # Development: log emails to console
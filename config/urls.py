@@ -7,7 +7,7 @@ from django.contrib.sitemaps.views import sitemap
 from django.urls import include, path, re_path
 from drf_spectacular.views import SpectacularAPIView, SpectacularRedocView, SpectacularSwaggerView
 
-from core.seo.views import LlmsTxtView
+from core.seo.views import LlmsTxtView, sitemap_index, sitemap_shard
 from core.sitemaps import ProjectSitemap, StaticViewSitemap, ToolSitemap, UserProfileSitemap
 from core.views.core_views import ai_plugin_manifest, db_health, robots_txt
 from core.views.crawler_views import (
@@ -35,7 +35,9 @@ urlpatterns = [
     # Prometheus metrics endpoint
     path('metrics', include('django_prometheus.urls')),
     # SEO and Privacy
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
+    # Index of pre-rendered shards (core.seo.shards); live sections stay available for robots.txt and fallback
+    path('sitemap.xml', sitemap_index, name='sitemap_index'),
+    path('sitemap-<str:section>-<int:shard>.xml', sitemap_shard, name='sitemap_shard'),
     path(
         'sitemap-<section>.xml',
         sitemap,
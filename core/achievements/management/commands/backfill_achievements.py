@@ -0,0 +1,71 @@
+"""Management command to backfill achievement progress from existing data."""
+
+from django.core.management.base import BaseCommand
+from django.db.models import Count
+
+from core.battles.models import BattleSubmission
+from core.projects.models import Project, ProjectComment
+from core.quizzes.models import QuizAttempt
+from core.users.models import User
+from services.achievements.engine import achievement_engine
+
+# Lifetime counters recomputable from existing rows: tracking_field -> rows counted per user
+COUNTED_FIELDS = {
+    'lifetime_projects_created': Project.objects.all(),
+    'lifetime_quizzes_completed': QuizAttempt.objects.filter(completed_at__isnull=False),
+    'lifetime_battles_participated': BattleSubmission.objects.all(),
+    'lifetime_comments_posted': ProjectComment.objects.all(),
+}
+
+
+class Command(BaseCommand):
+    help = 'Recompute achievement progress for all users in batches and unlock anything already earned'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000, help='Users per batch (default: 1000)')
+        parser.add_argument('--username', type=str, help='Only backfill a single user')
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        users = User.objects.filter(is_active=True).order_by('id')
+        if options.get('username'):
+            users = users.filter(username=options['username'])
+
+        rows = users.values_list('id', 'total_points', 'level', 'current_streak_days')
+        processed = 0
+        unlocked = 0
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            batch.append(row)
+            if len(batch) >= batch_size:
+                unlocked += self._backfill(batch)
+                processed += len(batch)
+                batch = []
+                self.stdout.write(f'  {processed} users processed, {unlocked} achievements unlocked')
+        if batch:
+            unlocked += self._backfill(batch)
+            processed += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(f'✓ Backfilled {processed} users, {unlocked} achievements unlocked'))
+
+    def _backfill(self, batch) -> int:
+        """Evaluate one batch of users with a grouped count query per field."""
+        user_ids = [row[0] for row in batch]
+        events = {
+            user_id: {'total_points': total_points, 'level': level, 'current_streak_days': streak}
+            for user_id, total_points, level, streak in batch
+        }
+        for field, queryset in COUNTED_FIELDS.items():
+            counts = (
+                queryset.filter(user_id__in=user_ids)
+                .order_by()
+                .values('user_id')
+                .annotate(n=Count('id'))
+                .values_list('user_id', 'n')
+            )
+            for user_id, n in counts:
+                events[user_id][field] = n
+
+        # Values are totals, so re-running the backfill never double counts
+        results = achievement_engine.evaluate_many(events, absolute=True)
+        return sum(len(achievements) for achievements in results.values())
@@ -2,18 +2,28 @@
 
 import logging
 
-from django.db.models.signals import post_save
+from django.db.models.signals import m2m_changed, post_delete, post_save
 from django.dispatch import receiver
 
+from core.achievements.models import Achievement
 from core.battles.models import BattleSubmission
 from core.projects.models import Project, ProjectComment, ProjectLike
 from core.quizzes.models import QuizAttempt
 from core.thrive_circle.models import UserSideQuest
+from services.achievements.engine import achievement_engine
 from services.gamification.achievements import AchievementTracker
 
 logger = logging.getLogger(__name__)
 
 
+@receiver(post_save, sender=Achievement)
+@receiver(post_delete, sender=Achievement)
+@receiver(m2m_changed, sender=Achievement.requires_achievements.through)
+def invalidate_achievement_definitions(sender, **kwargs):
+    """Reload cached achievement rules after staff edit them (other processes pick it up within the TTL)."""
+    achievement_engine.invalidate()
+
+
 @receiver(post_save, sender=Project)
 def track_project_created(sender, instance, created, **kwargs):
     """
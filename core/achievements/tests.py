@@ -0,0 +1,152 @@
+# ruff: noqa: S106
+"""
+Tests for the batched achievement engine.
+"""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from services.achievements.engine import achievement_engine
+from services.gamification.achievements import AchievementTracker
+
+from .models import Achievement, AchievementProgress, CriteriaType, UserAchievement
+
+User = get_user_model()
+
+
+class AchievementEngineTest(TestCase):
+    """Tests for AchievementEngine evaluation and bulk writes"""
+
+    def setUp(self):
+        achievement_engine.invalidate()
+        self.user = User.objects.create_user(username='achiever', email='achiever@test.com', password='testpass123')
+        self.first = Achievement.objects.create(
+            key='first_project',
+            name='First Project',
+            description='Created a project',
+            criteria_type=CriteriaType.FIRST_TIME,
+            criteria_value=1,
+            tracking_field='lifetime_projects_created',
+        )
+        self.five = Achievement.objects.create(
+            key='five_projects',
+            name='Five Projects',
+            description='Created five projects',
+            criteria_type=CriteriaType.COUNT,
+            criteria_value=5,
+            tracking_field='lifetime_projects_created',
+        )
+        self.five.requires_achievements.add(self.first)
+        self.points = Achievement.objects.create(
+            key='thousand_points',
+            name='Thousand Points',
+            description='Earned 1,000 points',
+            criteria_type=CriteriaType.THRESHOLD,
+            criteria_value=1000,
+            tracking_field='total_points',
+        )
+
+    def tearDown(self):
+        achievement_engine.invalidate()
+
+    def test_count_progress_and_unlock(self):
+        """Test that events accumulate progress and unlock once"""
+        unlocked = AchievementTracker.track_event(self.user, 'lifetime_projects_created', 1)
+        self.assertEqual(unlocked, [self.first])
+
+        for _ in range(3):
+            AchievementTracker.track_event(self.user, 'lifetime_projects_created', 1)
+        progress = AchievementProgress.objects.get(user=self.user, achievement=self.five)
+        self.assertEqual(progress.current_value, 4)
+
+        unlocked = AchievementTracker.track_event(self.user, 'lifetime_projects_created', 1)
+        self.assertEqual(unlocked, [self.five])
+        self.assertEqual(AchievementTracker.track_event(self.user, 'lifetime_projects_created', 1), [])
+
+    def test_single_event_unlocks_dependency_chain(self):
+        """Test that prerequisites are evaluated before dependents"""
+        unlocked = AchievementTracker.track_event(self.user, 'lifetime_projects_created', 5)
+
+        self.assertEqual(unlocked, [self.first, self.five])
+
+    def test_track_events_evaluates_several_fields(self):
+        """Test that several tracking fields are evaluated in one pass"""
+        unlocked = AchievementTracker.track_events(self.user, {'lifetime_projects_created': 1, 'total_points': 1500})
+
+        self.assertCountEqual(unlocked, [self.first, self.points])
+        self.assertEqual(UserAchievement.objects.filter(user=self.user).count(), 2)
+
+    def test_query_count_independent_of_users(self):
+        """Test that evaluating many users costs the same queries as one"""
+        others = [
+            User.objects.create_user(username=f'batch{i}', email=f'batch{i}@test.com', password='testpass123')
+            for i in range(5)
+        ]
+        achievement_engine.evaluate_many({self.user.id: {'total_points': 10}})  # Warm the definitions cache
+
+        with CaptureQueriesContext(connection) as single:
+            achievement_engine.evaluate_many({self.user.id: {'lifetime_projects_created': 1}})
+        with CaptureQueriesContext(connection) as batch:
+            achievement_engine.evaluate_many({user.id: {'lifetime_projects_created': 1} for user in others})
+
+        self.assertEqual(len(batch), len(single))
+
+    def test_absolute_backfill_does_not_double_count(self):
+        """Test that absolute evaluation sets totals instead of adding"""
+        for _ in range(2):
+            achievement_engine.evaluate_many({self.user.id: {'lifetime_projects_created': 3}}, absolute=True)
+
+        progress = AchievementProgress.objects.get(user=self.user, achievement=self.five)
+        self.assertEqual(progress.current_value, 3)
+
+    def test_definitions_reload_after_edit(self):
+        """Test that editing an achievement invalidates the cached rules"""
+        AchievementTracker.track_event(self.user, 'total_points', 500)
+
+        self.points.criteria_value = 400
+        self.points.save()
+
+        self.assertEqual(AchievementTracker.track_event(self.user, 'total_points', 500), [self.points])
+
+    def test_concurrent_unlock_reported_once(self):
+        """Test that an achievement unlocked by a concurrent request is not reported again"""
+        lock_progress = achievement_engine._lock_progress
+
+        def lock_after_concurrent_unlock(*args, **kwargs):
+            # Another request unlocks it after this one read the earned set
+            UserAchievement.objects.get_or_create(user=self.user, achievement=self.points)
+            return lock_progress(*args, **kwargs)
+
+        with patch.object(achievement_engine, '_lock_progress', side_effect=lock_after_concurrent_unlock):
+            unlocked = AchievementTracker.track_event(self.user, 'total_points', 1500)
+
+        self.assertEqual(unlocked, [])
+        self.assertEqual(UserAchievement.objects.filter(user=self.user, achievement=self.points).count(), 1)
+
+    def test_concurrently_created_progress_is_added_to(self):
+        """Test that a progress row another request created first is incremented, not overwritten"""
+        lock_progress = achievement_engine._lock_progress
+        calls = []
+
+        def lock_before_concurrent_insert(*args, **kwargs):
+            rows = lock_progress(*args, **kwargs)
+            if not calls:
+                AchievementProgress.objects.create(user=self.user, achievement=self.five, current_value=3)
+            calls.append(rows)
+            return rows
+
+        with patch.object(achievement_engine, '_lock_progress', side_effect=lock_before_concurrent_insert):
+            AchievementTracker.track_event(self.user, 'lifetime_projects_created', 1)
+
+        self.assertEqual(AchievementProgress.objects.get(user=self.user, achievement=self.five).current_value, 4)
+
+    def test_threshold_progress_never_decreases(self):
+        """Test that a late event with an older total does not lower progress"""
+        AchievementTracker.track_event(self.user, 'total_points', 800)
+        AchievementTracker.track_event(self.user, 'total_points', 500)
+
+        self.assertEqual(AchievementProgress.objects.get(user=self.user, achievement=self.points).current_value, 800)
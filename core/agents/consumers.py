@@ -294,7 +294,7 @@ class ChatConsumer(AsyncWebsocketConsumer):
             rate_limiter = self._rate_limiter
             is_allowed, retry_after = rate_limiter.check_message_rate_limit(self.user.id)
             if not is_allowed:
-                minutes = retry_after // 60
+                minutes = max(1, (retry_after + 59) // 60)
                 MetricsCollector.record_rate_limit_hit(self.user.id, 'websocket_message')
                 await self.send_error(f'Rate limit exceeded. Try again in {minutes} minutes.')
                 return
@@ -13,6 +13,9 @@ import re
 
 from django.core.cache import cache
 
+from core.utils.rate_limit import RateLimit
+from core.utils.rate_limit import rate_limiter as shared_rate_limiter
+
 logger = logging.getLogger(__name__)
 
 
@@ -228,7 +231,7 @@ class RateLimiter:
     - Per-user message limits
     - Per-user project creation limits
     - IP-based limits for anonymous users
-    - Sliding window rate limiting
+    - Sliding window rate limiting (atomic, via core.utils.rate_limit)
     - WebSocket connection limits
 
     Note: Rate limiting is disabled in DEBUG mode for local development.
@@ -239,6 +242,11 @@ class RateLimiter:
     MAX_MESSAGE_SIZE = 32 * 1024  # 32KB max message size
     CONNECTION_RATE_LIMIT = 10  # Max new connections per minute per user
 
+    # Sliding-window request limits
+    MESSAGES_PER_HOUR = 50
+    PROJECTS_PER_HOUR = 10
+    ANONYMOUS_REQUESTS_PER_HOUR = 20
+
     def __init__(self):
         from django.conf import settings
 
@@ -318,18 +326,10 @@ class RateLimiter:
         if self._skip_rate_limit():
             return True, 0
 
-        key = f'ws_rate:user:{user_id}'
-        count = self.cache.get(key, 0)
-
-        if count >= self.CONNECTION_RATE_LIMIT:
+        result = shared_rate_limiter.check(RateLimit('ws_connections', user_id, self.CONNECTION_RATE_LIMIT, 60))
+        if not result.allowed:
             logger.warning(f'[SECURITY] User {user_id} exceeded connection rate limit')
-            return False, 60  # Retry after 1 minute
-
-        # Increment with 1 minute window
-        if count == 0:
-            self.cache.set(key, 1, timeout=60)
-        else:
-            self.cache.incr(key)
+            return False, result.retry_after_seconds
 
         return True, 0
 
@@ -353,24 +353,7 @@ class RateLimiter:
         Returns:
             (is_allowed: bool, retry_after_seconds: int)
         """
-        if self._skip_rate_limit():
-            return True, 0
-
-        key = f'rate_limit:messages:user:{user_id}'
-        count = self.cache.get(key, 0)
-        limit = 50  # 50 messages per hour
-
-        if count >= limit:
-            # Django cache doesn't expose TTL, so return fixed retry time
-            return False, 3600
-
-        # Increment counter
-        if count == 0:
-            self.cache.set(key, 1, timeout=3600)  # 1 hour
-        else:
-            self.cache.incr(key)
-
-        return True, 0
+        return self._check(RateLimit('messages', f'user:{user_id}', self.MESSAGES_PER_HOUR, 3600))
 
     def check_project_creation_rate_limit(self, user_id: int) -> tuple[bool, int]:
         """
@@ -379,24 +362,7 @@ class RateLimiter:
         Returns:
             (is_allowed: bool, retry_after_seconds: int)
         """
-        if self._skip_rate_limit():
-            return True, 0
-
-        key = f'rate_limit:projects:user:{user_id}'
-        count = self.cache.get(key, 0)
-        limit = 10  # 10 projects per hour
-
-        if count >= limit:
-            # Django cache doesn't expose TTL, so return fixed retry time
-            return False, 3600
-
-        # Increment counter
-        if count == 0:
-            self.cache.set(key, 1, timeout=3600)
-        else:
-            self.cache.incr(key)
-
-        return True, 0
+        return self._check(RateLimit('projects', f'user:{user_id}', self.PROJECTS_PER_HOUR, 3600))
 
     def check_ip_rate_limit(self, ip_address: str) -> tuple[bool, int]:
         """
@@ -405,21 +371,16 @@ class RateLimiter:
         Returns:
             (is_allowed: bool, retry_after_seconds: int)
         """
+        return self._check(RateLimit('anon', f'ip:{ip_address}', self.ANONYMOUS_REQUESTS_PER_HOUR, 3600))
+
+    def _check(self, limit: RateLimit) -> tuple[bool, int]:
+        """Run a sliding-window check and return (is_allowed, retry_after_seconds)."""
         if self._skip_rate_limit():
             return True, 0
 
-        key = f'rate_limit:ip:{ip_address}'
-        count = self.cache.get(key, 0)
-        limit = 20  # 20 requests per hour for anonymous users
-
-        if count >= limit:
-            # Django cache doesn't expose TTL, so return fixed retry time
-            return False, 3600
-
-        if count == 0:
-            self.cache.set(key, 1, timeout=3600)
-        else:
-            self.cache.incr(key)
+        result = shared_rate_limiter.check(limit)
+        if not result.allowed:
+            return False, result.retry_after_seconds
 
         return True, 0
 
@@ -461,7 +422,7 @@ def validate_chat_input(user_message: str, user_id: int = None) -> tuple[bool, s
     if user_id:
         is_allowed, retry_after = rate_limiter.check_message_rate_limit(user_id)
         if not is_allowed:
-            minutes = retry_after // 60
+            minutes = max(1, (retry_after + 59) // 60)
             return False, f'Rate limit exceeded. Try again in {minutes} minutes.', ''
 
     return True, '', sanitized
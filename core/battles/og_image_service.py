@@ -5,12 +5,18 @@ Generates 1200x630px images optimized for Twitter/Facebook social cards,
 showing side-by-side comparison of battle submissions with scores and branding.
 """
 
+import hashlib
 import io
+import json
 import logging
+import threading
+from collections import OrderedDict
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 import requests
 from django.conf import settings
+from django.core.cache import cache
 from PIL import Image, ImageDraw, ImageFont
 
 from services.integrations.storage import get_storage_service
@@ -51,9 +57,50 @@ SCORE_COLOR = (6, 182, 212)  # Cyan-500
 WINNER_COLOR = (250, 204, 21)  # Yellow-400 (gold)
 SECONDARY_TEXT = (148, 163, 184)  # Slate-400
 
+# Bump when the card layout changes so cached renders are regenerated
+RENDER_VERSION = 1
+RENDER_FOLDER = 'battle-og-images'
+RENDER_CACHE_TIMEOUT = 60 * 60 * 24 * 30  # 30 days - a render never goes stale, only its inputs change
+
+# Downloaded, resized submission images kept per process (each is at most 400x350 RGB, ~420KB)
+SOURCE_IMAGE_CACHE_SIZE = 32
+
+
+class _SourceImageCache:
+    """Bounded LRU of downloaded source images keyed by (url, max_size).
+
+    Failed downloads are not cached, so a transient error is retried on the next render.
+    """
+
+    def __init__(self, maxsize: int = SOURCE_IMAGE_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._images: OrderedDict[tuple[str, tuple[int, int]], Image.Image] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, tuple[int, int]]) -> Image.Image | None:
+        with self._lock:
+            img = self._images.get(key)
+            if img is not None:
+                self._images.move_to_end(key)
+            return img
+
+    def put(self, key: tuple[str, tuple[int, int]], img: Image.Image):
+        with self._lock:
+            self._images[key] = img
+            self._images.move_to_end(key)
+            while len(self._images) > self.maxsize:
+                self._images.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._images.clear()
+
+
+_source_images = _SourceImageCache()
+
 
 def _download_image(url: str, max_size: tuple[int, int] = (400, 350)) -> Image.Image | None:
-    """Download and resize an image from URL.
+    """Download and resize an image from URL, reusing recent downloads.
 
     Args:
         url: Image URL to download
@@ -62,6 +109,10 @@ def _download_image(url: str, max_size: tuple[int, int] = (400, 350)) -> Image.I
     Returns:
         PIL Image or None if download fails
     """
+    cached = _source_images.get((url, max_size))
+    if cached is not None:
+        return cached
+
     try:
         response = requests.get(url, timeout=10)
         response.raise_for_status()
@@ -80,22 +131,21 @@ def _download_image(url: str, max_size: tuple[int, int] = (400, 350)) -> Image.I
 
         # Resize maintaining aspect ratio
         img.thumbnail(max_size, Image.Resampling.LANCZOS)
+        _source_images.put((url, max_size), img)
         return img
     except Exception as e:
         logger.warning(f'Failed to download image from {url}: {e}')
         return None
 
 
+@lru_cache(maxsize=8)
 def _create_placeholder_image(size: tuple[int, int] = (400, 350)) -> Image.Image:
     """Create a placeholder image when player image is unavailable."""
     img = Image.new('RGB', size, (30, 41, 59))  # Slate-800
     draw = ImageDraw.Draw(img)
 
     # Draw "No Image" text in center
-    try:
-        font = ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', 24)
-    except OSError:
-        font = ImageFont.load_default()
+    font = _get_font(24)
 
     text = 'No Image'
     bbox = draw.textbbox((0, 0), text, font=font)
@@ -108,8 +158,9 @@ def _create_placeholder_image(size: tuple[int, int] = (400, 350)) -> Image.Image
     return img
 
 
+@lru_cache(maxsize=32)
 def _get_font(size: int, bold: bool = False) -> ImageFont.FreeTypeFont:
-    """Get font with fallback to default if system fonts unavailable."""
+    """Get font with fallback to default if system fonts unavailable (loaded once per process)."""
     try:
         if bold:
             return ImageFont.truetype('/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', size)
@@ -125,6 +176,61 @@ def _truncate_text(text: str, max_length: int = 60) -> str:
     return text[: max_length - 3] + '...'
 
 
+def _render_inputs(battle: 'PromptBattle', challenger_sub, opponent_sub) -> dict:
+    """Everything that appears on the card; the render cache is keyed on a hash of this."""
+
+    def player(sub):
+        return {
+            'username': sub.user.username,
+            'image_url': sub.generated_output_url or '',
+            'score': f'{float(sub.score):.1f}' if sub.score else '--',
+        }
+
+    if battle.winner_id is None:
+        winner = None
+    elif battle.winner_id == battle.challenger_id:
+        winner = 'challenger'
+    elif battle.winner_id == battle.opponent_id:
+        winner = 'opponent'
+    else:
+        winner = 'other'
+
+    return {
+        'version': RENDER_VERSION,
+        'challenge_text': battle.challenge_text,
+        'challenger': player(challenger_sub),
+        'opponent': player(opponent_sub),
+        'winner': winner,
+    }
+
+
+def _render_key(inputs: dict) -> str:
+    return hashlib.sha256(json.dumps(inputs, sort_keys=True).encode()).hexdigest()
+
+
+def _render_cache_key(key: str) -> str:
+    return f'battle_og_render:{key}'
+
+
+def _find_cached_render(storage, key: str) -> str | None:
+    """URL of an existing render for these inputs, from the cache or object storage."""
+    url = cache.get(_render_cache_key(key))
+    if url:
+        return url
+
+    object_name = f'public/{RENDER_FOLDER}/{key}.png'
+    try:
+        if not storage.file_exists(object_name):
+            return None
+    except Exception as e:
+        logger.warning(f'Failed to look up cached OG image {object_name}: {e}')
+        return None
+
+    url = storage.get_file_url(object_name, is_public=True)
+    cache.set(_render_cache_key(key), url, RENDER_CACHE_TIMEOUT)
+    return url
+
+
 def generate_battle_og_image(battle: 'PromptBattle') -> str | None:
     """Generate OG image for a completed battle.
 
@@ -135,6 +241,9 @@ def generate_battle_og_image(battle: 'PromptBattle') -> str | None:
     - Winner highlight
     - AllThrive branding
 
+    Renders are stored under a hash of their inputs, so a battle whose card was
+    already drawn gets the existing URL without downloading or drawing anything.
+
     Args:
         battle: Completed PromptBattle instance
 
@@ -142,10 +251,6 @@ def generate_battle_og_image(battle: 'PromptBattle') -> str | None:
         URL to the generated image, or None if generation fails
     """
     try:
-        # Create base image
-        img = Image.new('RGB', (OG_WIDTH, OG_HEIGHT), BACKGROUND_COLOR)
-        draw = ImageDraw.Draw(img)
-
         # Get submissions
         submissions = list(battle.submissions.select_related('user').all())
         if len(submissions) < 2:
@@ -160,185 +265,205 @@ def generate_battle_og_image(battle: 'PromptBattle') -> str | None:
             logger.warning(f'Battle {battle.id} missing challenger or opponent submission')
             return None
 
-        # Load fonts
-        font_challenge = _get_font(22)
-        font_username = _get_font(20, bold=True)
-        font_score = _get_font(24, bold=True)
-        font_label = _get_font(16)
-        font_branding = _get_font(18, bold=True)
-
-        # --- Header Section (challenge text) ---
-        header_height = 80
-        draw.rectangle([(0, 0), (OG_WIDTH, header_height)], fill=HEADER_BG_COLOR)
-
-        # Challenge text
-        challenge_preview = _truncate_text(battle.challenge_text, 80)
-        draw.text((40, 15), 'Challenge:', fill=SECONDARY_TEXT, font=font_label)
-        draw.text((40, 38), f'"{challenge_preview}"', fill=TEXT_COLOR, font=font_challenge)
-
-        # --- Player Images Section ---
-        img_section_y = header_height + 20
-        img_height = 350
-        img_width = 400
-        gap = 80  # Gap between images
-
-        # Calculate positions for centered side-by-side images
-        total_width = img_width * 2 + gap
-        start_x = (OG_WIDTH - total_width) // 2
-
-        # Download player images (convert to internal URLs for Docker access)
-        img1 = None
-        img2 = None
-        if challenger_sub.generated_output_url:
-            internal_url = _get_internal_url(challenger_sub.generated_output_url)
-            img1 = _download_image(internal_url, (img_width, img_height))
-        if opponent_sub.generated_output_url:
-            internal_url = _get_internal_url(opponent_sub.generated_output_url)
-            img2 = _download_image(internal_url, (img_width, img_height))
-
-        # Use placeholders if images unavailable
-        if img1 is None:
-            img1 = _create_placeholder_image((img_width, img_height))
-        if img2 is None:
-            img2 = _create_placeholder_image((img_width, img_height))
-
-        # Calculate centered positions for each image (in case they're smaller than max)
-        img1_x = start_x + (img_width - img1.width) // 2
-        img1_y = img_section_y + (img_height - img1.height) // 2
-        img2_x = start_x + img_width + gap + (img_width - img2.width) // 2
-        img2_y = img_section_y + (img_height - img2.height) // 2
-
-        # Winner highlight - draw gold border around winner's image
-        border_width = 6
-        if battle.winner_id == battle.challenger_id:
-            draw.rectangle(
-                [
-                    (img1_x - border_width, img1_y - border_width),
-                    (img1_x + img1.width + border_width, img1_y + img1.height + border_width),
-                ],
-                outline=WINNER_COLOR,
-                width=border_width,
-            )
-        elif battle.winner_id == battle.opponent_id:
-            draw.rectangle(
-                [
-                    (img2_x - border_width, img2_y - border_width),
-                    (img2_x + img2.width + border_width, img2_y + img2.height + border_width),
-                ],
-                outline=WINNER_COLOR,
-                width=border_width,
-            )
-
-        # Paste images
-        img.paste(img1, (img1_x, img1_y))
-        img.paste(img2, (img2_x, img2_y))
-
-        # Draw "VS" in the gap
-        vs_x = start_x + img_width + gap // 2
-        vs_y = img_section_y + img_height // 2 - 20
-        vs_font = _get_font(36, bold=True)
-        bbox = draw.textbbox((0, 0), 'VS', font=vs_font)
-        vs_text_width = bbox[2] - bbox[0]
-        draw.text((vs_x - vs_text_width // 2, vs_y), 'VS', fill=SECONDARY_TEXT, font=vs_font)
-
-        # --- Player Info Section ---
-        info_y = img_section_y + img_height + 15
-
-        # Challenger info (left)
-        challenger_name = f'@{challenger_sub.user.username}'
-        challenger_name = _truncate_text(challenger_name, 20)
-        challenger_score = f'{float(challenger_sub.score):.1f}' if challenger_sub.score else '--'
-
-        # Center username under image
-        name_bbox = draw.textbbox((0, 0), challenger_name, font=font_username)
-        name_width = name_bbox[2] - name_bbox[0]
-        name_x = start_x + (img_width - name_width) // 2
-        draw.text((name_x, info_y), challenger_name, fill=TEXT_COLOR, font=font_username)
-
-        # Score
-        score_text = f'Score: {challenger_score}'
-        score_bbox = draw.textbbox((0, 0), score_text, font=font_score)
-        score_width = score_bbox[2] - score_bbox[0]
-        score_x = start_x + (img_width - score_width) // 2
-        draw.text((score_x, info_y + 28), score_text, fill=SCORE_COLOR, font=font_score)
-
-        # Winner badge
-        if battle.winner_id == battle.challenger_id:
-            winner_text = 'WINNER'
-            winner_bbox = draw.textbbox((0, 0), winner_text, font=font_label)
-            winner_width = winner_bbox[2] - winner_bbox[0]
-            winner_x = start_x + (img_width - winner_width) // 2
-            draw.text((winner_x, info_y + 58), winner_text, fill=WINNER_COLOR, font=font_label)
-
-        # Opponent info (right)
-        opponent_name = f'@{opponent_sub.user.username}'
-        opponent_name = _truncate_text(opponent_name, 20)
-        opponent_score = f'{float(opponent_sub.score):.1f}' if opponent_sub.score else '--'
-
-        # Center username under image
-        name_bbox = draw.textbbox((0, 0), opponent_name, font=font_username)
-        name_width = name_bbox[2] - name_bbox[0]
-        name_x = start_x + img_width + gap + (img_width - name_width) // 2
-        draw.text((name_x, info_y), opponent_name, fill=TEXT_COLOR, font=font_username)
-
-        # Score
-        score_text = f'Score: {opponent_score}'
-        score_bbox = draw.textbbox((0, 0), score_text, font=font_score)
-        score_width = score_bbox[2] - score_bbox[0]
-        score_x = start_x + img_width + gap + (img_width - score_width) // 2
-        draw.text((score_x, info_y + 28), score_text, fill=SCORE_COLOR, font=font_score)
-
-        # Winner badge
-        if battle.winner_id == battle.opponent_id:
-            winner_text = 'WINNER'
-            winner_bbox = draw.textbbox((0, 0), winner_text, font=font_label)
-            winner_width = winner_bbox[2] - winner_bbox[0]
-            winner_x = start_x + img_width + gap + (img_width - winner_width) // 2
-            draw.text((winner_x, info_y + 58), winner_text, fill=WINNER_COLOR, font=font_label)
-
-        # Tie indicator
-        if battle.winner_id is None:
-            tie_text = "IT'S A TIE!"
-            tie_font = _get_font(28, bold=True)
-            tie_bbox = draw.textbbox((0, 0), tie_text, font=tie_font)
-            tie_width = tie_bbox[2] - tie_bbox[0]
-            tie_x = (OG_WIDTH - tie_width) // 2
-            draw.text((tie_x, info_y + 55), tie_text, fill=SCORE_COLOR, font=tie_font)
-
-        # --- Footer / Branding ---
-        footer_y = OG_HEIGHT - 40
-        branding_text = 'AllThrive AI - Prompt Battle'
-        draw.text((40, footer_y), branding_text, fill=SECONDARY_TEXT, font=font_branding)
-
-        # Battle URL hint
-        url_text = 'allthrive.ai/battles'
-        url_bbox = draw.textbbox((0, 0), url_text, font=font_label)
-        url_width = url_bbox[2] - url_bbox[0]
-        draw.text((OG_WIDTH - url_width - 40, footer_y + 4), url_text, fill=SECONDARY_TEXT, font=font_label)
-
-        # --- Save and upload ---
-        output = io.BytesIO()
-        img.save(output, format='PNG', optimize=True)
-        output.seek(0)
-        image_bytes = output.getvalue()
-
-        # Upload to storage
+        inputs = _render_inputs(battle, challenger_sub, opponent_sub)
+        key = _render_key(inputs)
         storage = get_storage_service()
+
+        url = _find_cached_render(storage, key)
+        if url:
+            logger.info(f'Reusing cached OG image for battle {battle.id}: {url}')
+            return url
+
+        image_bytes = _render_card(inputs)
+
+        # Upload to storage under the input hash so identical inputs are never drawn twice
         url, error = storage.upload_file(
             file_data=image_bytes,
             filename=f'battle_{battle.id}_og.png',
             content_type='image/png',
-            folder='battle-og-images',
+            folder=RENDER_FOLDER,
             is_public=True,
+            object_name=f'{key}.png',
         )
 
         if error:
             logger.error(f'Failed to upload OG image for battle {battle.id}: {error}')
             return None
 
+        cache.set(_render_cache_key(key), url, RENDER_CACHE_TIMEOUT)
         logger.info(f'Generated OG image for battle {battle.id}: {url}')
         return url
 
     except Exception as e:
         logger.error(f'Error generating OG image for battle {battle.id}: {e}', exc_info=True)
         return None
+
+
+def _render_card(inputs: dict) -> bytes:
+    """Draw the card described by _render_inputs and return it as PNG bytes."""
+    challenger = inputs['challenger']
+    opponent = inputs['opponent']
+    winner = inputs['winner']
+
+    # Create base image
+    img = Image.new('RGB', (OG_WIDTH, OG_HEIGHT), BACKGROUND_COLOR)
+    draw = ImageDraw.Draw(img)
+
+    # Load fonts
+    font_challenge = _get_font(22)
+    font_username = _get_font(20, bold=True)
+    font_score = _get_font(24, bold=True)
+    font_label = _get_font(16)
+    font_branding = _get_font(18, bold=True)
+
+    # --- Header Section (challenge text) ---
+    header_height = 80
+    draw.rectangle([(0, 0), (OG_WIDTH, header_height)], fill=HEADER_BG_COLOR)
+
+    # Challenge text
+    challenge_preview = _truncate_text(inputs['challenge_text'], 80)
+    draw.text((40, 15), 'Challenge:', fill=SECONDARY_TEXT, font=font_label)
+    draw.text((40, 38), f'"{challenge_preview}"', fill=TEXT_COLOR, font=font_challenge)
+
+    # --- Player Images Section ---
+    img_section_y = header_height + 20
+    img_height = 350
+    img_width = 400
+    gap = 80  # Gap between images
+
+    # Calculate positions for centered side-by-side images
+    total_width = img_width * 2 + gap
+    start_x = (OG_WIDTH - total_width) // 2
+
+    # Download player images (convert to internal URLs for Docker access)
+    img1 = None
+    img2 = None
+    if challenger['image_url']:
+        internal_url = _get_internal_url(challenger['image_url'])
+        img1 = _download_image(internal_url, (img_width, img_height))
+    if opponent['image_url']:
+        internal_url = _get_internal_url(opponent['image_url'])
+        img2 = _download_image(internal_url, (img_width, img_height))
+
+    # Use placeholders if images unavailable
+    if img1 is None:
+        img1 = _create_placeholder_image((img_width, img_height))
+    if img2 is None:
+        img2 = _create_placeholder_image((img_width, img_height))
+
+    # Calculate centered positions for each image (in case they're smaller than max)
+    img1_x = start_x + (img_width - img1.width) // 2
+    img1_y = img_section_y + (img_height - img1.height) // 2
+    img2_x = start_x + img_width + gap + (img_width - img2.width) // 2
+    img2_y = img_section_y + (img_height - img2.height) // 2
+
+    # Winner highlight - draw gold border around winner's image
+    border_width = 6
+    if winner == 'challenger':
+        draw.rectangle(
+            [
+                (img1_x - border_width, img1_y - border_width),
+                (img1_x + img1.width + border_width, img1_y + img1.height + border_width),
+            ],
+            outline=WINNER_COLOR,
+            width=border_width,
+        )
+    elif winner == 'opponent':
+        draw.rectangle(
+            [
+                (img2_x - border_width, img2_y - border_width),
+                (img2_x + img2.width + border_width, img2_y + img2.height + border_width),
+            ],
+            outline=WINNER_COLOR,
+            width=border_width,
+        )
+
+    # Paste images
+    img.paste(img1, (img1_x, img1_y))
+    img.paste(img2, (img2_x, img2_y))
+
+    # Draw "VS" in the gap
+    vs_x = start_x + img_width + gap // 2
+    vs_y = img_section_y + img_height // 2 - 20
+    vs_font = _get_font(36, bold=True)
+    bbox = draw.textbbox((0, 0), 'VS', font=vs_font)
+    vs_text_width = bbox[2] - bbox[0]
+    draw.text((vs_x - vs_text_width // 2, vs_y), 'VS', fill=SECONDARY_TEXT, font=vs_font)
+
+    # --- Player Info Section ---
+    info_y = img_section_y + img_height + 15
+
+    # Challenger info (left)
+    challenger_name = f'@{challenger["username"]}'
+    challenger_name = _truncate_text(challenger_name, 20)
+
+    # Center username under image
+    name_bbox = draw.textbbox((0, 0), challenger_name, font=font_username)
+    name_width = name_bbox[2] - name_bbox[0]
+    name_x = start_x + (img_width - name_width) // 2
+    draw.text((name_x, info_y), challenger_name, fill=TEXT_COLOR, font=font_username)
+
+    # Score
+    score_text = f'Score: {challenger["score"]}'
+    score_bbox = draw.textbbox((0, 0), score_text, font=font_score)
+    score_width = score_bbox[2] - score_bbox[0]
+    score_x = start_x + (img_width - score_width) // 2
+    draw.text((score_x, info_y + 28), score_text, fill=SCORE_COLOR, font=font_score)
+
+    # Winner badge
+    if winner == 'challenger':
+        winner_text = 'WINNER'
+        winner_bbox = draw.textbbox((0, 0), winner_text, font=font_label)
+        winner_width = winner_bbox[2] - winner_bbox[0]
+        winner_x = start_x + (img_width - winner_width) // 2
+        draw.text((winner_x, info_y + 58), winner_text, fill=WINNER_COLOR, font=font_label)
+
+    # Opponent info (right)
+    opponent_name = f'@{opponent["username"]}'
+    opponent_name = _truncate_text(opponent_name, 20)
+
+    # Center username under image
+    name_bbox = draw.textbbox((0, 0), opponent_name, font=font_username)
+    name_width = name_bbox[2] - name_bbox[0]
+    name_x = start_x + img_width + gap + (img_width - name_width) // 2
+    draw.text((name_x, info_y), opponent_name, fill=TEXT_COLOR, font=font_username)
+
+    # Score
+    score_text = f'Score: {opponent["score"]}'
+    score_bbox = draw.textbbox((0, 0), score_text, font=font_score)
+    score_width = score_bbox[2] - score_bbox[0]
+    score_x = start_x + img_width + gap + (img_width - score_width) // 2
+    draw.text((score_x, info_y + 28), score_text, fill=SCORE_COLOR, font=font_score)
+
+    # Winner badge
+    if winner == 'opponent':
+        winner_text = 'WINNER'
+        winner_bbox = draw.textbbox((0, 0), winner_text, font=font_label)
+        winner_width = winner_bbox[2] - winner_bbox[0]
+        winner_x = start_x + img_width + gap + (img_width - winner_width) // 2
+        draw.text((winner_x, info_y + 58), winner_text, fill=WINNER_COLOR, font=font_label)
+
+    # Tie indicator
+    if winner is None:
+        tie_text = "IT'S A TIE!"
+        tie_font = _get_font(28, bold=True)
+        tie_bbox = draw.textbbox((0, 0), tie_text, font=tie_font)
+        tie_width = tie_bbox[2] - tie_bbox[0]
+        tie_x = (OG_WIDTH - tie_width) // 2
+        draw.text((tie_x, info_y + 55), tie_text, fill=SCORE_COLOR, font=tie_font)
+
+    # --- Footer / Branding ---
+    footer_y = OG_HEIGHT - 40
+    branding_text = 'AllThrive AI - Prompt Battle'
+    draw.text((40, footer_y), branding_text, fill=SECONDARY_TEXT, font=font_branding)
+
+    # Battle URL hint
+    url_text = 'allthrive.ai/battles'
+    url_bbox = draw.textbbox((0, 0), url_text, font=font_label)
+    url_width = url_bbox[2] - url_bbox[0]
+    draw.text((OG_WIDTH - url_width - 40, footer_y + 4), url_text, fill=SECONDARY_TEXT, font=font_label)
+
+    # --- Save ---
+    output = io.BytesIO()
+    img.save(output, format='PNG', optimize=True)
+    return output.getvalue()
@@ -0,0 +1,113 @@
+"""
+Tests for battle OG image render caching.
+"""
+
+import io
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from PIL import Image, ImageDraw
+
+from core.battles import og_image_service
+from core.battles.og_image_service import _SourceImageCache, generate_battle_og_image
+
+
+def _png_response():
+    output = io.BytesIO()
+    Image.new('RGB', (800, 600), (10, 120, 200)).save(output, format='PNG')
+    return MagicMock(content=output.getvalue(), raise_for_status=MagicMock())
+
+
+def _battle(winner_id=1, opponent_score=71.0):
+    challenger = SimpleNamespace(
+        user_id=1, user=SimpleNamespace(username='alice'), score=88.5, generated_output_url='http://img/a.png'
+    )
+    opponent = SimpleNamespace(
+        user_id=2, user=SimpleNamespace(username='bob'), score=opponent_score, generated_output_url='http://img/b.png'
+    )
+    submissions = MagicMock()
+    submissions.select_related.return_value.all.return_value = [challenger, opponent]
+    return SimpleNamespace(
+        id=7,
+        challenger_id=1,
+        opponent_id=2,
+        winner_id=winner_id,
+        challenge_text='Draw a cat riding a bicycle',
+        submissions=submissions,
+    )
+
+
+class BattleOGImageCacheTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        og_image_service._source_images.clear()
+        self.storage = MagicMock()
+        self.storage.file_exists.return_value = False
+        self.storage.upload_file.side_effect = lambda **kwargs: (
+            f'http://minio/bucket/public/{kwargs["folder"]}/{kwargs["object_name"]}',
+            None,
+        )
+        self.storage.get_file_url.side_effect = lambda name, is_public: f'http://minio/bucket/{name}'
+
+    def _generate(self, battle):
+        with (
+            patch('core.battles.og_image_service.get_storage_service', return_value=self.storage),
+            patch('core.battles.og_image_service.requests.get', return_value=_png_response()) as fetch,
+            patch('core.battles.og_image_service.ImageDraw.Draw', wraps=ImageDraw.Draw) as draw,
+        ):
+            url = generate_battle_og_image(battle)
+        return url, fetch, draw
+
+    def test_repeat_render_does_no_downloads_or_drawing(self):
+        """Test that a finished battle's card is drawn once and then served from the cache"""
+        first_url, fetch, draw = self._generate(_battle())
+        self.assertEqual(fetch.call_count, 2)
+        self.assertTrue(draw.called)
+        self.assertEqual(self.storage.upload_file.call_count, 1)
+
+        for _ in range(3):
+            url, fetch, draw = self._generate(_battle())
+            self.assertEqual(url, first_url)
+            fetch.assert_not_called()
+            draw.assert_not_called()
+        self.assertEqual(self.storage.upload_file.call_count, 1)
+
+    def test_render_found_in_storage_after_cache_eviction(self):
+        """Test that object storage is the durable cache when the key/value cache is cold"""
+        first_url, _, _ = self._generate(_battle())
+        object_name = first_url.split('/bucket/', 1)[1]
+        cache.clear()
+        self.storage.file_exists.side_effect = lambda name: name == object_name
+
+        url, fetch, draw = self._generate(_battle())
+
+        self.assertEqual(url, first_url)
+        fetch.assert_not_called()
+        draw.assert_not_called()
+
+    def test_changed_inputs_render_a_new_card_from_cached_sources(self):
+        """Test that a new score re-renders, reusing the already downloaded submission images"""
+        first_url, _, _ = self._generate(_battle())
+
+        url, fetch, draw = self._generate(_battle(opponent_score=95.0, winner_id=2))
+
+        self.assertNotEqual(url, first_url)
+        self.assertTrue(draw.called)
+        fetch.assert_not_called()
+        self.assertEqual(self.storage.upload_file.call_count, 2)
+
+
+class SourceImageCacheTest(SimpleTestCase):
+    def test_evicts_least_recently_used(self):
+        lru = _SourceImageCache(maxsize=2)
+        a, b, c = (Image.new('RGB', (1, 1)) for _ in range(3))
+        lru.put(('a', (1, 1)), a)
+        lru.put(('b', (1, 1)), b)
+        lru.get(('a', (1, 1)))
+        lru.put(('c', (1, 1)), c)
+
+        self.assertIs(lru.get(('a', (1, 1))), a)
+        self.assertIsNone(lru.get(('b', (1, 1))))
+        self.assertIs(lru.get(('c', (1, 1))), c)
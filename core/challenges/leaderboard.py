@@ -4,36 +4,70 @@ import logging
 
 from django.core.cache import cache
 
+from core.utils.leaderboard import RedisLeaderboard, get_redis_client
+
 logger = logging.getLogger(__name__)
 
+# KEYS[1] - voter's daily vote counter, KEYS[2] - challenge leaderboard ZSET
+# ARGV: max daily votes, counter TTL (s), score increment, recipient user id
+# Returns {vote_counted, votes_remaining_today}
+CAST_VOTE_SCRIPT = """
+local max_votes = tonumber(ARGV[1])
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+if current >= max_votes then
+    return {0, 0}
+end
+current = redis.call('INCR', KEYS[1])
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('ZINCRBY', KEYS[2], ARGV[3], ARGV[4])
+return {1, max_votes - current}
+"""
+
 
 class ChallengeLeaderboardService:
     """Real-time leaderboard using Redis sorted sets.
 
     Uses Redis ZSET for O(log N) rank lookups and O(log N + M) range queries.
+    Board reads/writes go through the generic RedisLeaderboard engine; the
+    vote-specific flows (daily limits, submissions) live here.
     """
 
     LEADERBOARD_KEY = 'challenge:{challenge_id}:leaderboard'
     USER_SUBMISSION_COUNT_KEY = 'challenge:{challenge_id}:user:{user_id}:submissions'
     DAILY_VOTES_KEY = 'challenge:{challenge_id}:user:{user_id}:votes:{date}'
     PARTICIPATION_KEY = 'challenge:participation:{year}:{week}'
+    LEADERBOARD_PAGE_CACHE_KEY = 'challenge:{challenge_id}:leaderboard_page:{start}:{end}'
+
+    # Short TTL: pages stay fresh during voting but spikes read from cache
+    LEADERBOARD_PAGE_TTL = 5
 
     # Limits
     MAX_DAILY_VOTES = 50  # Max votes per user per day per challenge
 
+    _cast_vote_script = None
+
     @classmethod
     def _get_redis(cls):
         """Get Redis client from cache backend."""
-        try:
-            # Django cache backend for Redis
-            return cache._cache.get_client()
-        except AttributeError:
+        redis = get_redis_client()
+        if redis is None:
             logger.warning('Redis client not available, using cache fallback')
-            return None
+        return redis
+
+    @classmethod
+    def board(cls, challenge_id: str) -> RedisLeaderboard:
+        """The vote leaderboard for a challenge."""
+        return RedisLeaderboard(cls.LEADERBOARD_KEY.format(challenge_id=challenge_id))
 
     @classmethod
-    def add_submission(cls, challenge_id: str, user_id: int, submission_id: str):
-        """Track a new submission and initialize leaderboard entry."""
+    def add_submission(
+        cls, challenge_id: str, user_id: int, submission_id: str, year: int | None = None, week: int | None = None
+    ):
+        """Track a new submission and initialize leaderboard entry.
+
+        All writes go out in a single pipeline. When year/week are given the
+        weekly participation counter is updated in the same round trip.
+        """
         redis = cls._get_redis()
         if not redis:
             return
@@ -42,12 +76,20 @@ class ChallengeLeaderboardService:
         count_key = cls.USER_SUBMISSION_COUNT_KEY.format(challenge_id=challenge_id, user_id=user_id)
 
         try:
+            pipe = redis.pipeline(transaction=False)
             # Initialize user in leaderboard if not exists (score = 0)
-            redis.zadd(key, {str(user_id): 0}, nx=True)
+            pipe.zadd(key, {str(user_id): 0}, nx=True)
 
             # Track submission count
-            redis.incr(count_key)
-            redis.expire(count_key, 60 * 60 * 24 * 30)  # 30 days TTL
+            pipe.incr(count_key)
+            pipe.expire(count_key, 60 * 60 * 24 * 30)  # 30 days TTL
+
+            if year is not None and week is not None:
+                participation_key = cls.PARTICIPATION_KEY.format(year=year, week=week)
+                pipe.zincrby(participation_key, 1, str(user_id))
+                pipe.expire(participation_key, 60 * 60 * 24 * 90)  # 90 days TTL
+
+            pipe.execute()
 
             logger.debug(f'Added submission {submission_id} for user {user_id} in challenge {challenge_id}')
         except Exception as e:
@@ -65,34 +107,14 @@ class ChallengeLeaderboardService:
         Returns:
             True if vote was counted, False if user hit daily limit
         """
-        redis = cls._get_redis()
-        if not redis:
-            return True  # Allow vote if Redis unavailable
-
-        key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
-
-        try:
-            # Increment user's score
-            redis.zincrby(key, increment, str(user_id))
-            logger.debug(f'Added {increment} votes to user {user_id} in challenge {challenge_id}')
-            return True
-        except Exception as e:
-            logger.error(f'Error adding vote to leaderboard: {e}')
-            return True
+        cls.board(challenge_id).incr(user_id, increment)
+        logger.debug(f'Added {increment} votes to user {user_id} in challenge {challenge_id}')
+        return True
 
     @classmethod
     def remove_vote(cls, challenge_id: str, user_id: int, decrement: float = 1.0):
         """Remove a vote from user's score (e.g., if vote is deleted)."""
-        redis = cls._get_redis()
-        if not redis:
-            return
-
-        key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
-
-        try:
-            redis.zincrby(key, -decrement, str(user_id))
-        except Exception as e:
-            logger.error(f'Error removing vote from leaderboard: {e}')
+        cls.board(challenge_id).incr(user_id, -decrement)
 
     @classmethod
     def check_daily_vote_limit(cls, challenge_id: str, voter_id: int) -> tuple[bool, int]:
@@ -136,6 +158,61 @@ class ChallengeLeaderboardService:
         except Exception as e:
             logger.error(f'Error recording daily vote: {e}')
 
+    @classmethod
+    def cast_vote(cls, challenge_id: str, voter_id: int, recipient_id: int, increment: float = 1.0) -> tuple[bool, int]:
+        """Check the voter's daily limit, record the vote and bump the recipient's score atomically.
+
+        One Lua script, one round trip: the daily counter can never overshoot
+        MAX_DAILY_VOTES under concurrent votes, and the leaderboard only moves
+        when the vote is admitted.
+
+        Returns:
+            Tuple of (vote_counted, votes_remaining_today)
+        """
+        redis = cls._get_redis()
+        if not redis:
+            return True, cls.MAX_DAILY_VOTES
+
+        from datetime import date
+
+        today = date.today().isoformat()
+        votes_key = cls.DAILY_VOTES_KEY.format(challenge_id=challenge_id, user_id=voter_id, date=today)
+        leaderboard_key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
+
+        try:
+            if cls._cast_vote_script is None:
+                cls._cast_vote_script = redis.register_script(CAST_VOTE_SCRIPT)
+            allowed, remaining = cls._cast_vote_script(
+                keys=[votes_key, leaderboard_key],
+                args=[cls.MAX_DAILY_VOTES, 60 * 60 * 24 * 2, increment, str(recipient_id)],
+                client=redis,
+            )
+            return bool(allowed), int(remaining)
+        except Exception as e:
+            logger.error(f'Error casting vote: {e}')
+            return True, cls.MAX_DAILY_VOTES
+
+    @classmethod
+    def refund_vote(cls, challenge_id: str, voter_id: int, recipient_id: int, increment: float = 1.0):
+        """Undo a cast_vote() whose database write failed."""
+        redis = cls._get_redis()
+        if not redis:
+            return
+
+        from datetime import date
+
+        today = date.today().isoformat()
+        votes_key = cls.DAILY_VOTES_KEY.format(challenge_id=challenge_id, user_id=voter_id, date=today)
+        leaderboard_key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.decr(votes_key)
+            pipe.zincrby(leaderboard_key, -increment, str(recipient_id))
+            pipe.execute()
+        except Exception as e:
+            logger.error(f'Error refunding vote: {e}')
+
     @classmethod
     def get_leaderboard(cls, challenge_id: str, start: int = 0, end: int = 99) -> list[tuple[int, float]]:
         """Get top N users from leaderboard.
@@ -148,19 +225,7 @@ class ChallengeLeaderboardService:
         Returns:
             List of (user_id, score) tuples, highest score first
         """
-        redis = cls._get_redis()
-        if not redis:
-            return []
-
-        key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
-
-        try:
-            # ZREVRANGE returns highest scores first
-            results = redis.zrevrange(key, start, end, withscores=True)
-            return [(int(user_id), score) for user_id, score in results]
-        except Exception as e:
-            logger.error(f'Error getting leaderboard: {e}')
-            return []
+        return cls.board(challenge_id).page(start, end)
 
     @classmethod
     def get_user_rank(cls, challenge_id: str, user_id: int) -> int | None:
@@ -169,35 +234,26 @@ class ChallengeLeaderboardService:
         Returns:
             Rank (1 = first place) or None if user not in leaderboard
         """
-        redis = cls._get_redis()
-        if not redis:
-            return None
-
-        key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
-
-        try:
-            # ZREVRANK returns 0-indexed rank (highest score = 0)
-            rank = redis.zrevrank(key, str(user_id))
-            return rank + 1 if rank is not None else None
-        except Exception as e:
-            logger.error(f'Error getting user rank: {e}')
-            return None
+        return cls.board(challenge_id).rank(user_id)
 
     @classmethod
     def get_user_score(cls, challenge_id: str, user_id: int) -> float:
         """Get a user's current score in the challenge."""
-        redis = cls._get_redis()
-        if not redis:
-            return 0.0
+        return cls.board(challenge_id).score(user_id)
 
-        key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
+    @classmethod
+    def get_user_standing(cls, challenge_id: str, user_id: int) -> tuple[int | None, float]:
+        """Get a user's (rank, score) in one round trip."""
+        return cls.board(challenge_id).standing(user_id)
 
-        try:
-            score = redis.zscore(key, str(user_id))
-            return float(score) if score is not None else 0.0
-        except Exception as e:
-            logger.error(f'Error getting user score: {e}')
-            return 0.0
+    @classmethod
+    def get_user_standings(cls, challenge_id: str, user_ids: list[int]) -> dict[int, tuple[int | None, float]]:
+        """Batch rank/score lookup for a page of users in a single pipeline.
+
+        Returns:
+            Dict of user_id -> (rank (1-indexed) or None, score)
+        """
+        return cls.board(challenge_id).standings(user_ids)
 
     @classmethod
     def get_user_submission_count(cls, challenge_id: str, user_id: int) -> int:
@@ -234,82 +290,97 @@ class ChallengeLeaderboardService:
         Returns:
             List of (user_id, score, rank) tuples
         """
-        rank = cls.get_user_rank(challenge_id, user_id)
-        if rank is None:
-            return []
-
-        # Calculate range (rank is 1-indexed)
-        start = max(0, rank - 1 - context)
-        end = rank - 1 + context
-
-        entries = cls.get_leaderboard(challenge_id, start, end)
-        return [(uid, score, start + i + 1) for i, (uid, score) in enumerate(entries)]
+        return cls.board(challenge_id).neighbors(user_id, context)
 
     @classmethod
-    def sync_from_database(cls, challenge_id: str):
-        """Sync leaderboard from database (for recovery or initialization).
+    def get_leaderboard_page(cls, challenge_id: str, start: int = 0, end: int = 99) -> dict:
+        """Get a leaderboard page with user display data, cached briefly.
 
-        This rebuilds the Redis leaderboard from the submission vote counts.
-        """
-        from django.db import models
+        Ranked entries and the participant count are read in one pipeline, and
+        user display data is loaded in a single query. The hydrated page is
+        cached for LEADERBOARD_PAGE_TTL seconds so voting spikes don't turn
+        every leaderboard view into Redis + Postgres work.
 
-        from core.challenges.models import ChallengeSubmission
+        Returns:
+            Dict with 'entries' (rank, user_id, username, avatar_url, vote_count)
+            and 'total_participants'
+        """
+        cache_key = cls.LEADERBOARD_PAGE_CACHE_KEY.format(challenge_id=challenge_id, start=start, end=end)
+        page = cache.get(cache_key)
+        if page is not None:
+            return page
 
         redis = cls._get_redis()
         if not redis:
-            return
+            return {'entries': [], 'total_participants': 0}
 
         key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
 
         try:
-            # Get all submissions with vote counts
-            submissions = (
-                ChallengeSubmission.objects.filter(challenge_id=challenge_id, is_disqualified=False)
-                .values('user_id')
-                .annotate(total_votes=models.Sum('vote_count'))
-            )
+            pipe = redis.pipeline(transaction=False)
+            pipe.zrevrange(key, start, end, withscores=True)
+            pipe.zcard(key)
+            ranked, total = pipe.execute()
+        except Exception as e:
+            logger.error(f'Error getting leaderboard page: {e}')
+            return {'entries': [], 'total_participants': 0}
+
+        from core.users.models import User
+
+        ranked = [(int(user_id), score) for user_id, score in ranked]
+        users = {
+            u['id']: u
+            for u in User.objects.filter(id__in=[uid for uid, _ in ranked]).values('id', 'username', 'avatar_url')
+        }
+
+        entries = []
+        for offset, (user_id, score) in enumerate(ranked):
+            user = users.get(user_id)
+            if user:
+                entries.append(
+                    {
+                        'rank': start + offset + 1,
+                        'user_id': user_id,
+                        'username': user['username'],
+                        'avatar_url': user['avatar_url'],
+                        'vote_count': int(score),
+                    }
+                )
+
+        page = {'entries': entries, 'total_participants': total}
+        cache.set(cache_key, page, cls.LEADERBOARD_PAGE_TTL)
+        return page
 
-            # Build leaderboard data
-            leaderboard_data = {str(s['user_id']): float(s['total_votes'] or 0) for s in submissions}
+    @classmethod
+    def sync_from_database(cls, challenge_id: str):
+        """Sync leaderboard from database (for recovery or initialization).
 
-            if leaderboard_data:
-                # Clear existing and rebuild
-                redis.delete(key)
-                redis.zadd(key, leaderboard_data)
+        This rebuilds the Redis leaderboard from the submission vote counts.
+        """
+        from django.db import models
 
-                logger.info(f'Synced leaderboard for challenge {challenge_id} with {len(leaderboard_data)} entries')
-        except Exception as e:
-            logger.error(f'Error syncing leaderboard: {e}')
+        from core.challenges.models import ChallengeSubmission
+
+        submissions = (
+            ChallengeSubmission.objects.filter(challenge_id=challenge_id, is_disqualified=False)
+            .values('user_id')
+            .annotate(total_votes=models.Sum('vote_count'))
+        )
+
+        written = cls.board(challenge_id).replace((s['user_id'], s['total_votes'] or 0) for s in submissions)
+        if written:
+            logger.info(f'Synced leaderboard for challenge {challenge_id} with {written} entries')
 
     @classmethod
     def clear_leaderboard(cls, challenge_id: str):
         """Clear leaderboard data for a challenge."""
-        redis = cls._get_redis()
-        if not redis:
-            return
-
-        key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
-
-        try:
-            redis.delete(key)
-            logger.info(f'Cleared leaderboard for challenge {challenge_id}')
-        except Exception as e:
-            logger.error(f'Error clearing leaderboard: {e}')
+        cls.board(challenge_id).clear()
+        logger.info(f'Cleared leaderboard for challenge {challenge_id}')
 
     @classmethod
     def get_total_participants(cls, challenge_id: str) -> int:
         """Get total number of participants in the leaderboard."""
-        redis = cls._get_redis()
-        if not redis:
-            return 0
-
-        key = cls.LEADERBOARD_KEY.format(challenge_id=challenge_id)
-
-        try:
-            return redis.zcard(key)
-        except Exception as e:
-            logger.error(f'Error getting participant count: {e}')
-            return 0
+        return cls.board(challenge_id).size()
 
     @classmethod
     def track_weekly_participation(cls, year: int, week: int, user_id: int):
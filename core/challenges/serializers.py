@@ -158,9 +158,8 @@ class WeeklyChallengeDetailSerializer(serializers.ModelSerializer):
         # Check vote limits
         can_vote_today, votes_remaining = ChallengeLeaderboardService.check_daily_vote_limit(str(obj.id), user.id)
 
-        # Get user's rank if they have submissions
-        rank = ChallengeLeaderboardService.get_user_rank(str(obj.id), user.id)
-        score = ChallengeLeaderboardService.get_user_score(str(obj.id), user.id)
+        # Get user's rank and score if they have submissions
+        rank, score = ChallengeLeaderboardService.get_user_standing(str(obj.id), user.id)
 
         return {
             'has_submitted': submission_count > 0,
@@ -289,11 +288,10 @@ class ChallengeSubmissionCreateSerializer(serializers.ModelSerializer):
 
         submission = ChallengeSubmission.objects.create(challenge=challenge, user=user, **validated_data)
 
-        # Track in leaderboard
-        ChallengeLeaderboardService.add_submission(str(challenge.id), user.id, str(submission.id))
-
-        # Track weekly participation
-        ChallengeLeaderboardService.track_weekly_participation(challenge.year, challenge.week_number, user.id)
+        # Track in leaderboard and weekly participation
+        ChallengeLeaderboardService.add_submission(
+            str(challenge.id), user.id, str(submission.id), year=challenge.year, week=challenge.week_number
+        )
 
         # Award participation points
         submission.award_participation_points()
@@ -325,11 +323,6 @@ class ChallengeVoteSerializer(serializers.Serializer):
         if ChallengeVote.objects.filter(submission=submission, voter=user).exists():
             raise serializers.ValidationError('You have already voted for this submission.')
 
-        # Check daily limit
-        can_vote, remaining = ChallengeLeaderboardService.check_daily_vote_limit(str(submission.challenge_id), user.id)
-        if not can_vote:
-            raise serializers.ValidationError('You have reached your daily vote limit for this challenge.')
-
         # Check if challenge allows voting
         if not submission.challenge.can_vote:
             raise serializers.ValidationError('Voting is not currently available for this challenge.')
@@ -337,20 +330,27 @@ class ChallengeVoteSerializer(serializers.Serializer):
         return data
 
     def create(self, validated_data):
-        """Create vote and update leaderboard."""
+        """Create vote and update leaderboard.
+
+        The daily limit check, daily vote record and leaderboard increment run
+        as one atomic Redis script before the vote row is written.
+        """
         submission = self.context['submission']
         user = self.context['request'].user
+        challenge_id = str(submission.challenge_id)
 
-        vote = ChallengeVote.objects.create(
-            submission=submission,
-            voter=user,
-        )
-
-        # Update leaderboard
-        ChallengeLeaderboardService.add_vote(str(submission.challenge_id), submission.user_id, 1.0)
+        can_vote, _ = ChallengeLeaderboardService.cast_vote(challenge_id, user.id, submission.user_id, 1.0)
+        if not can_vote:
+            raise serializers.ValidationError('You have reached your daily vote limit for this challenge.')
 
-        # Record daily vote
-        ChallengeLeaderboardService.record_daily_vote(str(submission.challenge_id), user.id)
+        try:
+            vote = ChallengeVote.objects.create(
+                submission=submission,
+                voter=user,
+            )
+        except Exception:
+            ChallengeLeaderboardService.refund_vote(challenge_id, user.id, submission.user_id, 1.0)
+            raise
 
         return vote
 
@@ -0,0 +1 @@
+# Challenges tests
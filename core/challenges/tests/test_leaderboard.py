@@ -0,0 +1,74 @@
+"""Tests for the pipelined / Lua-backed challenge leaderboard operations."""
+
+from unittest.mock import patch
+
+import pytest
+
+from core.challenges.leaderboard import ChallengeLeaderboardService
+
+fakeredis = pytest.importorskip('fakeredis')
+pytest.importorskip('lupa')
+
+
+@pytest.fixture
+def redis_client():
+    client = fakeredis.FakeRedis()
+    with (
+        patch.object(ChallengeLeaderboardService, '_get_redis', return_value=client),
+        patch('core.utils.leaderboard.get_redis_client', return_value=client),
+    ):
+        yield client
+
+
+class TestCastVote:
+    def test_records_vote_and_increments_score(self, redis_client):
+        allowed, remaining = ChallengeLeaderboardService.cast_vote('c1', voter_id=1, recipient_id=2)
+
+        assert allowed is True
+        assert remaining == ChallengeLeaderboardService.MAX_DAILY_VOTES - 1
+        assert ChallengeLeaderboardService.get_user_score('c1', 2) == 1.0
+
+    def test_daily_limit_is_enforced_atomically(self, redis_client):
+        with patch.object(ChallengeLeaderboardService, 'MAX_DAILY_VOTES', 3):
+            results = [ChallengeLeaderboardService.cast_vote('c2', voter_id=1, recipient_id=2) for _ in range(5)]
+
+        assert [allowed for allowed, _ in results] == [True, True, True, False, False]
+        # Rejected votes never reach the leaderboard
+        assert ChallengeLeaderboardService.get_user_score('c2', 2) == 3.0
+
+    def test_vote_is_one_round_trip(self, redis_client):
+        # First call loads the script; steady-state votes are a single EVALSHA
+        ChallengeLeaderboardService.cast_vote('c3', voter_id=1, recipient_id=2)
+
+        with patch.object(redis_client, 'execute_command', wraps=redis_client.execute_command) as execute:
+            ChallengeLeaderboardService.cast_vote('c3', voter_id=1, recipient_id=2)
+
+        commands = [call.args[0] for call in execute.call_args_list]
+        assert commands == ['EVALSHA']
+
+    def test_refund_reverts_vote(self, redis_client):
+        ChallengeLeaderboardService.cast_vote('c4', voter_id=1, recipient_id=2)
+
+        ChallengeLeaderboardService.refund_vote('c4', voter_id=1, recipient_id=2)
+
+        assert ChallengeLeaderboardService.get_user_score('c4', 2) == 0.0
+        assert ChallengeLeaderboardService.check_daily_vote_limit('c4', 1) == (
+            True,
+            ChallengeLeaderboardService.MAX_DAILY_VOTES,
+        )
+
+
+class TestBatchReads:
+    def test_get_user_standings(self, redis_client):
+        redis_client.zadd(ChallengeLeaderboardService.LEADERBOARD_KEY.format(challenge_id='c5'), {'1': 5, '2': 9})
+
+        standings = ChallengeLeaderboardService.get_user_standings('c5', [1, 2, 3])
+
+        assert standings == {1: (2, 5.0), 2: (1, 9.0), 3: (None, 0.0)}
+
+    def test_add_submission_pipelines_participation(self, redis_client):
+        ChallengeLeaderboardService.add_submission('c6', 7, 'sub-1', year=2026, week=10)
+
+        assert ChallengeLeaderboardService.get_user_submission_count('c6', 7) == 1
+        assert ChallengeLeaderboardService.get_user_rank('c6', 7) == 1
+        assert ChallengeLeaderboardService.get_weekly_participation_leaders(2026, 10) == [(7, 1)]
@@ -25,7 +25,6 @@ from core.challenges.serializers import (
     WeeklyChallengeListSerializer,
 )
 from core.logging_utils import StructuredLogger
-from core.users.models import User
 
 logger = logging.getLogger(__name__)
 
@@ -155,35 +154,20 @@ class WeeklyChallengeViewSet(viewsets.ReadOnlyModelViewSet):
         """Get real-time leaderboard for a challenge."""
         challenge = self.get_object()
 
-        # Get leaderboard from Redis
+        # Get leaderboard page from Redis (user display data hydrated in bulk, briefly cached)
         limit = int(request.query_params.get('limit', 100))
-        entries = ChallengeLeaderboardService.get_leaderboard(str(challenge.id), 0, limit - 1)
-
-        # Get user details for each entry
-        user_ids = [uid for uid, _ in entries]
-        users = {u.id: u for u in User.objects.filter(id__in=user_ids)}
-
-        leaderboard_entries = []
-        for rank, (user_id, score) in enumerate(entries, 1):
-            user = users.get(user_id)
-            if user:
-                leaderboard_entries.append(
-                    {
-                        'rank': rank,
-                        'user_id': user_id,
-                        'username': user.username,
-                        'avatar_url': user.avatar_url if hasattr(user, 'avatar_url') else None,
-                        'vote_count': int(score),
-                        'is_current_user': request.user.is_authenticated and user_id == request.user.id,
-                    }
-                )
+        page = ChallengeLeaderboardService.get_leaderboard_page(str(challenge.id), 0, limit - 1)
+
+        current_user_id = request.user.id if request.user.is_authenticated else None
+        leaderboard_entries = [
+            {**entry, 'is_current_user': entry['user_id'] == current_user_id} for entry in page['entries']
+        ]
 
         # Get current user's entry if authenticated and not in top N
         user_entry = None
         if request.user.is_authenticated:
-            user_rank = ChallengeLeaderboardService.get_user_rank(str(challenge.id), request.user.id)
+            user_rank, user_score = ChallengeLeaderboardService.get_user_standing(str(challenge.id), request.user.id)
             if user_rank and user_rank > limit:
-                user_score = ChallengeLeaderboardService.get_user_score(str(challenge.id), request.user.id)
                 user_entry = {
                     'rank': user_rank,
                     'user_id': request.user.id,
@@ -196,7 +180,7 @@ class WeeklyChallengeViewSet(viewsets.ReadOnlyModelViewSet):
         return Response(
             {
                 'entries': leaderboard_entries,
-                'total_participants': ChallengeLeaderboardService.get_total_participants(str(challenge.id)),
+                'total_participants': page['total_participants'],
                 'user_entry': user_entry,
             }
         )
@@ -25,6 +25,7 @@ from django.utils import timezone
 
 from core.community.models import Message, Room, RoomMembership
 from core.logging_utils import StructuredLogger
+from core.utils.rate_limit import RateLimit, rate_limiter
 
 logger = logging.getLogger(__name__)
 
@@ -575,16 +576,10 @@ class CommunityRoomConsumer(AsyncWebsocketConsumer):
 
     async def _check_rate_limit(self) -> bool:
         """Check if user is within rate limits."""
-        from django.core.cache import cache
-
-        key = f'rate_limit:community:{self.user.id}'
-        current = cache.get(key, 0)
-
-        if current >= RATE_LIMIT_MESSAGES_PER_MINUTE:
-            return False
-
-        cache.set(key, current + 1, timeout=60)
-        return True
+        result = await rate_limiter.acheck(
+            RateLimit('community_messages', self.user.id, RATE_LIMIT_MESSAGES_PER_MINUTE, 60)
+        )
+        return result.allowed
 
 
 class DirectMessageConsumer(AsyncWebsocketConsumer):
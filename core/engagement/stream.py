@@ -0,0 +1,153 @@
+"""
+Redis stream buffer for engagement event ingest.
+
+The batch endpoint validates events and appends them to a Redis stream in
+one pipelined round trip, then returns 202. The drain_engagement_stream task
+reads the stream through a consumer group in chunks, bulk-inserts the rows
+and runs one profile update per user per drain window.
+
+Delivery is at-least-once: entries are acknowledged only after their rows
+are committed, and entries left pending by a crashed worker are reclaimed
+after PENDING_IDLE_MS.
+"""
+
+import json
+import logging
+import socket
+
+from django.core.cache import cache
+from redis.exceptions import ResponseError
+
+logger = logging.getLogger(__name__)
+
+
+class EngagementStream:
+    """Append/read/ack wrapper around the engagement events stream."""
+
+    STREAM_KEY = 'engagement:events'
+    GROUP = 'engagement-ingest'
+    MAX_LENGTH = 1_000_000  # Approximate cap so a stalled consumer can't exhaust Redis memory
+    PENDING_IDLE_MS = 5 * 60 * 1000
+
+    def __init__(self, key: str | None = None):
+        self.key = key or self.STREAM_KEY
+        self._group_ready = False
+
+    def _get_redis(self):
+        """Get the raw Redis client from the cache backend, or None for non-Redis caches."""
+        try:
+            return cache._cache.get_client(write=True)
+        except AttributeError:
+            return None
+
+    def append(self, user_id: int, events: list[dict]) -> bool:
+        """
+        Append validated events for a user.
+
+        Args:
+            user_id: Owner of the events
+            events: Dicts with event_type, project_id (or None) and payload
+
+        Returns:
+            True if the events were buffered, False if Redis is unavailable
+            (callers should write the rows directly instead)
+        """
+        redis = self._get_redis()
+        if redis is None:
+            return False
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for event in events:
+                pipe.xadd(
+                    self.key,
+                    {
+                        'user_id': user_id,
+                        'event_type': event['event_type'],
+                        'project_id': event['project_id'] or '',
+                        'payload': json.dumps(event['payload']),
+                    },
+                    maxlen=self.MAX_LENGTH,
+                    approximate=True,
+                )
+            pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f'Error appending engagement events for user {user_id}: {e}')
+            return False
+
+    def read(self, count: int, consumer: str | None = None) -> list[tuple[str, dict]]:
+        """
+        Claim up to `count` entries for this consumer.
+
+        Entries abandoned by another consumer are reclaimed first, then new
+        entries are read. Returns (entry_id, event) pairs with decoded fields.
+        """
+        redis = self._get_redis()
+        if redis is None:
+            return []
+
+        consumer = consumer or socket.gethostname()
+        self._ensure_group(redis)
+
+        try:
+            entries = self._claim(redis, consumer, count)
+        except ResponseError as e:
+            if 'NOGROUP' not in str(e):
+                raise
+            # The stream (and its group) was deleted or flushed since the group was created
+            logger.warning(f'Consumer group {self.GROUP} missing on {self.key}; recreating it')
+            self._group_ready = False
+            self._ensure_group(redis)
+            entries = self._claim(redis, consumer, count)
+
+        return [(self._decode(entry_id), self._decode_event(fields)) for entry_id, fields in entries if fields]
+
+    def ack(self, entry_ids: list[str]) -> None:
+        """Acknowledge and delete processed entries."""
+        redis = self._get_redis()
+        if redis is None or not entry_ids:
+            return
+
+        pipe = redis.pipeline(transaction=False)
+        pipe.xack(self.key, self.GROUP, *entry_ids)
+        pipe.xdel(self.key, *entry_ids)
+        pipe.execute()
+
+    def _claim(self, redis, consumer: str, count: int) -> list:
+        """Reclaim abandoned entries, then top up with new ones."""
+        _, claimed, *_ = redis.xautoclaim(self.key, self.GROUP, consumer, self.PENDING_IDLE_MS, '0-0', count=count)
+        entries = list(claimed)
+        if len(entries) < count:
+            response = redis.xreadgroup(self.GROUP, consumer, {self.key: '>'}, count=count - len(entries))
+            for _, stream_entries in response or []:
+                entries.extend(stream_entries)
+        return entries
+
+    def _ensure_group(self, redis):
+        if self._group_ready:
+            return
+        try:
+            redis.xgroup_create(self.key, self.GROUP, id='0', mkstream=True)
+        except ResponseError as e:
+            if 'BUSYGROUP' not in str(e):
+                raise
+        self._group_ready = True
+
+    @staticmethod
+    def _decode(value) -> str:
+        return value.decode() if isinstance(value, bytes) else value
+
+    @classmethod
+    def _decode_event(cls, fields: dict) -> dict:
+        fields = {cls._decode(k): cls._decode(v) for k, v in fields.items()}
+        return {
+            'user_id': int(fields['user_id']),
+            'event_type': fields['event_type'],
+            'project_id': int(fields['project_id']) if fields.get('project_id') else None,
+            'payload': json.loads(fields.get('payload') or '{}'),
+        }
+
+
+# Singleton instance
+engagement_stream = EngagementStream()
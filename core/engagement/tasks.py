@@ -9,6 +9,7 @@ import logging
 from collections import defaultdict
 
 from celery import shared_task
+from django.db import transaction
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -50,7 +51,7 @@ def process_engagement_batch(self):
             update_user_profile_from_events.delay(user_id, event_ids)
             queued_users += 1
 
-        logger.info(f'Queued engagement processing for {queued_users} users ' f'({len(events)} events total)')
+        logger.info(f'Queued engagement processing for {queued_users} users ({len(events)} events total)')
 
         return {
             'status': 'queued',
@@ -72,8 +73,6 @@ def update_user_profile_from_events(self, user_id: int, event_ids: list[int]):
     """
     from core.engagement.models import EngagementEvent
     from core.users.models import User
-    from services.personalization.settings_aware_scorer import SettingsAwareScorer
-    from services.weaviate.tasks import sync_user_profile_to_weaviate
 
     try:
         user = User.objects.get(id=user_id)
@@ -83,67 +82,13 @@ def update_user_profile_from_events(self, user_id: int, event_ids: list[int]):
             logger.debug(f'No unprocessed events for user_id={user_id}')
             return {'status': 'no_events', 'user_id': user_id}
 
-        # Check user's settings
-        scorer = SettingsAwareScorer(user)
-
-        # Filter events based on settings
-        valid_events = []
-        filtered_count = 0
-        for event in events:
-            # Filter based on user preferences
-            if event.event_type == EngagementEvent.EventType.TIME_SPENT:
-                if not scorer.should_track_time():
-                    filtered_count += 1
-                    continue
-            elif event.event_type == EngagementEvent.EventType.SCROLL_DEPTH:
-                if not scorer.should_track_scroll():
-                    filtered_count += 1
-                    continue
-            elif event.event_type in (
-                EngagementEvent.EventType.VIEW,
-                EngagementEvent.EventType.VIEW_MILESTONE,
-            ):
-                if not scorer.should_penalize_views():
-                    filtered_count += 1
-                    continue
-            valid_events.append(event)
-
         # Mark all events as processed (even filtered ones)
-        now = timezone.now()
         EngagementEvent.objects.filter(id__in=event_ids).update(
             processed=True,
-            processed_at=now,
+            processed_at=timezone.now(),
         )
 
-        if not valid_events:
-            logger.debug(f'All {filtered_count} events filtered by settings for user_id={user_id}')
-            return {'status': 'filtered_by_settings', 'user_id': user_id, 'filtered': filtered_count}
-
-        # Aggregate engagement signals
-        aggregated = _aggregate_engagement_signals(valid_events)
-
-        # Update user profile if significant engagement
-        if _should_update_profile(aggregated):
-            sync_user_profile_to_weaviate.delay(user_id)
-            logger.info(
-                f'Triggered profile sync for user_id={user_id} '
-                f'(milestones={aggregated["view_milestones"]}, '
-                f'time={aggregated["total_time_spent"]}s, '
-                f'scroll={aggregated["max_scroll_depth"]}%)'
-            )
-            return {
-                'status': 'profile_sync_triggered',
-                'user_id': user_id,
-                'processed': len(valid_events),
-                'aggregated': aggregated,
-            }
-
-        return {
-            'status': 'processed_no_sync',
-            'user_id': user_id,
-            'processed': len(valid_events),
-            'reason': 'engagement_below_threshold',
-        }
+        return _apply_user_engagement(user, events)
 
     except User.DoesNotExist:
         logger.warning(f'User {user_id} not found for engagement processing')
@@ -161,6 +106,156 @@ def update_user_profile_from_events(self, user_id: int, event_ids: list[int]):
         raise self.retry(exc=e) from e
 
 
+@shared_task(bind=True, max_retries=2, default_retry_delay=60)
+def drain_engagement_stream(self, chunk_size: int = 1000, max_chunks: int = 50):
+    """
+    Drain buffered engagement events from the Redis stream.
+
+    Each chunk is written with one bulk_create (already marked processed) and
+    acknowledged after commit. Events are grouped by user across the whole
+    drain window, so each user gets at most one profile update per run.
+
+    Runs every minute via Celery Beat.
+    """
+    from core.engagement.models import EngagementEvent
+    from core.engagement.stream import engagement_stream
+    from core.projects.models import Project
+    from core.users.models import User
+
+    try:
+        user_events = defaultdict(list)
+        inserted = 0
+        dropped = 0
+
+        for _ in range(max_chunks):
+            entries = engagement_stream.read(chunk_size)
+            if not entries:
+                break
+
+            # Drop events whose user/project was deleted since they were buffered
+            user_ids = {event['user_id'] for _, event in entries}
+            project_ids = {event['project_id'] for _, event in entries if event['project_id']}
+            existing_users = set(User.objects.filter(id__in=user_ids).values_list('id', flat=True))
+            existing_projects = set(Project.objects.filter(id__in=project_ids).values_list('id', flat=True))
+
+            now = timezone.now()
+            rows = [
+                EngagementEvent(
+                    user_id=event['user_id'],
+                    event_type=event['event_type'],
+                    project_id=event['project_id'],
+                    payload=event['payload'],
+                    processed=True,
+                    processed_at=now,
+                )
+                for _, event in entries
+                if event['user_id'] in existing_users
+                and (event['project_id'] is None or event['project_id'] in existing_projects)
+            ]
+            dropped += len(entries) - len(rows)
+
+            entry_ids = [entry_id for entry_id, _ in entries]
+            with transaction.atomic():
+                EngagementEvent.objects.bulk_create(rows)
+                # Ack only once the rows are committed; until then the entries stay pending and are reclaimable
+                transaction.on_commit(lambda entry_ids=entry_ids: engagement_stream.ack(entry_ids))
+
+            inserted += len(rows)
+            for row in rows:
+                user_events[row.user_id].append(row)
+
+            if len(entries) < chunk_size:
+                break
+
+        if not inserted:
+            return {'status': 'no_events', 'inserted': 0, 'dropped': dropped}
+
+        synced = 0
+        for user in User.objects.filter(id__in=user_events):
+            result = _apply_user_engagement(user, user_events[user.id])
+            if result['status'] == 'profile_sync_triggered':
+                synced += 1
+
+        logger.info(
+            f'Drained {inserted} engagement events for {len(user_events)} users '
+            f'(dropped={dropped}, profile_syncs={synced})'
+        )
+        return {'status': 'drained', 'inserted': inserted, 'users': len(user_events), 'dropped': dropped}
+
+    except Exception as e:
+        logger.error(f'Error draining engagement stream: {e}', exc_info=True)
+        raise self.retry(exc=e) from e
+
+
+def _apply_user_engagement(user, events) -> dict:
+    """
+    Apply one window of a user's engagement events to their profile.
+
+    Respects PersonalizationSettings toggles, aggregates the remaining events
+    and queues a Weaviate profile sync when engagement is significant.
+    """
+    from core.engagement.models import EngagementEvent
+    from services.personalization.settings_aware_scorer import SettingsAwareScorer
+    from services.weaviate.tasks import sync_user_profile_to_weaviate
+
+    user_id = user.id
+
+    # Check user's settings
+    scorer = SettingsAwareScorer(user)
+
+    # Filter events based on settings
+    valid_events = []
+    filtered_count = 0
+    for event in events:
+        # Filter based on user preferences
+        if event.event_type == EngagementEvent.EventType.TIME_SPENT:
+            if not scorer.should_track_time():
+                filtered_count += 1
+                continue
+        elif event.event_type == EngagementEvent.EventType.SCROLL_DEPTH:
+            if not scorer.should_track_scroll():
+                filtered_count += 1
+                continue
+        elif event.event_type in (
+            EngagementEvent.EventType.VIEW,
+            EngagementEvent.EventType.VIEW_MILESTONE,
+        ):
+            if not scorer.should_penalize_views():
+                filtered_count += 1
+                continue
+        valid_events.append(event)
+
+    if not valid_events:
+        logger.debug(f'All {filtered_count} events filtered by settings for user_id={user_id}')
+        return {'status': 'filtered_by_settings', 'user_id': user_id, 'filtered': filtered_count}
+
+    # Aggregate engagement signals
+    aggregated = _aggregate_engagement_signals(valid_events)
+
+    # Update user profile if significant engagement
+    if _should_update_profile(aggregated):
+        sync_user_profile_to_weaviate.delay(user_id)
+        logger.info(
+            f'Triggered profile sync for user_id={user_id} '
+            f'(milestones={aggregated["view_milestones"]}, '
+            f'time={aggregated["total_time_spent"]}s, '
+            f'scroll={aggregated["max_scroll_depth"]}%)'
+        )
+        return {
+            'status': 'profile_sync_triggered',
+            'user_id': user_id,
+            'processed': len(valid_events),
+            'aggregated': aggregated,
+        }
+
+    return {
+        'status': 'processed_no_sync',
+        'user_id': user_id,
+        'processed': len(valid_events),
+        'reason': 'engagement_below_threshold',
+    }
+
+
 def _aggregate_engagement_signals(events) -> dict:
     """Aggregate engagement events into meaningful signals."""
     from core.engagement.models import EngagementEvent
@@ -0,0 +1,136 @@
+"""
+Tests for engagement ingest through the Redis stream buffer.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core.engagement.models import EngagementEvent
+from core.engagement.stream import EngagementStream
+from core.engagement.tasks import drain_engagement_stream
+from core.engagement.views import _validate_events
+from core.projects.models import Project
+from core.users.models import User
+
+
+@pytest.fixture
+def stream():
+    fakeredis = pytest.importorskip('fakeredis')
+    client = fakeredis.FakeRedis()
+    stream = EngagementStream(key='engagement:test')
+    with patch.object(stream, '_get_redis', return_value=client):
+        yield stream
+
+
+class TestEngagementStream:
+    def test_append_read_ack_round_trip(self, stream):
+        events = [
+            {'event_type': 'time_spent', 'project_id': 7, 'payload': {'seconds': 45}},
+            {'event_type': 'scroll_depth', 'project_id': None, 'payload': {'depth_percent': 80}},
+        ]
+
+        assert stream.append(42, events) is True
+        entries = stream.read(10, consumer='worker-1')
+
+        assert [event for _, event in entries] == [
+            {'user_id': 42, 'event_type': 'time_spent', 'project_id': 7, 'payload': {'seconds': 45}},
+            {'user_id': 42, 'event_type': 'scroll_depth', 'project_id': None, 'payload': {'depth_percent': 80}},
+        ]
+
+        stream.ack([entry_id for entry_id, _ in entries])
+        assert stream.read(10, consumer='worker-1') == []
+
+    def test_read_respects_chunk_size(self, stream):
+        stream.append(1, [{'event_type': 'view', 'project_id': None, 'payload': {}}] * 5)
+
+        assert len(stream.read(3, consumer='worker-1')) == 3
+        assert len(stream.read(3, consumer='worker-1')) == 2
+
+    def test_unacked_entries_are_reclaimed(self, stream):
+        stream.append(1, [{'event_type': 'view', 'project_id': None, 'payload': {}}])
+        stream.read(10, consumer='crashed-worker')
+
+        with patch.object(EngagementStream, 'PENDING_IDLE_MS', 0):
+            reclaimed = stream.read(10, consumer='worker-2')
+
+        assert len(reclaimed) == 1
+
+    def test_read_recreates_missing_group(self, stream):
+        stream.read(10, consumer='worker-1')
+        # A flush or manual delete drops the stream along with its consumer group
+        stream._get_redis().delete(stream.key)
+
+        stream.append(1, [{'event_type': 'view', 'project_id': None, 'payload': {}}])
+
+        assert len(stream.read(10, consumer='worker-1')) == 1
+
+    def test_append_without_redis_reports_fallback(self):
+        stream = EngagementStream(key='engagement:test')
+        with patch.object(stream, '_get_redis', return_value=None):
+            assert stream.append(1, [{'event_type': 'view', 'project_id': None, 'payload': {}}]) is False
+
+
+class TestValidateEvents:
+    def test_numeric_string_project_id_is_coerced(self):
+        valid, errors = _validate_events([{'event_type': 'view', 'project_id': '123'}])
+
+        assert errors == []
+        assert valid == [{'event_type': 'view', 'project_id': 123, 'payload': {}}]
+
+    @pytest.mark.parametrize('project_id', ['abc', True, 1.5, [1]])
+    def test_non_integer_project_id_is_rejected(self, project_id):
+        valid, errors = _validate_events([{'event_type': 'view', 'project_id': project_id}])
+
+        assert valid == []
+        assert errors == [{'index': 0, 'error': 'project_id must be an integer'}]
+
+
+@pytest.mark.django_db
+class TestDrainEngagementStream:
+    @pytest.fixture
+    def drain(self, stream):
+        with (
+            patch('core.engagement.stream.engagement_stream', stream),
+            patch(
+                'core.engagement.tasks._apply_user_engagement', return_value={'status': 'processed_no_sync'}
+            ) as apply_engagement,
+        ):
+            yield apply_engagement
+
+    def test_drain_bulk_creates_acks_after_commit_and_updates_each_user_once(
+        self, stream, drain, django_capture_on_commit_callbacks
+    ):
+        alice = User.objects.create_user(username='alice', email='alice@example.com')
+        bob = User.objects.create_user(username='bob', email='bob@example.com')
+        project = Project.objects.create(user=alice, title='Project', slug='project')
+        missing_project_id = project.id + 1000
+
+        stream.append(alice.id, [{'event_type': 'view', 'project_id': project.id, 'payload': {}}] * 2)
+        stream.append(bob.id, [{'event_type': 'time_spent', 'project_id': project.id, 'payload': {'seconds': 30}}])
+        stream.append(bob.id, [{'event_type': 'view', 'project_id': missing_project_id, 'payload': {}}])
+        stream.append(alice.id, [{'event_type': 'scroll_depth', 'project_id': None, 'payload': {}}])
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            with CaptureQueriesContext(connection) as queries:
+                result = drain_engagement_stream.run(chunk_size=2)
+
+            # Written, but nothing is acknowledged until the transaction commits
+            table = EngagementEvent._meta.db_table
+            inserts = [query for query in queries if query['sql'].startswith(f'INSERT INTO "{table}"')]
+            assert len(inserts) == 3  # One bulk_create per chunk of 2
+            assert stream._get_redis().xlen(stream.key) == 5
+
+        for callback in callbacks:
+            callback()
+
+        assert result == {'status': 'drained', 'inserted': 4, 'users': 2, 'dropped': 1}
+        assert stream._get_redis().xlen(stream.key) == 0
+        assert EngagementEvent.objects.filter(processed=True).count() == 4
+        assert not EngagementEvent.objects.filter(project_id=missing_project_id).exists()
+
+        assert drain.call_count == 2
+        events_by_user = {call.args[0].id: len(call.args[1]) for call in drain.call_args_list}
+        assert events_by_user == {alice.id: 3, bob.id: 1}
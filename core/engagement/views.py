@@ -12,6 +12,7 @@ from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 
 from core.engagement.models import EngagementEvent
+from core.engagement.stream import engagement_stream
 
 logger = logging.getLogger(__name__)
 
@@ -43,8 +44,14 @@ def batch_engagement_events(request):
         ]
     }
 
+    Valid events are appended to the engagement Redis stream and written in
+    bulk by drain_engagement_stream, so the request returns without touching
+    the database. Without Redis, events are bulk-inserted directly.
+
     Returns:
-        201: Events created successfully
+        202: Events accepted (queued for ingest)
+        201: Events created directly (Redis unavailable)
+        207: Some events rejected
         400: Invalid payload
     """
     events_data = request.data.get('events', [])
@@ -69,14 +76,56 @@ def batch_engagement_events(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
+    valid_events, errors = _validate_events(events_data)
+
+    event_ids = []
+    if valid_events:
+        if engagement_stream.append(request.user.id, valid_events):
+            success_status = status.HTTP_202_ACCEPTED
+        else:
+            try:
+                created = EngagementEvent.objects.bulk_create(
+                    [EngagementEvent(user=request.user, **event) for event in valid_events]
+                )
+                event_ids = [event.id for event in created]
+                success_status = status.HTTP_201_CREATED
+            except Exception as e:
+                logger.warning(
+                    f'Failed to create engagement events: {e}',
+                    extra={'user_id': request.user.id},
+                )
+                errors.append({'index': None, 'error': str(e)})
+                valid_events = []
+
+    response_data = {
+        'created': len(valid_events),
+        'event_ids': event_ids,
+    }
+
+    if errors:
+        response_data['errors'] = errors
+        # Partial success
+        if valid_events:
+            return Response(response_data, status=status.HTTP_207_MULTI_STATUS)
+        return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+
+    return Response(response_data, status=success_status)
+
+
+def _validate_events(events_data: list) -> tuple[list[dict], list[dict]]:
+    """Split a batch into normalized valid events and per-index errors."""
     valid_event_types = {choice[0] for choice in EngagementEvent.EventType.choices}
-    created_events = []
+    valid_events = []
     errors = []
 
     for idx, event_data in enumerate(events_data):
+        if not isinstance(event_data, dict):
+            errors.append({'index': idx, 'error': 'Event must be an object'})
+            continue
+
         event_type = event_data.get('event_type')
         project_id = event_data.get('project_id')
-        payload = event_data.get('payload', {})
+        payload = event_data.get('payload') or {}
 
         # Validate event type
         if not event_type:
@@ -92,35 +141,23 @@ def batch_engagement_events(request):
             )
             continue
 
-        # Create event
-        try:
-            event = EngagementEvent.objects.create(
-                user=request.user,
-                event_type=event_type,
-                project_id=project_id,
-                payload=payload,
-            )
-            created_events.append(event.id)
-        except Exception as e:
-            logger.warning(
-                f'Failed to create engagement event: {e}',
-                extra={'event_data': event_data, 'user_id': request.user.id},
-            )
-            errors.append({'index': idx, 'error': str(e)})
+        # Numeric strings ("123") are accepted and coerced, as the model field did on the per-row path
+        if isinstance(project_id, str):
+            try:
+                project_id = int(project_id)
+            except ValueError:
+                pass
+        if project_id is not None and (isinstance(project_id, bool) or not isinstance(project_id, int)):
+            errors.append({'index': idx, 'error': 'project_id must be an integer'})
+            continue
 
-    response_data = {
-        'created': len(created_events),
-        'event_ids': created_events,
-    }
+        if not isinstance(payload, dict):
+            errors.append({'index': idx, 'error': 'payload must be an object'})
+            continue
 
-    if errors:
-        response_data['errors'] = errors
-        # Partial success
-        if created_events:
-            return Response(response_data, status=status.HTTP_207_MULTI_STATUS)
-        return Response(response_data, status=status.HTTP_400_BAD_REQUEST)
+        valid_events.append({'event_type': event_type, 'project_id': project_id, 'payload': payload})
 
-    return Response(response_data, status=status.HTTP_201_CREATED)
+    return valid_events, errors
 
 
 @api_view(['POST'])
@@ -0,0 +1,113 @@
+"""
+Shared HTTP plumbing for the GitHub REST API.
+
+- One pooled httpx.AsyncClient (HTTP/2, keep-alive) per event loop, so repeated
+  calls reuse connections and TLS sessions instead of handshaking per request.
+- One long-lived background event loop per process for the sync wrappers.
+  asyncio.run() would create and close a loop per call, which also throws away
+  every pooled connection bound to it.
+- A conditional-request cache: the ETag and body of each response are stored
+  per URL and token scope, and sent back as If-None-Match. GitHub doesn't count
+  304 responses against the rate limit.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
+import weakref
+from collections.abc import Coroutine
+from typing import Any
+
+import httpx
+from django.core.cache import cache
+
+from core.integrations.github.constants import GITHUB_API_TIMEOUT
+
+logger = logging.getLogger(__name__)
+
+ETAG_CACHE_TTL = 60 * 60 * 24  # 1 day - entries are revalidated on every use anyway
+ETAG_CACHE_MAX_BODY_BYTES = 1024 * 1024  # Don't put huge trees in Redis
+
+_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]' = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Pooled client for the running event loop (httpx clients can't be shared across loops)."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(
+                timeout=GITHUB_API_TIMEOUT,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                http2=True,
+            )
+            _clients[loop] = client
+        return client
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='github-http-loop', daemon=True).start()
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """Run a coroutine on the shared background loop and wait for its result."""
+    loop = _get_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError('run_sync() called from the GitHub HTTP loop; await the coroutine instead')
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+def _forget_after_fork():
+    # The loop thread doesn't survive fork; the child starts its own on first use
+    global _loop, _clients, _clients_lock, _loop_lock
+    _loop = None
+    _clients = weakref.WeakKeyDictionary()
+    _clients_lock = threading.Lock()
+    _loop_lock = threading.Lock()
+
+
+os.register_at_fork(after_in_child=_forget_after_fork)
+
+
+def conditional_cache_key(token: str, url: str, params: dict | None) -> str:
+    """Cache key for a response, scoped to the token (visibility differs per token)."""
+    token_scope = hashlib.sha256(token.encode()).hexdigest()[:16]
+    request = hashlib.sha256(json.dumps([url, sorted((params or {}).items())]).encode()).hexdigest()
+    return f'github:etag:{token_scope}:{request}'
+
+
+async def get_cached_response(key: str) -> dict | None:
+    """Stored {'etag': ..., 'body': ...} for a request, if any."""
+    try:
+        return await cache.aget(key)
+    except Exception as e:
+        logger.warning(f'GitHub ETag cache read failed: {e}')
+        return None
+
+
+async def store_response(key: str, response: httpx.Response, body: Any):
+    """Remember a 200 response's ETag and body so the next read can be conditional."""
+    etag = response.headers.get('ETag')
+    if not etag or len(response.content) > ETAG_CACHE_MAX_BODY_BYTES:
+        return
+    try:
+        await cache.aset(key, {'etag': etag, 'body': body}, ETAG_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f'GitHub ETag cache write failed: {e}')
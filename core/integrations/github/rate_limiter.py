@@ -5,14 +5,18 @@ import time
 from functools import wraps
 
 from django.conf import settings
-from django.core.cache import cache
 from rest_framework.exceptions import Throttled
 
+from core.utils.rate_limit import RateLimit, rate_limiter
+
 logger = logging.getLogger(__name__)
 
 
 class GitHubRateLimiter:
-    """Rate limiter for GitHub API calls using Django cache."""
+    """Rate limiter for GitHub API calls using the shared sliding-window limiter."""
+
+    # Windows tracked per action, used when resetting all limits
+    WINDOWS = (60, 3600)
 
     def __init__(self, user_id: int = None):
         """
@@ -24,15 +28,10 @@ class GitHubRateLimiter:
         self.user_id = user_id
         self.config = settings.GITHUB_RATE_LIMIT
 
-    def _get_cache_key(self, action: str, window: str) -> str:
-        """Generate cache key for rate limit tracking."""
-        if self.user_id:
-            return f'github_ratelimit:user:{self.user_id}:{action}:{window}'
-        return f'github_ratelimit:global:{action}:{window}'
-
-    def _get_expiry_cache_key(self, action: str, window: str) -> str:
-        """Generate cache key for storing expiry timestamp."""
-        return f'{self._get_cache_key(action, window)}:expiry'
+    def _get_limit(self, action: str, max_requests: int, window_seconds: int) -> RateLimit:
+        """Build the shared-limiter limit for an action and window."""
+        owner = f'user:{self.user_id}' if self.user_id else 'global'
+        return RateLimit(f'github_{action}', f'{owner}:{window_seconds}s', max_requests, window_seconds)
 
     def check_rate_limit(self, action: str, max_requests: int, window_seconds: int) -> tuple[bool, int]:
         """
@@ -46,47 +45,22 @@ class GitHubRateLimiter:
         Returns:
             Tuple of (allowed: bool, requests_remaining: int)
         """
-        import time
-
-        cache_key = self._get_cache_key(action, f'{window_seconds}s')
-        expiry_key = self._get_expiry_cache_key(action, f'{window_seconds}s')
-
-        # Get current count and expiry timestamp
-        current_count = cache.get(cache_key, 0)
-        expiry_timestamp = cache.get(expiry_key)
-
-        if current_count >= max_requests:
-            # Calculate retry_after from expiry timestamp
-            if expiry_timestamp:
-                retry_after = max(0, int(expiry_timestamp - time.time()))
-            else:
-                retry_after = window_seconds
+        result = rate_limiter.check(self._get_limit(action, max_requests, window_seconds))
 
+        if not result.allowed:
             logger.warning(
                 f'Rate limit exceeded for {action}: '
                 f'user_id={self.user_id}, '
-                f'count={current_count}/{max_requests}, '
-                f'retry_after={retry_after}s'
+                f'limit={max_requests}/{window_seconds}s, '
+                f'retry_after={result.retry_after_seconds}s'
             )
             return False, 0
 
-        # Set expiry timestamp on first request in window
-        if current_count == 0:
-            expiry_timestamp = time.time() + window_seconds
-            cache.set(expiry_key, expiry_timestamp, window_seconds)
-
-        # Increment counter
-        cache.set(cache_key, current_count + 1, window_seconds)
-
-        requests_remaining = max_requests - (current_count + 1)
         logger.debug(
-            f'Rate limit check passed for {action}: '
-            f'user_id={self.user_id}, '
-            f'count={current_count + 1}/{max_requests}, '
-            f'remaining={requests_remaining}'
+            f'Rate limit check passed for {action}: user_id={self.user_id}, remaining={result.remaining}/{max_requests}'
         )
 
-        return True, requests_remaining
+        return True, result.remaining
 
     def check_user_repo_fetch_limit(self) -> tuple[bool, int]:
         """Check user-specific repo fetch rate limit (per hour)."""
@@ -115,16 +89,21 @@ class GitHubRateLimiter:
         return self.check_rate_limit('global', max_requests, 3600)
 
     def get_retry_after(self, action: str, window_seconds: int) -> int:
-        """Get seconds until rate limit resets."""
-        import time
-
-        expiry_key = self._get_expiry_cache_key(action, f'{window_seconds}s')
-        expiry_timestamp = cache.get(expiry_key)
-
-        if expiry_timestamp:
-            retry_after = max(0, int(expiry_timestamp - time.time()))
-            return retry_after
-        return 0
+        """Get seconds until a request for this action would be allowed again."""
+        max_requests = self._max_requests_for(action, window_seconds)
+        if max_requests is None:
+            return 0
+        return rate_limiter.peek(self._get_limit(action, max_requests, window_seconds)).retry_after_seconds
+
+    def _max_requests_for(self, action: str, window_seconds: int) -> int | None:
+        """Look up the configured limit for an action/window pair."""
+        if action == 'global':
+            return self.config['MAX_REQUESTS_PER_MINUTE' if window_seconds == 60 else 'MAX_REQUESTS_PER_HOUR']
+        if action == 'repo_fetch':
+            return self.config['USER_MAX_REPO_FETCHES_PER_HOUR']
+        if action == 'import':
+            return self.config['USER_MAX_IMPORTS_PER_HOUR']
+        return None
 
     def reset_limits(self, action: str = None):
         """
@@ -134,9 +113,8 @@ class GitHubRateLimiter:
             action: Specific action to reset, or None to reset all
         """
         if action:
-            for window in ['60s', '3600s']:
-                cache_key = self._get_cache_key(action, window)
-                cache.delete(cache_key)
+            # Limit size does not affect the key, only scope/action/window do
+            rate_limiter.reset(*(self._get_limit(action, 0, window) for window in self.WINDOWS))
             logger.info(f'Rate limits reset for action: {action}, user_id={self.user_id}')
         else:
             # Reset all actions
@@ -144,6 +122,13 @@ class GitHubRateLimiter:
                 self.reset_limits(action)
 
 
+# User-facing messages for actions with a per-user hourly limit
+USER_ACTION_MESSAGES = {
+    'repo_fetch': 'Too many repository fetches.',
+    'import': 'Too many imports.',
+}
+
+
 def github_rate_limit(action: str = 'general'):
     """
     Decorator for rate limiting GitHub API calls.
@@ -164,33 +149,26 @@ def github_rate_limit(action: str = 'general'):
                     user_id = arg.user.id
                     break
 
-            # Check rate limits
+            # Check the global and user-specific limits in one round trip
             limiter = GitHubRateLimiter(user_id=user_id)
-
-            # Check global limits first
-            allowed, _ = limiter.check_global_minute_limit()
-            if not allowed:
-                retry_after = limiter.get_retry_after('global', 60)
-                logger.error(f'Global minute rate limit exceeded, retry after {retry_after}s')
-                raise Throttled(detail=f'Rate limit exceeded. Try again in {retry_after} seconds.', wait=retry_after)
-
-            # Check user-specific limits
-            if action == 'repo_fetch':
-                allowed, remaining = limiter.check_user_repo_fetch_limit()
-                if not allowed:
-                    retry_after = limiter.get_retry_after('repo_fetch', 3600)
-                    raise Throttled(
-                        detail=f'Too many repository fetches. Try again in {retry_after // 60} minutes.',
-                        wait=retry_after,
-                    )
-            elif action == 'import':
-                allowed, remaining = limiter.check_user_import_limit()
-                if not allowed:
-                    retry_after = limiter.get_retry_after('import', 3600)
+            global_limit = limiter._get_limit('global', limiter.config['MAX_REQUESTS_PER_MINUTE'], 60)
+            limits = [global_limit]
+            if user_id and action in USER_ACTION_MESSAGES:
+                limits.append(limiter._get_limit(action, limiter._max_requests_for(action, 3600), 3600))
+
+            result = rate_limiter.check(*limits)
+            if not result.allowed:
+                retry_after = result.retry_after_seconds
+                if global_limit in result.blocked_by:
+                    logger.error(f'Global minute rate limit exceeded, retry after {retry_after}s')
                     raise Throttled(
-                        detail=f'Too many imports. Try again in {retry_after // 60} minutes.',
-                        wait=retry_after,
+                        detail=f'Rate limit exceeded. Try again in {retry_after} seconds.', wait=retry_after
                     )
+                minutes = max(1, (retry_after + 59) // 60)
+                raise Throttled(
+                    detail=f'{USER_ACTION_MESSAGES[action]} Try again in {minutes} minutes.',
+                    wait=retry_after,
+                )
 
             # Execute function
             return func(*args, **kwargs)
@@ -15,8 +15,14 @@ from tenacity import (
     wait_exponential,
 )
 
+from core.integrations.github.client import (
+    conditional_cache_key,
+    get_async_client,
+    get_cached_response,
+    run_sync,
+    store_response,
+)
 from core.integrations.github.constants import (
-    GITHUB_API_TIMEOUT,
     GITHUB_RETRY_ATTEMPTS,
     GITHUB_RETRY_MAX_WAIT,
     GITHUB_RETRY_MIN_WAIT,
@@ -66,6 +72,9 @@ class GitHubService:
         """
         Make authenticated request to GitHub API with retry logic.
 
+        Uses the shared pooled client and revalidates cached responses with
+        If-None-Match, so unchanged resources cost a free 304.
+
         Args:
             url: GitHub API endpoint URL
             params: Optional query parameters
@@ -73,19 +82,27 @@ class GitHubService:
         Returns:
             JSON response as dict or None if 404
         """
-        async with httpx.AsyncClient(timeout=GITHUB_API_TIMEOUT) as client:
-            response = await client.get(url, headers=self.headers, params=params or {})
+        cache_key = conditional_cache_key(self.token, url, params)
+        cached = await get_cached_response(cache_key)
+        headers = {**self.headers, 'If-None-Match': cached['etag']} if cached else self.headers
+
+        response = await get_async_client().get(url, headers=headers, params=params or {})
+
+        # Check rate limit
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining and int(remaining) < 100:
+            logger.warning(f'GitHub API rate limit low: {remaining} requests remaining')
 
-            # Check rate limit
-            remaining = response.headers.get('X-RateLimit-Remaining')
-            if remaining and int(remaining) < 100:
-                logger.warning(f'GitHub API rate limit low: {remaining} requests remaining')
+        if response.status_code == 304 and cached:
+            return cached['body']
 
-            if response.status_code == 404:
-                return None  # File/resource not found
+        if response.status_code == 404:
+            return None  # File/resource not found
 
-            response.raise_for_status()
-            return response.json()
+        response.raise_for_status()
+        data = response.json()
+        await store_response(cache_key, response, data)
+        return data
 
     def _decode_content(self, content_data: dict) -> str:
         """Decode base64 content from GitHub API response."""
@@ -272,7 +289,8 @@ class GitHubService:
         """
         Synchronous wrapper for get_repository_info.
 
-        Use this in synchronous contexts like LangChain tools.
+        Use this in synchronous contexts like LangChain tools. Runs on the shared
+        GitHub event loop so pooled connections survive between calls.
 
         Args:
             owner: Repository owner
@@ -281,9 +299,7 @@ class GitHubService:
         Returns:
             Dictionary with readme, tree, dependencies, and tech_stack
         """
-        import asyncio
-
-        return asyncio.run(self.get_repository_info(owner, repo))
+        return run_sync(self.get_repository_info(owner, repo))
 
     async def verify_repo_access(self, owner: str, repo: str) -> bool:
         """
@@ -330,12 +346,11 @@ class GitHubService:
             # This catches cases where user was added as collaborator but hasn't pushed yet
             try:
                 collab_url = f'{self.BASE_URL}/repos/{owner}/{repo}/collaborators/{github_username}'
-                async with httpx.AsyncClient(timeout=GITHUB_API_TIMEOUT) as client:
-                    response = await client.get(collab_url, headers=self.headers)
-                    # 204 means user is a collaborator
-                    if response.status_code == 204:
-                        logger.info(f'User {github_username} is a collaborator on {owner}/{repo}')
-                        return True
+                response = await get_async_client().get(collab_url, headers=self.headers)
+                # 204 means user is a collaborator
+                if response.status_code == 204:
+                    logger.info(f'User {github_username} is a collaborator on {owner}/{repo}')
+                    return True
             except Exception as e:
                 logger.debug(f'Collaborator check failed (expected for non-collaborators): {e}')
 
@@ -359,6 +374,4 @@ class GitHubService:
         Returns:
             True if user owns or contributed to the repo, False otherwise
         """
-        import asyncio
-
-        return asyncio.run(self.verify_repo_access(owner, repo))
+        return run_sync(self.verify_repo_access(owner, repo))
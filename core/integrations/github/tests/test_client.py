@@ -0,0 +1,102 @@
+"""Tests for the pooled GitHub client and conditional-request cache against a local mock GitHub."""
+
+import base64
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase
+
+from core.integrations.github.service import GitHubService
+
+
+class MockGitHubHandler(BaseHTTPRequestHandler):
+    """Serves repo contents with ETags; one handler instance per TCP connection."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_GET(self):  # noqa: N802
+        path = self.path.split('?', 1)[0]
+        if path.endswith('/contents/README.md'):
+            body = {'content': base64.b64encode(b'# Demo').decode(), 'encoding': 'base64'}
+        elif path.endswith('/contents/requirements.txt'):
+            body = {'content': base64.b64encode(b'django\n').decode(), 'encoding': 'base64'}
+        elif path.endswith('/git/trees/HEAD'):
+            body = {'tree': [{'path': 'README.md', 'type': 'blob'}, {'path': 'app.py', 'type': 'blob'}]}
+        else:
+            self._reply(404, b'{"message": "Not Found"}')
+            return
+
+        etag = f'"{path}"'
+        with self.server.lock:
+            self.server.requests += 1
+            if self.headers.get('If-None-Match') == etag:
+                self.server.conditional_hits += 1
+                not_modified = True
+            else:
+                not_modified = False
+        if not_modified:
+            self._reply(304, b'', etag)
+        else:
+            self._reply(200, json.dumps(body).encode(), etag)
+
+    def _reply(self, status, body, etag=None):
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        if etag:
+            self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PooledConditionalGitHubClientTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), MockGitHubHandler)
+        self.server.lock = threading.Lock()
+        self.server.connections = self.server.requests = self.server.conditional_hits = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        base_url = patch.object(GitHubService, 'BASE_URL', f'http://127.0.0.1:{self.server.server_port}')
+        base_url.start()
+        self.addCleanup(base_url.stop)
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_repeat_reads_reuse_connections_and_revalidate(self):
+        """Test that a second import reuses pooled connections and is answered with 304s"""
+        service = GitHubService('token-a')
+
+        first = service.get_repository_info_sync('octo', 'demo')
+        connections_after_first = self.server.connections
+        second = service.get_repository_info_sync('octo', 'demo')
+
+        self.assertEqual(first, second)
+        self.assertEqual(first['readme'], '# Demo')
+        self.assertEqual(first['dependencies']['requirements.txt'], 'django\n')
+        self.assertEqual(len(first['tree']), 2)
+        # README, tree and requirements.txt carry ETags; the second round revalidates all three
+        self.assertEqual(self.server.requests, 6)
+        self.assertEqual(self.server.conditional_hits, 3)
+        # The sync wrapper runs on one long-lived loop, so the pool survives between calls
+        self.assertEqual(self.server.connections, connections_after_first)
+
+    def test_cache_is_scoped_to_token(self):
+        """Test that another token doesn't revalidate against responses it may not be allowed to see"""
+        GitHubService('token-a').get_repository_info_sync('octo', 'demo')
+
+        GitHubService('token-b').get_repository_info_sync('octo', 'demo')
+
+        self.assertEqual(self.server.conditional_hits, 0)
@@ -0,0 +1,29 @@
+# Generated by Django 5.1.15 on 2026-10-18 00:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('integrations', '0013_remove_reddit_agent_tables'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rssfeedagent',
+            name='feed_etag',
+            field=models.CharField(
+                blank=True, default='', help_text='ETag of the last processed feed response', max_length=255
+            ),
+        ),
+        migrations.AddField(
+            model_name='rssfeedagent',
+            name='feed_last_modified',
+            field=models.CharField(
+                blank=True,
+                default='',
+                help_text='Last-Modified header of the last processed feed response',
+                max_length=64,
+            ),
+        ),
+    ]
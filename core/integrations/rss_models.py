@@ -101,6 +101,21 @@ class RSSFeedAgent(models.Model):
         help_text='Error message from last failed sync',
     )
 
+    # HTTP validators from the last successful fetch (sent back as conditional request headers)
+    feed_etag = models.CharField(
+        max_length=255,
+        blank=True,
+        default='',
+        help_text='ETag of the last processed feed response',
+    )
+
+    feed_last_modified = models.CharField(
+        max_length=64,
+        blank=True,
+        default='',
+        help_text='Last-Modified header of the last processed feed response',
+    )
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
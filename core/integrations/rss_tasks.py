@@ -4,7 +4,7 @@ import logging
 
 from celery import shared_task
 
-from core.integrations.rss_models import RSSFeedAgent
+from core.integrations.rss_models import RSSFeedAgent, RSSFeedItem
 from core.logging_utils import StructuredLogger
 from services.integrations.rss.sync import RSSFeedSyncService
 
@@ -20,7 +20,7 @@ def sync_all_rss_agents_task(self):
     1. Fetches RSS feeds for all active RSS agents
     2. Creates new projects for new RSS feed items
     3. Updates existing projects with fresh content
-    4. Applies AI-based topic extraction and difficulty detection
+    4. Queues AI enrichment (review, topics, difficulty, images) on the rss_enrichment queue
 
     Returns:
         dict with sync results
@@ -103,3 +103,36 @@ def sync_all_rss_agents_task(self):
         logger.error(f'RSS sync task failed: {e}', exc_info=True)
         # Retry with exponential backoff
         raise self.retry(exc=e, countdown=300, max_retries=3) from e  # 5 min, 10 min, 20 min
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    rate_limit='30/m',  # Per worker; bounds paid AI calls when a large sync queues many items
+    time_limit=600,
+    soft_time_limit=540,
+)
+def enrich_rss_item_task(self, feed_item_pk: int, generate_review: bool = False):
+    """
+    Run the AI enrichment steps for one RSS feed item.
+
+    Queued by RSSFeedSyncService after a sync commits; routed to the
+    rss_enrichment queue so AI latency never holds up feed syncing or
+    the default queue.
+
+    Args:
+        feed_item_pk: RSSFeedItem primary key
+        generate_review: Generate the curator's expert review (new items)
+    """
+    try:
+        feed_item = RSSFeedItem.objects.select_related('project', 'agent__agent_user').get(pk=feed_item_pk)
+    except RSSFeedItem.DoesNotExist:
+        logger.warning(f'RSS feed item {feed_item_pk} no longer exists, skipping enrichment')
+        return {'success': False, 'error': 'not_found'}
+
+    try:
+        RSSFeedSyncService.enrich_feed_item(feed_item, generate_review=generate_review)
+        return {'success': True, 'project_id': feed_item.project_id}
+    except Exception as e:
+        logger.error(f'RSS enrichment failed for feed item {feed_item_pk}: {e}', exc_info=True)
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries)) from e
@@ -0,0 +1,284 @@
+"""Tests for RSS feed fetching and set-based item sync."""
+
+# ruff: noqa: S106
+import threading
+import time
+from datetime import UTC, datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.integrations.rss_models import RSSFeedAgent, RSSFeedItem
+from core.projects.models import Project
+from services.integrations.rss.sync import FeedFetchResult, RSSFeedParser, RSSFeedSyncService
+
+User = get_user_model()
+
+FEED_XML = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>Fixture</title>
+<item><title>Hello</title><link>https://example.com/hello</link><guid>hello-1</guid></item>
+</channel></rss>"""
+
+FEED_ETAG = '"fixture-v1"'
+
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """Serves FEED_XML with an ETag and answers matching conditional requests with 304."""
+
+    def do_GET(self):  # noqa: N802
+        server = self.server
+        with server.lock:
+            server.active += 1
+            server.max_active = max(server.max_active, server.active)
+        try:
+            time.sleep(server.delay)
+            if self.headers.get('If-None-Match') == FEED_ETAG:
+                server.not_modified += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            server.full += 1
+            body = FEED_XML.encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/rss+xml')
+            self.send_header('ETag', FEED_ETAG)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RSSConditionalFetchTest(SimpleTestCase):
+    """Fetch feeds from a local HTTP server that supports ETag revalidation."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+        self.server.lock = threading.Lock()
+        self.server.active = self.server.max_active = 0
+        self.server.full = self.server.not_modified = 0
+        self.server.delay = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.feed_url = f'http://127.0.0.1:{self.server.server_port}/feed.xml'
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _agent(self, agent_id=1):
+        return RSSFeedAgent(id=agent_id, name=f'Agent {agent_id}', source_name='Fixture', feed_url=self.feed_url)
+
+    def test_second_sync_is_not_modified_and_skips_parsing(self):
+        """Test that stored validators turn the second sync into a 304 with no parse"""
+        agent = self._agent()
+
+        with (
+            patch.object(RSSFeedAgent, 'save'),
+            patch.object(RSSFeedParser, 'parse_feed', wraps=RSSFeedParser.parse_feed) as parse_feed,
+            patch.object(
+                RSSFeedSyncService,
+                '_sync_items',
+                side_effect=lambda agent, items, results: results.update(created=len(items)),
+            ),
+        ):
+            first = RSSFeedSyncService.sync_agent(agent)
+            second = RSSFeedSyncService.sync_agent(agent)
+
+        self.assertEqual(first['created'], 1)
+        self.assertEqual(agent.feed_etag, FEED_ETAG)
+        self.assertTrue(second['not_modified'])
+        self.assertEqual(parse_feed.call_count, 1)
+        self.assertEqual((self.server.full, self.server.not_modified), (1, 1))
+
+    def test_fetch_feeds_caps_concurrency_per_host(self):
+        """Test that concurrent fetches to one host never exceed the per-host cap"""
+        self.server.delay = 0.1
+        agents = [self._agent(agent_id) for agent_id in range(1, 7)]
+
+        results = RSSFeedSyncService.fetch_feeds(agents)
+
+        self.assertEqual(set(results), {agent.id for agent in agents})
+        self.assertTrue(all(result.text == FEED_XML for result in results.values()))
+        self.assertLessEqual(self.server.max_active, RSSFeedSyncService.MAX_FETCHES_PER_HOST)
+
+    def test_fetch_error_is_reported_not_raised(self):
+        """Test that a failing feed becomes an error result instead of aborting the batch"""
+        agent = self._agent()
+        agent.feed_url = 'http://127.0.0.1:1/feed.xml'  # Nothing listens on port 1
+
+        result = RSSFeedSyncService.fetch_feed(agent)
+
+        self.assertIsNotNone(result.error)
+
+
+def _feed_items(count, prefix='item'):
+    return [
+        {
+            'feed_item_id': f'{prefix}-{i}',
+            'title': f'Article {i}',
+            'description': f'Summary of article {i}',
+            'permalink': f'https://example.com/{prefix}/{i}',
+            'author': 'Writer',
+            'thumbnail_url': '',
+            'categories': ['AI'],
+            'published_at': datetime(2025, 6, 1, tzinfo=UTC),
+        }
+        for i in range(count)
+    ]
+
+
+AI_STEPS = (
+    '_generate_expert_review',
+    '_extract_topics_from_article',
+    '_detect_difficulty_level',
+    '_generate_hero_image',
+)
+
+
+class RSSSetBasedSyncTest(TestCase):
+    """Sync parsed items with bulk writes and enrichment deferred to a task."""
+
+    def setUp(self):
+        for name in AI_STEPS:
+            patcher = patch.object(RSSFeedSyncService, name, side_effect=AssertionError('AI call on sync path'))
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.user = User.objects.create_user(username='curator', email='curator@test.com', password='testpass123')
+        self.agent = RSSFeedAgent.objects.create(
+            agent_user=self.user, name='Curator', source_name='Fixture', feed_url='https://example.com/feed.xml'
+        )
+
+    def _sync(self, items):
+        results = {'created': 0, 'updated': 0, 'errors': 0, 'error_messages': []}
+        with patch.object(RSSFeedSyncService, '_queue_enrichment') as queue:
+            with self.captureOnCommitCallbacks(execute=True):
+                RSSFeedSyncService._sync_items(self.agent, items, results)
+        queued = queue.call_args.args[0] if queue.called else []
+        return results, queued
+
+    def test_new_items_are_bulk_created_in_minimal_state(self):
+        """Test that 200 new items cost a constant number of queries and no AI calls"""
+        start = time.perf_counter()
+        with CaptureQueriesContext(connection) as queries:
+            results, queued = self._sync(_feed_items(200))
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(results['created'], 200)
+        self.assertLess(len(queries), 15)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(len(queued), 200)
+        self.assertTrue(all(generate_review for _, generate_review in queued))
+        self.assertEqual(Project.objects.filter(user=self.user).values('slug').distinct().count(), 200)
+        self.assertFalse(Project.objects.filter(user=self.user).exclude(created_at=datetime(2025, 6, 1, tzinfo=UTC)))
+
+    def test_known_items_are_updated_not_recreated(self):
+        """Test that a re-sync diffs by GUID and only bulk-updates metadata"""
+        self._sync(_feed_items(5))
+        RSSFeedItem.objects.update(rss_metadata={'enriched_at': '2025-06-02T00:00:00+00:00'})
+
+        results, queued = self._sync(_feed_items(5) + _feed_items(1, prefix='fresh'))
+
+        self.assertEqual((results['created'], results['updated']), (1, 5))
+        self.assertEqual(queued, [(RSSFeedItem.objects.get(feed_item_id='fresh-0').pk, True)])
+        self.assertEqual(RSSFeedItem.objects.filter(agent=self.agent).count(), 6)
+        self.assertEqual(
+            RSSFeedItem.objects.get(feed_item_id='item-0').rss_metadata['enriched_at'], '2025-06-02T00:00:00+00:00'
+        )
+
+    def test_duplicate_slugs_get_suffixes(self):
+        """Test that same-titled articles get unique slugs without per-row queries"""
+        items = _feed_items(3)
+        for item in items:
+            item['title'] = 'Same Title'
+
+        self._sync(items)
+
+        self.assertCountEqual(
+            Project.objects.filter(user=self.user).values_list('slug', flat=True),
+            ['same-title', 'same-title-2', 'same-title-3'],
+        )
+
+    def test_sync_agent_reports_counts(self):
+        """Test that sync_agent runs the set-based path for a parsed feed"""
+        with (
+            patch.object(RSSFeedParser, 'parse_feed', return_value=_feed_items(3)),
+            patch.object(RSSFeedSyncService, '_queue_enrichment'),
+        ):
+            results = RSSFeedSyncService.sync_agent(self.agent, fetched=FeedFetchResult(text=FEED_XML))
+
+        self.assertEqual((results['created'], results['errors']), (3, 0))
+
+    def test_failed_item_processing_keeps_validators(self):
+        """Test that a sync whose item writes fail is not recorded as a success"""
+        self.agent.feed_etag = '"old"'
+        self.agent.save()
+
+        with (
+            patch.object(RSSFeedParser, 'parse_feed', return_value=_feed_items(3)),
+            patch.object(RSSFeedSyncService, '_sync_items', side_effect=RuntimeError('database went away')),
+        ):
+            results = RSSFeedSyncService.sync_agent(
+                self.agent, fetched=FeedFetchResult(text=FEED_XML, etag='"new"', last_modified='today')
+            )
+
+        self.agent.refresh_from_db()
+        self.assertEqual(results['errors'], 1)
+        self.assertEqual((self.agent.feed_etag, self.agent.feed_last_modified), ('"old"', ''))
+        self.assertTrue(self.agent.last_sync_status.startswith('Failed'))
+        self.assertEqual(self.agent.last_sync_error, 'database went away')
+
+    def test_long_titles_get_slugs_within_max_length(self):
+        """Test that slugs, including suffixed ones, fit Project.slug"""
+        items = _feed_items(2)
+        for item in items:
+            item['title'] = ' '.join(['Headline'] * 27)  # 242 characters
+
+        results, _ = self._sync(items)
+
+        slugs = list(Project.objects.filter(user=self.user).values_list('slug', flat=True))
+        self.assertEqual(results['created'], 2)
+        self.assertEqual(len(set(slugs)), 2)
+        self.assertTrue(all(len(slug) <= Project._meta.get_field('slug').max_length for slug in slugs))
+
+    def test_invalid_item_is_skipped_not_the_batch(self):
+        """Test that one item the database would reject is recorded and the rest are created"""
+        items = _feed_items(3)
+        items[1]['author'] = 'A' * 300
+        items[2]['permalink'] = 'not a url'
+
+        results, queued = self._sync(items)
+
+        self.assertEqual((results['created'], results['errors']), (1, 2))
+        self.assertEqual(len(queued), 1)
+        self.assertIn('author', results['error_messages'][0])
+        self.assertEqual(list(RSSFeedItem.objects.values_list('feed_item_id', flat=True)), ['item-0'])
+
+    def test_enrichment_skips_review_once_recorded(self):
+        """Test that a re-queued enrichment doesn't pay for the expert review twice"""
+        self._sync(_feed_items(1))
+        feed_item = RSSFeedItem.objects.select_related('project', 'agent').get()
+
+        with (
+            patch.object(RSSFeedSyncService, '_generate_expert_review', return_value='Expert take') as review,
+            patch.object(RSSFeedSyncService, '_extract_topics_from_article', return_value=[]),
+            patch.object(RSSFeedSyncService, '_detect_difficulty_level', return_value='beginner'),
+            patch.object(RSSFeedSyncService, '_generate_hero_image', return_value=None),
+            patch.object(RSSFeedSyncService, '_add_categories_to_project'),
+            patch.object(RSSFeedSyncService, '_add_tools_to_project'),
+            patch('services.tagging.tasks.tag_content_task'),
+        ):
+            RSSFeedSyncService.enrich_feed_item(feed_item, generate_review=True)
+            feed_item.refresh_from_db()
+            RSSFeedSyncService.enrich_feed_item(feed_item, generate_review=True)
+
+        self.assertEqual(review.call_count, 1)
+        self.assertIn('expert_review_at', feed_item.rss_metadata)
+        self.assertEqual(Project.objects.get().description, 'Expert take')
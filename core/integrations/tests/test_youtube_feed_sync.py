@@ -0,0 +1,96 @@
+# ruff: noqa: S106
+"""Tests for batched YouTube feed syncing."""
+
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.integrations.youtube.service import YouTubeService
+from core.integrations.youtube_feed_models import YouTubeFeedAgent
+from services.integrations.youtube_feed.sync import YouTubeFeedSyncService
+
+User = get_user_model()
+
+VIDEO_IDS = [f'video{i:05d}' for i in range(50)]
+
+
+class StubYouTubeService(YouTubeService):
+    """Answers videos.list from fixtures and counts API requests."""
+
+    def __init__(self):
+        super().__init__(api_key='test-key')
+        self.requests = []
+
+    def _make_request(self, endpoint, params):
+        video_ids = params['id'].split(',')
+        self.requests.append((endpoint, video_ids))
+        return {'items': [self._item(video_id) for video_id in video_ids]}
+
+    def _is_vertical_video(self, thumbnails):
+        return False
+
+    @staticmethod
+    def _item(video_id):
+        index = int(video_id[-5:])
+        return {
+            'id': video_id,
+            'snippet': {
+                'title': f'Title {video_id}',
+                'description': 'A long enough description for a regular video upload.',
+                'channelId': 'UC123',
+                'channelTitle': 'Channel',
+                'thumbnails': {},
+                'publishedAt': '2024-05-01T00:00:00Z' if index % 10 == 0 else '2025-05-01T00:00:00Z',
+            },
+            'contentDetails': {'duration': 'PT45S' if index % 2 else 'PT10M'},
+        }
+
+
+class YouTubeFeedBatchSyncTest(TestCase):
+    """Sync a 50-video channel with one existence query and one videos.list call."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='channel', email='channel@test.com', password='testpass123')
+        self.agent = YouTubeFeedAgent.objects.create(
+            agent_user=self.user,
+            name='Channel',
+            channel_url='https://www.youtube.com/@channel',
+            channel_id='UC123',
+            channel_name='Channel',
+        )
+        self.service = StubYouTubeService()
+
+    def _sync(self):
+        with (
+            patch('services.integrations.youtube_feed.sync.YouTubeService', return_value=self.service),
+            patch('services.integrations.youtube_feed.sync.check_channel_rss_for_new_videos', return_value=VIDEO_IDS),
+            patch.object(YouTubeFeedSyncService, '_create_video_project') as create,
+            CaptureQueriesContext(connection) as queries,
+        ):
+            results = YouTubeFeedSyncService.sync_agent(self.agent)
+        return results, create, queries
+
+    def test_fifty_videos_cost_one_api_call_and_constant_queries(self):
+        """Test that details for 50 videos come from a single batched request"""
+        results, create, queries = self._sync()
+
+        self.assertEqual(len(self.service.requests), 1)
+        self.assertEqual(self.service.requests[0], ('/videos', VIDEO_IDS))
+        self.assertEqual(create.call_count, 45)  # Every 10th video is from 2024
+        self.assertEqual((results['created'], results['skipped'], results['errors']), (45, 5, 0))
+        existence_queries = [q for q in queries.captured_queries if 'youtube_feed_videos' in q['sql']]
+        self.assertEqual(len(existence_queries), 2)  # Known IDs for the agent + global existence check
+
+    def test_shorts_filter_runs_on_the_batch(self):
+        """Test that shorts_only filters fetched details in memory"""
+        self.agent.settings = {'shorts_only': True}
+        self.agent.save()
+
+        results, create, _ = self._sync()
+
+        self.assertEqual(len(self.service.requests), 1)
+        self.assertEqual(results['created'], 25)  # Odd indexes are 45s Shorts; none of them is a 2024 upload
+        self.assertEqual(create.call_count, 25)
@@ -121,6 +121,7 @@ class YouTubeService:
     """YouTube Data API v3 client - SYNCHRONOUS for Celery compatibility."""
 
     BASE_URL = 'https://www.googleapis.com/youtube/v3'
+    MAX_VIDEO_IDS_PER_REQUEST = 50  # videos.list limit for the comma-separated id parameter
 
     def __init__(self, oauth_token: str = None, api_key: str = None):
         """
@@ -240,13 +241,44 @@ class YouTubeService:
         if not data.get('items'):
             raise IntegrationNotFoundError(f'Video {video_id} not found', integration_name='youtube')
 
-        item = data['items'][0]
+        return self._parse_video_item(data['items'][0])
+
+    def get_videos_info(self, video_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """
+        Fetch metadata for many videos with batched videos.list calls.
+
+        Each request covers up to MAX_VIDEO_IDS_PER_REQUEST IDs and costs one
+        quota unit, the same as a single get_video_info call.
+
+        Args:
+            video_ids: YouTube video IDs
+
+        Returns:
+            Mapping of video ID -> metadata dict (same shape as get_video_info).
+            Videos the API doesn't return (deleted, private) are absent.
+
+        Raises:
+            IntegrationError: If a request fails
+            QuotaExceededError: If API quota exceeded
+            CircuitBreakerError: If circuit breaker is open
+        """
+        videos = {}
+        for start in range(0, len(video_ids), self.MAX_VIDEO_IDS_PER_REQUEST):
+            chunk = video_ids[start : start + self.MAX_VIDEO_IDS_PER_REQUEST]
+            logger.debug(f'Fetching video info for {len(chunk)} videos')
+            data = self._make_request('/videos', {'part': 'snippet,contentDetails,statistics', 'id': ','.join(chunk)})
+            for item in data.get('items', []):
+                videos[item['id']] = self._parse_video_item(item)
+        return videos
+
+    def _parse_video_item(self, item: dict) -> dict[str, Any]:
+        """Convert a videos.list resource into our video metadata dict."""
         snippet = item['snippet']
         content_details = item['contentDetails']
         statistics = item.get('statistics', {})
 
         return {
-            'video_id': video_id,
+            'video_id': item['id'],
             'title': snippet['title'],
             'description': snippet['description'],
             'channel_id': snippet['channelId'],
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('learning_paths', '0019_add_sections_organization'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TopicContentCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('topic', models.CharField(help_text='Normalized (slugified) topic', max_length=200)),
+                ('modality', models.CharField(max_length=30)),
+                ('count', models.PositiveIntegerField(default=0)),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Topic Content Count',
+                'verbose_name_plural': 'Topic Content Counts',
+                'unique_together': {('topic', 'modality')},
+            },
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.15 on 2026-10-18 22:25
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('learning_paths', '0020_topiccontentcount'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='topiccontentcount',
+            name='requested_at',
+            field=models.DateTimeField(
+                default=django.utils.timezone.now,
+                help_text='Last time the topic was looked up (refreshed at most daily)',
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='topiccontentcount',
+            index=models.Index(fields=['requested_at'], name='learning_pa_request_aa8421_idx'),
+        ),
+    ]
@@ -1065,6 +1065,42 @@ class ContentGap(models.Model):
         return f'{self.topic} / {self.modality} ({self.request_count} requests)'
 
 
+class TopicContentCount(models.Model):
+    """
+    Precomputed count of available content per topic and modality.
+
+    Counting content live means several icontains scans across joined tables per
+    modality, so the counts are computed once per topic and refreshed by a
+    periodic task. Looking up a topic's modalities is a single indexed query.
+
+    Topics are free text, so rows for topics outside the taxonomy are pruned once
+    nobody has asked for them within the retention window (see requested_at).
+    """
+
+    topic = models.CharField(
+        max_length=200,
+        help_text='Normalized (slugified) topic',
+    )
+    modality = models.CharField(max_length=30)
+    count = models.PositiveIntegerField(default=0)
+    computed_at = models.DateTimeField(auto_now=True)
+    requested_at = models.DateTimeField(
+        default=timezone.now,
+        help_text='Last time the topic was looked up (refreshed at most daily)',
+    )
+
+    class Meta:
+        unique_together = ['topic', 'modality']
+        indexes = [
+            models.Index(fields=['requested_at']),
+        ]
+        verbose_name = 'Topic Content Count'
+        verbose_name_plural = 'Topic Content Counts'
+
+    def __str__(self):
+        return f'{self.topic} / {self.modality}: {self.count}'
+
+
 # ============================================================================
 # LEARNING OUTCOME - What users will achieve
 # ============================================================================
@@ -27,6 +27,7 @@ from .models import (
     LearningEvent,
     MicroLesson,
     ProjectLearningMetadata,
+    TopicContentCount,
     UserConceptMastery,
     UserLearningPath,
 )
@@ -975,6 +976,11 @@ class LearningContentService:
         ('projects', 'Study a Project', 'Learn from examples'),
     ]
 
+    # How often a lookup refreshes TopicContentCount.requested_at, and how long a
+    # topic outside the taxonomy is kept (and recounted) after its last lookup
+    TOPIC_REQUEST_TOUCH_INTERVAL = timedelta(days=1)
+    TOPIC_COUNT_RETENTION = timedelta(days=30)
+
     # Map modalities to content sources
     MODALITY_CONTENT_MAP = {
         'video': ['youtube', 'video_projects'],
@@ -1121,10 +1127,11 @@ class LearningContentService:
         Only returns modalities with actual content (hides empty ones).
         """
         topic_slug = cls._normalize_topic(topic)
+        counts = await cls._get_content_counts(topic_slug)
         available = []
 
         for modality, display, description in cls.MODALITY_CHOICES:
-            count = await cls._count_content(topic_slug, modality)
+            count = counts.get(modality, 0)
             if count > 0:
                 available.append(
                     {
@@ -1146,8 +1153,61 @@ class LearningContentService:
 
     @classmethod
     @sync_to_async
-    def _count_content(cls, topic: str, modality: str) -> int:
-        """Count available content for topic+modality."""
+    def _get_content_counts(cls, topic: str) -> dict[str, int]:
+        """
+        Get content counts per modality for a normalized topic.
+
+        Reads the precomputed TopicContentCount rows in one indexed query. A topic
+        that has not been counted yet is counted live and stored for next time.
+        """
+        topic = topic[:200]
+        rows = TopicContentCount.objects.filter(topic=topic).values_list('modality', 'count', 'requested_at')
+        counts = {modality: count for modality, count, _ in rows}
+        if len(counts) < len(cls.MODALITY_CHOICES):
+            return cls.refresh_topic_counts(topic)
+
+        # Keep the topic out of the stale-row pruning (one write per topic per day at most)
+        now = timezone.now()
+        if min(requested_at for _, _, requested_at in rows) < now - cls.TOPIC_REQUEST_TOUCH_INTERVAL:
+            TopicContentCount.objects.filter(topic=topic).update(requested_at=now)
+        return counts
+
+    @classmethod
+    def refresh_topic_counts(cls, topic: str) -> dict[str, int]:
+        """
+        Recount content for every modality of a topic and store the counts.
+
+        A modality whose count fails keeps its stored count instead of being
+        overwritten with 0 (and is reported from that stored count).
+        """
+        topic = topic[:200]
+        counts = {modality: cls._count_content(topic, modality) for modality, _, _ in cls.MODALITY_CHOICES}
+        TopicContentCount.objects.bulk_create(
+            [
+                TopicContentCount(topic=topic, modality=modality, count=n)
+                for modality, n in counts.items()
+                if n is not None
+            ],
+            update_conflicts=True,
+            unique_fields=['topic', 'modality'],
+            update_fields=['count', 'computed_at'],
+        )
+
+        failed = [modality for modality, n in counts.items() if n is None]
+        if failed:
+            stored = dict(
+                TopicContentCount.objects.filter(topic=topic, modality__in=failed).values_list('modality', 'count')
+            )
+            counts.update({modality: stored.get(modality, 0) for modality in failed})
+        return counts
+
+    @classmethod
+    def _count_content(cls, topic: str, modality: str) -> int | None:
+        """
+        Count available content for topic+modality (distinct rows, despite the M2M joins).
+
+        Returns None if counting failed, so callers can keep the previous count.
+        """
         count = 0
 
         try:
@@ -1159,7 +1219,7 @@ class LearningContentService:
                     models.Q(tags__icontains=topic)
                     | models.Q(project__title__icontains=topic)
                     | models.Q(project__topics__name__icontains=topic)
-                ).count()
+                ).distinct().count()
 
             elif modality == 'quiz-challenges':
                 # Count quizzes
@@ -1169,7 +1229,8 @@ class LearningContentService:
                     Quiz.objects.filter(
                         is_published=True,
                     )
-                    .filter(models.Q(topic__icontains=topic) | models.Q(topics__name__icontains=topic))
+                    .filter(models.Q(topics__slug__icontains=topic) | models.Q(topics__name__icontains=topic))
+                    .distinct()
                     .count()
                 )
 
@@ -1198,6 +1259,7 @@ class LearningContentService:
                         | models.Q(project__title__icontains=topic)
                         | models.Q(project__topics__name__icontains=topic)
                     )
+                    .distinct()
                     .count()
                 )
 
@@ -1213,11 +1275,13 @@ class LearningContentService:
                         project__topics__name__icontains='games',
                     )
                     .filter(models.Q(key_techniques__icontains=topic) | models.Q(project__title__icontains=topic))
+                    .distinct()
                     .count()
                 )
 
         except Exception as e:
             logger.warning(f'Error counting content for {topic}/{modality}: {e}')
+            return None
 
         return count
 
@@ -3,6 +3,7 @@ Celery tasks for learning paths.
 
 Handles:
 - Cover image generation with Gemini for SavedLearningPath
+- Refreshing precomputed topic/modality content counts
 """
 
 import logging
@@ -11,6 +12,7 @@ import uuid
 
 from celery import shared_task
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 
 from core.ai_usage.tracker import AIUsageTracker
 from services.ai import AIProvider
@@ -697,3 +699,38 @@ def generate_lesson_images_for_path(self, saved_path_id: int, user_id: int):
         except self.MaxRetriesExceededError:
             logger.error(f'Lesson image generation failed after max retries: {exc}')
             return {'status': 'error', 'reason': 'max_retries_exceeded'}
+
+
+@shared_task
+def refresh_topic_content_counts():
+    """
+    Recount available content for canonical and recently requested topics.
+
+    Canonical topics are the active topic taxonomies, so new content shows up
+    within one run. Other (free-text) topics are recounted while they have been
+    looked up within LearningContentService.TOPIC_COUNT_RETENTION and pruned
+    after that, which keeps the run bounded by what users actually ask for.
+    """
+    from core.taxonomy.models import Taxonomy
+
+    from .models import TopicContentCount
+    from .services import LearningContentService
+
+    canonical = set(Taxonomy.objects.filter(taxonomy_type='topic', is_active=True).values_list('slug', flat=True))
+    cutoff = timezone.now() - LearningContentService.TOPIC_COUNT_RETENTION
+
+    pruned, _ = TopicContentCount.objects.filter(requested_at__lt=cutoff).exclude(topic__in=canonical).delete()
+
+    topics = canonical | set(
+        TopicContentCount.objects.filter(requested_at__gte=cutoff).values_list('topic', flat=True).distinct()
+    )
+
+    start = time.monotonic()
+    for topic in sorted(topics):
+        LearningContentService.refresh_topic_counts(topic)
+
+    logger.info(
+        f'Refreshed content counts for {len(topics)} topics in {time.monotonic() - start:.1f}s '
+        f'(pruned {pruned} stale rows)'
+    )
+    return {'status': 'success', 'topics': len(topics), 'pruned': pruned}
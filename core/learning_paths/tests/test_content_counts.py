@@ -0,0 +1,157 @@
+"""
+Tests for precomputed topic/modality content counts.
+
+Covers the single-query modality lookup, lazy counting of new topics,
+distinct counting across M2M joins, and the periodic refresh task
+(including pruning of stale free-text topics and keeping counts on failure).
+"""
+
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.utils import timezone
+
+from core.learning_paths.models import Concept, MicroLesson, TopicContentCount
+from core.learning_paths.services import LearningContentService
+from core.learning_paths.tasks import refresh_topic_content_counts
+from core.quizzes.models import Quiz
+from core.taxonomy.models import Taxonomy
+from core.users.models import User
+
+
+def get_available_modalities(topic):
+    return async_to_sync(LearningContentService.get_available_modalities)(topic, user_id=1)
+
+
+@pytest.fixture
+def user(db):
+    """Create a quiz author."""
+    return User.objects.create_user(
+        username='countauthor',
+        email='countauthor@example.com',
+        password='testpass123',
+    )
+
+
+@pytest.fixture
+def rag_lessons(db):
+    """Create a concept in the 'rag' topic with two active micro lessons."""
+    concept = Concept.objects.create(name='Retrieval', slug='retrieval', topic='rag')
+    for i in range(2):
+        MicroLesson.objects.create(
+            title=f'Retrieval {i}',
+            slug=f'retrieval-{i}',
+            concept=concept,
+            content_template='Lesson body',
+        )
+    return concept
+
+
+@pytest.mark.django_db
+class TestTopicContentCounts:
+    def test_counted_topic_is_one_query(self, django_assert_num_queries):
+        """Modalities for an already counted topic come from one indexed lookup."""
+        counts = {'video': 0, 'long-reads': 4, 'microlearning': 4, 'quiz-challenges': 2, 'games': 0, 'projects': 1}
+        TopicContentCount.objects.bulk_create(
+            TopicContentCount(topic='rag', modality=modality, count=count) for modality, count in counts.items()
+        )
+
+        with django_assert_num_queries(1):
+            available = get_available_modalities('RAG')
+
+        assert {item['modality']: item['available_count'] for item in available} == {
+            'long-reads': 4,
+            'microlearning': 4,
+            'quiz-challenges': 2,
+            'projects': 1,
+        }
+
+    def test_new_topic_is_counted_once_and_stored(self, rag_lessons, django_assert_num_queries):
+        """The first lookup counts live and stores the result for the next one."""
+        available = get_available_modalities('rag')
+
+        assert {item['modality']: item['available_count'] for item in available} == {
+            'long-reads': 2,
+            'microlearning': 2,
+        }
+        assert TopicContentCount.objects.filter(topic='rag').count() == len(LearningContentService.MODALITY_CHOICES)
+
+        with django_assert_num_queries(1):
+            get_available_modalities('rag')
+
+    def test_m2m_matches_are_counted_once(self, user):
+        """A quiz tagged with two matching topics counts as one quiz."""
+        quiz = Quiz.objects.create(
+            title='RAG quiz',
+            slug='rag-quiz',
+            description='Test your RAG knowledge',
+            estimated_time=5,
+            is_published=True,
+            created_by=user,
+        )
+        quiz.topics.set(
+            [
+                Taxonomy.objects.create(name='RAG Basics', slug='rag-basics', taxonomy_type='topic'),
+                Taxonomy.objects.create(name='Advanced RAG', slug='advanced-rag', taxonomy_type='topic'),
+            ]
+        )
+
+        assert LearningContentService.refresh_topic_counts('rag')['quiz-challenges'] == 1
+
+    def test_refresh_task_recounts_known_topics(self, rag_lessons):
+        """The periodic task updates stale counts for topics already in the table."""
+        TopicContentCount.objects.create(topic='rag', modality='microlearning', count=0)
+
+        result = refresh_topic_content_counts()
+
+        assert result['topics'] >= 1
+        assert TopicContentCount.objects.get(topic='rag', modality='microlearning').count == 2
+
+    def test_lookup_touches_stale_requested_at(self, django_assert_num_queries):
+        """A lookup refreshes requested_at once it is older than a day, so the topic is kept."""
+        stale = timezone.now() - timedelta(days=3)
+        TopicContentCount.objects.bulk_create(
+            TopicContentCount(topic='rag', modality=modality, count=1, requested_at=stale)
+            for modality, _, _ in LearningContentService.MODALITY_CHOICES
+        )
+
+        with django_assert_num_queries(2):
+            get_available_modalities('rag')
+        with django_assert_num_queries(1):
+            get_available_modalities('rag')
+
+        assert TopicContentCount.objects.filter(requested_at__lte=stale).count() == 0
+
+    def test_refresh_task_prunes_stale_free_text_topics(self, rag_lessons):
+        """Only canonical and recently requested topics are recounted; stale free-text topics are deleted."""
+        Taxonomy.objects.create(name='RAG', slug='rag', taxonomy_type='topic')
+        long_ago = timezone.now() - LearningContentService.TOPIC_COUNT_RETENTION - timedelta(days=1)
+        TopicContentCount.objects.create(topic='rag', modality='microlearning', count=0, requested_at=long_ago)
+        TopicContentCount.objects.create(topic='my-typo-topic', modality='video', count=0, requested_at=long_ago)
+        TopicContentCount.objects.create(topic='recent-question', modality='video', count=0)
+
+        with patch.object(LearningContentService, 'refresh_topic_counts') as refresh:
+            result = refresh_topic_content_counts()
+
+        assert result['pruned'] == 1
+        assert not TopicContentCount.objects.filter(topic='my-typo-topic').exists()
+        refreshed = {call.args[0] for call in refresh.call_args_list}
+        assert {'rag', 'recent-question'} <= refreshed
+        assert 'my-typo-topic' not in refreshed
+
+    def test_failed_count_keeps_stored_value(self, rag_lessons):
+        """A modality whose count raises keeps its previous count instead of dropping to 0."""
+        TopicContentCount.objects.create(topic='rag', modality='microlearning', count=7)
+        count_content = LearningContentService._count_content
+
+        def failing_microlearning(topic, modality):
+            return None if modality == 'microlearning' else count_content(topic, modality)
+
+        with patch.object(LearningContentService, '_count_content', side_effect=failing_microlearning):
+            counts = LearningContentService.refresh_topic_counts('rag')
+
+        assert counts['microlearning'] == 7
+        assert counts['long-reads'] == 2
+        assert TopicContentCount.objects.get(topic='rag', modality='microlearning').count == 7
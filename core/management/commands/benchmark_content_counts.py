@@ -0,0 +1,91 @@
+"""
+Django management command to benchmark learning-path modality availability lookups.
+
+Seeds --rows micro lessons (default 100k) spread over --topics topics, inside a
+transaction that is rolled back at the end, then compares per-topic latency and
+query counts of:
+- live counting (one icontains count per modality, the previous behaviour)
+- the precomputed TopicContentCount lookup used by get_available_modalities
+
+Usage:
+    python manage.py benchmark_content_counts --rows 100000 --topics 50
+"""
+
+import time
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+
+from core.learning_paths.models import Concept, MicroLesson
+from core.learning_paths.services import LearningContentService
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmark topic modality availability: live counts vs precomputed TopicContentCount lookups'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--rows', type=int, default=100_000, help='Micro lessons to seed (default: 100000)')
+        parser.add_argument('--topics', type=int, default=50, help='Distinct topics (default: 50)')
+
+    def handle(self, *args, **options):
+        rows = options['rows']
+        topics = [f'bench-topic-{i}' for i in range(options['topics'])]
+
+        self.stdout.write(f'Seeding {rows} micro lessons over {len(topics)} topics on {connection.vendor}...\n')
+        try:
+            with transaction.atomic():
+                self._seed(topics, rows)
+
+                self._report('live counts', topics, self._live_counts)
+                refresh_start = time.perf_counter()
+                for topic in topics:
+                    LearningContentService.refresh_topic_counts(topic)
+                refresh = time.perf_counter() - refresh_start
+                self.stdout.write(f'  (periodic refresh of {len(topics)} topics: {refresh:.2f}s)')
+                self._report(
+                    'precomputed lookup', topics, async_to_sync(LearningContentService.get_available_modalities)
+                )
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, topics, rows):
+        concepts = Concept.objects.bulk_create(
+            Concept(name=f'Bench {topic}', slug=f'bench-{topic}', topic=topic) for topic in topics
+        )
+        MicroLesson.objects.bulk_create(
+            (
+                MicroLesson(
+                    title=f'Bench lesson {i}',
+                    slug=f'bench-lesson-{i}',
+                    concept=concepts[i % len(concepts)],
+                    content_template='Benchmark lesson body',
+                )
+                for i in range(rows)
+            ),
+            batch_size=5000,
+        )
+
+    @staticmethod
+    def _live_counts(topic, user_id):
+        return {
+            modality: LearningContentService._count_content(topic, modality)
+            for modality, _, _ in LearningContentService.MODALITY_CHOICES
+        }
+
+    def _report(self, label, topics, lookup):
+        with CaptureQueriesContext(connection) as queries:
+            start = time.perf_counter()
+            for topic in topics:
+                lookup(topic, user_id=1)
+            elapsed = time.perf_counter() - start
+        self.stdout.write(
+            f'  {label:<20} {elapsed / len(topics) * 1000:>9.2f} ms/topic   '
+            f'{len(queries) / len(topics):.1f} queries/topic'
+        )
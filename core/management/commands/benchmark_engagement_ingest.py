@@ -0,0 +1,104 @@
+"""
+Django management command to benchmark engagement event ingest.
+
+Compares, for 50-event payloads:
+- legacy: one EngagementEvent.objects.create per event on the request path
+- stream append: what the batch endpoint now does per request (one pipelined XADD)
+- stream drain: what drain_engagement_stream does per chunk (read, bulk_create, ack)
+
+Database writes happen inside a transaction that is rolled back, and the
+stream runs on a throwaway key that is deleted afterwards.
+
+Usage:
+    python manage.py benchmark_engagement_ingest --payloads 200
+"""
+
+import secrets
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from core.engagement.models import EngagementEvent
+from core.engagement.stream import EngagementStream
+from core.users.models import User
+
+BATCH_SIZE = 50
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmark engagement ingest events/sec: per-row creates vs Redis stream append + bulk drain'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--payloads', type=int, default=100, help='Number of 50-event payloads (default: 100)')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Drain chunk size (default: 1000)')
+
+    def handle(self, *args, **options):
+        payloads = options['payloads']
+        chunk_size = options['chunk_size']
+        total = payloads * BATCH_SIZE
+        events = [
+            {'event_type': EngagementEvent.EventType.TIME_SPENT, 'project_id': None, 'payload': {'seconds': i}}
+            for i in range(BATCH_SIZE)
+        ]
+
+        self.stdout.write(f'Benchmarking {payloads} payloads x {BATCH_SIZE} events ({total} events)...\n')
+
+        stream = EngagementStream(key=f'engagement:benchmark:{secrets.token_hex(4)}')
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=f'bench_{uuid.uuid4().hex[:12]}',
+                    email=f'bench_{uuid.uuid4().hex[:12]}@example.com',
+                )
+
+                start = time.perf_counter()
+                for _ in range(payloads):
+                    for event in events:
+                        EngagementEvent.objects.create(user=user, **event)
+                self._report('legacy per-row create', total, time.perf_counter() - start)
+
+                if stream._get_redis() is None:
+                    self.stdout.write(self.style.WARNING('Cache backend is not Redis; skipping stream benchmarks'))
+                    raise _Rollback
+
+                start = time.perf_counter()
+                for _ in range(payloads):
+                    stream.append(user.id, events)
+                self._report('stream append (request)', total, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                drained = 0
+                while entries := stream.read(chunk_size, consumer='benchmark'):
+                    EngagementEvent.objects.bulk_create(
+                        [
+                            EngagementEvent(
+                                user_id=event['user_id'],
+                                event_type=event['event_type'],
+                                project_id=event['project_id'],
+                                payload=event['payload'],
+                                processed=True,
+                            )
+                            for _, event in entries
+                        ]
+                    )
+                    stream.ack([entry_id for entry_id, _ in entries])
+                    drained += len(entries)
+                self._report('stream drain (worker)', drained, time.perf_counter() - start)
+
+                raise _Rollback
+        except _Rollback:
+            pass
+        finally:
+            redis = stream._get_redis()
+            if redis is not None:
+                redis.delete(stream.key)
+
+    def _report(self, label, events, elapsed):
+        rate = events / elapsed if elapsed else 0.0
+        self.stdout.write(f'  {label:<26} {rate:>12.1f} events/sec   ({elapsed:.2f}s)')
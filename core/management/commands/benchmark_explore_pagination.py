@@ -0,0 +1,176 @@
+"""
+Django management command to benchmark explore feed pagination depth.
+
+Seeds --projects public projects (default 500k) over --users owners, inside a
+transaction that is rolled back at the end, then times page 1 and page --page
+(default 50) of:
+- newest: ORDER BY created_at with OFFSET (previous) vs keyset on (created_at, id)
+- shuffled ('new' tab): MD5(id || seed) with OFFSET (previous) vs the seeded
+  random_key walk
+
+and prints EXPLAIN for the keyset page queries, checking that they are served
+by the explore indexes rather than a sort of the table. Requires PostgreSQL.
+
+Usage:
+    python manage.py benchmark_explore_pagination --projects 500000 --page 50
+"""
+
+import random
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import CharField, Value
+from django.db.models.functions import MD5, Cast, Concat
+
+from core.projects.keyset import SHUFFLE_ORDERING, ShuffledWalk, after, keyset_window, row_values
+from core.projects.models import Project
+from core.users.models import User
+
+NEWEST = ['-created_at', '-id']
+SEED = 'benchmark-seed'
+
+
+class _Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmark explore pagination: page 1 vs a deep page, OFFSET vs keyset'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--projects', type=int, default=500_000, help='Projects to seed (default: 500000)')
+        parser.add_argument('--users', type=int, default=2000, help='Project owners (default: 2000)')
+        parser.add_argument('--page', type=int, default=50, help='Deep page to compare with page 1 (default: 50)')
+        parser.add_argument('--page-size', type=int, default=30, help='Rows per page (default: 30)')
+        parser.add_argument('--repeat', type=int, default=5, help='Timed runs per case (default: 5)')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('This benchmark needs PostgreSQL (partial indexes, MD5, EXPLAIN output)')
+
+        self.page_size = options['page_size']
+        self.repeat = options['repeat']
+        deep_page = options['page']
+
+        self.stdout.write(f'Seeding {options["projects"]} projects over {options["users"]} users...\n')
+        try:
+            with transaction.atomic():
+                self._seed(options['projects'], options['users'])
+                with connection.cursor() as cursor:
+                    cursor.execute('ANALYZE core_project')
+
+                queryset = (
+                    Project.objects.filter(is_private=False, is_archived=False)
+                    .exclude(type='battle', content__battleResult__is_challenger=False)
+                    .select_related('user')
+                )
+                walk = ShuffledWalk(SEED)
+                md5_order = queryset.annotate(random_order=MD5(Concat(Cast('id', CharField()), Value(SEED)))).order_by(
+                    'random_order'
+                )
+
+                newest_cursor = self._cursor_before(
+                    deep_page, lambda cursor: keyset_window(queryset, NEWEST, cursor, self.page_size), NEWEST
+                )
+                shuffle_cursor = self._cursor_before(
+                    deep_page, lambda cursor: walk.window(queryset, cursor, self.page_size), walk=walk
+                )
+                offset = (deep_page - 1) * self.page_size
+
+                self.stdout.write(f'\nms per page (page size {self.page_size}, best of {self.repeat})')
+                self.stdout.write(f'  {"case":<28}{"page 1":>10}{f"page {deep_page}":>10}')
+                self._report(
+                    'newest, OFFSET',
+                    lambda: list(queryset.order_by(*NEWEST)[: self.page_size]),
+                    lambda: list(queryset.order_by(*NEWEST)[offset : offset + self.page_size]),
+                )
+                self._report(
+                    'newest, keyset',
+                    lambda: keyset_window(queryset, NEWEST, None, self.page_size),
+                    lambda: keyset_window(queryset, NEWEST, newest_cursor, self.page_size),
+                )
+                self._report(
+                    'shuffled, MD5 + OFFSET',
+                    lambda: list(md5_order[: self.page_size]),
+                    lambda: list(md5_order[offset : offset + self.page_size]),
+                )
+                self._report(
+                    'shuffled, random_key walk',
+                    lambda: walk.window(queryset, None, self.page_size),
+                    lambda: walk.window(queryset, shuffle_cursor, self.page_size),
+                )
+
+                segment = {'random_key__lt' if shuffle_cursor['w'] else 'random_key__gte': walk.start}
+                self._explain(
+                    'newest keyset page',
+                    queryset.filter(after(NEWEST, newest_cursor['v'])).order_by(*NEWEST)[: self.page_size],
+                    'project_explore_newest_idx',
+                )
+                self._explain(
+                    'shuffled walk page',
+                    queryset.filter(**segment)
+                    .filter(after(SHUFFLE_ORDERING, shuffle_cursor['v']))
+                    .order_by(*SHUFFLE_ORDERING)[: self.page_size],
+                    'project_explore_shuffle_idx',
+                )
+                raise _Rollback
+        except _Rollback:
+            pass
+
+    def _seed(self, projects, users):
+        rng = random.Random(50)  # noqa: S311 - reproducible data, not security
+        first_id = (Project.objects.order_by('-id').values_list('id', flat=True).first() or 0) + 1
+        owners = User.objects.bulk_create(
+            User(username=f'bench-explore-{i}', email=f'bench-explore-{i}@example.com') for i in range(users)
+        )
+        Project.objects.bulk_create(
+            (
+                Project(
+                    user=owners[i % users],
+                    title=f'Bench project {i}',
+                    slug=f'bench-project-{i}',
+                    is_private=i % 20 == 0,
+                    random_key=rng.random(),
+                )
+                for i in range(projects)
+            ),
+            batch_size=5000,
+        )
+        # created_at is auto_now_add, so spread the seeded rows over a year afterwards
+        with connection.cursor() as cursor:
+            cursor.execute('SELECT setseed(0.5)')
+            cursor.execute(
+                "UPDATE core_project SET created_at = now() - random() * interval '365 days' WHERE id >= %s",
+                [first_id],
+            )
+
+    def _cursor_before(self, page, read, ordering=None, walk=None):
+        """Follow cursors from page 1 to the cursor that opens `page`, the way a client scrolls."""
+        cursor = None
+        for _ in range(page - 1):
+            rows = read(cursor)
+            if not rows:
+                raise CommandError(f'Fewer than {page} pages seeded; raise --projects')
+            cursor = walk.cursor_for(rows[-1]) if walk else {'v': row_values(rows[-1], ordering)}
+        return cursor
+
+    def _report(self, label, first_page, deep_page):
+        first, deep = self._time(first_page), self._time(deep_page)
+        self.stdout.write(f'  {label:<28}{first:>10.2f}{deep:>10.2f}')
+
+    def _time(self, fn):
+        fn()  # Warm the buffer cache
+        timings = []
+        for _ in range(self.repeat):
+            start = time.perf_counter()
+            fn()
+            timings.append((time.perf_counter() - start) * 1000)
+        return min(timings)
+
+    def _explain(self, label, queryset, index_name):
+        plan = queryset.explain(analyze=True)
+        uses_index = 'yes' if index_name in plan else self.style.WARNING('NO')
+        sorts = self.style.WARNING('YES') if 'Sort Key' in plan else 'no'
+        self.stdout.write(f'\nEXPLAIN {label}: uses {index_name}: {uses_index}, sort node: {sorts}')
+        self.stdout.write(plan)
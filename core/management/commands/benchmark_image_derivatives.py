@@ -0,0 +1,76 @@
+"""
+Django management command to benchmark per-image CPU time of upload image processing.
+
+Compares, on synthetic photos of several sizes:
+- inline: the old upload path - full decode, LANCZOS to 1920px, JPEG q85 re-encode
+  (all inside the request)
+- request: what the upload request now does - sanitize_original (draft/reduce
+  to at most 1920px, JPEG re-encode without metadata)
+- derivatives: the background task - draft/reduce downscaling to every srcset
+  width in each format
+
+Usage:
+    python manage.py benchmark_image_derivatives --iterations 5
+"""
+
+import time
+from io import BytesIO
+
+from django.core.management.base import BaseCommand
+from PIL import Image
+
+from core.uploads.derivatives import available_formats, flatten_to_rgb, generate_derivatives, sanitize_original
+
+SIZES = [(1600, 1200), (3000, 2000), (5000, 5000)]
+
+
+def _photo(size: tuple[int, int]) -> bytes:
+    # Noise + gradient compresses like a photo, unlike a flat colour
+    noise = Image.effect_noise(size, 40).convert('RGB')
+    gradient = Image.linear_gradient('L').resize(size).convert('RGB')
+    output = BytesIO()
+    Image.blend(noise, gradient, 0.5).save(output, format='JPEG', quality=92)
+    return output.getvalue()
+
+
+def _inline_optimize(data: bytes) -> bytes:
+    img = Image.open(BytesIO(data))
+    img.load()
+    img = flatten_to_rgb(img)
+    if img.width > 1920:
+        img = img.resize((1920, int(img.height * 1920 / img.width)), Image.Resampling.LANCZOS)
+    output = BytesIO()
+    img.save(output, format='JPEG', quality=85, optimize=True)
+    return output.getvalue()
+
+
+class Command(BaseCommand):
+    help = 'Benchmark per-image CPU time: inline re-encode vs sanitized request rendition + background derivatives'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=3, help='Runs per image and path (default: 3)')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        formats = available_formats()
+        self.stdout.write(f'Derivative formats: {", ".join(formats)}; CPU ms per image (best of {iterations})\n')
+
+        for size in SIZES:
+            self._bench_image(_photo(size), size, iterations, formats)
+
+    def _bench_image(self, data, size, iterations, formats):
+        self.stdout.write(f'{size[0]}x{size[1]} JPEG ({len(data) / 1024:.0f}KB)')
+        self._report('inline (old request path)', iterations, lambda: _inline_optimize(data))
+        self._report('request (sanitize_original)', iterations, lambda: sanitize_original(Image.open(BytesIO(data))))
+        for fmt in formats:
+            self._report(f'derivatives ({fmt})', iterations, lambda fmt=fmt: generate_derivatives(data, [fmt]))
+        self._report('derivatives (all formats)', iterations, lambda: generate_derivatives(data, formats))
+        self.stdout.write('')
+
+    def _report(self, label, iterations, fn):
+        best = float('inf')
+        for _ in range(iterations):
+            start = time.process_time()
+            fn()
+            best = min(best, time.process_time() - start)
+        self.stdout.write(f'  {label:<28} {best * 1000:>9.1f} ms')
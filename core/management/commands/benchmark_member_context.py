@@ -0,0 +1,70 @@
+"""
+Django management command to benchmark member context cold-miss latency.
+
+Replaces the six context source loaders with stubs that sleep for known delays
+(no database or Weaviate access), then measures a cold miss - every source
+cache invalidated - through:
+- the sync path, which loads sources one after another
+- the async path, which loads them concurrently with per-source timeouts
+and a warm hit for reference.
+
+Usage:
+    python manage.py benchmark_member_context --iterations 20
+"""
+
+import time
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from django.core.management.base import BaseCommand
+
+from services.agents.context.member_context import MemberContextService
+
+# Stubbed source delays (seconds), roughly matching production p50s
+SOURCE_DELAYS = {
+    'learning': 0.040,
+    'personalization': 0.025,
+    'profile': 0.010,
+    'preferences': 0.015,
+    'semantic': 0.120,
+    'feedback': 0.030,
+}
+BENCH_USER_ID = -1  # Never a real user; only cache keys are touched
+
+
+def _stub_load_source(source, user_id):
+    time.sleep(SOURCE_DELAYS[source])
+    return MemberContextService._get_source_default(source)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark member context cold-miss latency (ms) with stubbed sources of known delay'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20, help='Cold misses per path (default: 20)')
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        delays = ', '.join(f'{name}={delay * 1000:.0f}ms' for name, delay in SOURCE_DELAYS.items())
+        self.stdout.write(f'Source delays: {delays}')
+        self.stdout.write(
+            f'Expected: series ~{sum(SOURCE_DELAYS.values()) * 1000:.0f}ms, '
+            f'concurrent ~{max(SOURCE_DELAYS.values()) * 1000:.0f}ms\n'
+        )
+
+        aggregate_async = async_to_sync(MemberContextService._aggregate_context_async)
+        with patch.object(MemberContextService, '_load_source', side_effect=_stub_load_source):
+            self._report('cold miss, series (sync)', iterations, MemberContextService._aggregate_context)
+            self._report('cold miss, concurrent', iterations, aggregate_async)
+            self._report('warm hit', iterations, aggregate_async, cold=False)
+        MemberContextService.invalidate_cache(BENCH_USER_ID)
+
+    def _report(self, label, iterations, aggregate, cold=True):
+        elapsed = 0.0
+        for _ in range(iterations):
+            if cold:
+                MemberContextService.invalidate_cache(BENCH_USER_ID)
+            start = time.perf_counter()
+            aggregate(BENCH_USER_ID)
+            elapsed += time.perf_counter() - start
+        self.stdout.write(f'  {label:<26} {elapsed / iterations * 1000:>8.1f} ms')
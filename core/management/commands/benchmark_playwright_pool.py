@@ -0,0 +1,90 @@
+"""
+Django management command to benchmark Playwright page fetches.
+
+Serves local fixture pages (HTML plus images, a web font and a video) and
+renders them with:
+- unpooled: a browser launched per page, nothing blocked (the old behaviour)
+- pooled: one long-lived browser, a fresh context per page, heavy resources blocked
+
+Usage:
+    python manage.py benchmark_playwright_pool --pages 30
+"""
+
+import tempfile
+import threading
+import time
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from services.url_import.browser_pool import BrowserPool
+
+FIXTURE_IMAGES = 12
+FIXTURE_IMAGE_BYTES = 200_000
+
+
+class _QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class Command(BaseCommand):
+    help = 'Benchmark pages/minute for Playwright fetches: browser per page vs pooled browser'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--pages', type=int, default=20, help='Pages to render per mode (default: 20)')
+
+    def handle(self, *args, **options):
+        try:
+            import playwright  # noqa: F401
+        except ImportError as e:
+            raise CommandError('Playwright is not installed') from e
+
+        pages = options['pages']
+        with tempfile.TemporaryDirectory() as root:
+            self._write_fixtures(Path(root), pages)
+            server = ThreadingHTTPServer(('127.0.0.1', 0), partial(_QuietHandler, directory=root))
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            base_url = f'http://127.0.0.1:{server.server_port}'
+
+            try:
+                self.stdout.write(f'Rendering {pages} fixture pages per mode...\n')
+                self._run('unpooled (launch per page)', BrowserPool(max_pages=1), base_url, pages, block=False)
+                self._run('pooled (blocked resources)', BrowserPool(max_pages=pages + 1), base_url, pages, block=True)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    def _run(self, label, pool, base_url, pages, block):
+        try:
+            start = time.perf_counter()
+            for i in range(pages):
+                with pool.page(block_resources=block) as page:
+                    page.goto(f'{base_url}/page-{i}.html', wait_until='networkidle')
+                    page.content()
+            elapsed = time.perf_counter() - start
+        finally:
+            pool.close()
+
+        rate = pages / elapsed * 60 if elapsed else 0.0
+        self.stdout.write(f'  {label:<28} {rate:>8.1f} pages/min   ({elapsed:.2f}s)')
+
+    def _write_fixtures(self, root: Path, pages: int):
+        (root / 'font.woff2').write_bytes(b'\0' * 50_000)
+        (root / 'clip.mp4').write_bytes(b'\0' * 500_000)
+        for n in range(FIXTURE_IMAGES):
+            (root / f'image-{n}.png').write_bytes(b'\0' * FIXTURE_IMAGE_BYTES)
+
+        images = ''.join(f'<img src="image-{n}.png?p={{page}}">' for n in range(FIXTURE_IMAGES))
+        template = (
+            '<!doctype html><html><head><title>Fixture {page}</title>'
+            '<style>@font-face{{font-family:f;src:url(font.woff2?p={page})}} body{{font-family:f}}</style>'
+            '</head><body><main><h1>Fixture page {page}</h1>'
+            + '<p>Lorem ipsum dolor sit amet.</p>' * 50
+            + images
+            + '<video src="clip.mp4?p={page}" preload="auto"></video></main></body></html>'
+        )
+        for page in range(pages):
+            (root / f'page-{page}.html').write_text(template.format(page=page))
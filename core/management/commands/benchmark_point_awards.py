@@ -0,0 +1,103 @@
+"""
+Django management command to benchmark User.add_points throughput.
+
+Runs awards back to back on one connection (so the result is awards/sec for a
+single core) against a throwaway user, inside a transaction that is rolled
+back at the end. Compares the current single-statement award with the
+previous implementation (F() update, refresh_from_db, tier/level save, streak
+updates and reloads), which is replicated here as the baseline.
+
+Usage:
+    python manage.py benchmark_point_awards --awards 2000
+"""
+
+import time
+import uuid
+
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import F
+
+from core.thrive_circle.models import PointActivity
+from core.users.models import User
+
+
+class _Rollback(Exception):
+    pass
+
+
+def _legacy_award(user, amount, activity_type):
+    """The pre-RETURNING award path, kept only as a benchmark baseline."""
+    with transaction.atomic():
+        old_tier = user.tier
+        User.objects.filter(pk=user.pk).update(total_points=F('total_points') + amount)
+        user.refresh_from_db()
+
+        new_tier = user._calculate_tier()
+        new_level = user._calculate_level()
+        if new_tier != user.tier or new_level != user.level:
+            user.tier = new_tier
+            user.level = new_level
+            user.save(update_fields=['tier', 'level'])
+
+        # Same-day award: the old _update_streak skipped the update but still reloaded the row
+        user.refresh_from_db()
+
+        PointActivity.objects.create(user=user, amount=amount, activity_type=activity_type, tier_at_time=old_tier)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark points awards per second (single connection) for the legacy and current award paths'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--awards', type=int, default=1000, help='Number of awards per path (default: 1000)')
+        parser.add_argument('--amount', type=int, default=5, help='Points per award (default: 5)')
+
+    def handle(self, *args, **options):
+        awards = options['awards']
+        amount = options['amount']
+
+        self.stdout.write(f'Benchmarking {awards} awards per path on {connection.vendor}...\n')
+
+        paths = [
+            ('legacy', lambda user: _legacy_award(user, amount, 'quiz_complete')),
+            ('current', lambda user: user.add_points(amount, 'quiz_complete')),
+        ]
+        results = {}
+        for name, award in paths:
+            results[name] = self._run(award, awards)
+            rate, queries = results[name]
+            self.stdout.write(f'  {name:<8} {rate:>10.1f} awards/sec   {queries:.1f} queries/award')
+
+        if results['legacy'][0]:
+            speedup = results['current'][0] / results['legacy'][0]
+            self.stdout.write(self.style.SUCCESS(f'\nSpeedup: {speedup:.2f}x'))
+
+    def _run(self, award, awards):
+        """Time `awards` calls against a fresh user, then roll everything back."""
+        elapsed = 0.0
+        query_count = 0
+        try:
+            with transaction.atomic():
+                user = User.objects.create_user(
+                    username=f'bench_{uuid.uuid4().hex[:12]}',
+                    email=f'bench_{uuid.uuid4().hex[:12]}@example.com',
+                )
+                # Warm up (first award also initialises the streak)
+                award(user)
+
+                def count_queries(execute, sql, params, many, context):
+                    nonlocal query_count
+                    query_count += 1
+                    return execute(sql, params, many, context)
+
+                with connection.execute_wrapper(count_queries):
+                    start = time.perf_counter()
+                    for _ in range(awards):
+                        award(user)
+                    elapsed = time.perf_counter() - start
+                raise _Rollback
+        except _Rollback:
+            pass
+
+        return (awards / elapsed if elapsed else 0.0), query_count / awards
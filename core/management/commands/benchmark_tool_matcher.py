@@ -0,0 +1,84 @@
+"""
+Django management command to benchmark tool mention extraction.
+
+Builds --tools synthetic tool names (no database access) and extracts mentions
+from chat-length messages, comparing the cached ToolNameMatcher (one trie pass)
+with the previous approach of one word-boundary regex search per tool. The
+previous approach also loaded every active tool from the database on each
+call; that query is not included, so the gap shown is a lower bound.
+
+Usage:
+    python manage.py benchmark_tool_matcher --tools 5000 --iterations 200
+"""
+
+import random
+import re
+import string
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core.taxonomy.services import ToolNameMatcher
+
+MESSAGE = (
+    'I have been comparing a few assistants for my side project. Right now I use {a} for drafting and '
+    'something like {b} for code review, but the context window keeps running out when I paste whole files. '
+    'Would a retrieval setup with a vector store help, or should I switch to a model with longer context? '
+    'Also curious whether anyone has tried chaining prompts so the first call summarises the repo and the '
+    'second one answers the question. Budget matters, so free tiers are a plus.'
+)
+
+
+def _tool_names(count, rng):
+    names = set()
+    while len(names) < count:
+        words = [''.join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(rng.randint(1, 3))]
+        name = ' '.join(word.capitalize() for word in words)
+        names.add(name + rng.choice(['', '', '', ' AI', '.ai', '-4', ' Pro']))
+    return sorted(names)
+
+
+class Command(BaseCommand):
+    help = 'Benchmark tool mention extraction (ms per message) for the trie matcher vs per-tool regex search'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tools', type=int, default=5000, help='Number of tool names (default: 5000)')
+        parser.add_argument('--iterations', type=int, default=200, help='Messages per case (default: 200)')
+
+    def handle(self, *args, **options):
+        rng = random.Random(48)  # noqa: S311 - reproducible tool names, not security
+        names = _tool_names(options['tools'], rng)
+        entries = [(name, tool_id) for tool_id, name in enumerate(names)]
+
+        start = time.perf_counter()
+        matcher = ToolNameMatcher(entries)
+        build_ms = (time.perf_counter() - start) * 1000
+        self.stdout.write(f'{len(names)} tools, matcher built in {build_ms:.1f} ms (once per tool change)\n')
+
+        messages = {
+            'no mentions': MESSAGE.format(a='one tool', b='another'),
+            'two mentions': MESSAGE.format(a=names[10], b=names[-10]),
+        }
+        for label, message in messages.items():
+            legacy_found = self._legacy_find(entries, message)
+            if set(matcher.find(message)) != legacy_found:
+                raise CommandError(f'Matcher and regex search disagree on the {label} message')
+
+            legacy = self._time(options['iterations'], self._legacy_find, entries, message)
+            indexed = self._time(options['iterations'], matcher.find, message)
+            self.stdout.write(
+                f'  {label:<13} ({len(message)} chars, {len(legacy_found)} found)   per-tool regex {legacy:>8.3f} ms   '
+                f'trie {indexed:>7.3f} ms   ({legacy / indexed:.0f}x)'
+            )
+
+    @staticmethod
+    def _legacy_find(entries, text):
+        text_lower = text.lower()
+        return {tool_id for name, tool_id in entries if re.search(r'\b' + re.escape(name.lower()) + r'\b', text_lower)}
+
+    @staticmethod
+    def _time(iterations, fn, *args):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            fn(*args)
+        return (time.perf_counter() - start) / iterations * 1000
@@ -798,10 +798,10 @@ class AssetUploadView(IsProductOwner, APIView):
         try:
             # Upload to storage (private bucket)
             storage = get_storage_service()
-            file_data = uploaded_file.read()
 
+            # Streamed in parts, never fully in memory
             file_path, error = storage.upload_file(
-                file_data=file_data,
+                file_data=uploaded_file,
                 filename=uploaded_file.name,
                 content_type=uploaded_file.content_type or 'application/octet-stream',
                 user_id=request.user.id,
@@ -826,7 +826,7 @@ class AssetUploadView(IsProductOwner, APIView):
                 description=description,
                 asset_type=asset_type,
                 file_path=file_path,
-                file_size=len(file_data),
+                file_size=uploaded_file.size,
                 content_type=uploaded_file.content_type or 'application/octet-stream',
                 order=max_order,
                 is_preview=is_preview,
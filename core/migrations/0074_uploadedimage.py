@@ -0,0 +1,63 @@
+# Generated by Django 5.1.15 on 2026-10-18 09:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0073_alter_project_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UploadedImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                (
+                    'url',
+                    models.CharField(
+                        help_text='Public URL (or object name for private files) of the original', max_length=1000
+                    ),
+                ),
+                (
+                    'object_name',
+                    models.CharField(help_text='Storage object name of the original', max_length=500),
+                ),
+                ('filename', models.CharField(max_length=255)),
+                ('content_type', models.CharField(max_length=100)),
+                ('width', models.PositiveIntegerField()),
+                ('height', models.PositiveIntegerField()),
+                ('size', models.PositiveBigIntegerField(help_text='Original size in bytes')),
+                ('is_public', models.BooleanField(default=True)),
+                (
+                    'status',
+                    models.CharField(
+                        choices=[('pending', 'Pending'), ('ready', 'Ready'), ('failed', 'Failed')],
+                        default='pending',
+                        max_length=20,
+                    ),
+                ),
+                (
+                    'variants',
+                    models.JSONField(blank=True, default=list, help_text='Generated derivatives, widest first'),
+                ),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('processed_at', models.DateTimeField(blank=True, null=True)),
+                (
+                    'user',
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name='uploaded_images',
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['user', '-created_at'], name='core_upload_user_id_f19b55_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0074_uploadedimage'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SitemapShard',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(help_text='Sitemap section (projects, profiles, tools)', max_length=20)),
+                ('shard', models.PositiveIntegerField(help_text='Shard number; covers one fixed ID range')),
+                ('url_count', models.PositiveIntegerField(default=0)),
+                ('signature', models.CharField(help_text='Summary of the ID range at the last render', max_length=100)),
+                (
+                    'max_updated_at',
+                    models.DateTimeField(blank=True, help_text='Latest updated_at in the ID range', null=True),
+                ),
+                ('object_name', models.CharField(help_text='Storage object name of the gzip file', max_length=500)),
+                ('generated_at', models.DateTimeField()),
+            ],
+            options={
+                'ordering': ['section', 'shard'],
+                'constraints': [models.UniqueConstraint(fields=('section', 'shard'), name='unique_sitemap_shard')],
+            },
+        ),
+    ]
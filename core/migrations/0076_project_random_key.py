@@ -0,0 +1,43 @@
+# Generated by Django 5.1.15 on 2026-10-18 21:58
+
+import random
+
+from django.db import migrations, models
+
+import core.projects.models
+
+
+def backfill_random_keys(apps, schema_editor):
+    """
+    Give every existing project its own random key.
+
+    AddField evaluates the callable default once, so all existing rows start
+    with the same value; re-draw it per row.
+    """
+    if schema_editor.connection.vendor == 'postgresql':
+        schema_editor.execute('UPDATE core_project SET random_key = random()')
+        return
+
+    Project = apps.get_model('core', 'Project')
+    projects = list(Project.objects.only('id'))
+    for project in projects:
+        project.random_key = random.random()  # noqa: S311 - feed shuffling, not security
+    Project.objects.bulk_update(projects, ['random_key'], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ('core', '0075_sitemapshard'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='random_key',
+            field=models.FloatField(
+                default=core.projects.models.generate_random_key,
+                help_text='Per-row random key for seeded, seekable shuffled feeds',
+            ),
+        ),
+        migrations.RunPython(backfill_random_keys, migrations.RunPython.noop),
+    ]
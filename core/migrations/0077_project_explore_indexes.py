@@ -0,0 +1,33 @@
+# Generated by Django 5.1.15 on 2026-10-18 23:40
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY can't run inside a transaction; building the
+    # indexes this way keeps core_project writable while they are created
+    atomic = False
+
+    dependencies = [
+        ('core', '0076_project_random_key'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='project',
+            index=models.Index(
+                condition=models.Q(('is_archived', False), ('is_private', False)),
+                fields=['-created_at', '-id'],
+                name='project_explore_newest_idx',
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name='project',
+            index=models.Index(
+                condition=models.Q(('is_archived', False), ('is_private', False)),
+                fields=['random_key', 'id'],
+                name='project_explore_shuffle_idx',
+            ),
+        ),
+    ]
@@ -1,8 +1,11 @@
 """Core models - Re-export models from domain packages for Django compatibility.
 
 Django's AUTH_USER_MODEL expects to find User at 'core.User', so we re-export it here.
+UploadedImage and SitemapShard are only imported lazily by views and tasks, so they are registered here too.
 """
 
+from .seo.models import SitemapShard
+from .uploads.models import UploadedImage
 from .users.models import User, UserRole
 
-__all__ = ['User', 'UserRole']
+__all__ = ['SitemapShard', 'UploadedImage', 'User', 'UserRole']
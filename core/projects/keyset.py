@@ -0,0 +1,181 @@
+"""
+Keyset pagination for the explore feed.
+
+Each page is read with a WHERE condition on the sort key of the last row the
+client saw, so page 50 is the same index range scan as page 1 instead of an
+OFFSET that sorts and discards every earlier row.
+
+Deterministic orderings (newest, popular, similarity) seek on their ORDER BY
+columns with the primary key as the tie-breaker. Shuffled orderings ('new' tab,
+random sort) walk Project.random_key, a uniform per-row key with its own
+index: the seed picks a start point in [0, 1), the walk runs up to 1.0 and then
+wraps around to the keys below the start. The same seed always yields the same
+order, and any position in it can be seeked by key.
+
+Cursors are opaque URL-safe tokens holding the sort values of the last row.
+They come from the client, so decoding checks them against the ordering
+(one value per column, of the column's type); anything else is treated as
+no cursor rather than reaching the query.
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import math
+from dataclasses import dataclass
+from datetime import datetime
+
+from django.db.models import Q, QuerySet
+
+logger = logging.getLogger(__name__)
+
+SHUFFLE_ORDERING = ['random_key', 'id']
+
+
+def _json_default(value):
+    # Full microsecond precision: DjangoJSONEncoder rounds datetimes to milliseconds,
+    # which would make the cursor skip or repeat rows created within the same millisecond
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'Cannot encode {type(value).__name__} in an explore cursor')
+
+
+def _cursor_int(value) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or not -(2**63) <= value < 2**63:
+        raise ValueError(f'expected a 64-bit integer, got {value!r}')
+    return value
+
+
+def _cursor_float(value) -> float:
+    if isinstance(value, bool) or not isinstance(value, int | float) or not math.isfinite(value):
+        raise ValueError(f'expected a finite number, got {value!r}')
+    return float(value)
+
+
+def _cursor_datetime(value) -> datetime:
+    if not isinstance(value, str):
+        raise ValueError(f'expected an ISO datetime, got {value!r}')
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is None:
+        raise ValueError(f'expected an aware datetime, got {value!r}')
+    return parsed
+
+
+# Parser for each column an explore ordering can seek on
+CURSOR_FIELDS = {
+    'id': _cursor_int,
+    'created_at': _cursor_datetime,
+    'random_key': _cursor_float,
+    'search_similarity': _cursor_float,
+    'recent_likes': _cursor_int,
+    'total_likes': _cursor_int,
+}
+
+
+def encode_cursor(payload: dict) -> str:
+    """Pack cursor values into an opaque URL-safe token."""
+    data = json.dumps(payload, default=_json_default, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(data).decode().rstrip('=')
+
+
+def decode_cursor(token: str | None, ordering: list[str]) -> dict | None:
+    """
+    Unpack a cursor token for `ordering`, parsing each value to its column's type.
+
+    Malformed tokens, and values that don't match the ordering in count or
+    type, are treated as "first page".
+    """
+    if not token:
+        return None
+    parsers = [CURSOR_FIELDS[field.lstrip('-')] for field in ordering]
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+        if not isinstance(payload, dict) or not isinstance(payload.get('v'), list):
+            raise ValueError('not a cursor object')
+        if len(payload['v']) != len(parsers):
+            raise ValueError(f'expected {len(parsers)} values, got {len(payload["v"])}')
+        if not isinstance(payload.get('w', False), bool):
+            raise ValueError('wrap flag is not a boolean')
+        payload['v'] = [parse(value) for parse, value in zip(parsers, payload['v'], strict=True)]
+    except (ValueError, TypeError) as e:
+        logger.debug(f'Ignoring malformed explore cursor {token[:50]}: {e}')
+        return None
+    return payload
+
+
+def seed_start(seed: str) -> float:
+    """Map a seed to a start point in [0, 1) for the shuffled walk."""
+    digest = hashlib.sha256(seed.encode()).digest()
+    return int.from_bytes(digest[:8], 'big') / 2**64
+
+
+def after(ordering: list[str], values: list) -> Q:
+    """
+    Rows strictly after `values` in `ordering` (e.g. ['-created_at', '-id']).
+
+    Expands the row comparison into nested OR/AND terms, led by a plain range
+    condition on the first column so PostgreSQL can start the index scan at
+    the cursor.
+    """
+    condition = None
+    for field, value in reversed(list(zip(ordering, values, strict=True))):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        strict_after = Q(**{f'{name}__{lookup}': value})
+        condition = strict_after if condition is None else strict_after | (Q(**{name: value}) & condition)
+
+    first = ordering[0]
+    bound = 'lte' if first.startswith('-') else 'gte'
+    return Q(**{f'{first.lstrip("-")}__{bound}': values[0]}) & condition
+
+
+def row_values(row, ordering: list[str]) -> list:
+    """Sort values of a model instance (fields or annotations) for a cursor."""
+    return [getattr(row, field.lstrip('-')) for field in ordering]
+
+
+def keyset_window(queryset: QuerySet, ordering: list[str], cursor: dict | None, size: int, offset: int = 0) -> list:
+    """
+    The next `size` rows in `ordering` after the cursor.
+
+    `offset` only serves legacy `?page=N` requests that arrive without a cursor.
+    """
+    if cursor:
+        queryset = queryset.filter(after(ordering, cursor['v']))
+    return list(queryset.order_by(*ordering)[offset : offset + size])
+
+
+@dataclass
+class ShuffledWalk:
+    """Seeded, seekable walk over random_key: [start, 1.0) then wrapped to [0, start)."""
+
+    seed: str
+
+    @property
+    def start(self) -> float:
+        return seed_start(self.seed)
+
+    def window(self, queryset: QuerySet, cursor: dict | None, size: int, offset: int = 0) -> list:
+        """The next `size` rows of the walk after the cursor, crossing the wrap point if needed."""
+        wrapped = bool(cursor and cursor.get('w'))
+        rows = []
+        if not wrapped:
+            head = queryset.filter(random_key__gte=self.start)
+            rows = keyset_window(head, SHUFFLE_ORDERING, cursor, size, offset)
+            if len(rows) == size:
+                return rows
+            # Past the end of the head segment; continue from the lowest key. A legacy
+            # offset that lies entirely beyond the head carries over into the tail.
+            offset = max(0, offset - head.count()) if offset and not rows else 0
+            cursor = None
+
+        tail = queryset.filter(random_key__lt=self.start)
+        return rows + keyset_window(tail, SHUFFLE_ORDERING, cursor, size - len(rows), offset)
+
+    def cursor_for(self, row) -> dict:
+        return {'v': row_values(row, SHUFFLE_ORDERING), 'w': row.random_key < self.start}
+
+    def sample(self, queryset: QuerySet, count: int) -> list:
+        """`count` rows from the seed's start point; a cheap, indexed replacement for order_by('?')[:count]."""
+        return self.window(queryset, None, count)
@@ -1,3 +1,5 @@
+import random
+
 from django.conf import settings
 from django.db import models
 from django.db.models.signals import m2m_changed, post_delete, post_save
@@ -9,6 +11,11 @@ from core.taxonomy.models import Taxonomy
 from core.tools.models import Tool
 
 
+def generate_random_key() -> float:
+    """Default for Project.random_key (migrations need an importable callable)."""
+    return random.random()  # noqa: S311 - feed shuffling, not security
+
+
 class ProjectQuerySet(models.QuerySet):
     """Custom QuerySet for Project with security and performance methods."""
 
@@ -268,6 +275,12 @@ class Project(WeaviateSyncMixin, models.Model):
         blank=True,
         help_text='When engagement velocity was last calculated',
     )
+    # Uniform [0, 1) shuffle key: the 'new' tab and random sort walk it from a seed-derived
+    # start point (see core.projects.keyset) instead of hashing or sorting the whole table
+    random_key = models.FloatField(
+        default=generate_random_key,
+        help_text='Per-row random key for seeded, seekable shuffled feeds',
+    )
     # Original publication date for external content (RSS articles, news, etc.)
     # For user-generated content, this defaults to created_at
     published_date = models.DateTimeField(
@@ -298,6 +311,17 @@ class Project(WeaviateSyncMixin, models.Model):
             models.Index(fields=['is_private', 'is_archived', '-created_at']),  # Primary explore filter
             models.Index(fields=['user', '-created_at']),
             models.Index(fields=['is_showcased', 'is_archived', '-created_at']),  # Profile showcase
+            # Keyset pagination of the explore feed over public projects
+            models.Index(
+                fields=['-created_at', '-id'],
+                condition=models.Q(is_private=False, is_archived=False),
+                name='project_explore_newest_idx',
+            ),
+            models.Index(
+                fields=['random_key', 'id'],
+                condition=models.Q(is_private=False, is_archived=False),
+                name='project_explore_shuffle_idx',
+            ),
         ]
 
     def __str__(self):
@@ -0,0 +1,202 @@
+"""
+Tests for keyset pagination of the explore feed.
+
+Covers:
+- Cursor encoding (microsecond datetimes survive the round trip)
+- Cursors that don't match the ordering in length or types mean "first page"
+- Walking every page by cursor returns each public project exactly once
+- The seeded shuffle is stable for a seed and wraps around its start point
+- Legacy ?page=N requests still return the same rows
+- Page queries use the explore indexes (EXPLAIN)
+"""
+
+import base64
+import json
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from django.db import connection
+from rest_framework.test import APIClient
+
+from core.projects.keyset import SHUFFLE_ORDERING, ShuffledWalk, after, decode_cursor, encode_cursor, seed_start
+from core.projects.models import Project, ProjectLike
+from core.users.models import User
+
+EXPLORE_URL = '/api/v1/projects/explore/'
+NEWEST = ['-created_at', '-id']
+
+
+@pytest.fixture
+def api_client():
+    """Create an API client."""
+    return APIClient()
+
+
+@pytest.fixture
+def projects(db):
+    """45 public projects from 15 users (3 each, so the per-user cap never holds rows back)."""
+    users = [
+        User.objects.create_user(username=f'keyset{i}', email=f'keyset{i}@example.com', password='testpass123')
+        for i in range(15)
+    ]
+    created = [
+        Project.objects.create(user=users[i % 15], title=f'Project {i}', slug=f'project-{i}', is_private=False)
+        for i in range(45)
+    ]
+    # Shared timestamps force the id tie-breaker to do its job; spread-out shuffle keys
+    # put the test seeds' start points in different gaps
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    for i, project in enumerate(created):
+        Project.objects.filter(id=project.id).update(
+            created_at=base + timedelta(seconds=i // 4, microseconds=7),
+            random_key=(i * 17) % 45 / 45 + 0.01,
+        )
+    Project.objects.create(user=users[0], title='Hidden', slug='hidden', is_private=True)
+    return list(Project.objects.filter(id__in=[project.id for project in created]).order_by('id'))
+
+
+def walk_pages(client, params, page_size=10):
+    """Follow next_cursor until the feed ends; returns the project IDs per page."""
+    pages = []
+    cursor = None
+    for page_num in range(1, 50):
+        query = {**params, 'page': page_num, 'page_size': page_size}
+        if cursor:
+            query['cursor'] = cursor
+        data = client.get(EXPLORE_URL, query).data
+        pages.append([project['id'] for project in data['results']])
+        cursor = data['next_cursor']
+        if not cursor:
+            return pages
+    raise AssertionError('Explore feed did not end')
+
+
+class TestCursorEncoding:
+    """Tests for cursor tokens."""
+
+    def test_round_trip_keeps_microseconds(self):
+        created = datetime(2026, 3, 4, 5, 6, 7, 123456, tzinfo=UTC)
+        token = encode_cursor({'v': [created, 42]})
+
+        assert decode_cursor(token, NEWEST) == {'v': [created, 42]}
+
+    @pytest.mark.parametrize('token', ['not-base64!', 'bnVsbA', '', None])
+    def test_malformed_cursor_means_first_page(self, token):
+        assert decode_cursor(token, NEWEST) is None
+
+    @pytest.mark.parametrize(
+        'payload',
+        [
+            {'v': ['2026-01-01T00:00:00+00:00']},
+            {'v': ['2026-01-01T00:00:00+00:00', 5, 6]},
+            {'v': ['yesterday', 5]},
+            {'v': ['2026-01-01T00:00:00', 5]},
+            {'v': [1767225600, 5]},
+            {'v': ['2026-01-01T00:00:00+00:00', '5']},
+            {'v': ['2026-01-01T00:00:00+00:00', True]},
+            {'v': ['2026-01-01T00:00:00+00:00', 2**64]},
+            {'v': ['2026-01-01T00:00:00+00:00', 5], 'w': 'yes'},
+        ],
+    )
+    def test_cursor_not_matching_ordering_means_first_page(self, payload):
+        token = base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        assert decode_cursor(token, NEWEST) is None
+
+    def test_shuffle_cursor_rejects_non_finite_keys(self):
+        token = base64.urlsafe_b64encode(b'{"v":[NaN,5],"w":false}').decode()
+
+        assert decode_cursor(token, SHUFFLE_ORDERING) is None
+
+    def test_seed_start_is_stable_and_in_range(self):
+        assert seed_start('abc') == seed_start('abc')
+        assert 0 <= seed_start('abc') < 1
+        assert seed_start('abc') != seed_start('abd')
+
+    def test_after_leads_with_range_on_first_column(self):
+        condition = after(['-created_at', '-id'], ['2026-01-01T00:00:00+00:00', 5])
+
+        assert condition.children[0] == ('created_at__lte', '2026-01-01T00:00:00+00:00')
+
+
+@pytest.mark.django_db
+class TestExploreKeysetPagination:
+    """Tests for cursor pagination through explore_projects."""
+
+    def test_newest_pages_cover_every_project_once(self, api_client, projects):
+        pages = walk_pages(api_client, {'sort': 'newest'})
+        ids = [project_id for page in pages for project_id in page]
+
+        expected = Project.objects.public().order_by('-created_at', '-id').values_list('id', flat=True)
+        assert ids == list(expected)
+        assert len(pages) == 5
+
+    def test_popular_pages_follow_like_counts(self, api_client, projects):
+        liker = User.objects.create_user(username='liker', email='liker@example.com', password='testpass123')
+        second = User.objects.create_user(username='liker2', email='liker2@example.com', password='testpass123')
+        for project in projects[:5]:
+            ProjectLike.objects.create(user=liker, project=project)
+        ProjectLike.objects.create(user=second, project=projects[3])
+
+        ids = [project_id for page in walk_pages(api_client, {'sort': 'popular'}, page_size=4) for project_id in page]
+
+        assert len(ids) == len(set(ids)) == len(projects)
+        assert ids[0] == projects[3].id
+        assert set(ids[1:5]) == {project.id for project in projects[:5]} - {projects[3].id}
+
+    def test_new_tab_is_stable_for_a_seed_and_wraps(self, api_client, projects):
+        first = walk_pages(api_client, {'tab': 'new', 'seed': 'fixed'})
+        again = walk_pages(api_client, {'tab': 'new', 'seed': 'fixed'})
+        other = walk_pages(api_client, {'tab': 'new', 'seed': 'other'})
+
+        ids = [project_id for page in first for project_id in page]
+        assert first == again
+        assert sorted(ids) == sorted(project.id for project in projects)
+
+        # The walk starts at the seed's point on random_key and wraps to the lowest keys
+        walk = ShuffledWalk('fixed')
+        keys = dict(Project.objects.public().values_list('id', 'random_key'))
+        expected = sorted(keys, key=lambda project_id: (keys[project_id] < walk.start, keys[project_id], project_id))
+        assert ids == expected
+        assert [project_id for page in other for project_id in page] != ids
+
+    def test_new_tab_reports_next_cursor(self, api_client, projects):
+        data = api_client.get(EXPLORE_URL, {'tab': 'new', 'seed': 'fixed', 'page_size': 44}).data
+        assert data['next'] is True
+        assert data['next_cursor']
+
+        data = api_client.get(EXPLORE_URL, {'tab': 'new', 'seed': 'fixed', 'page_size': 45}).data
+        assert data['next'] is False
+        assert data['next_cursor'] is None
+
+    def test_random_sort_pages_do_not_repeat(self, api_client, projects):
+        ids = [project_id for page in walk_pages(api_client, {'sort': 'random', 'seed': 's'}) for project_id in page]
+
+        assert sorted(ids) == sorted(project.id for project in projects)
+
+    def test_invalid_cursor_serves_first_page(self, api_client, projects):
+        first = api_client.get(EXPLORE_URL, {'sort': 'newest', 'page_size': 10}).data
+        bad = encode_cursor({'v': ['not-a-date', 'x', 3]})
+        response = api_client.get(EXPLORE_URL, {'sort': 'newest', 'page_size': 10, 'cursor': bad})
+
+        assert response.status_code == 200
+        assert [project['id'] for project in response.data['results']] == [
+            project['id'] for project in first['results']
+        ]
+
+    def test_legacy_page_number_matches_cursor_page(self, api_client, projects):
+        by_cursor = walk_pages(api_client, {'tab': 'new', 'seed': 'fixed'})
+        legacy = api_client.get(EXPLORE_URL, {'tab': 'new', 'seed': 'fixed', 'page': 3, 'page_size': 10}).data
+
+        assert [project['id'] for project in legacy['results']] == by_cursor[2]
+
+    def test_page_queries_use_explore_indexes(self, projects):
+        with connection.cursor() as cursor:
+            cursor.execute('SET LOCAL enable_seqscan = off')
+
+        public = Project.objects.public()
+        newest = public.filter(after(['-created_at', '-id'], [projects[20].created_at, projects[20].id]))
+        shuffled = public.filter(random_key__gte=0.5).order_by(*SHUFFLE_ORDERING)
+
+        assert 'project_explore_newest_idx' in newest.order_by('-created_at', '-id')[:30].explain()
+        assert 'project_explore_shuffle_idx' in shuffled[:30].explain()
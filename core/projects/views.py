@@ -20,6 +20,7 @@ from core.throttles import AuthenticatedProjectsThrottle, ProjectLikeThrottle, P
 from core.users.models import User
 
 from .constants import MIN_RESPONSE_TIME_SECONDS
+from .keyset import SHUFFLE_ORDERING, ShuffledWalk, decode_cursor, encode_cursor, keyset_window, row_values
 from .models import Project, ProjectDismissal, ProjectLike
 from .serializers import ProjectCardSerializer, ProjectContextSerializer, ProjectSerializer
 from .topic_utils import get_project_topic_names, set_project_topics
@@ -1657,15 +1658,13 @@ def explore_projects(request):
             # Fall through to default sorting
 
     elif tab == 'new':
-        # Seeded random ordering - randomized but stable across pagination
-        # Uses a seed to create deterministic pseudo-random order:
+        # Seeded shuffle - randomized but stable across pagination
         # - Frontend passes freshness_token for fresh ordering each page visit
         # - Falls back to legacy 'seed' param or hourly seed
-        # Admin-promoted projects get an 8% boost to appear more frequently near the top
-        import time
-
-        from django.db.models import CharField, Value
-        from django.db.models.functions import MD5, Cast, Concat
+        # The seed picks a start point on the indexed Project.random_key and pages
+        # seek along it with a cursor (see core.projects.keyset), so a deep page
+        # costs the same as the first one.
+        # Admin-promoted projects get an 8% boost within each page
         from django.utils import timezone
 
         from services.personalization.cold_start import PROMOTION_DURATION_DAYS, PROMOTION_WEIGHT
@@ -1677,24 +1676,17 @@ def explore_projects(request):
             # Hourly seed - all users see same "random" order within the hour
             seed = str(int(time.time() // 3600))
 
-        # Create deterministic random order using MD5 hash of (id + seed)
-        # This produces the same order for the same seed across all page requests
-        queryset = queryset.annotate(random_order=MD5(Concat(Cast('id', CharField()), Value(seed)))).order_by(
-            'random_order'
-        )
-
-        # Use standard pagination (no user diversity for "new" tab)
+        walk = ShuffledWalk(seed)
+        cursor = decode_cursor(request.GET.get('cursor'), SHUFFLE_ORDERING)
         page_num = int(request.GET.get('page', 1))
         page_size = min(int(request.GET.get('page_size', 30)), 100)
 
-        # Fetch more projects than needed to apply promotion boost
-        fetch_size = page_size * 3
-        start_idx = (page_num - 1) * page_size
-
-        if page_num == 1:
-            raw_projects = list(queryset[:fetch_size])
-        else:
-            raw_projects = list(queryset[start_idx : start_idx + fetch_size])
+        # Legacy ?page=N requests without a cursor still work, via an offset into the walk
+        offset = 0 if cursor else (page_num - 1) * page_size
+        raw_projects = walk.window(queryset, cursor, page_size + 1, offset)
+        has_next = len(raw_projects) > page_size
+        raw_projects = raw_projects[:page_size]
+        next_cursor = encode_cursor(walk.cursor_for(raw_projects[-1])) if has_next else None
 
         # Apply promotion boost - reorder to give promoted projects higher visibility
         # without pinning them to the top
@@ -1720,7 +1712,7 @@ def explore_projects(request):
 
         # Sort by combined score, then by original position for ties
         scored.sort(key=lambda x: (-x[1], x[2]))
-        boosted_projects = [item[0] for item in scored][:page_size]
+        boosted_projects = [item[0] for item in scored]
 
         serializer = ProjectCardSerializer(boosted_projects, many=True)
         results = serializer.data
@@ -1736,7 +1728,6 @@ def explore_projects(request):
 
         # Build paginated response manually since we're not using the paginator
         total_count = queryset.count()
-        has_next = (page_num * page_size) < total_count
         has_previous = page_num > 1
 
         return Response(
@@ -1745,29 +1736,32 @@ def explore_projects(request):
                 'next': has_next,
                 'previous': has_previous,
                 'results': results,
+                'next_cursor': next_cursor,
                 'seed': seed,
                 'freshness_token': freshness_token,
             }
         )
 
-    # Default sorting for 'all' tab or fallback
-    # If fuzzy search was applied, prioritize by similarity score
+    # Default sorting for 'all' tab or fallback. Every ordering ends in the primary
+    # key so pages can seek past the cursor row instead of using OFFSET.
+    walk = None
+    ordering = ['-created_at', '-id']  # newest (default)
     if search_similarity_applied:
-        # Order by similarity first, then by creation date
-        queryset = queryset.order_by('-search_similarity', '-created_at')
+        # If fuzzy search was applied, order by similarity first, then by creation date
+        ordering = ['-search_similarity', '-created_at', '-id']
     elif sort == 'trending':
         # Trending: most likes in the last 7 days
-        queryset = queryset.annotate(recent_likes=Count('likes')).order_by('-recent_likes', '-created_at')
+        queryset = queryset.annotate(recent_likes=Count('likes'))
+        ordering = ['-recent_likes', '-created_at', '-id']
     elif sort == 'popular':
         # Popular: most likes all-time
-        queryset = queryset.annotate(total_likes=Count('likes')).order_by('-total_likes', '-created_at')
+        queryset = queryset.annotate(total_likes=Count('likes'))
+        ordering = ['-total_likes', '-created_at', '-id']
     elif sort == 'random':
-        queryset = queryset.order_by('?')
-    else:  # newest (default)
-        # Sort by newest, then apply user diversity to prevent feed domination
-        queryset = queryset.order_by('-created_at')
+        # Seeded shuffle, stable across pages (order_by('?') reshuffled on every page)
+        walk = ShuffledWalk(freshness_token or request.GET.get('seed') or str(int(time.time() // 3600)))
+    cursor = decode_cursor(request.GET.get('cursor'), SHUFFLE_ORDERING if walk else ordering)
 
-    # Apply pagination with user diversity for newest sort
     # Mobile optimization: detect mobile via User-Agent and reduce default page size
     # This significantly reduces initial payload for mobile users
     user_agent = request.headers.get('user-agent', '').lower()
@@ -1783,31 +1777,46 @@ def explore_projects(request):
         page_size = default_page_size
     page_num = int(request.GET.get('page', 1))
 
+    # Legacy ?page=N requests without a cursor still work, via an offset
+    offset = 0 if cursor else (page_num - 1) * page_size
+
+    def read_window(size):
+        if walk:
+            return walk.window(queryset, cursor, size, offset)
+        return keyset_window(queryset, ordering, cursor, size, offset)
+
     if sort == 'newest' or sort is None:
         # Apply user diversity - max 3 posts per user per page
         from services.personalization import apply_user_diversity
 
         # Fetch extra to account for diversity filtering
-        start_idx = (page_num - 1) * page_size
         fetch_size = page_size * 3
-        raw_projects = list(queryset[start_idx : start_idx + fetch_size])
+        window = read_window(fetch_size)
 
         diverse_projects = apply_user_diversity(
-            raw_projects,
+            window,
             max_per_user=3,
             page_size=page_size,
         )
 
+        # The next page resumes after the last served row; rows before it that
+        # the per-user cap held back stay skipped, as with the offset version
+        served_ids = {p.id for p in diverse_projects}
+        last_served = max((idx for idx, p in enumerate(window) if p.id in served_ids), default=-1)
+        has_next = last_served < len(window) - 1 or len(window) == fetch_size
+        last_row = window[last_served] if last_served >= 0 else None
+
         # Mix in timeless content (games, evergreen content) periodically
-        # Inject 1-2 timeless items per page, spread throughout the results
-        timeless_projects = list(
+        # Inject 1-2 timeless items per page, spread throughout the results.
+        # Random selection of timeless content, seeded per page so it's an index seek rather than a full sort
+        timeless_seed = f'{freshness_token or int(time.time() // 3600)}:{request.GET.get("cursor") or page_num}'
+        timeless_projects = ShuffledWalk(timeless_seed).sample(
             Project.objects.filter(
                 is_private=False,
                 is_archived=False,
                 is_timeless=True,
-            )
-            .exclude(id__in=[p.id for p in diverse_projects])
-            .order_by('?')[:2]  # Random selection of timeless content
+            ).exclude(id__in=served_ids),
+            2,
         )
 
         if timeless_projects:
@@ -1817,33 +1826,34 @@ def explore_projects(request):
                 if i < len(insert_positions) and insert_positions[i] < len(diverse_projects):
                     diverse_projects.insert(insert_positions[i] + i, timeless_project)
 
-        serializer = ProjectCardSerializer(diverse_projects, many=True)
-        results = serializer.data
-
-        # Build paginated response manually
-        total_count = queryset.count()
-        has_next = start_idx + page_size < total_count
-        next_url = f'?page={page_num + 1}&page_size={page_size}' if has_next else None
-        prev_url = f'?page={page_num - 1}&page_size={page_size}' if page_num > 1 else None
-        return Response(
-            {
-                'count': total_count,
-                'next': next_url,
-                'previous': prev_url,
-                'results': results,
-            }
-        )
+        page_projects = diverse_projects
+    else:
+        # For other sorts (trending, popular, random), one row past the page tells us if there's a next one
+        window = read_window(page_size + 1)
+        has_next = len(window) > page_size
+        page_projects = window[:page_size]
+        last_row = page_projects[-1] if page_projects else None
 
-    # For other sorts (trending, popular, random), use standard pagination
-    paginator = ProjectPagination()
-    paginator.page_size = page_size
-    page = paginator.paginate_queryset(queryset, request)
+    next_cursor = None
+    if has_next and last_row is not None:
+        next_cursor = encode_cursor(walk.cursor_for(last_row) if walk else {'v': row_values(last_row, ordering)})
 
-    serializer = ProjectCardSerializer(page, many=True)
+    serializer = ProjectCardSerializer(page_projects, many=True)
     results = serializer.data
 
-    response = paginator.get_paginated_response(results)
-    return response
+    # Build paginated response manually
+    total_count = queryset.count()
+    next_url = f'?page={page_num + 1}&page_size={page_size}&cursor={next_cursor}' if next_cursor else None
+    prev_url = f'?page={page_num - 1}&page_size={page_size}' if page_num > 1 else None
+    return Response(
+        {
+            'count': total_count,
+            'next': next_url,
+            'previous': prev_url,
+            'results': results,
+            'next_cursor': next_cursor,
+        }
+    )
 
 
 @api_view(['POST'])
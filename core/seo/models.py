@@ -0,0 +1,30 @@
+from django.db import models
+
+
+class SitemapShard(models.Model):
+    """A pre-rendered, gzip-compressed sitemap file covering one ID range of a section.
+
+    Shard ``n`` of a section holds the public rows with IDs in
+    ``(n * SITEMAP_SHARD_SIZE, (n + 1) * SITEMAP_SHARD_SIZE]``. ``signature``
+    summarises the range (rows included, their ID sum, and the latest
+    ``updated_at`` of every row in it, public or not); the shard is only
+    re-rendered when it changes or is cleared by a username change. See
+    core.seo.shards.
+    """
+
+    section = models.CharField(max_length=20, help_text='Sitemap section (projects, profiles, tools)')
+    shard = models.PositiveIntegerField(help_text='Shard number; covers one fixed ID range')
+    url_count = models.PositiveIntegerField(default=0)
+    signature = models.CharField(max_length=100, help_text='Summary of the ID range at the last render')
+    max_updated_at = models.DateTimeField(null=True, blank=True, help_text='Latest updated_at in the ID range')
+    object_name = models.CharField(max_length=500, help_text='Storage object name of the gzip file')
+    generated_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['section', 'shard']
+        constraints = [
+            models.UniqueConstraint(fields=['section', 'shard'], name='unique_sitemap_shard'),
+        ]
+
+    def __str__(self):
+        return f'{self.section} shard {self.shard} ({self.url_count} URLs)'
@@ -0,0 +1,207 @@
+"""
+Pre-rendered sitemap shards behind the /sitemap.xml index.
+
+Each sharded section is split into fixed ID ranges of SITEMAP_SHARD_SIZE rows;
+shard n covers IDs (n * size, (n + 1) * size]. A row never moves to another
+shard, so an edit only touches the file for its own range.
+
+regenerate_sitemap_shards() summarises every range of a section in one grouped
+query (public rows, their ID sum, and the latest updated_at of all rows in the
+range), renders only the ranges whose summary changed since the last run, and
+stores each as a gzip-compressed sitemap in object storage under a content
+hash. The index and shard views serve these files without touching the
+section tables.
+
+Profile and project URLs embed the owner's username, which the summaries
+can't see, so a username change clears the signatures of the owner's shards
+(mark_user_shards_dirty) and the next run re-renders them.
+"""
+
+import gzip
+import hashlib
+import logging
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db.models import Count, ExpressionWrapper, F, IntegerField, Max, Sum
+from django.template.loader import render_to_string
+from django.utils import timezone
+
+from core.seo.models import SitemapShard
+from core.sitemaps import ProjectSitemap, ToolSitemap, UserProfileSitemap
+from services.integrations.storage.storage_service import get_storage_service
+
+logger = logging.getLogger(__name__)
+
+SHARDED_SITEMAPS = {
+    'projects': ProjectSitemap,
+    'profiles': UserProfileSitemap,
+    'tools': ToolSitemap,
+}
+STORAGE_FOLDER = 'sitemaps'
+
+
+def shard_id_range(shard: int) -> tuple[int, int]:
+    """(exclusive lower, inclusive upper) ID bounds of a shard."""
+    size = settings.SITEMAP_SHARD_SIZE
+    return shard * size, (shard + 1) * size
+
+
+def summarize_shards(sitemap) -> dict[int, dict]:
+    """
+    Summaries of every non-empty ID range of a section, from one grouped query.
+
+    Returns:
+        {shard: {'url_count', 'signature', 'max_updated_at'}}
+    """
+    public = sitemap.public_filter()
+    aggregates = {
+        'url_count': Count('id', filter=public),
+        'id_sum': Sum('id', filter=public),
+    }
+    if sitemap.updated_field:
+        # Over every row in the range, so rows leaving the public set (made private, archived) are noticed
+        aggregates['max_updated_at'] = Max(sitemap.updated_field)
+
+    rows = (
+        sitemap.get_model()
+        .objects.annotate(
+            shard=ExpressionWrapper((F('id') - 1) / settings.SITEMAP_SHARD_SIZE, output_field=IntegerField())
+        )
+        .values('shard')
+        .annotate(**aggregates)
+        .order_by()
+    )
+
+    summaries = {}
+    for row in rows:
+        max_updated_at = row.get('max_updated_at')
+        updated = max_updated_at.isoformat() if max_updated_at else ''
+        summaries[row['shard']] = {
+            'url_count': row['url_count'],
+            'signature': f'{row["url_count"]}:{row["id_sum"] or 0}:{updated}',
+            'max_updated_at': max_updated_at,
+        }
+    return summaries
+
+
+def mark_user_shards_dirty(user_id: int) -> int:
+    """
+    Clear the signatures of the shards holding a user's profile and projects.
+
+    Called when the username changes, since it appears in every one of their
+    URLs. Returns the number of shard records marked.
+    """
+    size = settings.SITEMAP_SHARD_SIZE
+    project_shards = (
+        ProjectSitemap()
+        .get_model()
+        .objects.filter(user_id=user_id)
+        .annotate(shard=ExpressionWrapper((F('id') - 1) / size, output_field=IntegerField()))
+        .values_list('shard', flat=True)
+        .distinct()
+    )
+    profiles = SitemapShard.objects.filter(section='profiles', shard=(user_id - 1) // size)
+    projects = SitemapShard.objects.filter(section='projects', shard__in=project_shards)
+    return (profiles | projects).update(signature='')
+
+
+def render_shard(sitemap, shard: int, domain: str) -> tuple[bytes, int]:
+    """
+    Render one shard as a gzip-compressed sitemap, reading its ID range in ID order.
+
+    Returns:
+        (gzip bytes, number of URLs)
+    """
+    first_id, last_id = shard_id_range(shard)
+    rows = sitemap.get_queryset().filter(id__gt=first_id, id__lte=last_id).order_by('id')
+
+    urlset = [
+        {
+            'location': f'{sitemap.protocol}://{domain}{sitemap.location(obj)}',
+            'lastmod': sitemap.lastmod(obj),
+            'changefreq': sitemap.changefreq,
+            'priority': sitemap.priority,
+        }
+        for obj in rows.iterator(chunk_size=2000)
+    ]
+    xml = render_to_string('sitemap.xml', {'urlset': urlset})
+    # mtime=0 keeps the output (and its content hash) identical for identical XML
+    return gzip.compress(xml.encode('utf-8'), mtime=0), len(urlset)
+
+
+def regenerate_sitemap_shards(sections: list[str] | None = None, force: bool = False) -> dict[str, dict[str, int]]:
+    """
+    Bring the stored sitemap shards up to date.
+
+    Args:
+        sections: Sections to process (default: all sharded sections)
+        force: Re-render every shard, even unchanged ones
+
+    Returns:
+        Per-section counts: shards, rendered, unchanged, removed, failed
+    """
+    storage = get_storage_service()
+    domain = Site.objects.get_current().domain
+    stats = {}
+
+    for section in sections or list(SHARDED_SITEMAPS):
+        sitemap = SHARDED_SITEMAPS[section]()
+        summaries = {shard: summary for shard, summary in summarize_shards(sitemap).items() if summary['url_count']}
+        existing = {record.shard: record for record in SitemapShard.objects.filter(section=section)}
+        counts = {'shards': len(summaries), 'rendered': 0, 'unchanged': 0, 'removed': 0, 'failed': 0}
+
+        for shard, summary in sorted(summaries.items()):
+            record = existing.get(shard)
+            if record and record.signature == summary['signature'] and not force:
+                counts['unchanged'] += 1
+                continue
+
+            data, url_count = render_shard(sitemap, shard, domain)
+            # Content-addressed, so a cached copy of an object name never goes stale
+            filename = f'{section}-{shard}-{hashlib.sha256(data).hexdigest()[:16]}.xml.gz'
+            object_name = f'private/{STORAGE_FOLDER}/{filename}'
+
+            if record is None or record.object_name != object_name:
+                stored_name, error = storage.upload_file(
+                    data,
+                    filename=f'sitemap-{section}-{shard}.xml.gz',
+                    content_type='application/gzip',
+                    folder=STORAGE_FOLDER,
+                    is_public=False,
+                    object_name=filename,
+                )
+                if error:
+                    logger.error(f'Failed to store sitemap shard {section}/{shard}: {error}')
+                    counts['failed'] += 1
+                    continue
+                previous = record.object_name if record else None
+            else:
+                stored_name, previous = object_name, None
+
+            SitemapShard.objects.update_or_create(
+                section=section,
+                shard=shard,
+                defaults={
+                    'url_count': url_count,
+                    'signature': summary['signature'],
+                    'max_updated_at': summary['max_updated_at'],
+                    'object_name': stored_name,
+                    'generated_at': timezone.now(),
+                },
+            )
+            if previous:
+                storage.delete_object(previous)
+            counts['rendered'] += 1
+
+        # Ranges whose rows were all deleted or made private
+        for shard, record in existing.items():
+            if shard not in summaries:
+                record.delete()
+                storage.delete_object(record.object_name)
+                counts['removed'] += 1
+
+        logger.info(f'Sitemap shards for {section}: {counts}')
+        stats[section] = counts
+
+    return stats
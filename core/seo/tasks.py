@@ -0,0 +1,27 @@
+"""
+Celery tasks for SEO files.
+"""
+
+import logging
+
+from celery import shared_task
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(soft_time_limit=900, time_limit=960)
+def regenerate_sitemap_shards_task(force: bool = False):
+    """
+    Re-render the sitemap shards whose rows changed since the last run.
+
+    Args:
+        force: Re-render every shard (e.g. after a template or URL format change)
+
+    Returns:
+        Per-section counts from regenerate_sitemap_shards
+    """
+    from .shards import regenerate_sitemap_shards
+
+    stats = regenerate_sitemap_shards(force=force)
+    logger.info(f'Regenerated sitemap shards: {stats}')
+    return stats
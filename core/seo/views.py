@@ -1,15 +1,33 @@
 """
-SEO views for LLM discoverability.
+SEO views for search engine and LLM discoverability.
 
 Implements the llms.txt specification (https://llmstxt.org/) to help
-AI tools and LLMs discover and index project content.
+AI tools and LLMs discover and index project content, and serves the
+sitemap index with its pre-rendered shards (see core.seo.shards).
 """
 
+import gzip
+import logging
+
+from django.contrib.sitemaps.views import SitemapIndexItem, x_robots_tag
+from django.contrib.sites.shortcuts import get_current_site
 from django.core.cache import cache
 from django.http import HttpResponse
+from django.shortcuts import get_object_or_404
+from django.template.response import TemplateResponse
+from django.urls import reverse
+from django.utils.http import http_date
 from django.views import View
 
 from core.projects.models import Project
+from core.seo.models import SitemapShard
+from core.seo.shards import SHARDED_SITEMAPS
+from core.sitemaps import StaticViewSitemap
+from services.integrations.storage.storage_service import get_storage_service
+
+logger = logging.getLogger(__name__)
+
+SHARD_CACHE_TTL = 60 * 60 * 24  # Shard objects are content-addressed, so cached bytes never go stale
 
 
 class LlmsTxtView(View):
@@ -87,3 +105,58 @@ def render_llms_txt(projects, request) -> str:
     lines.append(f'Take AI quizzes at {base_url}/learn')
 
     return '\n'.join(lines)
+
+
+@x_robots_tag
+def sitemap_index(request):
+    """Sitemap index of the static sitemap and every stored shard.
+
+    Sections not generated yet (fresh deploy) link their live, capped
+    /sitemap-<section>.xml instead, so crawlers always get something.
+    """
+    domain = get_current_site(request).domain
+
+    def absolute(protocol, path):
+        return f'{protocol}://{domain}{path}'
+
+    static_url = reverse('django.contrib.sitemaps.views.sitemap_section', kwargs={'section': 'static'})
+    items = [SitemapIndexItem(absolute(StaticViewSitemap.protocol, static_url))]
+
+    sharded = set()
+    for shard in SitemapShard.objects.all():
+        sharded.add(shard.section)
+        path = reverse('sitemap_shard', kwargs={'section': shard.section, 'shard': shard.shard})
+        protocol = SHARDED_SITEMAPS[shard.section].protocol
+        items.append(SitemapIndexItem(absolute(protocol, path), shard.max_updated_at or shard.generated_at))
+
+    for section, sitemap in SHARDED_SITEMAPS.items():
+        if section not in sharded:
+            path = reverse('django.contrib.sitemaps.views.sitemap_section', kwargs={'section': section})
+            items.append(SitemapIndexItem(absolute(sitemap.protocol, path)))
+
+    return TemplateResponse(request, 'sitemap_index.xml', {'sitemaps': items}, content_type='application/xml')
+
+
+@x_robots_tag
+def sitemap_shard(request, section, shard):
+    """Serve one pre-rendered sitemap shard, gzip-encoded when the client accepts it."""
+    record = get_object_or_404(SitemapShard, section=section, shard=shard)
+
+    cache_key = f'sitemap_shard:{record.object_name}'
+    data = cache.get(cache_key)
+    if data is None:
+        try:
+            data = get_storage_service().download_file(record.object_name)
+        except Exception as e:
+            logger.error(f'Failed to load sitemap shard {section}/{shard}: {e}', exc_info=True)
+            return HttpResponse(status=503)  # Crawlers retry later
+        cache.set(cache_key, data, SHARD_CACHE_TTL)
+
+    if 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = HttpResponse(data, content_type='application/xml')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = HttpResponse(gzip.decompress(data), content_type='application/xml')
+    response['Vary'] = 'Accept-Encoding'
+    response['Last-Modified'] = http_date(record.generated_at.timestamp())
+    return response
@@ -9,7 +9,7 @@ from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from .projects.models import Project
-from .users.models import User
+from .users.models import User, UsernameHistory
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +94,15 @@ def invalidate_user_cache(sender, instance, **kwargs):
         cache.delete(f'projects:{username}:own')
 
 
+@receiver(post_save, sender=UsernameHistory)
+def mark_sitemap_shards_for_username_change(sender, instance, created, **kwargs):
+    """Re-render the sitemap shards listing the renamed user's profile and project URLs."""
+    if created:
+        from core.seo.shards import mark_user_shards_dirty
+
+        mark_user_shards_dirty(instance.user_id)
+
+
 @receiver(post_save, sender=User)
 def create_email_preferences(sender, instance, created, **kwargs):
     """Create EmailPreferences for new users.
@@ -8,6 +8,11 @@ Features:
 - Error handling for database failures
 - Redis caching for performance
 - Protocol-aware (http in dev, https in production)
+
+/sitemap.xml is an index of pre-rendered, gzip-compressed shards of the
+projects, profiles and tools sitemaps (see core.seo.shards), so every row is
+advertised however large the tables grow. The per-section sitemaps below
+still serve /sitemap-<section>.xml directly, capped at `limit` rows.
 """
 
 import logging
@@ -16,6 +21,7 @@ from django.conf import settings
 from django.contrib.sitemaps import Sitemap
 from django.core.cache import cache
 from django.db import DatabaseError
+from django.db.models import Q
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +64,7 @@ class ProjectSitemap(Sitemap):
     changefreq = 'daily'
     protocol = 'https' if not settings.DEBUG else 'http'
     limit = 5000  # Google recommends max 50,000 URLs per sitemap
+    updated_field = 'updated_at'  # Detects changed shards (core.seo.shards)
 
     def items(self):
         """Return queryset of public projects with caching and error handling."""
@@ -69,27 +76,7 @@ class ProjectSitemap(Sitemap):
             if cached_projects is not None:
                 return cached_projects
 
-            from core.projects.models import Project
-
-            # Only include truly public projects
-            # Only include public showcased projects in sitemap
-            projects = list(
-                Project.objects.filter(
-                    is_private=False,
-                    is_archived=False,
-                    is_showcased=True,
-                )
-                .select_related(
-                    'user'  # Optimize N+1 queries
-                )
-                .only(
-                    'id',
-                    'slug',
-                    'updated_at',
-                    'user__username',  # Only fetch needed fields
-                )
-                .order_by('-updated_at')[: self.limit]
-            )
+            projects = list(self.get_queryset().order_by('-updated_at')[: self.limit])
 
             # Cache for 1 hour
             cache.set(cache_key, projects, 3600)
@@ -102,6 +89,31 @@ class ProjectSitemap(Sitemap):
             logger.error(f'Unexpected error in ProjectSitemap: {e}', exc_info=True)
             return []
 
+    def get_model(self):
+        from core.projects.models import Project
+
+        return Project
+
+    def public_filter(self) -> Q:
+        """Only include public showcased projects in sitemap."""
+        return Q(is_private=False, is_archived=False, is_showcased=True)
+
+    def get_queryset(self):
+        """Public projects with only the fields needed to build their URLs."""
+        return (
+            self.get_model()
+            .objects.filter(self.public_filter())
+            .select_related(
+                'user'  # Optimize N+1 queries
+            )
+            .only(
+                'id',
+                'slug',
+                'updated_at',
+                'user__username',  # Only fetch needed fields
+            )
+        )
+
     def lastmod(self, obj):
         """Return last modification date."""
         return obj.updated_at
@@ -119,6 +131,7 @@ class UserProfileSitemap(Sitemap):
     changefreq = 'weekly'
     protocol = 'https' if not settings.DEBUG else 'http'
     limit = 5000
+    updated_field = None  # User has no updated_at; renames mark shards dirty (core.seo.shards.mark_user_shards_dirty)
 
     def items(self):
         """Return queryset of active users with caching and error handling."""
@@ -130,24 +143,7 @@ class UserProfileSitemap(Sitemap):
             if cached_profiles is not None:
                 return cached_profiles
 
-            from core.users.models import User
-
-            # Only include active users who opted-in to public profiles
-            # Respects user privacy - users can opt-out in settings
-            # Exclude guest users from sitemap
-            profiles = list(
-                User.objects.filter(
-                    is_active=True,
-                    is_profile_public=True,  # Privacy: Only users who want to be discovered
-                    is_guest=False,  # Exclude temporary guest accounts
-                )
-                .only(
-                    'username',
-                    'date_joined',
-                    'is_profile_public',  # Minimal fields
-                )
-                .order_by('-date_joined')[: self.limit]
-            )
+            profiles = list(self.get_queryset().order_by('-date_joined')[: self.limit])
 
             # Cache for 2 hours (profiles change less frequently)
             cache.set(cache_key, profiles, 7200)
@@ -160,6 +156,36 @@ class UserProfileSitemap(Sitemap):
             logger.error(f'Unexpected error in UserProfileSitemap: {e}', exc_info=True)
             return []
 
+    def get_model(self):
+        from core.users.models import User
+
+        return User
+
+    def public_filter(self) -> Q:
+        """
+        Only include active users who opted-in to public profiles.
+
+        Respects user privacy - users can opt-out in settings.
+        Exclude guest users from sitemap.
+        """
+        return Q(
+            is_active=True,
+            is_profile_public=True,  # Privacy: Only users who want to be discovered
+            is_guest=False,  # Exclude temporary guest accounts
+        )
+
+    def get_queryset(self):
+        """Public profiles with only the fields needed to build their URLs."""
+        return (
+            self.get_model()
+            .objects.filter(self.public_filter())
+            .only(
+                'username',
+                'date_joined',
+                'is_profile_public',  # Minimal fields
+            )
+        )
+
     def lastmod(self, obj):
         """Return last modification date."""
         # User model doesn't have updated_at, use date_joined
@@ -177,6 +203,7 @@ class ToolSitemap(Sitemap):
     changefreq = 'monthly'
     protocol = 'https' if not settings.DEBUG else 'http'
     limit = 5000
+    updated_field = 'updated_at'  # Detects changed shards (core.seo.shards)
 
     def items(self):
         """Return queryset of active tools with caching and error handling."""
@@ -188,19 +215,7 @@ class ToolSitemap(Sitemap):
             if cached_tools is not None:
                 return cached_tools
 
-            from core.tools.models import Tool
-
-            tools = list(
-                Tool.objects.filter(
-                    is_active=True,
-                )
-                .only(
-                    'slug',
-                    'updated_at',
-                    'created_at',  # Minimal fields
-                )
-                .order_by('-created_at')[: self.limit]
-            )
+            tools = list(self.get_queryset().order_by('-created_at')[: self.limit])
 
             # Cache for 4 hours (tools change rarely)
             cache.set(cache_key, tools, 14400)
@@ -213,6 +228,26 @@ class ToolSitemap(Sitemap):
             logger.error(f'Unexpected error in ToolSitemap: {e}', exc_info=True)
             return []
 
+    def get_model(self):
+        from core.tools.models import Tool
+
+        return Tool
+
+    def public_filter(self) -> Q:
+        return Q(is_active=True)
+
+    def get_queryset(self):
+        """Active tools with only the fields needed to build their URLs."""
+        return (
+            self.get_model()
+            .objects.filter(self.public_filter())
+            .only(
+                'slug',
+                'updated_at',
+                'created_at',  # Minimal fields
+            )
+        )
+
     def lastmod(self, obj):
         """Return last modification date."""
         return obj.updated_at
@@ -10,8 +10,11 @@ This module provides intelligent, automatic personalization by:
 """
 
 import logging
+import threading
+import uuid
 from datetime import timedelta
 
+from django.core.cache import cache
 from django.utils import timezone
 
 from core.taxonomy.models import Taxonomy, UserTag
@@ -20,6 +23,116 @@ from services.ai import AIProvider
 
 logger = logging.getLogger(__name__)
 
+TOOL_MATCHER_VERSION_KEY = 'taxonomy:tool_matcher:version'
+
+# Trie key marking the end of a tool name (never a real character)
+_END = ''
+
+
+def _is_word_char(char: str) -> bool:
+    # Same character class as the \w that regex word boundaries use
+    return char.isalnum() or char == '_'
+
+
+class ToolNameMatcher:
+    """
+    Finds tool names mentioned in text in one pass.
+
+    Names are stored lowercased in a character trie. Matching walks the trie
+    from every word boundary in the text and keeps names that also end on a
+    word boundary, the same result as searching r'\\b<name>\\b' per tool.
+    """
+
+    def __init__(self, names: list[tuple[str, int]]):
+        """
+        Args:
+            names: (name, tool_id) pairs; a tool may appear under several names
+        """
+        self._trie: dict = {}
+        self.size = 0
+        for name, tool_id in names:
+            term = name.lower()
+            if not term:
+                continue
+            node = self._trie
+            for char in term:
+                node = node.setdefault(char, {})
+            node.setdefault(_END, []).append(tool_id)
+            self.size += 1
+
+    @classmethod
+    def from_db(cls) -> 'ToolNameMatcher':
+        return cls(list(Tool.objects.filter(is_active=True).values_list('name', 'id')))
+
+    def find(self, text: str) -> list[int]:
+        """IDs of the tools mentioned in text, in order of first mention."""
+        text_lower = text.lower()
+        words = [_is_word_char(char) for char in text_lower]
+        length = len(text_lower)
+        found: dict[int, None] = {}
+
+        for start, char in enumerate(text_lower):
+            if (start > 0 and words[start - 1]) == words[start]:
+                continue  # No word boundary before this character
+            node = self._trie.get(char)
+            end = start
+            while node is not None:
+                tool_ids = node.get(_END)
+                if tool_ids and (end + 1 < length and words[end + 1]) != words[end]:
+                    found.update(dict.fromkeys(tool_ids))
+                end += 1
+                if end == length:
+                    break
+                node = node.get(text_lower[end])
+
+        return list(found)
+
+
+_tool_matcher: tuple[str, ToolNameMatcher] | None = None
+_tool_matcher_lock = threading.Lock()
+
+
+def get_tool_matcher() -> ToolNameMatcher:
+    """
+    The process-wide tool name matcher, rebuilt when the tool list changes.
+
+    Tool saves and deletes stamp a new version in the shared cache (see
+    invalidate_tool_matcher), so every process rebuilds on its next call.
+    Between changes, matching costs one cache read and no database queries.
+    """
+    global _tool_matcher
+
+    version = cache.get(TOOL_MATCHER_VERSION_KEY)
+    if version is None:
+        cache.add(TOOL_MATCHER_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(TOOL_MATCHER_VERSION_KEY)
+
+    current = _tool_matcher
+    if current is not None and current[0] == version:
+        return current[1]
+
+    with _tool_matcher_lock:
+        if _tool_matcher is None or _tool_matcher[0] != version:
+            _tool_matcher = (version, ToolNameMatcher.from_db())
+            logger.debug(f'Built tool name matcher with {_tool_matcher[1].size} names (version {version})')
+        return _tool_matcher[1]
+
+
+def invalidate_tool_matcher() -> None:
+    """Stamp a new tool matcher version so every process rebuilds its matcher."""
+    cache.set(TOOL_MATCHER_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+
+
+def find_tools_in_text(text: str) -> list[Tool]:
+    """Active tools whose names appear as whole words in text; no query when none do."""
+    if not text or not text.strip():
+        return []
+
+    tool_ids = get_tool_matcher().find(text)
+    if not tool_ids:
+        return []
+    return list(Tool.objects.filter(id__in=tool_ids, is_active=True).select_related('taxonomy'))
+
 
 def auto_assign_category_to_project(project, force: bool = False) -> Taxonomy | None:
     """
@@ -149,30 +262,12 @@ def extract_tools_from_project(project) -> list[Tool]:
     Returns:
         List of Tool instances found in the project
     """
-    tools_found = []
-
     # Combine text sources for analysis
-    text = f'{project.title} {project.description or ""}'.lower()
-
-    if not text.strip():
-        return tools_found
-
-    # Get all active tools with their common variations
-    known_tools = Tool.objects.filter(is_active=True).select_related('taxonomy')
-
-    for tool in known_tools:
-        # Check tool name
-        tool_name_lower = tool.name.lower()
+    text = f'{project.title} {project.description or ""}'
 
-        # Simple word boundary check
-        if tool_name_lower in text:
-            # Verify it's a word boundary (not part of another word)
-            import re
-
-            pattern = r'\b' + re.escape(tool_name_lower) + r'\b'
-            if re.search(pattern, text):
-                tools_found.append(tool)
-                logger.debug(f"Found tool '{tool.name}' in project '{project.title}'")
+    tools_found = find_tools_in_text(text)
+    for tool in tools_found:
+        logger.debug(f"Found tool '{tool.name}' in project '{project.title}'")
 
     return tools_found
 
@@ -439,8 +534,8 @@ def extract_tools_from_text(text: str) -> list[Tool]:
     """
     Extract AI tools mentioned in any text (search queries, chat, etc.).
 
-    Searches for known Tool names in the provided text.
-    Case-insensitive matching with whole-word boundaries.
+    Searches for known Tool names in the provided text with the cached
+    tool name matcher. Case-insensitive matching with whole-word boundaries.
 
     Args:
         text: Text content to analyze
@@ -448,26 +543,9 @@ def extract_tools_from_text(text: str) -> list[Tool]:
     Returns:
         List of Tool instances found in the text
     """
-    import re
-
-    tools_found = []
-
-    if not text or not text.strip():
-        return tools_found
-
-    text_lower = text.lower()
-
-    # Get all active tools
-    known_tools = Tool.objects.filter(is_active=True).select_related('taxonomy')
-
-    for tool in known_tools:
-        tool_name_lower = tool.name.lower()
-
-        # Word boundary check
-        pattern = r'\b' + re.escape(tool_name_lower) + r'\b'
-        if re.search(pattern, text_lower):
-            tools_found.append(tool)
-            logger.debug(f"Found tool '{tool.name}' in text")
+    tools_found = find_tools_in_text(text)
+    for tool in tools_found:
+        logger.debug(f"Found tool '{tool.name}' in text")
 
     return tools_found
 
@@ -7,10 +7,12 @@ UserTags to improve personalization recommendations.
 
 import logging
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from core.taxonomy.models import UserInteraction
+from core.tools.models import Tool
 
 logger = logging.getLogger(__name__)
 
@@ -81,3 +83,19 @@ def auto_tag_from_conversation(sender, instance, created, **kwargs):
             )
     except Exception as e:
         logger.error(f'Error auto-tagging from conversation: {e}', exc_info=True)
+
+
+@receiver(post_save, sender=Tool)
+@receiver(post_delete, sender=Tool)
+def invalidate_tool_matcher(sender, instance, **kwargs):
+    """
+    Rebuild the tool name matcher after a tool is added, renamed, deactivated or deleted.
+
+    The version is bumped now for this process and again after commit, so
+    other processes can't keep a matcher built from uncommitted rows.
+    """
+    # Import here to avoid circular imports
+    from core.taxonomy.services import invalidate_tool_matcher as invalidate
+
+    invalidate()
+    transaction.on_commit(invalidate)
@@ -0,0 +1,124 @@
+"""
+Tests for the cached tool name matcher behind extract_tools_from_text.
+
+Tests cover:
+- Whole-word matching identical to the previous per-tool regex search
+- Overlapping and repeated mentions
+- Zero database queries when the tool list hasn't changed
+- Rebuilds after tools are saved or deleted
+"""
+
+import random
+import re
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.test.utils import CaptureQueriesContext
+
+from core.taxonomy.services import ToolNameMatcher, extract_tools_from_text
+from core.tools.models import Tool
+
+NAMES = ['ChatGPT', 'GPT-4', 'GPT', 'C++', '.NET', 'Claude', 'LangChain', 'Stable Diffusion', 'R', 'node.js']
+
+
+def regex_matches(names: list[str], text: str) -> set[int]:
+    """The previous implementation: one \\b-bounded regex search per tool."""
+    text_lower = text.lower()
+    return {
+        tool_id for tool_id, name in enumerate(names) if re.search(r'\b' + re.escape(name.lower()) + r'\b', text_lower)
+    }
+
+
+class ToolNameMatcherTests(SimpleTestCase):
+    """Tests for the trie matcher itself."""
+
+    def setUp(self):
+        self.matcher = ToolNameMatcher([(name, tool_id) for tool_id, name in enumerate(NAMES)])
+
+    def find_names(self, text):
+        return [NAMES[tool_id] for tool_id in self.matcher.find(text)]
+
+    def test_case_insensitive_whole_words(self):
+        """Names match regardless of case, but not inside other words."""
+        self.assertEqual(self.find_names('I use chatgpt and LANGCHAIN daily'), ['ChatGPT', 'LangChain'])
+        self.assertEqual(self.find_names('chatgptx and mylangchain'), [])
+
+    def test_overlapping_names_all_match(self):
+        """A longer name and its prefix are both reported, like separate regex searches."""
+        self.assertEqual(self.find_names('Is GPT-4 better?'), ['GPT', 'GPT-4'])
+
+    def test_repeated_mentions_reported_once_in_first_mention_order(self):
+        self.assertEqual(self.find_names('Claude vs GPT, then Claude again'), ['Claude', 'GPT'])
+
+    def test_multi_word_names(self):
+        self.assertEqual(self.find_names('stable diffusion XL'), ['Stable Diffusion'])
+
+    def test_matches_regex_search_on_random_text(self):
+        """Results equal the per-tool regex search, including \\b quirks around punctuation."""
+        rng = random.Random(48)  # noqa: S311 - reproducible inputs, not security
+        alphabet = ['gpt', '-4', 'c++', '.net', 'r', 'node.js', 'claude', ' ', ' ', '.', 'x', '_', '4', 'é']
+        for _ in range(2000):
+            text = ''.join(rng.choices(alphabet, k=rng.randint(1, 12)))
+            with self.subTest(text=text):
+                self.assertEqual(set(self.matcher.find(text)), regex_matches(NAMES, text))
+
+    def test_empty_names_are_ignored(self):
+        matcher = ToolNameMatcher([('', 1), ('Cursor', 2)])
+        self.assertEqual(matcher.find('Cursor rocks'), [2])
+        self.assertEqual(matcher.size, 1)
+
+
+class ExtractToolsFromTextTests(TestCase):
+    """Tests for the cached matcher behind extract_tools_from_text."""
+
+    def setUp(self):
+        cache.clear()
+        self.tools = [
+            Tool.objects.create(
+                name=name,
+                slug=f'tool-{index}',
+                tagline=f'{name} tagline',
+                description=f'{name} description',
+                tool_type='ai_tool',
+                category='chat',
+            )
+            for index, name in enumerate(['ChatGPT', 'Claude', 'Midjourney'])
+        ]
+
+    def test_no_mentions_runs_no_queries(self):
+        """Once built, the matcher answers text without tools with zero queries."""
+        extract_tools_from_text('warm up')
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(extract_tools_from_text('How do I write a good prompt?'), [])
+        self.assertEqual(len(queries), 0)
+
+    def test_mentions_fetch_only_matched_tools(self):
+        extract_tools_from_text('warm up')
+
+        with CaptureQueriesContext(connection) as queries:
+            found = extract_tools_from_text('Compare claude with ChatGPT')
+        self.assertEqual({tool.name for tool in found}, {'ChatGPT', 'Claude'})
+        self.assertEqual(len(queries), 1)
+
+    def test_matcher_rebuilds_after_tool_changes(self):
+        """Saving or deleting a tool invalidates the matcher."""
+        self.assertEqual(extract_tools_from_text('Try Cursor'), [])
+
+        cursor = Tool.objects.create(
+            name='Cursor',
+            slug='cursor',
+            tagline='AI code editor',
+            description='Editor',
+            tool_type='ai_tool',
+            category='code',
+        )
+        self.assertEqual(extract_tools_from_text('Try Cursor'), [cursor])
+
+        cursor.is_active = False
+        cursor.save()
+        self.assertEqual(extract_tools_from_text('Try Cursor'), [])
+
+        self.tools[2].delete()
+        self.assertEqual(extract_tools_from_text('Midjourney art'), [])
@@ -0,0 +1,75 @@
+"""Tests for the generic Redis ZSET leaderboard engine."""
+
+from unittest.mock import patch
+
+import pytest
+
+from core.utils.leaderboard import RedisLeaderboard
+
+fakeredis = pytest.importorskip('fakeredis')
+
+
+@pytest.fixture
+def redis_client():
+    client = fakeredis.FakeRedis()
+    with patch('core.utils.leaderboard.get_redis_client', return_value=client):
+        yield client
+
+
+@pytest.fixture
+def board(redis_client):
+    board = RedisLeaderboard('test:board')
+    board.replace([(1, 10), (2, 50), (3, 30), (4, 20), (5, 40)])
+    return board
+
+
+class TestRedisLeaderboard:
+    def test_page_is_ordered_by_score(self, board):
+        assert board.page(0, 2) == [(2, 50.0), (5, 40.0), (3, 30.0)]
+
+    def test_standings(self, board):
+        assert board.standings([3, 99]) == {3: (3, 30.0), 99: (None, 0.0)}
+
+    def test_neighbors_window(self, board):
+        assert board.neighbors(3, window=1) == [(5, 40.0, 2), (3, 30.0, 3), (4, 20.0, 4)]
+
+    def test_neighbors_clamped_at_top(self, board):
+        assert board.neighbors(2, window=1) == [(2, 50.0, 1), (5, 40.0, 2)]
+
+    def test_incr_and_set_score(self, board):
+        board.incr(1, 100)
+        board.set_score(6, 5, only_new=True)
+        board.set_score(2, 0, only_new=True)
+
+        assert board.rank(1) == 1
+        assert board.score(6) == 5.0
+        assert board.score(2) == 50.0
+
+    def test_pipelined_writes_across_boards(self, redis_client, board):
+        other = RedisLeaderboard('test:other', ttl=60)
+        pipe = redis_client.pipeline(transaction=False)
+        board.incr(4, 1, pipe=pipe)
+        other.incr(4, 1, pipe=pipe)
+        pipe.execute()
+
+        assert board.score(4) == 21.0
+        assert other.score(4) == 1.0
+        assert 0 < redis_client.ttl('test:other') <= 60
+
+    def test_replace_swaps_contents(self, board):
+        written = board.replace([(7, 1)])
+
+        assert written == 1
+        assert board.size() == 1
+
+    def test_replace_with_no_rows_clears_board(self, board):
+        board.replace([])
+
+        assert board.exists() is False
+
+    def test_reads_fail_soft_without_redis(self):
+        board = RedisLeaderboard('test:none')
+        with patch('core.utils.leaderboard.get_redis_client', return_value=None):
+            assert board.page() == []
+            assert board.standing(1) == (None, 0.0)
+            assert board.size() == 0
@@ -0,0 +1,202 @@
+"""
+Tests for the sharded sitemap index.
+
+Tests cover:
+1. Every public project is reachable from /sitemap.xml through the stored shards
+2. A second run re-renders only the shards whose rows changed
+3. Shards whose rows all disappear are removed
+4. Shards are served gzip-encoded or plain depending on Accept-Encoding
+5. Sections without stored shards fall back to their live sitemap
+6. A username change re-renders the owner's profile and project shards
+"""
+
+import gzip
+import re
+from unittest.mock import patch
+
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.test import Client, TestCase, override_settings
+
+from core.projects.models import Project
+from core.seo.models import SitemapShard
+from core.seo.shards import regenerate_sitemap_shards
+from core.users.models import User
+
+LOC_RE = re.compile(r'<loc>([^<]+)</loc>')
+
+
+class FakeStorage:
+    """In-memory stand-in for StorageService (upload/download/delete by object name)."""
+
+    def __init__(self):
+        self.objects = {}
+        self.uploads = 0
+
+    def upload_file(self, file_data, filename, content_type, folder, is_public, object_name):
+        name = f'private/{folder}/{object_name}'
+        self.objects[name] = file_data
+        self.uploads += 1
+        return name, None
+
+    def download_file(self, object_name):
+        return self.objects[object_name]
+
+    def delete_object(self, object_name):
+        return self.objects.pop(object_name, None) is not None
+
+
+class ShardedSitemapTestCase(TestCase):
+    def setUp(self):
+        cache.clear()
+        Site.objects.update_or_create(id=1, defaults={'domain': 'testserver', 'name': 'Test'})
+        Site.objects.clear_cache()
+
+        self.storage = FakeStorage()
+        for module in ('core.seo.shards', 'core.seo.views'):
+            patcher = patch(f'{module}.get_storage_service', return_value=self.storage)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.client = Client()
+
+    def create_projects(self, count, users=1):
+        owners = [
+            User.objects.create_user(username=f'owner{i}', email=f'owner{i}@test.com', password='testpass123')
+            for i in range(users)
+        ]
+        Project.objects.bulk_create(
+            (
+                Project(
+                    user=owners[i % users],
+                    title=f'Project {i}',
+                    slug=f'project-{i}',
+                    is_showcased=True,
+                    is_private=False,
+                    is_archived=False,
+                )
+                for i in range(count)
+            ),
+            batch_size=5000,
+        )
+        return list(Project.objects.select_related('user').order_by('id'))
+
+    def crawl(self):
+        """Follow /sitemap.xml to every project URL, the way a crawler would."""
+        index = self.client.get('/sitemap.xml')
+        self.assertEqual(index.status_code, 200)
+
+        urls = set()
+        for loc in LOC_RE.findall(index.content.decode()):
+            path = loc.split('testserver', 1)[1]
+            if not re.match(r'^/sitemap-projects-\d+\.xml$', path):
+                continue
+            response = self.client.get(path, HTTP_ACCEPT_ENCODING='gzip, deflate')
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response['Content-Encoding'], 'gzip')
+            urls.update(LOC_RE.findall(gzip.decompress(response.content).decode()))
+        return urls
+
+    @staticmethod
+    def project_url(project):
+        return f'https://testserver/@{project.user.username}/{project.slug}'
+
+
+class ShardRegenerationTests(ShardedSitemapTestCase):
+    """Full and incremental shard generation over 50k projects."""
+
+    def test_every_project_reachable_and_only_dirty_shards_rerendered(self):
+        projects = self.create_projects(50_000, users=50)
+        private = projects[7]
+        private.is_private = True
+        private.save()
+
+        first = regenerate_sitemap_shards(['projects'])['projects']
+
+        self.assertGreaterEqual(first['shards'], 5)
+        self.assertEqual(first['rendered'], first['shards'])
+        self.assertEqual(first['unchanged'], 0)
+
+        expected = {self.project_url(project) for project in projects if project.id != private.id}
+        self.assertEqual(self.crawl(), expected)
+
+        # Touch two projects in different shards: one renamed, one made private
+        renamed, hidden = projects[100], projects[-100]
+        renamed.slug = 'renamed-project'
+        renamed.save()
+        hidden.is_private = True
+        hidden.save()
+
+        second = regenerate_sitemap_shards(['projects'])['projects']
+
+        self.assertEqual(second['rendered'], 2)
+        self.assertEqual(second['unchanged'], first['shards'] - 2)
+        self.assertEqual(len(self.storage.objects), first['shards'])  # Replaced files are deleted
+
+        expected.discard(self.project_url(hidden))
+        expected.discard(f'https://testserver/@{renamed.user.username}/project-100')
+        expected.add(self.project_url(renamed))
+        self.assertEqual(self.crawl(), expected)
+
+        third = regenerate_sitemap_shards(['projects'])['projects']
+        self.assertEqual(third['rendered'], 0)
+
+
+@override_settings(SITEMAP_SHARD_SIZE=10)
+class ShardLifecycleTests(ShardedSitemapTestCase):
+    """Shard removal, encoding negotiation and the live fallback."""
+
+    def test_emptied_shard_is_removed(self):
+        projects = self.create_projects(15)
+        regenerate_sitemap_shards(['projects'])
+        last_shard = SitemapShard.objects.filter(section='projects').order_by('-shard').first()
+
+        Project.objects.filter(id__gt=last_shard.shard * 10).delete()
+        stats = regenerate_sitemap_shards(['projects'])['projects']
+
+        self.assertEqual(stats['removed'], 1)
+        self.assertFalse(SitemapShard.objects.filter(id=last_shard.id).exists())
+        self.assertNotIn(last_shard.object_name, self.storage.objects)
+        self.assertLess(len(self.crawl()), len(projects))
+
+    def test_username_change_rerenders_owner_shards(self):
+        projects = self.create_projects(25, users=2)
+        regenerate_sitemap_shards(['projects', 'profiles'])
+        owner = projects[0].user
+
+        owner.username = 'renamed-owner'
+        owner.save()
+        stats = regenerate_sitemap_shards(['projects', 'profiles'])
+
+        owner_shards = {(project.id - 1) // 10 for project in projects if project.user_id == owner.id}
+        self.assertEqual(stats['projects']['rendered'], len(owner_shards))
+        self.assertEqual(stats['profiles']['rendered'], 1)
+        urls = self.crawl()
+        self.assertIn(f'https://testserver/@renamed-owner/{projects[0].slug}', urls)
+        self.assertNotIn(f'https://testserver/@owner0/{projects[0].slug}', urls)
+
+    def test_shard_served_plain_without_gzip_support(self):
+        project = self.create_projects(1)[0]
+        regenerate_sitemap_shards(['projects'])
+        shard = SitemapShard.objects.get(section='projects')
+
+        response = self.client.get(f'/sitemap-projects-{shard.shard}.xml')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('Content-Encoding', response)
+        self.assertIn(self.project_url(project), response.content.decode())
+
+    def test_unknown_shard_is_404(self):
+        self.assertEqual(self.client.get('/sitemap-projects-999.xml').status_code, 404)
+
+    def test_sections_without_shards_link_live_sitemaps(self):
+        self.create_projects(3)
+        regenerate_sitemap_shards(['projects'])
+
+        content = self.client.get('/sitemap.xml').content.decode()
+
+        self.assertIn('/sitemap-static.xml', content)
+        self.assertRegex(content, r'/sitemap-projects-\d+\.xml')
+        self.assertNotIn('/sitemap-projects.xml', content)
+        self.assertIn('/sitemap-profiles.xml', content)
+        self.assertIn('/sitemap-tools.xml', content)
@@ -0,0 +1,273 @@
+"""Redis-backed points leaderboards for Thrive Circle.
+
+Boards (all ZSETs, member = user id):
+- global: lifetime total_points for every user
+- weekly: points earned this week (Monday-based), expires after a few weeks
+- tier: total_points of users currently in a tier
+- circle: points earned inside a weekly circle (its size = active members)
+
+Boards are updated incrementally from PointActivity creation (see signals.py)
+and can be rebuilt from Postgres on demand, so leaderboard pages never need
+an ORDER BY over the users table.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.db.models import Sum
+
+from core.utils.leaderboard import RedisLeaderboard, get_redis_client
+
+from .utils import get_week_end, get_week_start
+
+logger = logging.getLogger(__name__)
+
+
+class PointsLeaderboardService:
+    """Global, weekly, per-tier and per-circle points leaderboards."""
+
+    GLOBAL_KEY = 'leaderboard:points:global'
+    WEEKLY_KEY = 'leaderboard:points:week:{week_start}'
+    TIER_KEY = 'leaderboard:points:tier:{tier}'
+    CIRCLE_KEY = 'leaderboard:points:circle:{circle_id}'
+    USER_CIRCLE_CACHE_KEY = 'thrive_circle:user_circle:{user_id}'
+    REBUILD_LOCK_KEY = 'leaderboard:points:rebuild_lock'
+
+    WEEKLY_TTL = 60 * 60 * 24 * 21  # Keep the last few weeks around
+    CIRCLE_TTL = 60 * 60 * 24 * 21
+    USER_CIRCLE_CACHE_TTL = 60 * 60  # 1 hour (invalidated on membership changes)
+    REBUILD_LOCK_TTL = 300
+
+    # ------------------------------------------------------------------
+    # Boards
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def global_board(cls) -> RedisLeaderboard:
+        return RedisLeaderboard(cls.GLOBAL_KEY)
+
+    @classmethod
+    def weekly_board(cls, week_start=None) -> RedisLeaderboard:
+        week_start = week_start or get_week_start()
+        return RedisLeaderboard(cls.WEEKLY_KEY.format(week_start=week_start.isoformat()), ttl=cls.WEEKLY_TTL)
+
+    @classmethod
+    def tier_board(cls, tier: str) -> RedisLeaderboard:
+        return RedisLeaderboard(cls.TIER_KEY.format(tier=tier))
+
+    @classmethod
+    def circle_board(cls, circle_id) -> RedisLeaderboard:
+        return RedisLeaderboard(cls.CIRCLE_KEY.format(circle_id=circle_id), ttl=cls.CIRCLE_TTL)
+
+    # ------------------------------------------------------------------
+    # Incremental updates
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def record_award(cls, user_id: int, amount: int, total_points: int, old_tier: str, new_tier: str):
+        """Apply a points award to every board in a single pipeline."""
+        redis = get_redis_client()
+        if not redis:
+            return
+
+        circle_id = cls.get_user_circle_id(user_id)
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            cls.global_board().set_score(user_id, total_points, pipe=pipe)
+            cls.weekly_board().incr(user_id, amount, pipe=pipe)
+            if old_tier != new_tier:
+                cls.tier_board(old_tier).remove(user_id, pipe=pipe)
+            cls.tier_board(new_tier).set_score(user_id, total_points, pipe=pipe)
+            if circle_id:
+                cls.circle_board(circle_id).incr(user_id, amount, pipe=pipe)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f'Error recording points award for user {user_id}: {e}')
+
+    @classmethod
+    def add_user(cls, user_id: int, tier: str, total_points: int = 0):
+        """Put a new user on the global and tier boards (without overwriting an existing score)."""
+        redis = get_redis_client()
+        if not redis:
+            return
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            cls.global_board().set_score(user_id, total_points, pipe=pipe, only_new=True)
+            cls.tier_board(tier).set_score(user_id, total_points, pipe=pipe, only_new=True)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f'Error adding user {user_id} to points leaderboards: {e}')
+
+    @classmethod
+    def remove_user(cls, user_id: int, tier: str):
+        """Take a deleted user off the global, tier and recent weekly boards."""
+        redis = get_redis_client()
+        if not redis:
+            return
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            cls.global_board().remove(user_id, pipe=pipe)
+            cls.tier_board(tier).remove(user_id, pipe=pipe)
+            this_week = get_week_start()
+            for weeks_ago in range(cls.WEEKLY_TTL // (60 * 60 * 24 * 7)):
+                cls.weekly_board(this_week - timedelta(weeks=weeks_ago)).remove(user_id, pipe=pipe)
+            pipe.execute()
+        except Exception as e:
+            logger.error(f'Error removing user {user_id} from points leaderboards: {e}')
+
+    @classmethod
+    def get_user_circle_id(cls, user_id: int) -> str | None:
+        """The user's current active circle id (cached, invalidated on membership changes)."""
+        cache_key = cls.USER_CIRCLE_CACHE_KEY.format(user_id=user_id)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            return cached or None
+
+        from .models import CircleMembership
+
+        circle_id = (
+            CircleMembership.objects.filter(user_id=user_id, is_active=True, circle__is_active=True)
+            .order_by('-joined_at')
+            .values_list('circle_id', flat=True)
+            .first()
+        )
+        # Cache misses as '' so users without a circle don't hit the DB on every award
+        cache.set(cache_key, str(circle_id) if circle_id else '', cls.USER_CIRCLE_CACHE_TTL)
+        return str(circle_id) if circle_id else None
+
+    @classmethod
+    def invalidate_user_circle(cls, user_id: int):
+        cache.delete(cls.USER_CIRCLE_CACHE_KEY.format(user_id=user_id))
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def get_my_ranks(cls, user, window: int = 0) -> dict:
+        """The user's rank on each board they belong to, with optional neighbors.
+
+        Returns:
+            Dict of board name -> {'rank', 'score', 'total', 'neighbors'}
+        """
+        boards = {
+            'global': cls.global_board(),
+            'weekly': cls.weekly_board(),
+            'tier': cls.tier_board(user.tier),
+        }
+        circle_id = cls.get_user_circle_id(user.id)
+        if circle_id:
+            boards['circle'] = cls.circle_board(circle_id)
+
+        ranks = {}
+        for name, board in boards.items():
+            rank, score = board.standing(user.id)
+            ranks[name] = {
+                'rank': rank,
+                'score': int(score),
+                'total': board.size(),
+                'neighbors': [
+                    {'user_id': uid, 'score': int(s), 'rank': r} for uid, s, r in board.neighbors(user.id, window)
+                ]
+                if window
+                else [],
+            }
+        return ranks
+
+    # ------------------------------------------------------------------
+    # Rebuild from Postgres
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def ensure_global(cls) -> RedisLeaderboard | None:
+        """Return the global board, or None if callers should fall back to the database.
+
+        A missing board (e.g. after a Redis flush) is rebuilt in the background by
+        rebuild_points_leaderboards; until it exists, requests are served from
+        Postgres rather than from a partial or empty board.
+        """
+        if not get_redis_client():
+            return None
+
+        board = cls.global_board()
+        if board.exists():
+            return board
+
+        if cache.add(cls.REBUILD_LOCK_KEY, True, cls.REBUILD_LOCK_TTL):
+            from .tasks import rebuild_points_leaderboards
+
+            try:
+                rebuild_points_leaderboards.delay()
+            except Exception as e:
+                cache.delete(cls.REBUILD_LOCK_KEY)
+                logger.error(f'Error queueing points leaderboard rebuild: {e}')
+        return None
+
+    @classmethod
+    def rebuild_global(cls) -> int:
+        """Rebuild the global board from users.total_points."""
+        from core.users.models import User
+
+        rows = User.objects.values_list('id', 'total_points').iterator(chunk_size=5000)
+        written = cls.global_board().replace(rows)
+        logger.info(f'Rebuilt global points leaderboard with {written} users')
+        return written
+
+    @classmethod
+    def rebuild_tiers(cls) -> dict[str, int]:
+        """Rebuild every tier board from users.total_points."""
+        from core.users.models import User
+
+        tiers = User.objects.values_list('tier', flat=True).distinct()
+        written = {}
+        for tier in tiers:
+            rows = User.objects.filter(tier=tier).values_list('id', 'total_points').iterator(chunk_size=5000)
+            written[tier] = cls.tier_board(tier).replace(rows)
+        return written
+
+    @classmethod
+    def rebuild_weekly(cls, week_start=None) -> int:
+        """Rebuild a weekly board from that week's PointActivity rows."""
+        from .models import PointActivity
+
+        week_start = week_start or get_week_start()
+        rows = (
+            PointActivity.objects.filter(
+                created_at__date__gte=week_start,
+                created_at__date__lte=get_week_end(week_start),
+            )
+            .order_by()
+            .values('user_id')
+            .annotate(points=Sum('amount'))
+            .values_list('user_id', 'points')
+        )
+        return cls.weekly_board(week_start).replace(rows)
+
+    @classmethod
+    def rebuild_circle(cls, circle) -> int:
+        """Rebuild a circle board from its members' PointActivity during the circle's week.
+
+        Returns:
+            Number of active members (members with point activity that week), counted
+            from Postgres, so it is correct even when Redis is unavailable
+        """
+        from .models import PointActivity
+
+        member_ids = circle.memberships.filter(is_active=True).values('user_id')
+        rows = list(
+            PointActivity.objects.filter(
+                user_id__in=member_ids,
+                created_at__date__gte=circle.week_start,
+                created_at__date__lte=circle.week_end,
+            )
+            .order_by()
+            .values('user_id')
+            .annotate(points=Sum('amount'))
+            .values_list('user_id', 'points')
+        )
+        cls.circle_board(circle.id).replace(rows)
+        return len(rows)
@@ -573,20 +573,14 @@ class Circle(models.Model):
     def update_member_counts(self):
         """Update cached member counts."""
         self.member_count = self.memberships.filter(is_active=True).count()
-        # Active = had any point activity this week
-        from django.db.models import Exists, OuterRef
 
-        active_users = PointActivity.objects.filter(
-            user=OuterRef('user'),
-            created_at__date__gte=self.week_start,
-            created_at__date__lte=self.week_end,
-        )
-        self.active_member_count = (
-            self.memberships.filter(is_active=True)
-            .annotate(has_activity=Exists(active_users))
-            .filter(has_activity=True)
-            .count()
-        )
+        # Active = had any point activity this week. Counted from PointActivity
+        # rather than the Redis circle board, which incremental updates can leave
+        # stale (membership changes, awards made while Redis was down); the board
+        # is rebuilt from the same rows.
+        from .leaderboard import PointsLeaderboardService
+
+        self.active_member_count = PointsLeaderboardService.rebuild_circle(self)
         self.save(update_fields=['member_count', 'active_member_count', 'updated_at'])
 
 
@@ -8,14 +8,16 @@ quest progress for users who have relevant active quests.
 import logging
 
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from core.agents.models import ImageGenerationSession
 from core.projects.models import Project, ProjectComment, ProjectLike
 from core.quizzes.models import QuizAttempt
 
-from .models import Circle, CircleMembership
+from .leaderboard import PointsLeaderboardService
+from .models import Circle, CircleMembership, PointActivity
 from .quest_tracker import track_quest_action
 from .utils import get_week_start
 
@@ -510,3 +512,52 @@ def assign_new_user_to_circle(sender, instance, created, **kwargs):
     except Exception as e:
         # Don't let circle assignment failure prevent user creation
         logger.error(f'Failed to assign new user {instance.id} to circle: {e}')
+
+
+# =============================================================================
+# Points leaderboards (Redis ZSETs kept in sync with point awards)
+# =============================================================================
+
+
+@receiver(post_save, sender=PointActivity)
+def update_points_leaderboards(sender, instance, created, **kwargs):
+    """Apply a new point award to the global/weekly/tier/circle leaderboards after commit."""
+    if not created:
+        return
+
+    user = instance.user
+    transaction.on_commit(
+        lambda: PointsLeaderboardService.record_award(
+            user_id=user.id,
+            amount=instance.amount,
+            total_points=user.total_points,
+            old_tier=instance.tier_at_time,
+            new_tier=user.tier,
+        )
+    )
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def add_new_user_to_points_leaderboards(sender, instance, created, **kwargs):
+    """Put new users on the global and tier leaderboards with their starting points."""
+    if not created:
+        return
+
+    transaction.on_commit(
+        lambda: PointsLeaderboardService.add_user(instance.id, instance.tier, instance.total_points or 0)
+    )
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def remove_deleted_user_from_points_leaderboards(sender, instance, **kwargs):
+    """Drop deleted users from the global, tier and weekly leaderboards after commit."""
+    # Bind the id now: Model.delete() clears the instance's pk before on_commit callbacks run
+    user_id, tier = instance.id, instance.tier
+    transaction.on_commit(lambda: PointsLeaderboardService.remove_user(user_id, tier))
+
+
+@receiver(post_save, sender=CircleMembership)
+@receiver(post_delete, sender=CircleMembership)
+def invalidate_user_circle_cache(sender, instance, **kwargs):
+    """Drop the cached user -> circle mapping used to route points to circle leaderboards."""
+    PointsLeaderboardService.invalidate_user_circle(instance.user_id)
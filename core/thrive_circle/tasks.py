@@ -6,6 +6,7 @@ from datetime import timedelta
 
 from celery import shared_task
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.db import transaction
 from django.utils import timezone
 
@@ -419,6 +420,63 @@ def update_circle_activity_stats():
     return {'circles_updated': updated}
 
 
+@shared_task
+def process_points_award(user_id: int, activity_type: str):
+    """
+    Run the side effects of a points award after it has been committed.
+
+    Queued by User.add_points so the award itself stays a single UPDATE:
+    weekly goal progress and points/level/streak achievements are evaluated
+    here instead of inline on the request path.
+    """
+    from services.achievements.tracker import AchievementTracker
+
+    from .utils import check_weekly_goals
+
+    user = User.objects.filter(pk=user_id).first()
+    if not user:
+        return {'user_id': user_id, 'achievements_unlocked': 0}
+
+    check_weekly_goals(user, activity_type)
+
+    unlocked = AchievementTracker.track_events(
+        user,
+        {
+            'total_points': user.total_points,
+            'level': user.level,
+            'current_streak_days': user.current_streak_days,
+        },
+    )
+
+    return {'user_id': user_id, 'achievements_unlocked': len(unlocked)}
+
+
+@shared_task
+def rebuild_points_leaderboards():
+    """
+    Rebuild the Redis points leaderboards from Postgres.
+
+    Run on demand (e.g. after a Redis flush or data fix). The list endpoint
+    also queues it when the global board is missing, and serves the
+    leaderboard from Postgres until it finishes.
+    """
+    from .leaderboard import PointsLeaderboardService
+
+    try:
+        global_count = PointsLeaderboardService.rebuild_global()
+        tier_counts = PointsLeaderboardService.rebuild_tiers()
+        weekly_count = PointsLeaderboardService.rebuild_weekly()
+
+        circles = 0
+        for circle in Circle.objects.filter(is_active=True):
+            PointsLeaderboardService.rebuild_circle(circle)
+            circles += 1
+    finally:
+        cache.delete(PointsLeaderboardService.REBUILD_LOCK_KEY)
+
+    return {'global': global_count, 'tiers': tier_counts, 'weekly': weekly_count, 'circles': circles}
+
+
 @shared_task
 def check_circle_challenge_completion():
     """
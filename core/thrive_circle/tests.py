@@ -14,7 +14,7 @@ from rest_framework import status
 from rest_framework.test import APITestCase
 
 from .models import PointActivity, SideQuest, UserSideQuest, WeeklyGoal
-from .tasks import check_streak_bonuses, create_weekly_goals
+from .tasks import check_streak_bonuses, create_weekly_goals, process_points_award
 from .utils import get_week_start
 
 User = get_user_model()
@@ -84,6 +84,31 @@ class UserPointsModelTest(TestCase):
         self.assertEqual(activity.activity_type, 'quiz_complete')
         self.assertEqual(activity.description, 'Test quiz completed')
 
+    def test_add_points_updates_instance_from_returned_row(self):
+        """Test that the award updates the in-memory user without a reload"""
+        total = self.user.add_points(1000, 'quiz_complete')
+
+        self.assertEqual(total, 1000)
+        self.assertEqual(self.user.total_points, 1000)
+        self.assertEqual(self.user.tier, 'sprout')
+        self.assertEqual(self.user.level, 5)
+        self.assertEqual(self.user.current_streak_days, 1)
+        self.assertEqual(self.user.last_activity_date, timezone.now().date())
+
+    def test_add_points_queues_side_effects_on_commit(self):
+        """Test that goals/achievements are queued after commit instead of run inline"""
+        with patch('core.thrive_circle.tasks.process_points_award.delay') as mock_delay:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.user.add_points(10, 'quiz_complete')
+
+        mock_delay.assert_called_once_with(self.user.id, 'quiz_complete')
+
+    def test_level_for_points_beyond_thresholds(self):
+        """Test levels past the predefined thresholds add one per 10,000 points"""
+        self.assertEqual(User.level_for_points(0), 1)
+        self.assertEqual(User.level_for_points(61000), 23)
+        self.assertEqual(User.level_for_points(71000), 24)
+
     def test_add_points_rejects_negative(self):
         """Test that negative points are rejected"""
         with self.assertRaises(ValueError):
@@ -254,6 +279,19 @@ class WeeklyGoalTest(TestCase):
         self.assertFalse(self.goal.is_completed)
         self.assertEqual(self.goal.points_reward, 30)
 
+    def test_points_award_task_completes_goal(self):
+        """Test that the queued award task advances goals and pays the bonus"""
+        self.goal.current_progress = 2
+        self.goal.save()
+
+        process_points_award(self.user.id, 'quiz_complete')
+
+        self.goal.refresh_from_db()
+        self.user.refresh_from_db()
+        self.assertTrue(self.goal.is_completed)
+        self.assertEqual(self.user.total_points, 30)
+        self.assertTrue(PointActivity.objects.filter(user=self.user, activity_type='weekly_goal').exists())
+
     def test_goal_progress_percentage(self):
         """Test goal progress percentage calculation"""
         self.assertEqual(self.goal.progress_percentage, 0)
@@ -628,3 +666,152 @@ class CeleryTaskTest(TestCase):
         self.assertEqual(result['active_users'], 2)
         self.assertEqual(result['bonuses_awarded'], 2)
         self.assertGreater(result['total_points'], 0)
+
+
+class PointsLeaderboardTest(APITestCase):
+    """Tests for the Redis-backed points leaderboards"""
+
+    def setUp(self):
+        import fakeredis
+
+        self.redis = fakeredis.FakeRedis()
+        patcher = patch('core.utils.leaderboard.get_redis_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('core.thrive_circle.leaderboard.get_redis_client', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.users = [
+            User.objects.create_user(username=f'board{i}', email=f'board{i}@test.com', password='testpass123')
+            for i in range(3)
+        ]
+        self.client.force_authenticate(user=self.users[0])
+
+    def test_add_points_updates_boards(self):
+        """Awards land on the global, weekly and tier boards"""
+        from .leaderboard import PointsLeaderboardService
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users[1].add_points(300, 'quiz_complete')
+            self.users[2].add_points(100, 'quiz_complete')
+
+        self.assertEqual(PointsLeaderboardService.global_board().standing(self.users[1].id), (1, 300.0))
+        self.assertEqual(PointsLeaderboardService.weekly_board().rank(self.users[2].id), 2)
+        self.assertEqual(PointsLeaderboardService.tier_board('seedling').rank(self.users[1].id), 1)
+
+    def test_tier_change_moves_user_between_tier_boards(self):
+        """A tier upgrade removes the user from the old tier board"""
+        from .leaderboard import PointsLeaderboardService
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users[1].add_points(1000, 'quiz_complete')
+
+        self.assertIsNone(PointsLeaderboardService.tier_board('seedling').rank(self.users[1].id))
+        self.assertEqual(PointsLeaderboardService.tier_board('sprout').rank(self.users[1].id), 1)
+
+    def test_list_endpoint_served_from_redis(self):
+        """While the board is missing the list comes from Postgres and a rebuild is queued; then from the ZSET"""
+        from django.core.cache import cache
+
+        from .leaderboard import PointsLeaderboardService
+        from .tasks import rebuild_points_leaderboards
+
+        User.objects.filter(pk=self.users[2].pk).update(total_points=500)
+        User.objects.filter(pk=self.users[1].pk).update(total_points=200)
+        self.redis.flushall()
+        cache.delete(PointsLeaderboardService.REBUILD_LOCK_KEY)
+
+        with patch('core.thrive_circle.tasks.rebuild_points_leaderboards.delay') as delay:
+            response = self.client.get('/api/v1/me/thrive-circle/', {'page_size': 2})
+            self.client.get('/api/v1/me/thrive-circle/', {'page_size': 2})
+
+        delay.assert_called_once()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([u['id'] for u in response.data['results']], [self.users[2].id, self.users[1].id])
+        self.assertFalse(self.redis.exists(PointsLeaderboardService.GLOBAL_KEY))
+
+        rebuild_points_leaderboards()
+        # Not on the board yet, so only visible if the page were still read from Postgres
+        User.objects.filter(pk=self.users[0].pk).update(total_points=900)
+
+        response = self.client.get('/api/v1/me/thrive-circle/', {'page_size': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 3)
+        self.assertEqual([u['id'] for u in response.data['results']], [self.users[2].id, self.users[1].id])
+        self.assertIsNotNone(response.data['next'])
+        self.assertIsNone(cache.get(PointsLeaderboardService.REBUILD_LOCK_KEY))
+
+    def test_deleted_user_removed_from_boards(self):
+        """Deleting a user takes them off the global, weekly and tier boards"""
+        from .leaderboard import PointsLeaderboardService
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users[1].add_points(300, 'quiz_complete')
+        user_id = self.users[1].id
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users[1].delete()
+
+        self.assertIsNone(PointsLeaderboardService.global_board().rank(user_id))
+        self.assertIsNone(PointsLeaderboardService.weekly_board().rank(user_id))
+        self.assertIsNone(PointsLeaderboardService.tier_board('seedling').rank(user_id))
+
+    def test_my_rank_endpoint(self):
+        """my_rank returns the user's position and neighbors"""
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users[0].add_points(50, 'comment')
+            self.users[1].add_points(80, 'comment')
+
+        response = self.client.get('/api/v1/me/thrive-circle/my_rank/', {'window': 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['global']['rank'], 2)
+        self.assertEqual(response.data['weekly']['score'], 50)
+        self.assertEqual(
+            [n['user_id'] for n in response.data['weekly']['neighbors']], [self.users[1].id, self.users[0].id]
+        )
+
+    def test_list_endpoint_keeps_paginator_rules(self):
+        """Page size allows up to the paginator's max; a page past the end is a 404"""
+        from .leaderboard import PointsLeaderboardService
+
+        PointsLeaderboardService.rebuild_global()
+
+        response = self.client.get('/api/v1/me/thrive-circle/', {'page_size': 500})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertIsNone(response.data['next'])
+
+        response = self.client.get('/api/v1/me/thrive-circle/', {'page_size': 2, 'page': 3})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        response = self.client.get('/api/v1/me/thrive-circle/', {'page_size': 2, 'page': 'last'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 1)
+
+    def test_member_counts_ignore_stale_circle_board(self):
+        """Active member counts come from PointActivity, and the stale circle board is rebuilt"""
+        from .leaderboard import PointsLeaderboardService
+        from .models import Circle, CircleMembership
+        from .utils import get_week_end
+
+        week_start = get_week_start()
+        circle = Circle.objects.create(
+            name='Test Circle', tier='seedling', week_start=week_start, week_end=get_week_end(week_start)
+        )
+        for user in self.users[:2]:
+            CircleMembership.objects.create(user=user, circle=circle, is_active=True)
+        PointActivity.objects.create(user=self.users[0], amount=10, activity_type='comment')
+
+        # A member who left, still on the board
+        board = PointsLeaderboardService.circle_board(circle.id)
+        board.set_score(self.users[2].id, 40)
+        board.set_score(self.users[1].id, 15)
+
+        circle.update_member_counts()
+
+        self.assertEqual((circle.member_count, circle.active_member_count), (2, 1))
+        self.assertEqual(board.size(), 1)
+        self.assertEqual(board.rank(self.users[0].id), 1)
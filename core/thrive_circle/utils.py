@@ -70,8 +70,8 @@ def check_weekly_goals(user, activity_type):
     """
     Check and update weekly goals based on user activity.
 
-    This function is called whenever a user earns XP to update progress
-    on relevant weekly goals. If a goal is completed, bonus XP is awarded.
+    This function is called (from the queued process_points_award task) whenever
+    a user earns points to update progress on relevant weekly goals. If a goal is completed, bonus XP is awarded.
 
     Uses atomic transactions and F() expressions to prevent race conditions.
 
@@ -112,13 +112,8 @@ def check_weekly_goals(user, activity_type):
         goal.completed_at = timezone.now()
         goal.save()
 
-        # Award bonus points with _skip_goal_check=True to prevent infinite recursion
-        user.tier_status.add_xp(
-            goal.points_reward,
-            'weekly_goal',
-            f'Completed: {goal.get_goal_type_display()}',
-            _skip_goal_check=True,  # Prevent recursion!
-        )
+        # Award bonus points ('weekly_goal' counts towards no goal, so this can't recurse)
+        user.add_points(goal.points_reward, 'weekly_goal', f'Completed: {goal.get_goal_type_display()}')
 
     # Note: streak_7 and topics_2 goals are checked by Celery tasks, not here
 
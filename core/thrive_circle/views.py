@@ -1,6 +1,7 @@
 """API views for Thrive Circle."""
 
 import logging
+import math
 
 from django.db import models
 from django.db.models import Prefetch
@@ -10,9 +11,11 @@ from rest_framework.exceptions import NotFound, PermissionDenied
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.throttling import UserRateThrottle
+from rest_framework.utils.urls import replace_query_param
 
 from core.users.models import User
 
+from .leaderboard import PointsLeaderboardService
 from .models import (
     Circle,
     CircleMembership,
@@ -55,7 +58,8 @@ class ThriveCircleViewSet(viewsets.ReadOnlyModelViewSet):
     ViewSet for Thrive Circle gamification status.
 
     Endpoints:
-    - GET /api/thrive-circle/ - List all users by points (leaderboard)
+    - GET /api/thrive-circle/ - List all users by points (leaderboard, served from Redis)
+    - GET /api/thrive-circle/my_rank/ - Current user's rank on global/weekly/tier/circle boards
     - GET /api/thrive-circle/{id}/ - Get specific user's points status
     - GET /api/thrive-circle/my-status/ - Get current user's points status
     - POST /api/thrive-circle/award-points/ - Award points to current user
@@ -75,6 +79,72 @@ class ThriveCircleViewSet(viewsets.ReadOnlyModelViewSet):
             Prefetch('point_activities', queryset=PointActivity.objects.order_by('-created_at')[:20])
         ).order_by('-total_points')
 
+    def list(self, request, *args, **kwargs):
+        """
+        Points leaderboard served from the Redis global ZSET.
+
+        Only the page of user ids comes from Redis; the users on that page are
+        loaded with one primary-key lookup, so there is no ORDER BY over the
+        users table. Falls back to the database ordering if Redis is unavailable or
+        the board is still being rebuilt.
+        """
+        board = PointsLeaderboardService.ensure_global()
+        if board is None:
+            return super().list(request, *args, **kwargs)
+
+        # Same page size and page number rules as the default paginator (CustomPageNumberPagination)
+        paginator = self.paginator
+        page_size = paginator.get_page_size(request)
+        count = board.size()
+        last_page = max(1, math.ceil(count / page_size))
+
+        page_number = request.query_params.get(paginator.page_query_param) or 1
+        if page_number in paginator.last_page_strings:
+            page_number = last_page
+        try:
+            page = int(page_number)
+        except (TypeError, ValueError):
+            page = 0
+        if not 1 <= page <= last_page:
+            raise NotFound(paginator.invalid_page_message)
+        start = (page - 1) * page_size
+
+        entries = board.page(start, start + page_size - 1)
+        users = self.get_queryset().order_by().in_bulk([user_id for user_id, _ in entries])
+        ranked_users = [users[user_id] for user_id, _ in entries if user_id in users]
+
+        base_url = request.build_absolute_uri()
+        return Response(
+            {
+                'count': count,
+                'next': replace_query_param(base_url, 'page', page + 1) if start + page_size < count else None,
+                'previous': replace_query_param(base_url, 'page', page - 1) if page > 1 else None,
+                'results': self.get_serializer(ranked_users, many=True).data,
+            }
+        )
+
+    @action(detail=False, methods=['get'])
+    def my_rank(self, request):
+        """
+        Get the authenticated user's rank on the global, weekly, tier and circle leaderboards.
+
+        Query params:
+            window: Number of neighbors above and below to include (0-10, default 0)
+
+        Returns:
+            {
+                "global": {"rank": 12, "score": 1450, "total": 5321, "neighbors": [...]},
+                "weekly": {...},
+                "tier": {...},
+                "circle": {...}  # only if the user is in an active circle
+            }
+        """
+        if PointsLeaderboardService.ensure_global() is None:
+            return Response({'detail': 'Leaderboard unavailable.'}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+
+        window = safe_int_param(request.query_params.get('window'), 0, min_val=0, max_val=10)
+        return Response(PointsLeaderboardService.get_my_ranks(request.user, window=window))
+
     def get_object(self):
         """
         Override to enforce user isolation - users can only view their own detailed data.
@@ -1566,7 +1636,7 @@ class AdminCircleViewSet(viewsets.ViewSet):
             return Response(
                 {
                     'detail': (
-                        f'User already has an active membership in a circle ' f'for this week ({existing.circle.name}).'
+                        f'User already has an active membership in a circle for this week ({existing.circle.name}).'
                     )
                 },
                 status=status.HTTP_400_BAD_REQUEST,
@@ -1764,7 +1834,7 @@ class AdminCircleViewSet(viewsets.ViewSet):
 
         old_circle_name = old_circle.name if old_circle else 'none'
         logger.info(
-            f'Admin moved user between circles: {target_user.username} ' f'from {old_circle_name} → {new_circle.name}',
+            f'Admin moved user between circles: {target_user.username} from {old_circle_name} → {new_circle.name}',
             extra={
                 'admin_id': str(request.user.id),
                 'admin_username': request.user.username,
@@ -0,0 +1,149 @@
+"""
+Responsive image derivatives (several widths x WebP/AVIF/JPEG) for uploaded images,
+and the sanitized rendition stored as the upload's original.
+
+Downscaling is done in two cheap steps before the final LANCZOS pass:
+- Image.draft() lets the JPEG decoder scale by 1/2, 1/4 or 1/8 while decoding
+- Image.reduce() box-averages by an integer factor down to ~2x the target width
+so LANCZOS only ever filters a small image.
+"""
+
+import logging
+from dataclasses import dataclass
+from io import BytesIO
+
+from PIL import ExifTags, Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+# Widths offered in srcset; the original width is used instead when it is smaller than the widest
+DERIVATIVE_WIDTHS = (320, 640, 1280, 1920)
+
+# Widest stored original; wider uploads are scaled down on the request path
+MAX_ORIGINAL_WIDTH = 1920
+
+# EXIF orientations that swap width and height (90/270 degree rotations)
+TRANSPOSED_ORIENTATIONS = frozenset({5, 6, 7, 8})
+
+# format key -> (PIL format, content type, save options), in srcset preference order
+DERIVATIVE_FORMATS = {
+    'avif': ('AVIF', 'image/avif', {'quality': 60, 'speed': 8}),
+    'webp': ('WEBP', 'image/webp', {'quality': 80, 'method': 4}),
+    'jpeg': ('JPEG', 'image/jpeg', {'quality': 85, 'optimize': True, 'progressive': True}),
+}
+
+
+@dataclass
+class ImageDerivative:
+    format: str
+    content_type: str
+    width: int
+    height: int
+    data: bytes
+
+
+def available_formats() -> list[str]:
+    """Derivative formats this Pillow build can encode (AVIF needs libavif)."""
+    return [key for key in DERIVATIVE_FORMATS if key != 'avif' or features.check('avif')]
+
+
+def target_widths(width: int) -> list[int]:
+    """Widths to generate for an image of the given width, widest first."""
+    widths = {w for w in DERIVATIVE_WIDTHS if w < width}
+    widths.add(min(width, DERIVATIVE_WIDTHS[-1]))
+    return sorted(widths, reverse=True)
+
+
+def flatten_to_rgb(img: Image.Image) -> Image.Image:
+    """Composite transparency onto white and convert to RGB (JPEG has no alpha)."""
+    if img.mode in ('RGBA', 'LA', 'P'):
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+
+def downscale(img: Image.Image, width: int, height: int | None = None) -> Image.Image:
+    """Resize to the given width, reducing by an integer factor first when the image is much larger.
+
+    Height defaults to the image's aspect ratio; pass it explicitly when scaling an
+    intermediate copy so rounding doesn't accumulate across steps.
+    """
+    if img.width <= width:
+        return img
+    height = height or max(1, round(img.height * width / img.width))
+    factor = img.width // (width * 2)
+    if factor > 1:
+        img = img.reduce(factor)
+    return img.resize((width, height), Image.Resampling.LANCZOS)
+
+
+def sanitize_original(img: Image.Image) -> ImageDerivative:
+    """
+    Re-encode an upload as the rendition stored and served as its original.
+
+    The image is rotated upright from its EXIF orientation, flattened to RGB,
+    capped at MAX_ORIGINAL_WIDTH and saved as JPEG without any metadata, so
+    camera details and GPS coordinates never reach public storage.
+
+    Args:
+        img: Image opened from the upload, with pixel data not yet loaded
+
+    Returns:
+        The JPEG rendition
+    """
+    transposed = img.getexif().get(ExifTags.Base.Orientation) in TRANSPOSED_ORIENTATIONS
+    upright_width, upright_height = (img.height, img.width) if transposed else img.size
+    width = min(upright_width, MAX_ORIGINAL_WIDTH)
+    height = max(1, round(upright_height * width / upright_width))
+
+    # JPEG only: decode at the smallest 1/2^n scale that still covers the target
+    img.draft('RGB', (height, width) if transposed else (width, height))
+    ImageOps.exif_transpose(img, in_place=True)
+    img = downscale(flatten_to_rgb(img), width, height)
+
+    # No exif/icc_profile passed, so the saved file carries no metadata. Baseline rather than
+    # progressive JPEG keeps the encode cheap on the request path; variants come later.
+    output = BytesIO()
+    img.save(output, format='JPEG', quality=85, optimize=True)
+    return ImageDerivative('jpeg', 'image/jpeg', img.width, img.height, output.getvalue())
+
+
+def generate_derivatives(data: bytes, formats: list[str] | None = None) -> list[ImageDerivative]:
+    """
+    Build every width x format derivative of an image.
+
+    Args:
+        data: Original image bytes
+        formats: Format keys from DERIVATIVE_FORMATS (default: all the build supports)
+
+    Returns:
+        Derivatives, widest first
+    """
+    formats = formats or available_formats()
+    img = Image.open(BytesIO(data))
+    original_width, original_height = img.size
+    widths = target_widths(original_width)
+
+    # JPEG only: decode at the smallest 1/2^n scale that still covers the widest derivative
+    widest = widths[0]
+    img.draft('RGB', (widest, max(1, original_height * widest // original_width)))
+    img = flatten_to_rgb(img)
+
+    derivatives = []
+    source = img
+    for width in widths:
+        # Each width is scaled from the previous (larger) one, which is already close in size
+        source = downscale(source, width, max(1, round(original_height * width / original_width)))
+        for key in formats:
+            pil_format, content_type, options = DERIVATIVE_FORMATS[key]
+            output = BytesIO()
+            source.save(output, format=pil_format, **options)
+            derivatives.append(ImageDerivative(key, content_type, source.width, source.height, output.getvalue()))
+
+    logger.debug(f'Generated {len(derivatives)} derivatives at widths {widths}')
+    return derivatives
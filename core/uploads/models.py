@@ -0,0 +1,40 @@
+from django.db import models
+
+from core.users.models import User
+
+
+class UploadedImage(models.Model):
+    """An uploaded original plus the responsive variants generated from it.
+
+    The upload request only stores a sanitized original (see derivatives.sanitize_original);
+    generate_image_derivatives_task fills in ``variants`` with one entry per width and format:
+    ``{'format': 'webp', 'content_type': 'image/webp', 'width': 640, 'height': 360, 'url': ..., 'size': 12345}``.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        READY = 'ready', 'Ready'
+        FAILED = 'failed', 'Failed'
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='uploaded_images')
+    url = models.CharField(max_length=1000, help_text='Public URL (or object name for private files) of the original')
+    object_name = models.CharField(max_length=500, help_text='Storage object name of the original')
+    filename = models.CharField(max_length=255)
+    content_type = models.CharField(max_length=100)
+    width = models.PositiveIntegerField()
+    height = models.PositiveIntegerField()
+    size = models.PositiveBigIntegerField(help_text='Original size in bytes')
+    is_public = models.BooleanField(default=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+    variants = models.JSONField(default=list, blank=True, help_text='Generated derivatives, widest first')
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+        ]
+
+    def __str__(self):
+        return f'{self.filename} ({self.user_id}, {self.status})'
@@ -4,16 +4,17 @@ PDF text extraction utility for resume parsing.
 
 import logging
 from io import BytesIO
+from typing import BinaryIO
 
 logger = logging.getLogger(__name__)
 
 
-def extract_text_from_pdf(file_data: bytes, max_pages: int = 10, max_chars: int = 15000) -> str:
+def extract_text_from_pdf(file_data: bytes | BinaryIO, max_pages: int = 10, max_chars: int = 15000) -> str:
     """
     Extract text from PDF bytes.
 
     Args:
-        file_data: Raw PDF file bytes
+        file_data: Raw PDF file bytes, or a seekable binary file
         max_pages: Maximum number of pages to extract (default: 10)
         max_chars: Maximum characters to return (default: 15000 for AI context limits)
 
@@ -23,7 +24,7 @@ def extract_text_from_pdf(file_data: bytes, max_pages: int = 10, max_chars: int
     try:
         from pypdf import PdfReader
 
-        reader = PdfReader(BytesIO(file_data))
+        reader = PdfReader(BytesIO(file_data) if isinstance(file_data, bytes) else file_data)
         text_parts = []
 
         for i, page in enumerate(reader.pages[:max_pages]):
@@ -0,0 +1,62 @@
+from rest_framework import serializers
+
+from services.integrations.storage.storage_service import get_storage_service
+
+from .derivatives import DERIVATIVE_FORMATS
+from .models import UploadedImage
+
+
+class UploadedImageSerializer(serializers.ModelSerializer):
+    """Serializer for uploaded images with responsive srcsets.
+
+    ``srcset`` uses the JPEG variants so it works in a plain <img>; ``sources``
+    lists one srcset per format (AVIF, WebP, JPEG) for a <picture> element.
+    Both are empty until the derivatives task has run.
+    """
+
+    url = serializers.SerializerMethodField()
+    srcset = serializers.SerializerMethodField()
+    sources = serializers.SerializerMethodField()
+
+    class Meta:
+        model = UploadedImage
+        fields = [
+            'id',
+            'url',
+            'filename',
+            'content_type',
+            'width',
+            'height',
+            'size',
+            'is_public',
+            'status',
+            'srcset',
+            'sources',
+            'created_at',
+        ]
+        read_only_fields = fields
+
+    def _resolve(self, obj, url):
+        # Private files store object names; hand out short-lived presigned URLs instead
+        return url if obj.is_public else get_storage_service().get_presigned_url(url, expires_seconds=3600)
+
+    def _srcset(self, obj, fmt):
+        return ', '.join(
+            f'{self._resolve(obj, variant["url"])} {variant["width"]}w'
+            for variant in obj.variants
+            if variant['format'] == fmt
+        )
+
+    def get_url(self, obj):
+        return self._resolve(obj, obj.url)
+
+    def get_srcset(self, obj):
+        return self._srcset(obj, 'jpeg')
+
+    def get_sources(self, obj):
+        present = {variant['format'] for variant in obj.variants}
+        return [
+            {'type': content_type, 'srcset': self._srcset(obj, fmt)}
+            for fmt, (_, content_type, _) in DERIVATIVE_FORMATS.items()
+            if fmt in present
+        ]
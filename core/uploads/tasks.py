@@ -0,0 +1,103 @@
+"""
+Celery tasks for uploaded image processing.
+"""
+
+import logging
+import os
+
+from celery import shared_task
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(
+    bind=True,
+    max_retries=3,
+    default_retry_delay=30,
+    soft_time_limit=120,
+    time_limit=150,
+)
+def generate_image_derivatives_task(self, uploaded_image_id: int):
+    """
+    Generate the responsive variants of an uploaded image and record them on the model.
+
+    Args:
+        uploaded_image_id: UploadedImage ID
+    """
+    from services.integrations.storage.storage_service import get_storage_service
+
+    from .derivatives import generate_derivatives
+    from .models import UploadedImage
+
+    try:
+        image = UploadedImage.objects.get(id=uploaded_image_id)
+    except UploadedImage.DoesNotExist:
+        logger.warning(f'UploadedImage {uploaded_image_id} not found, skipping derivatives')
+        return
+    if image.status == UploadedImage.Status.READY:
+        return
+
+    def mark_failed():
+        image.status = UploadedImage.Status.FAILED
+        image.processed_at = timezone.now()
+        image.save(update_fields=['status', 'processed_at'])
+
+    storage = get_storage_service()
+    try:
+        data = storage.download_file(image.object_name)
+    except Exception as e:
+        logger.warning(f'Failed to download original for UploadedImage {image.id}: {e}')
+        if self.request.retries < self.max_retries:
+            raise self.retry(exc=e) from e
+        mark_failed()
+        return
+
+    try:
+        derivatives = generate_derivatives(data)
+    except Exception as e:
+        # Undecodable or truncated image - retrying won't help
+        logger.warning(f'Failed to generate derivatives for UploadedImage {image.id}: {e}')
+        mark_failed()
+        return
+
+    stem = os.path.splitext(image.filename)[0]
+    folder = os.path.dirname(image.object_name).split('/', 1)[-1]  # Drop the public/private prefix
+    variants = []
+    for derivative in derivatives:
+        filename = f'{stem}-{derivative.width}w.{derivative.format}'
+        url, error = storage.upload_file(
+            file_data=derivative.data,
+            filename=filename,
+            content_type=derivative.content_type,
+            folder=f'{folder}/variants',
+            is_public=image.is_public,
+            # Fixed per image and variant, so a retry overwrites what an earlier attempt uploaded
+            object_name=f'{image.id}-{filename}',
+        )
+        if error:
+            logger.warning(f'Failed to upload {filename} for UploadedImage {image.id}: {error}')
+            if self.request.retries < self.max_retries:
+                raise self.retry(exc=RuntimeError(error))
+            # Out of retries: remove whatever this or earlier attempts managed to upload
+            variants_prefix = f'{os.path.dirname(image.object_name)}/variants/{image.id}-{stem}'
+            for uploaded in derivatives:
+                storage.delete_object(f'{variants_prefix}-{uploaded.width}w.{uploaded.format}')
+            mark_failed()
+            return
+        variants.append(
+            {
+                'format': derivative.format,
+                'content_type': derivative.content_type,
+                'width': derivative.width,
+                'height': derivative.height,
+                'url': url,
+                'size': len(derivative.data),
+            }
+        )
+
+    image.variants = variants
+    image.status = UploadedImage.Status.READY
+    image.processed_at = timezone.now()
+    image.save(update_fields=['variants', 'status', 'processed_at'])
+    logger.info(f'Generated {len(variants)} derivatives for UploadedImage {image.id}')
@@ -0,0 +1,198 @@
+# ruff: noqa: S106
+"""Tests for uploaded image derivatives."""
+
+from io import BytesIO
+from unittest.mock import MagicMock, patch
+
+from django.contrib.auth import get_user_model
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import SimpleTestCase, TestCase
+from PIL import ExifTags, Image
+from rest_framework.test import APIClient
+
+from .derivatives import DERIVATIVE_WIDTHS, downscale, generate_derivatives, sanitize_original, target_widths
+from .models import UploadedImage
+from .serializers import UploadedImageSerializer
+from .tasks import generate_image_derivatives_task
+
+User = get_user_model()
+
+
+def _image_bytes(size=(2400, 1600), mode='RGB', fmt='JPEG'):
+    output = BytesIO()
+    Image.new(mode, size, (200, 80, 40) if mode == 'RGB' else (200, 80, 40, 128)).save(output, format=fmt)
+    return output.getvalue()
+
+
+def _photo_with_exif(size=(3000, 2000), orientation=6):
+    """A JPEG carrying camera and GPS metadata, stored sideways (orientation 6 = rotate 90 degrees)."""
+    exif = Image.Exif()
+    exif[ExifTags.Base.Orientation] = orientation
+    exif[ExifTags.Base.Make] = 'ExampleCam'
+    exif[ExifTags.Base.GPSInfo] = {ExifTags.GPS.GPSLatitudeRef: 'N', ExifTags.GPS.GPSLatitude: (51.0, 30.0, 0.0)}
+    output = BytesIO()
+    Image.new('RGB', size, (200, 80, 40)).save(output, format='JPEG', exif=exif)
+    return output.getvalue()
+
+
+class DerivativeGenerationTest(SimpleTestCase):
+    def test_target_widths_never_upscale(self):
+        self.assertEqual(target_widths(4000), [1920, 1280, 640, 320])
+        self.assertEqual(target_widths(800), [800, 640, 320])
+        self.assertEqual(target_widths(200), [200])
+
+    def test_downscale_keeps_aspect_ratio(self):
+        img = Image.new('RGB', (4000, 3000))
+
+        resized = downscale(img, 640)
+
+        self.assertEqual(resized.size, (640, 480))
+
+    def test_every_width_and_format_is_generated(self):
+        derivatives = generate_derivatives(_image_bytes(), formats=['webp', 'jpeg'])
+
+        self.assertEqual(
+            [(d.format, d.width) for d in derivatives],
+            [(fmt, width) for width in sorted(DERIVATIVE_WIDTHS, reverse=True) for fmt in ('webp', 'jpeg')],
+        )
+        for derivative in derivatives:
+            decoded = Image.open(BytesIO(derivative.data))
+            self.assertEqual(decoded.format, derivative.format.upper())
+            self.assertEqual(decoded.size, (derivative.width, derivative.height))
+            self.assertEqual(derivative.height, round(derivative.width * 1600 / 2400))
+
+    def test_transparent_png_is_flattened(self):
+        derivatives = generate_derivatives(_image_bytes((600, 400), mode='RGBA', fmt='PNG'), formats=['jpeg'])
+
+        self.assertEqual([d.width for d in derivatives], [600, 320])
+        self.assertEqual(Image.open(BytesIO(derivatives[0].data)).mode, 'RGB')
+
+    def test_sanitized_original_is_upright_capped_and_stripped(self):
+        original = sanitize_original(Image.open(BytesIO(_photo_with_exif())))
+
+        decoded = Image.open(BytesIO(original.data))
+        self.assertEqual(decoded.format, 'JPEG')
+        self.assertEqual(decoded.size, (1920, 2880))
+        self.assertEqual((original.width, original.height), decoded.size)
+        self.assertEqual(dict(decoded.getexif()), {})
+        self.assertNotIn('exif', decoded.info)
+
+    def test_small_png_original_is_not_upscaled(self):
+        original = sanitize_original(Image.open(BytesIO(_image_bytes((600, 400), mode='RGBA', fmt='PNG'))))
+
+        self.assertEqual((original.content_type, original.width, original.height), ('image/jpeg', 600, 400))
+
+
+class GenerateImageDerivativesTaskTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='uploader', email='uploader@test.com', password='testpass123')
+        self.image = UploadedImage.objects.create(
+            user=self.user,
+            url='http://minio:9000/bucket/public/images/user_1/original.jpg',
+            object_name='public/images/user_1/original.jpg',
+            filename='photo.jpg',
+            content_type='image/jpeg',
+            width=2400,
+            height=1600,
+            size=1000,
+        )
+
+    def test_variants_are_recorded_and_exposed_as_srcset(self):
+        storage = MagicMock()
+        storage.download_file.return_value = _image_bytes()
+        storage.upload_file.side_effect = lambda file_data, filename, **kwargs: (f'http://cdn/{filename}', None)
+
+        with (
+            patch('services.integrations.storage.storage_service.get_storage_service', return_value=storage),
+            patch(
+                'core.uploads.derivatives.generate_derivatives',
+                side_effect=lambda data: generate_derivatives(data, formats=['webp', 'jpeg']),
+            ),
+        ):
+            generate_image_derivatives_task(self.image.id)
+
+        self.image.refresh_from_db()
+        self.assertEqual(self.image.status, UploadedImage.Status.READY)
+        self.assertEqual(len(self.image.variants), 8)
+        self.assertEqual(storage.upload_file.call_args.kwargs['folder'], 'images/user_1/variants')
+
+        data = UploadedImageSerializer(self.image).data
+        self.assertEqual(
+            data['srcset'],
+            'http://cdn/photo-1920w.jpeg 1920w, http://cdn/photo-1280w.jpeg 1280w, '
+            'http://cdn/photo-640w.jpeg 640w, http://cdn/photo-320w.jpeg 320w',
+        )
+        self.assertEqual([source['type'] for source in data['sources']], ['image/webp', 'image/jpeg'])
+
+    def test_upload_failure_after_last_retry_marks_failed_and_cleans_up(self):
+        storage = MagicMock()
+        storage.download_file.return_value = _image_bytes((800, 600))
+        storage.upload_file.side_effect = [('http://cdn/ok', None), (None, 'S3 unavailable')]
+
+        generate_image_derivatives_task.push_request(retries=generate_image_derivatives_task.max_retries)
+        try:
+            with (
+                patch('services.integrations.storage.storage_service.get_storage_service', return_value=storage),
+                patch(
+                    'core.uploads.derivatives.generate_derivatives',
+                    side_effect=lambda data: generate_derivatives(data, formats=['jpeg']),
+                ),
+            ):
+                generate_image_derivatives_task(self.image.id)
+        finally:
+            generate_image_derivatives_task.pop_request()
+
+        self.image.refresh_from_db()
+        self.assertEqual(self.image.status, UploadedImage.Status.FAILED)
+        self.assertEqual(self.image.variants, [])
+        self.assertEqual(
+            [call.kwargs['object_name'] for call in storage.upload_file.call_args_list],
+            [f'{self.image.id}-photo-800w.jpeg', f'{self.image.id}-photo-640w.jpeg'],
+        )
+        self.assertEqual(
+            [call.args[0] for call in storage.delete_object.call_args_list],
+            [f'public/images/user_1/variants/{self.image.id}-photo-{width}w.jpeg' for width in (800, 640, 320)],
+        )
+
+    def test_undecodable_original_is_marked_failed(self):
+        storage = MagicMock()
+        storage.download_file.return_value = b'not an image'
+
+        with patch('services.integrations.storage.storage_service.get_storage_service', return_value=storage):
+            generate_image_derivatives_task(self.image.id)
+
+        self.image.refresh_from_db()
+        self.assertEqual(self.image.status, UploadedImage.Status.FAILED)
+        storage.upload_file.assert_not_called()
+
+
+class UploadImageViewTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(username='uploader', email='uploader@test.com', password='testpass123')
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_stored_original_is_sanitized(self):
+        storage = MagicMock(bucket_name='bucket')
+        storage.upload_file.return_value = ('http://minio:9000/bucket/public/images/user_1/a.jpg', None)
+        storage.object_name_from_url.return_value = 'public/images/user_1/a.jpg'
+
+        with (
+            patch('core.uploads.views.get_storage_service', return_value=storage),
+            patch('core.uploads.views.generate_image_derivatives_task') as task,
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            response = self.client.post(
+                '/api/v1/upload/image/',
+                {'file': SimpleUploadedFile('photo.jpg', _photo_with_exif(), content_type='image/jpeg')},
+                format='multipart',
+            )
+
+        self.assertEqual(response.status_code, 201)
+        stored = Image.open(BytesIO(storage.upload_file.call_args.kwargs['file_data']))
+        self.assertEqual(dict(stored.getexif()), {})
+        self.assertEqual(stored.size, (1920, 2880))
+        self.assertEqual(storage.upload_file.call_args.kwargs['content_type'], 'image/jpeg')
+        self.assertEqual(response.data['status'], 'pending')
+        self.assertEqual((response.data['width'], response.data['height']), (1920, 2880))
+        task.delay.assert_called_once_with(response.data['id'])
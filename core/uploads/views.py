@@ -7,8 +7,8 @@ import mimetypes
 import os
 import re
 import unicodedata
-from io import BytesIO
 
+from django.db import transaction
 from django_ratelimit.decorators import ratelimit
 from PIL import Image
 from rest_framework import status
@@ -18,6 +18,11 @@ from rest_framework.response import Response
 
 from services.integrations.storage.storage_service import get_storage_service
 
+from .derivatives import sanitize_original
+from .models import UploadedImage
+from .serializers import UploadedImageSerializer
+from .tasks import generate_image_derivatives_task
+
 logger = logging.getLogger(__name__)
 
 # Allowed image formats (validated via PIL)
@@ -100,10 +105,19 @@ def upload_image(request):
     Expected multipart/form-data with 'file' field.
     Optional 'folder' field to organize uploads (default: 'images').
 
+    The stored original is a sanitized JPEG rendition (upright, at most
+    1920px wide, EXIF/GPS metadata stripped); resized WebP/AVIF/JPEG
+    variants are generated from it in the background and exposed as
+    srcset/sources once status is "ready".
+
     Returns:
         {
+            "id": 1,
             "url": "http://minio:9000/bucket/path/to/file.jpg",
-            "filename": "original_filename.jpg"
+            "filename": "original_filename.jpg",
+            "status": "pending",
+            "srcset": "",
+            ...
         }
     """
     if 'file' not in request.FILES:
@@ -122,10 +136,8 @@ def upload_image(request):
     safe_filename = sanitize_filename(uploaded_file.name)
 
     try:
-        # Validate image dimensions BEFORE loading full image into memory
-        # This prevents memory exhaustion from malicious large images
+        # Validate the image from its header before any pixel data is decoded
         try:
-            # PIL can read just the header to get dimensions without loading full image
             uploaded_file.seek(0)
             img = Image.open(uploaded_file)
 
@@ -137,7 +149,7 @@ def upload_image(request):
                     status=status.HTTP_400_BAD_REQUEST,
                 )
 
-            # Validate image dimensions BEFORE loading pixel data
+            # Validate image dimensions
             width, height = img.size
             if width > 5000 or height > 5000:
                 return Response(
@@ -151,11 +163,8 @@ def upload_image(request):
                     {'error': 'Image resolution too high. Maximum: 25 megapixels'}, status=status.HTTP_400_BAD_REQUEST
                 )
 
-            # Now it's safe to load the full image into memory
-            img.load()
-
-            # Optimize image (resize if too large, compress)
-            optimized_data = _optimize_image(img, safe_filename)
+            # Safe to decode now; the rendition is what gets stored and served
+            original = sanitize_original(img)
 
         except Exception as e:
             logger.warning(f'Invalid image file: {e}')
@@ -164,9 +173,9 @@ def upload_image(request):
         # Upload to MinIO with sanitized filename
         storage = get_storage_service()
         url, error = storage.upload_file(
-            file_data=optimized_data,
-            filename=safe_filename,
-            content_type='image/jpeg',  # Always save as JPEG after optimization
+            file_data=original.data,
+            filename=f'{os.path.splitext(safe_filename)[0]}.jpg',  # Always JPEG after sanitizing
+            content_type=original.content_type,
             user_id=request.user.id,
             folder=folder,
             is_public=is_public,
@@ -175,18 +184,24 @@ def upload_image(request):
         if error:
             return Response({'error': error}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-        # For private files, url is just the object name - generate presigned URL
-        if not is_public:
-            url = storage.get_presigned_url(url, expires_seconds=3600)
+        image = UploadedImage.objects.create(
+            user=request.user,
+            url=url,
+            object_name=storage.object_name_from_url(url) if is_public else url,
+            filename=safe_filename,
+            content_type=original.content_type,
+            width=original.width,
+            height=original.height,
+            size=len(original.data),
+            is_public=is_public,
+        )
+        transaction.on_commit(lambda: generate_image_derivatives_task.delay(image.id))
 
         return Response(
             {
-                'url': url,
-                'filename': safe_filename,
+                **UploadedImageSerializer(image).data,
                 'original_filename': uploaded_file.name,
                 'original_size': uploaded_file.size,
-                'optimized_size': len(optimized_data),
-                'is_public': is_public,
             },
             status=status.HTTP_201_CREATED,
         )
@@ -196,44 +211,6 @@ def upload_image(request):
         return Response({'error': 'Failed to upload file'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-def _optimize_image(img: Image.Image, filename: str, max_width: int = 1920) -> bytes:
-    """
-    Optimize image by resizing and compressing.
-
-    Args:
-        img: PIL Image object
-        filename: Original filename
-        max_width: Maximum width in pixels
-
-    Returns:
-        Optimized image data as bytes
-    """
-    # Convert RGBA/LA to RGB for JPEG
-    if img.mode in ('RGBA', 'LA', 'P'):
-        background = Image.new('RGB', img.size, (255, 255, 255))
-        if img.mode == 'P':
-            img = img.convert('RGBA')
-        background.paste(img, mask=img.split()[-1] if img.mode in ('RGBA', 'LA') else None)
-        img = background
-    elif img.mode != 'RGB':
-        img = img.convert('RGB')
-
-    # Resize if too large
-    if img.width > max_width:
-        ratio = max_width / img.width
-        new_size = (max_width, int(img.height * ratio))
-        img = img.resize(new_size, Image.Resampling.LANCZOS)
-        logger.info(f'Resized image from {img.size} to {new_size}')
-
-    # Save optimized
-    output = BytesIO()
-    img.save(output, format='JPEG', quality=85, optimize=True)
-    optimized_data = output.getvalue()
-
-    logger.info(f'Optimized image: {filename}')
-    return optimized_data
-
-
 @api_view(['POST'])
 @permission_classes([IsAuthenticated])
 @ratelimit(key='user', rate='20/m', method='POST')  # 20 uploads per minute
@@ -307,22 +284,19 @@ def upload_file(request):
     safe_filename = sanitize_filename(uploaded_file.name)
 
     try:
-        # Read file data
-        file_data = uploaded_file.read()
-
         # Extract text from PDFs for AI processing (e.g., resume parsing)
         extracted_text = None
         if content_type == 'application/pdf':
             from .pdf_extractor import extract_text_from_pdf
 
-            extracted_text = extract_text_from_pdf(file_data, max_pages=10, max_chars=15000)
+            extracted_text = extract_text_from_pdf(uploaded_file, max_pages=10, max_chars=15000)
             if extracted_text:
                 logger.info(f'Extracted {len(extracted_text)} characters from PDF: {safe_filename}')
 
-        # Upload to MinIO with sanitized filename
+        # Stream to MinIO with sanitized filename (large files go up in parts, never fully in memory)
         storage = get_storage_service()
         url, error = storage.upload_file(
-            file_data=file_data,
+            file_data=uploaded_file,
             filename=safe_filename,
             content_type=content_type,
             user_id=request.user.id,
@@ -5,8 +5,7 @@ from urllib.parse import urlparse
 import bleach
 from django.contrib.auth.models import AbstractUser
 from django.core.exceptions import ValidationError
-from django.db import models, transaction
-from django.db.models import F
+from django.db import connection, models, transaction
 from django.utils import timezone
 
 logger = logging.getLogger(__name__)
@@ -550,27 +549,22 @@ class User(AbstractUser):
                 extra={'user_id': self.id, 'activity_type': activity_type},
             )
 
-        # Store old values for upgrade detection
-        old_tier = self.tier
-        old_level = self.level
-
-        # Atomic points update using F() expression (prevents race conditions)
-        User.objects.filter(pk=self.pk).update(total_points=F('total_points') + amount)
-
-        # Refresh to get actual value after F() expression
-        self.refresh_from_db()
-
-        # Calculate and update tier and level
-        new_tier = self._calculate_tier()
-        new_level = self._calculate_level()
-
-        if new_tier != self.tier or new_level != self.level:
-            self.tier = new_tier
-            self.level = new_level
-            self.save(update_fields=['tier', 'level'])
+        # Single-statement award: points, tier, level and streak in one UPDATE ... RETURNING
+        award = self._apply_points_award(amount)
+        if award is None:
+            # Tier changed to curation/team since this instance was loaded
+            return self.total_points
 
-        # Update daily streak
-        self._update_streak()
+        (
+            self.total_points,
+            self.tier,
+            self.level,
+            self.current_streak_days,
+            self.longest_streak_days,
+            self.last_activity_date,
+            old_tier,
+            old_level,
+        ) = award
 
         # Log activity for history/audit trail
         from core.thrive_circle.models import PointActivity
@@ -579,6 +573,12 @@ class User(AbstractUser):
             user=self, amount=amount, activity_type=activity_type, description=description, tier_at_time=old_tier
         )
 
+        # Weekly goals and achievements run in Celery once the award is committed
+        from core.thrive_circle.tasks import process_points_award
+
+        user_id = self.pk
+        transaction.on_commit(lambda: process_points_award.delay(user_id, activity_type))
+
         # Check for tier/level upgrades and log
         tier_upgraded = old_tier != self.tier
         level_upgraded = old_level != self.level
@@ -609,69 +609,135 @@ class User(AbstractUser):
 
     def _calculate_tier(self):
         """Calculate tier from total_points using threshold mapping."""
-        if self.total_points >= self.TIER_THRESHOLDS['evergreen']:
-            return 'evergreen'
-        elif self.total_points >= self.TIER_THRESHOLDS['bloom']:
-            return 'bloom'
-        elif self.total_points >= self.TIER_THRESHOLDS['blossom']:
-            return 'blossom'
-        elif self.total_points >= self.TIER_THRESHOLDS['sprout']:
-            return 'sprout'
-        return 'seedling'
+        return self.tier_for_points(self.total_points)
 
     def _calculate_level(self):
+        """Calculate level from total_points."""
+        return self.level_for_points(self.total_points)
+
+    @classmethod
+    def tier_for_points(cls, points):
+        """Tier for a points total (highest threshold reached)."""
+        for tier in ('evergreen', 'bloom', 'blossom', 'sprout'):
+            if points >= cls.TIER_THRESHOLDS[tier]:
+                return tier
+        return 'seedling'
+
+    @classmethod
+    def level_for_points(cls, points):
         """
-        Calculate level from total_points.
+        Level for a points total.
 
         Levels 1-23 use predefined thresholds.
         After level 20, it's +10,000 points per additional level.
         """
         # Check predefined levels (1-23)
-        for level_num, threshold in enumerate(self.LEVEL_THRESHOLDS, start=1):
-            if self.total_points < threshold:
+        for level_num, threshold in enumerate(cls.LEVEL_THRESHOLDS, start=1):
+            if points < threshold:
                 return level_num - 1 if level_num > 1 else 1
 
         # After level 23 (61,000 points), calculate based on pattern
-        level_20_threshold = self.LEVEL_THRESHOLDS[19]  # 31,000 points
-        points_above_20 = self.total_points - level_20_threshold
-        additional_levels = points_above_20 // 10000
-        return 20 + additional_levels
+        level_20_threshold = cls.LEVEL_THRESHOLDS[19]  # 31,000 points
+        return 20 + (points - level_20_threshold) // 10000
 
-    def _update_streak(self):
+    def _apply_points_award(self, amount):
         """
-        Update daily activity streak based on last_activity_date.
+        Add points and update tier, level and daily streak in one locked write.
+
+        Streak rules: unchanged if the user already earned points today, +1 if
+        their last activity was yesterday, otherwise reset to 1.
 
-        Streak increases if user earned points on consecutive days.
-        Resets to 1 if there's a gap of more than 1 day.
+        Returns:
+            (total_points, tier, level, current_streak_days, longest_streak_days,
+            last_activity_date, old_tier, old_level), or None if the user is in a
+            no-points tier.
         """
         today = timezone.now().date()
         yesterday = today - timedelta(days=1)
 
-        if self.last_activity_date is None:
-            # First activity ever
-            User.objects.filter(pk=self.pk).update(
-                current_streak_days=1,
-                longest_streak_days=F('longest_streak_days') if self.longest_streak_days >= 1 else 1,
-                last_activity_date=today,
-            )
-        elif self.last_activity_date == today:
-            # Already earned points today, no streak update needed
-            pass
-        elif self.last_activity_date == yesterday:
-            # Consecutive day! Increment streak atomically
-            User.objects.filter(pk=self.pk).update(
-                current_streak_days=F('current_streak_days') + 1, last_activity_date=today
+        if connection.vendor == 'postgresql':
+            return self._apply_points_award_returning(amount, today, yesterday)
+
+        # Portable path (SQLite in local dev): lock, compute in Python, write once
+        row = (
+            User.objects.select_for_update()
+            .filter(pk=self.pk)
+            .exclude(tier__in=('curation', 'team'))
+            .values_list(
+                'total_points', 'tier', 'level', 'current_streak_days', 'longest_streak_days', 'last_activity_date'
             )
-            # Refresh and update longest streak if current exceeds it
-            self.refresh_from_db()
-            if self.current_streak_days > self.longest_streak_days:
-                User.objects.filter(pk=self.pk).update(longest_streak_days=F('current_streak_days'))
-        else:
-            # Streak broken (gap > 1 day), reset to 1
-            User.objects.filter(pk=self.pk).update(current_streak_days=1, last_activity_date=today)
+            .first()
+        )
+        if row is None:
+            return None
+
+        total_points, old_tier, old_level, current_streak, longest_streak, last_activity = row
+        total_points += amount
+        if last_activity == yesterday:
+            current_streak += 1
+        elif last_activity != today:
+            current_streak = 1
+        longest_streak = max(longest_streak, current_streak)
+        tier = self.tier_for_points(total_points)
+        level = self.level_for_points(total_points)
+
+        User.objects.filter(pk=self.pk).update(
+            total_points=total_points,
+            tier=tier,
+            level=level,
+            current_streak_days=current_streak,
+            longest_streak_days=longest_streak,
+            last_activity_date=today,
+        )
+        return total_points, tier, level, current_streak, longest_streak, today, old_tier, old_level
+
+    def _apply_points_award_returning(self, amount, today, yesterday):
+        """Postgres path: a single UPDATE ... RETURNING, with the pre-award tier/level from a locking CTE."""
+        table = connection.ops.quote_name(User._meta.db_table)
+        new_points = 'u.total_points + %(amount)s'
 
-        # Refresh to get updated values
-        self.refresh_from_db()
+        tier_cases = ' '.join(
+            f"WHEN {new_points} >= {self.TIER_THRESHOLDS[tier]} THEN '{tier}'"
+            for tier in ('evergreen', 'bloom', 'blossom', 'sprout')
+        )
+        level_20_threshold = self.LEVEL_THRESHOLDS[19]
+        level_cases = ' '.join(
+            [
+                f'WHEN {new_points} >= {self.LEVEL_THRESHOLDS[-1]} '
+                f'THEN 20 + ({new_points} - {level_20_threshold}) / 10000'
+            ]
+            + [
+                f'WHEN {new_points} >= {threshold} THEN {level_num}'
+                for level_num, threshold in reversed(list(enumerate(self.LEVEL_THRESHOLDS, start=1)))
+                if level_num < len(self.LEVEL_THRESHOLDS)
+            ]
+        )
+        new_streak = (
+            'CASE WHEN u.last_activity_date = %(today)s THEN u.current_streak_days '
+            'WHEN u.last_activity_date = %(yesterday)s THEN u.current_streak_days + 1 '
+            'ELSE 1 END'
+        )
+
+        # Only the quoted table name and threshold constants are interpolated; values are parameters
+        sql = f"""
+            WITH old AS (
+                SELECT id, tier, level FROM {table} WHERE id = %(pk)s FOR UPDATE
+            )
+            UPDATE {table} AS u SET
+                total_points = {new_points},
+                tier = CASE {tier_cases} ELSE 'seedling' END,
+                level = CASE {level_cases} ELSE 1 END,
+                current_streak_days = {new_streak},
+                longest_streak_days = GREATEST(u.longest_streak_days, {new_streak}),
+                last_activity_date = %(today)s
+            FROM old
+            WHERE u.id = old.id AND old.tier NOT IN ('curation', 'team')
+            RETURNING u.total_points, u.tier, u.level, u.current_streak_days, u.longest_streak_days,
+                u.last_activity_date, old.tier, old.level
+        """  # noqa: S608
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {'pk': self.pk, 'amount': amount, 'today': today, 'yesterday': yesterday})
+            return cursor.fetchone()
 
     @property
     def points_to_next_level(self):
@@ -360,7 +360,7 @@ class UserTaxonomyPreferencesSerializer(serializers.ModelSerializer):
             # Invalidate member context cache so Ava sees the update
             from services.agents.context.member_context import MemberContextService
 
-            MemberContextService.invalidate_cache(instance.id)
+            MemberContextService.invalidate_cache(instance.id, sources=['learning'])
 
         # Handle M2M fields separately
         learning_styles = validated_data.pop('learning_styles', None)
@@ -386,6 +386,11 @@ class UserTaxonomyPreferencesSerializer(serializers.ModelSerializer):
         if industries is not None:
             instance.industries.set(industries)
 
+        # Taxonomy preferences feed the member context's preferences source
+        from services.agents.context.member_context import MemberContextService
+
+        MemberContextService.invalidate_cache(instance.id, sources=['preferences'])
+
         return instance
 
 
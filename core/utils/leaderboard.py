@@ -0,0 +1,227 @@
+"""
+Generic Redis ZSET leaderboard engine.
+
+A RedisLeaderboard wraps one sorted set (member = user id, score = points or
+votes) and provides the operations every leaderboard in the app needs:
+
+- O(log N) score updates (incr / set) that can be batched into one pipeline
+- O(log N) "my rank" and O(log N + M) pages and windowed neighbors
+- Atomic rebuild from Postgres (written to a temp key, then RENAMEd in place)
+
+Used by the weekly challenge leaderboard (core.challenges.leaderboard) and
+the Thrive Circle points leaderboards (core.thrive_circle.leaderboard).
+
+All reads fail soft (empty/None) when Redis is unavailable, so callers can
+fall back to the database.
+"""
+
+import logging
+import secrets
+from collections.abc import Iterable
+
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+REBUILD_CHUNK_SIZE = 5000
+
+
+def get_redis_client():
+    """Get the raw Redis client from the cache backend, or None for non-Redis caches."""
+    try:
+        return cache._cache.get_client(write=True)
+    except AttributeError:
+        return None
+
+
+class RedisLeaderboard:
+    """A single ZSET-backed leaderboard."""
+
+    def __init__(self, key: str, ttl: int | None = None):
+        """
+        Args:
+            key: Redis key of the sorted set
+            ttl: Optional expiry (seconds) refreshed on every write, for time-boxed boards
+        """
+        self.key = key
+        self.ttl = ttl
+
+    def __repr__(self):
+        return f'RedisLeaderboard({self.key!r})'
+
+    # ------------------------------------------------------------------
+    # Writes (pass `pipe` to batch several boards into one round trip)
+    # ------------------------------------------------------------------
+
+    def incr(self, member: int | str, amount: float, pipe=None):
+        """Add `amount` to a member's score."""
+        self._write(pipe, lambda p: p.zincrby(self.key, amount, str(member)))
+
+    def set_score(self, member: int | str, score: float, pipe=None, only_new: bool = False):
+        """Set a member's score (only_new=True leaves existing members untouched)."""
+        self._write(pipe, lambda p: p.zadd(self.key, {str(member): score}, nx=only_new))
+
+    def remove(self, member: int | str, pipe=None):
+        """Remove a member from the board."""
+        self._write(pipe, lambda p: p.zrem(self.key, str(member)), touch_ttl=False)
+
+    def _write(self, pipe, command, touch_ttl: bool = True):
+        if pipe is not None:
+            command(pipe)
+            if touch_ttl and self.ttl:
+                pipe.expire(self.key, self.ttl)
+            return
+
+        redis = get_redis_client()
+        if not redis:
+            return
+        try:
+            own_pipe = redis.pipeline(transaction=False)
+            command(own_pipe)
+            if touch_ttl and self.ttl:
+                own_pipe.expire(self.key, self.ttl)
+            own_pipe.execute()
+        except Exception as e:
+            logger.error(f'Error updating leaderboard {self.key}: {e}')
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def rank(self, member: int | str) -> int | None:
+        """1-indexed rank (1 = highest score) or None if not on the board."""
+        return self.standing(member)[0]
+
+    def score(self, member: int | str) -> float:
+        """Member's score (0.0 if not on the board)."""
+        return self.standing(member)[1]
+
+    def standing(self, member: int | str) -> tuple[int | None, float]:
+        """(rank, score) for one member in a single round trip."""
+        return self.standings([member]).get(member, (None, 0.0))
+
+    def standings(self, members: list) -> dict:
+        """Batch (rank, score) lookup for many members in one pipeline."""
+        redis = get_redis_client()
+        if not redis or not members:
+            return {}
+
+        try:
+            pipe = redis.pipeline(transaction=False)
+            for member in members:
+                pipe.zrevrank(self.key, str(member))
+                pipe.zscore(self.key, str(member))
+            results = pipe.execute()
+        except Exception as e:
+            logger.error(f'Error getting standings from {self.key}: {e}')
+            return {}
+
+        standings = {}
+        for i, member in enumerate(members):
+            rank, score = results[2 * i], results[2 * i + 1]
+            standings[member] = (rank + 1 if rank is not None else None, float(score) if score is not None else 0.0)
+        return standings
+
+    def page(self, start: int = 0, end: int = 99) -> list[tuple[int, float]]:
+        """Entries ranked start..end (0-indexed, inclusive), highest score first."""
+        redis = get_redis_client()
+        if not redis:
+            return []
+
+        try:
+            results = redis.zrevrange(self.key, start, end, withscores=True)
+            return [(int(member), score) for member, score in results]
+        except Exception as e:
+            logger.error(f'Error reading leaderboard {self.key}: {e}')
+            return []
+
+    def neighbors(self, member: int | str, window: int = 2) -> list[tuple[int, float, int]]:
+        """Entries within `window` places above and below a member, as (member, score, rank)."""
+        rank = self.rank(member)
+        if rank is None:
+            return []
+
+        start = max(0, rank - 1 - window)
+        entries = self.page(start, rank - 1 + window)
+        return [(uid, score, start + i + 1) for i, (uid, score) in enumerate(entries)]
+
+    def size(self) -> int:
+        """Number of members on the board."""
+        redis = get_redis_client()
+        if not redis:
+            return 0
+
+        try:
+            return redis.zcard(self.key)
+        except Exception as e:
+            logger.error(f'Error counting leaderboard {self.key}: {e}')
+            return 0
+
+    def exists(self) -> bool:
+        """Whether the board has been built."""
+        redis = get_redis_client()
+        if not redis:
+            return False
+
+        try:
+            return bool(redis.exists(self.key))
+        except Exception as e:
+            logger.error(f'Error checking leaderboard {self.key}: {e}')
+            return False
+
+    # ------------------------------------------------------------------
+    # Maintenance
+    # ------------------------------------------------------------------
+
+    def replace(self, scores: Iterable[tuple[int | str, float]]) -> int:
+        """Atomically replace the board's contents (e.g. rebuild from Postgres).
+
+        Scores are streamed into a temporary key in chunks and swapped in with
+        RENAME, so readers never see a partially built board.
+
+        Returns:
+            Number of members written
+        """
+        redis = get_redis_client()
+        if not redis:
+            return 0
+
+        temp_key = f'{self.key}:rebuild:{secrets.token_hex(4)}'
+        written = 0
+        try:
+            chunk = {}
+            for member, score in scores:
+                chunk[str(member)] = float(score)
+                if len(chunk) >= REBUILD_CHUNK_SIZE:
+                    redis.zadd(temp_key, chunk)
+                    written += len(chunk)
+                    chunk = {}
+            if chunk:
+                redis.zadd(temp_key, chunk)
+                written += len(chunk)
+
+            if written:
+                pipe = redis.pipeline(transaction=True)
+                pipe.rename(temp_key, self.key)
+                if self.ttl:
+                    pipe.expire(self.key, self.ttl)
+                pipe.execute()
+            else:
+                redis.delete(self.key)
+        except Exception as e:
+            logger.error(f'Error rebuilding leaderboard {self.key}: {e}')
+            redis.delete(temp_key)
+            return 0
+
+        return written
+
+    def clear(self):
+        """Delete the board."""
+        redis = get_redis_client()
+        if not redis:
+            return
+
+        try:
+            redis.delete(self.key)
+        except Exception as e:
+            logger.error(f'Error clearing leaderboard {self.key}: {e}')
@@ -0,0 +1,242 @@
+"""
+Shared sliding-window rate limiter backed by an atomic Redis Lua script.
+
+Every rate limit in the app (chat messages, project creation, anonymous IPs,
+GitHub API calls, content search, community chat, scraper domains) goes
+through this module so they all get the same guarantees:
+
+- Atomic: check + admit happens inside one Lua script, so concurrent workers
+  can never both take the last slot (no get-then-set races).
+- Accurate retry-after: computed from the timestamp of the entry that has to
+  expire before a slot frees up, instead of a hard-coded window length.
+- Multi-key: several limits (e.g. global per-minute + per-user per-hour) are
+  checked in a single round trip and admitted all-or-nothing.
+- Observable: every decision is counted in Prometheus by scope and result.
+
+Each limit is a sliding-window log stored as a Redis ZSET of request
+timestamps (ms, taken from the Redis server clock so worker clock skew does
+not matter). When the cache backend is not Redis (locmem in tests/local dev),
+the same algorithm runs in-process against the Django cache.
+
+Usage:
+    from core.utils.rate_limit import RateLimit, rate_limiter
+
+    result = rate_limiter.check(RateLimit('chat_messages', user_id, limit=50, window=3600))
+    if not result.allowed:
+        return error(f'Try again in {result.retry_after_seconds}s')
+
+    # Async callers (consumers)
+    result = await rate_limiter.acheck(RateLimit('community_messages', user_id, limit=10, window=60))
+"""
+
+import logging
+import math
+import secrets
+import threading
+import time
+from dataclasses import dataclass
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = 'ratelimit'
+
+rate_limit_checks = Counter(
+    'allthrive_rate_limit_checks_total',
+    'Rate limit decisions by scope and result',
+    ['scope', 'result'],
+)
+
+# KEYS[i]  - sliding-window log (ZSET of ms timestamps) for limit i
+# ARGV[1]  - '1' to record the request when every window has room, '0' to peek
+# ARGV[2]  - unique member suffix for this request
+# ARGV[2i+1], ARGV[2i+2] - limit and window (ms) for KEYS[i]
+#
+# Returns {allowed, remaining_1, retry_ms_1, remaining_2, retry_ms_2, ...}
+SLIDING_WINDOW_SCRIPT = """
+local t = redis.call('TIME')
+local now = tonumber(t[1]) * 1000 + math.floor(tonumber(t[2]) / 1000)
+local admit = ARGV[1] == '1'
+local counts = {}
+local allowed = 1
+
+for i, key in ipairs(KEYS) do
+    local window = tonumber(ARGV[2 * i + 2])
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now - window)
+    counts[i] = redis.call('ZCARD', key)
+    if counts[i] >= tonumber(ARGV[2 * i + 1]) then
+        allowed = 0
+    end
+end
+
+local result = {allowed}
+for i, key in ipairs(KEYS) do
+    local limit = tonumber(ARGV[2 * i + 1])
+    local window = tonumber(ARGV[2 * i + 2])
+    local count = counts[i]
+    local retry = 0
+    if count >= limit then
+        -- The entry whose expiry brings the window back under the limit
+        local idx = count - limit
+        local entry = redis.call('ZRANGE', key, idx, idx, 'WITHSCORES')
+        retry = tonumber(entry[2]) + window - now
+    elseif allowed == 1 and admit then
+        redis.call('ZADD', key, now, now .. ':' .. ARGV[2])
+        redis.call('PEXPIRE', key, window)
+        count = count + 1
+    end
+    result[#result + 1] = math.max(limit - count, 0)
+    result[#result + 1] = math.max(retry, 0)
+end
+return result
+"""
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A single limit: at most `limit` requests per `window` seconds for one identifier."""
+
+    scope: str
+    identifier: str | int
+    limit: int
+    window: float
+
+    @property
+    def key(self) -> str:
+        return f'{KEY_PREFIX}:{self.scope}:{self.identifier}'
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    """Outcome of checking one or more limits together."""
+
+    allowed: bool
+    remaining: int
+    retry_after: float
+    blocked_by: tuple[RateLimit, ...] = ()
+
+    @property
+    def retry_after_seconds(self) -> int:
+        """Retry-after rounded up to whole seconds (for headers and user messages)."""
+        return math.ceil(self.retry_after)
+
+
+class SlidingWindowRateLimiter:
+    """Sliding-window-log rate limiter with sync and async APIs."""
+
+    def __init__(self):
+        self._script = None
+        self._local_lock = threading.Lock()
+
+    def _get_redis(self):
+        """Get the raw Redis client from the cache backend, or None for non-Redis caches."""
+        try:
+            return cache._cache.get_client(write=True)
+        except AttributeError:
+            return None
+
+    def check(self, *limits: RateLimit) -> RateLimitResult:
+        """Check every limit and record the request only if all of them have room."""
+        return self._evaluate(limits, admit=True)
+
+    def peek(self, *limits: RateLimit) -> RateLimitResult:
+        """Report the current state of the limits without recording a request."""
+        return self._evaluate(limits, admit=False)
+
+    async def acheck(self, *limits: RateLimit) -> RateLimitResult:
+        """Async variant of check() for consumers and async views."""
+        return await sync_to_async(self._evaluate, thread_sensitive=False)(limits, admit=True)
+
+    async def apeek(self, *limits: RateLimit) -> RateLimitResult:
+        """Async variant of peek()."""
+        return await sync_to_async(self._evaluate, thread_sensitive=False)(limits, admit=False)
+
+    def reset(self, *limits: RateLimit) -> None:
+        """Clear the recorded requests for the given limits (admin override / tests)."""
+        redis = self._get_redis()
+        keys = [limit.key for limit in limits]
+        if redis is not None:
+            redis.delete(*keys)
+        else:
+            cache.delete_many(keys)
+
+    def _evaluate(self, limits: tuple[RateLimit, ...], admit: bool) -> RateLimitResult:
+        if not limits:
+            raise ValueError('At least one RateLimit is required')
+
+        try:
+            redis = self._get_redis()
+            if redis is not None:
+                raw = self._run_script(redis, limits, admit)
+            else:
+                raw = self._run_local(limits, admit)
+        except Exception as e:
+            # Fail open: a cache outage should not take down every rate-limited endpoint
+            logger.warning(f'Rate limit check failed for {limits[0].scope}: {e}')
+            for limit in limits:
+                rate_limit_checks.labels(scope=limit.scope, result='error').inc()
+            return RateLimitResult(allowed=True, remaining=min(limit.limit for limit in limits), retry_after=0)
+
+        allowed = bool(raw[0])
+        remaining = []
+        blocked_by = []
+        retry_after = 0.0
+        for i, limit in enumerate(limits):
+            limit_remaining, retry_ms = int(raw[1 + 2 * i]), int(raw[2 + 2 * i])
+            remaining.append(limit_remaining)
+            if retry_ms > 0:
+                blocked_by.append(limit)
+                retry_after = max(retry_after, retry_ms / 1000)
+
+        if admit:
+            for limit in limits:
+                rate_limit_checks.labels(scope=limit.scope, result='allowed' if allowed else 'blocked').inc()
+
+        return RateLimitResult(
+            allowed=allowed,
+            remaining=min(remaining),
+            retry_after=retry_after,
+            blocked_by=tuple(blocked_by),
+        )
+
+    def _run_script(self, redis, limits: tuple[RateLimit, ...], admit: bool) -> list[int]:
+        if self._script is None:
+            self._script = redis.register_script(SLIDING_WINDOW_SCRIPT)
+
+        args = ['1' if admit else '0', secrets.token_hex(6)]
+        for limit in limits:
+            args.extend([limit.limit, int(limit.window * 1000)])
+
+        return self._script(keys=[limit.key for limit in limits], args=args, client=redis)
+
+    def _run_local(self, limits: tuple[RateLimit, ...], admit: bool) -> list[int]:
+        """Same algorithm as the Lua script, against a non-Redis Django cache (single process)."""
+        with self._local_lock:
+            now = int(time.time() * 1000)
+            logs = []
+            allowed = 1
+            for limit in limits:
+                window_ms = int(limit.window * 1000)
+                log = [ts for ts in cache.get(limit.key, []) if ts > now - window_ms]
+                logs.append(log)
+                if len(log) >= limit.limit:
+                    allowed = 0
+
+            result = [allowed]
+            for limit, log in zip(limits, logs, strict=True):
+                window_ms = int(limit.window * 1000)
+                retry = 0
+                if len(log) >= limit.limit:
+                    retry = log[len(log) - limit.limit] + window_ms - now
+                elif allowed and admit:
+                    log.append(now)
+                    cache.set(limit.key, log, timeout=math.ceil(limit.window))
+                result.extend([max(limit.limit - len(log), 0), max(retry, 0)])
+            return result
+
+
+# Singleton instance
+rate_limiter = SlidingWindowRateLimiter()
@@ -155,14 +155,15 @@ export function ExplorePage() {
     refetch: refetchProjects,
   } = useInfiniteQuery({
     queryKey: ['exploreProjects', exploreParamsBase],
-    queryFn: async ({ pageParam = 1 }) => {
-      const params = { ...exploreParamsBase, page: pageParam as number };
+    queryFn: async ({ pageParam }) => {
+      const params = { ...exploreParamsBase, page: pageParam.page, cursor: pageParam.cursor };
       return await exploreProjects(params);
     },
+    // Tabs backed by the project table page by keyset cursor; the personalized tabs use page numbers
     getNextPageParam: (lastPage, allPages) => {
-      return lastPage.next ? allPages.length + 1 : undefined;
+      return lastPage.next ? { page: allPages.length + 1, cursor: lastPage.nextCursor ?? undefined } : undefined;
     },
-    initialPageParam: 1,
+    initialPageParam: { page: 1 } as { page: number; cursor?: string },
     staleTime: 30 * 1000, // 30 seconds
     gcTime: 5 * 60 * 1000, // 5 minutes
     // Only run query if:
@@ -8,6 +8,7 @@ export interface ExploreParams {
   topics?: string[];      // Topic strings (user-generated)
   tools?: number[];       // Tool IDs
   page?: number;
+  cursor?: string;        // Keyset cursor from the previous page's nextCursor
   page_size?: number;
   sort?: string;          // Sort order (e.g., 'trending', 'new', 'top')
   seed?: string;          // Random seed for stable shuffled ordering (legacy, used by 'new' tab)
@@ -46,6 +47,7 @@ export async function exploreProjects(params: ExploreParams): Promise<PaginatedR
   if (params.tab) queryParams.append('tab', params.tab);
   if (params.search) queryParams.append('search', params.search);
   if (params.page) queryParams.append('page', params.page.toString());
+  if (params.cursor) queryParams.append('cursor', params.cursor);
   if (params.page_size) queryParams.append('page_size', params.page_size.toString());
   if (params.seed) queryParams.append('seed', params.seed);
   if (params.freshness_token) queryParams.append('freshness_token', params.freshness_token);
@@ -362,6 +362,7 @@ export interface PaginatedResponse<T> {
   next: string | null;
   previous: string | null;
   results: T[];
+  nextCursor?: string | null;  // Keyset cursor for the next page (explore feed)
 }
 
 // Taxonomy types
@@ -0,0 +1,266 @@
+"""
+Batched achievement evaluation engine.
+
+Achievement definitions and their dependency graph are cached in process
+(they change only when staff edit achievements), so evaluating an event costs
+two reads - the users' earned set and their progress rows - followed by
+in-memory rule evaluation and bulk writes:
+
+    from services.achievements.engine import achievement_engine
+
+    # One user, one or more tracking fields
+    unlocked = achievement_engine.evaluate(user, {'total_points': 1200, 'level': 6})
+
+    # Many users at once (backfills)
+    unlocked_by_user = achievement_engine.evaluate_many({user_id: {'lifetime_projects_created': 4}, ...})
+
+Values follow AchievementTracker.track_event semantics: an increment for
+COUNT/CUMULATIVE achievements and the current total for THRESHOLD/STREAK.
+"""
+
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+
+from django.db import connection, transaction
+from django.utils import timezone
+
+from core.achievements.models import Achievement, AchievementProgress, CriteriaType, UserAchievement
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class _Definitions:
+    """Snapshot of active achievements, indexed for evaluation."""
+
+    by_field: dict[str, list[Achievement]]
+    requires: dict[int, frozenset[int]]
+    loaded_at: float
+
+
+class AchievementEngine:
+    """Evaluate achievement rules for one or many users with a fixed number of queries."""
+
+    # Cross-process staleness bound; edits in this process invalidate immediately (see signals.py)
+    DEFINITIONS_TTL = 300
+
+    def __init__(self):
+        self._definitions: _Definitions | None = None
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Definitions cache
+    # ------------------------------------------------------------------
+
+    def invalidate(self):
+        """Drop the cached definitions (called when achievements are edited)."""
+        self._definitions = None
+
+    def _get_definitions(self) -> _Definitions:
+        definitions = self._definitions
+        if definitions is not None and time.monotonic() - definitions.loaded_at < self.DEFINITIONS_TTL:
+            return definitions
+
+        with self._lock:
+            definitions = self._definitions
+            if definitions is None or time.monotonic() - definitions.loaded_at >= self.DEFINITIONS_TTL:
+                definitions = self._load_definitions()
+                self._definitions = definitions
+        return definitions
+
+    def _load_definitions(self) -> _Definitions:
+        achievements = list(Achievement.objects.filter(is_active=True).prefetch_related('requires_achievements'))
+        requires = {a.id: frozenset(r.id for r in a.requires_achievements.all()) for a in achievements}
+
+        # Order each field's rules so prerequisites are evaluated before dependents,
+        # letting a single event unlock a whole chain (e.g. 10 projects -> 25 projects)
+        depth_cache = {}
+
+        def depth(achievement_id, seen=()):
+            if achievement_id not in depth_cache:
+                parents = [r for r in requires.get(achievement_id, ()) if r not in seen]
+                depth_cache[achievement_id] = 1 + max((depth(r, (*seen, achievement_id)) for r in parents), default=-1)
+            return depth_cache[achievement_id]
+
+        by_field = defaultdict(list)
+        for achievement in achievements:
+            by_field[achievement.tracking_field].append(achievement)
+        for rules in by_field.values():
+            rules.sort(key=lambda a: (depth(a.id), a.criteria_value, a.id))
+
+        return _Definitions(by_field=dict(by_field), requires=requires, loaded_at=time.monotonic())
+
+    # ------------------------------------------------------------------
+    # Evaluation
+    # ------------------------------------------------------------------
+
+    def evaluate(self, user, events: dict[str, int]) -> list[Achievement]:
+        """Apply tracking-field events for one user and return newly unlocked achievements."""
+        if not user or not user.is_authenticated:
+            return []
+        return self.evaluate_many({user.id: events}).get(user.id, [])
+
+    def evaluate_many(
+        self, events_by_user: dict[int, dict[str, int]], absolute: bool = False
+    ) -> dict[int, list[Achievement]]:
+        """
+        Apply tracking-field events for many users in one pass.
+
+        Args:
+            events_by_user: user id -> {tracking_field: value}
+            absolute: Treat every value as the user's current total, even for COUNT and
+                CUMULATIVE achievements (for backfills, so re-running never double counts)
+
+        Returns:
+            user id -> newly unlocked achievements (users with none are omitted)
+        """
+        definitions = self._get_definitions()
+        relevant = {
+            user_id: {field: value for field, value in events.items() if field in definitions.by_field}
+            for user_id, events in events_by_user.items()
+        }
+        relevant = {user_id: events for user_id, events in relevant.items() if events}
+        if not relevant:
+            return {}
+
+        achievement_ids = {
+            achievement.id
+            for events in relevant.values()
+            for field in events
+            for achievement in definitions.by_field[field]
+        }
+
+        with transaction.atomic():
+            # Query 1: everything the users have earned (dependencies can span fields)
+            earned = defaultdict(set)
+            for user_id, achievement_id in UserAchievement.objects.filter(user_id__in=relevant).values_list(
+                'user_id', 'achievement_id'
+            ):
+                earned[user_id].add(achievement_id)
+
+            # Query 2: progress rows for the achievements these events touch, locked so that
+            # concurrent evaluations for the same user apply their increments one after another
+            progress_rows = self._lock_progress(relevant, achievement_ids)
+            missing = [
+                AchievementProgress(user_id=user_id, achievement_id=achievement.id, current_value=0)
+                for user_id, events in relevant.items()
+                for field in events
+                for achievement in definitions.by_field[field]
+                if (user_id, achievement.id) not in progress_rows
+            ]
+            if missing:
+                # Create absent rows empty and lock them too; a row a concurrent request inserted
+                # first is then read with its committed value instead of being overwritten
+                AchievementProgress.objects.bulk_create(missing, ignore_conflicts=True)
+                progress_rows.update(
+                    self._lock_progress(
+                        {p.user_id for p in missing}, {p.achievement_id for p in missing}, exclude=progress_rows
+                    )
+                )
+
+            now = timezone.now()
+            progress_to_update = []
+            unlocks = []
+            unlocked_by_user = defaultdict(list)
+
+            for user_id, events in relevant.items():
+                user_earned = earned[user_id]
+                for field, value in events.items():
+                    for achievement in definitions.by_field[field]:
+                        if achievement.id in user_earned:
+                            continue
+                        if not definitions.requires.get(achievement.id, frozenset()) <= user_earned:
+                            continue
+
+                        progress = progress_rows[(user_id, achievement.id)]
+                        old_value = progress.current_value
+                        new_value = self._next_value(achievement.criteria_type, old_value, value, absolute)
+
+                        if new_value != old_value:
+                            progress.current_value = new_value
+                            progress.last_updated = now
+                            progress_to_update.append(progress)
+
+                        if new_value >= achievement.criteria_value:
+                            user_earned.add(achievement.id)
+                            unlocks.append(
+                                UserAchievement(user_id=user_id, achievement=achievement, progress_at_unlock=new_value)
+                            )
+                            unlocked_by_user[user_id].append(achievement)
+
+            if progress_to_update:
+                AchievementProgress.objects.bulk_update(progress_to_update, ['current_value', 'last_updated'])
+            if unlocks:
+                # A concurrent request may have unlocked some of these already; only the rows
+                # this insert actually wrote are reported, so notifications and points go out once
+                inserted = self._insert_unlocks(unlocks, now)
+                unlocked_by_user = {
+                    user_id: [achievement for achievement in achievements if (user_id, achievement.id) in inserted]
+                    for user_id, achievements in unlocked_by_user.items()
+                }
+                unlocked_by_user = {
+                    user_id: achievements for user_id, achievements in unlocked_by_user.items() if achievements
+                }
+
+        for user_id, achievements in unlocked_by_user.items():
+            for achievement in achievements:
+                logger.info(f"Achievement '{achievement.name}' unlocked for user {user_id}")
+
+        return dict(unlocked_by_user)
+
+    @staticmethod
+    def _lock_progress(user_ids, achievement_ids, exclude=()) -> dict[tuple[int, int], AchievementProgress]:
+        """Progress rows for the users x achievements, locked with SELECT ... FOR UPDATE."""
+        rows = AchievementProgress.objects.select_for_update().filter(
+            user_id__in=user_ids, achievement_id__in=achievement_ids
+        )
+        return {(p.user_id, p.achievement_id): p for p in rows if (p.user_id, p.achievement_id) not in exclude}
+
+    @staticmethod
+    def _insert_unlocks(unlocks: list[UserAchievement], earned_at) -> set[tuple[int, int]]:
+        """
+        Insert unlocks with ON CONFLICT DO NOTHING.
+
+        Returns:
+            The (user_id, achievement_id) pairs that were inserted (RETURNING skips conflicting rows)
+        """
+        meta = UserAchievement._meta
+        quote = connection.ops.quote_name
+        table = quote(meta.db_table)
+        user_col = quote(meta.get_field('user').column)
+        achievement_col = quote(meta.get_field('achievement').column)
+        columns = f'{user_col}, {achievement_col}, {quote("earned_at")}, {quote("progress_at_unlock")}'
+        values = ', '.join(['(%s, %s, %s, %s)'] * len(unlocks))
+        params = [
+            value
+            for unlock in unlocks
+            for value in (unlock.user_id, unlock.achievement_id, earned_at, unlock.progress_at_unlock)
+        ]
+
+        # Only quoted identifiers are interpolated; values are parameters
+        sql = f"""
+            INSERT INTO {table} ({columns}) VALUES {values}
+            ON CONFLICT ({user_col}, {achievement_col}) DO NOTHING
+            RETURNING {user_col}, {achievement_col}
+        """  # noqa: S608
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return set(cursor.fetchall())
+
+    @staticmethod
+    def _next_value(criteria_type: str, current: int, value: int, absolute: bool = False) -> int:
+        """New progress value for an event, by criteria type."""
+        if criteria_type == CriteriaType.FIRST_TIME:
+            return max(current, min(value, 1) if absolute else 1)
+        if criteria_type in (CriteriaType.COUNT, CriteriaType.CUMULATIVE) and not absolute:
+            return current + value
+        # THRESHOLD / STREAK (and backfills): value is the current total. Progress never goes
+        # backwards, so a late event carrying an older total can't undo a newer one
+        return max(current, value)
+
+
+# Singleton instance
+achievement_engine = AchievementEngine()
@@ -6,7 +6,8 @@ from django.contrib.auth import get_user_model
 from django.db import transaction
 from django.db.models import Count
 
-from core.achievements.models import Achievement, AchievementProgress, CriteriaType, UserAchievement
+from core.achievements.models import Achievement, AchievementProgress, UserAchievement
+from services.achievements.engine import achievement_engine
 
 User = get_user_model()
 logger = logging.getLogger(__name__)
@@ -28,61 +29,21 @@ class AchievementTracker:
         Returns:
             List of newly unlocked achievements
         """
-        if not user or not user.is_authenticated:
-            return []
+        return achievement_engine.evaluate(user, {tracking_field: value})
 
-        # Get all active achievements that track this field
-        achievements = Achievement.objects.filter(is_active=True, tracking_field=tracking_field)
-
-        if not achievements.exists():
-            return []
-
-        unlocked = []
+    @staticmethod
+    def track_events(user, events: dict[str, int]) -> list[Achievement]:
+        """
+        Track several fields at once (one evaluation pass instead of one per field).
 
-        with transaction.atomic():
-            for achievement in achievements:
-                # Skip if already earned
-                if UserAchievement.objects.filter(user=user, achievement=achievement).exists():
-                    continue
-
-                # Check dependencies first
-                if not AchievementTracker._check_dependencies(user, achievement):
-                    continue
-
-                # Get or create progress
-                progress, created = AchievementProgress.objects.get_or_create(
-                    user=user, achievement=achievement, defaults={'current_value': 0}
-                )
-
-                # Update progress based on criteria type
-                old_value = progress.current_value
-
-                if achievement.criteria_type == CriteriaType.COUNT:
-                    progress.current_value += value
-                elif achievement.criteria_type == CriteriaType.FIRST_TIME:
-                    progress.current_value = 1
-                elif achievement.criteria_type == CriteriaType.CUMULATIVE:
-                    progress.current_value += value
-                elif achievement.criteria_type == CriteriaType.THRESHOLD:
-                    # For threshold, value is the current total (not increment)
-                    progress.current_value = value
-                elif achievement.criteria_type == CriteriaType.STREAK:
-                    # For streaks, value is the current streak count
-                    progress.current_value = value
-
-                progress.save()
-
-                # Check if achievement should be unlocked
-                if progress.is_complete:
-                    newly_unlocked = AchievementTracker._unlock_achievement(user, achievement, progress.current_value)
-                    if newly_unlocked:
-                        unlocked.append(newly_unlocked)
-                        logger.info(
-                            f'Achievement unlocked: {achievement.name} for user {user.username} '
-                            f'(progress: {old_value} -> {progress.current_value})'
-                        )
+        Args:
+            user: The user to track for
+            events: Mapping of tracking field -> value (same semantics as track_event)
 
-        return unlocked
+        Returns:
+            List of newly unlocked achievements
+        """
+        return achievement_engine.evaluate(user, events)
 
     @staticmethod
     def _check_dependencies(user, achievement: Achievement) -> bool:
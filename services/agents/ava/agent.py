@@ -27,13 +27,14 @@ from typing import Annotated, TypedDict
 import httpx
 from django.conf import settings
 from django.core.cache import cache
-from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_openai import ChatOpenAI
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
 
 from core.ai_usage.tracker import AIUsageTracker
 from services.ai.callbacks import TokenTrackingCallback
+from services.ai.tokenizer import count_tokens, truncate_to_tokens
 
 from .prompts import (
     AVA_FULL_ONBOARDING_PROMPT,
@@ -227,6 +228,9 @@ MAX_TOOL_ITERATIONS = getattr(settings, 'AVA_MAX_TOOL_ITERATIONS', 10)
 # Keep last N messages to stay within context window and memory limits
 MAX_CONTEXT_MESSAGES = getattr(settings, 'AVA_MAX_CONTEXT_MESSAGES', 50)
 
+# Token budget for those messages (system prompt and tool schemas come on top)
+MAX_CONTEXT_TOKENS = getattr(settings, 'AVA_MAX_CONTEXT_TOKENS', 100_000)
+
 # Tool execution timeout in seconds (prevents hanging on slow tools)
 TOOL_EXECUTION_TIMEOUT = getattr(settings, 'AVA_TOOL_EXECUTION_TIMEOUT', 30)
 
@@ -833,13 +837,11 @@ def create_agent_node(model_name: str | None = None):
         all_messages = state.get('messages', [])
         logger.info(f'[AGENT_NODE] Total message count: {len(all_messages)}')
 
-        # Trim to last N messages to prevent context bloat and slow processing
-        # Uses module-level MAX_CONTEXT_MESSAGES (configurable via AVA_MAX_CONTEXT_MESSAGES setting)
-        if len(all_messages) > MAX_CONTEXT_MESSAGES:
-            messages = all_messages[-MAX_CONTEXT_MESSAGES:]
-            logger.info(f'[AGENT_NODE] Trimmed to last {MAX_CONTEXT_MESSAGES} messages')
-        else:
-            messages = all_messages
+        # Trim to the last N messages and the token budget to prevent context bloat and slow processing
+        # (AVA_MAX_CONTEXT_MESSAGES / AVA_MAX_CONTEXT_TOKENS settings)
+        messages = _truncate_messages(all_messages, MAX_CONTEXT_MESSAGES, max_tokens=MAX_CONTEXT_TOKENS)
+        if messages is not all_messages:
+            logger.info(f'[AGENT_NODE] Trimmed history to {len(messages)} messages')
 
         # Log message types for debugging
         for i, msg in enumerate(messages[-5:]):  # Last 5 messages
@@ -1131,14 +1133,9 @@ def create_ava_agent_with_state_injection(
 
 def _estimate_tokens(text: str) -> int:
     """
-    Estimate token count from text.
-
-    Uses the common approximation of ~4 characters per token for English.
-    For production billing, consider using tiktoken for exact counts.
+    Count tokens in text with the shared tokenizer (BPE when available, cached for long strings).
     """
-    if not text:
-        return 0
-    return max(1, len(text) // 4)
+    return count_tokens(text)
 
 
 def _estimate_messages_tokens(messages: list[BaseMessage]) -> int:
@@ -1217,19 +1214,43 @@ async def _track_ava_usage(
 # =============================================================================
 
 
-def _truncate_messages(messages: list[BaseMessage], max_messages: int) -> list[BaseMessage]:
+def _truncate_messages(
+    messages: list[BaseMessage], max_messages: int, max_tokens: int | None = None
+) -> list[BaseMessage]:
     """
     Truncate message history to prevent unbounded memory growth.
 
     Keeps the most recent messages while preserving conversation coherence.
     At 100k users with concurrent requests, unbounded message lists cause OOM.
+
+    With max_tokens, the kept messages are also cut to that many tokens, newest
+    first. The oldest message that only partly fits keeps its most recent text
+    if it is plain text; tool results left without their tool call are dropped.
     """
-    if len(messages) <= max_messages:
+    if len(messages) > max_messages:
+        # Keep the most recent messages
+        # This ensures we have recent context while staying within limits
+        messages = messages[-max_messages:]
+    if max_tokens is None or _estimate_messages_tokens(messages) <= max_tokens:
         return messages
 
-    # Keep the most recent messages
-    # This ensures we have recent context while staying within limits
-    return messages[-max_messages:]
+    kept = []
+    budget = max_tokens
+    for msg in reversed(messages):
+        cost = _estimate_messages_tokens([msg])
+        if cost <= budget:
+            kept.append(msg)
+            budget -= cost
+            continue
+        if budget > 0 and isinstance(msg.content, str) and not isinstance(msg, ToolMessage | AIMessage):
+            kept.append(msg.model_copy(update={'content': truncate_to_tokens(msg.content, budget, keep='end')}))
+        break
+    kept.reverse()
+
+    # The model API rejects a tool result whose tool call was trimmed away
+    while kept and isinstance(kept[0], ToolMessage):
+        kept.pop(0)
+    return kept
 
 
 async def _execute_tool_with_timeout(
@@ -13,7 +13,7 @@ Tests cover:
 import asyncio
 
 import pytest
-from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
 
 from services.agents.ava.agent import (
     _estimate_tokens,
@@ -22,6 +22,7 @@ from services.agents.ava.agent import (
     _serialize_tool_output,
     _truncate_messages,
 )
+from services.ai.tokenizer import count_tokens
 
 
 class TestGetUserFriendlyError:
@@ -291,6 +292,46 @@ class TestMessageTruncation:
         # Recent messages should be kept
         assert any('Recent' in str(m.content) for m in result)
 
+    def test_truncate_to_token_budget_keeps_newest(self):
+        """With a token budget, the newest messages that fit are kept whole."""
+        messages = [HumanMessage(content=f'Message number {i} about the project roadmap') for i in range(6)]
+        per_message = count_tokens(messages[0].content)
+
+        result = _truncate_messages(messages, max_messages=50, max_tokens=per_message * 3)
+
+        assert [m.content for m in result] == [m.content for m in messages[-3:]]
+
+    def test_partly_fitting_message_keeps_its_latest_text(self):
+        """The oldest message that only partly fits is cut exactly to the remaining budget."""
+        long_message = HumanMessage(content=' '.join(f'word{i}' for i in range(400)))
+        latest = AIMessage(content='Short answer')
+        budget = count_tokens(latest.content) + 20
+
+        result = _truncate_messages([long_message, latest], max_messages=50, max_tokens=budget)
+
+        assert result[-1] is latest
+        assert count_tokens(result[0].content) == 20
+        assert long_message.content.endswith(result[0].content)
+
+    def test_orphaned_tool_results_are_dropped(self):
+        """A tool result whose tool call was trimmed away is not kept."""
+        messages = [
+            AIMessage(content='', tool_calls=[{'name': 'find_content', 'args': {'q': 'x' * 2000}, 'id': 'call_1'}]),
+            ToolMessage(content='Found three projects', tool_call_id='call_1'),
+            HumanMessage(content='Thanks!'),
+        ]
+        budget = count_tokens('Found three projects') + count_tokens('Thanks!')
+
+        result = _truncate_messages(messages, max_messages=50, max_tokens=budget)
+
+        assert [m.content for m in result] == ['Thanks!']
+
+    def test_history_within_budget_is_unchanged(self):
+        """History under both limits is returned as is."""
+        messages = [HumanMessage(content='Hi'), AIMessage(content='Hello!')]
+
+        assert _truncate_messages(messages, max_messages=50, max_tokens=1000) is messages
+
 
 class TestTokenEstimation:
     """Tests for token estimation utility."""
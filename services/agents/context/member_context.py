@@ -4,7 +4,11 @@ Member context aggregation service.
 Aggregates comprehensive member state for injection into Ava agent.
 Combines learning context with personalization data for a complete picture.
 
-Uses Redis caching with 5-minute TTL for performance at scale.
+Each context source (learning, personalization, profile, preferences, semantic,
+feedback) is cached separately with its own TTL, so a change to one source only
+recomputes that source. The assembled context is cached for 5 minutes on top.
+On a cold miss the async path gathers the sources concurrently, each with its
+own timeout; a source that times out falls back to defaults.
 
 Usage:
     # Sync (from tools_node)
@@ -14,17 +18,35 @@ Usage:
     context = await MemberContextService.get_context_async(user_id)
 """
 
+import asyncio
 import logging
+from collections.abc import Iterable
 from typing import TypedDict
 
+from asgiref.sync import sync_to_async
 from django.core.cache import cache
+from django.db import close_old_connections
 
 logger = logging.getLogger(__name__)
 
 # Cache settings
 MEMBER_CONTEXT_CACHE_TTL = 300  # 5 minutes
+MEMBER_CONTEXT_DEGRADED_CACHE_TTL = 30  # Retry soon when a source timed out
 MEMBER_CONTEXT_CACHE_PREFIX = 'member_context:'
 
+# Per-source cache TTL and cold-miss timeout (seconds)
+CONTEXT_SOURCE_SETTINGS = {
+    'learning': {'ttl': 300, 'timeout': 3.0},
+    'personalization': {'ttl': 600, 'timeout': 3.0},
+    'profile': {'ttl': 300, 'timeout': 2.0},
+    'preferences': {'ttl': 900, 'timeout': 2.0},
+    'semantic': {'ttl': 900, 'timeout': 4.0},  # Weaviate gap detection
+    'feedback': {'ttl': 900, 'timeout': 3.0},
+}
+
+# Marks a source that failed or timed out (feedback legitimately returns None)
+_UNAVAILABLE = object()
+
 
 # =============================================================================
 # Learning-related TypedDicts
@@ -252,17 +274,37 @@ class MemberContextService:
         return f'{MEMBER_CONTEXT_CACHE_PREFIX}{user_id}'
 
     @classmethod
-    def invalidate_cache(cls, user_id: int) -> None:
-        """Invalidate cached member context (call after profile/tag updates)."""
-        cache.delete(cls.get_cache_key(user_id))
-        logger.debug('Invalidated member context cache', extra={'user_id': user_id})
+    def get_source_cache_key(cls, user_id: int, source: str) -> str:
+        """Get the cache key for one context source of a member."""
+        return f'{MEMBER_CONTEXT_CACHE_PREFIX}{user_id}:{source}'
+
+    @classmethod
+    def invalidate_cache(cls, user_id: int, sources: Iterable[str] | None = None) -> None:
+        """
+        Invalidate cached member context (call after profile/tag updates).
+
+        Args:
+            user_id: The member whose context changed.
+            sources: Context sources that changed (keys of CONTEXT_SOURCE_SETTINGS).
+                Defaults to all of them; only the named sources are recomputed.
+        """
+        sources = list(CONTEXT_SOURCE_SETTINGS if sources is None else sources)
+        keys = [cls.get_cache_key(user_id)] + [cls.get_source_cache_key(user_id, source) for source in sources]
+        cache.delete_many(keys)
+        logger.debug('Invalidated member context cache', extra={'user_id': user_id, 'sources': sources})
+
+    @classmethod
+    def _cache_context(cls, cache_key: str, context: MemberContext, complete: bool = True) -> None:
+        """Cache the assembled context; briefly if a source fell back to defaults."""
+        timeout = MEMBER_CONTEXT_CACHE_TTL if complete else MEMBER_CONTEXT_DEGRADED_CACHE_TTL
+        cache.set(cache_key, context, timeout=timeout)
 
     @classmethod
     def get_context(cls, user_id: int | None) -> MemberContext | None:
         """
         Get member context synchronously.
 
-        Uses Redis cache with 5-minute TTL.
+        Uses Redis cache with 5-minute TTL. Sources are gathered one after another.
 
         Args:
             user_id: The user ID to get context for.
@@ -284,7 +326,7 @@ class MemberContextService:
 
         try:
             context = cls._aggregate_context(user_id)
-            cache.set(cache_key, context, timeout=MEMBER_CONTEXT_CACHE_TTL)
+            cls._cache_context(cache_key, context)
             return context
         except Exception as e:
             logger.error(
@@ -301,6 +343,7 @@ class MemberContextService:
 
         Uses Redis cache with 5-minute TTL.
         Uses cache.add() to prevent cache stampede (only one request computes value).
+        Sources are gathered concurrently, each with its own timeout.
 
         Args:
             user_id: The user ID to get context for.
@@ -308,8 +351,6 @@ class MemberContextService:
         Returns:
             MemberContext dict or None if user not authenticated.
         """
-        import asyncio
-
         if not user_id:
             return None
 
@@ -343,13 +384,13 @@ class MemberContextService:
             logger.info('[CONTEXT] Lock acquired, aggregating context...')
             try:
                 # Add timeout to prevent indefinite hangs
-                context = await asyncio.wait_for(
+                context, complete = await asyncio.wait_for(
                     cls._aggregate_context_async(user_id),
                     timeout=10.0,  # 10 second timeout
                 )
                 logger.info('[CONTEXT] Context aggregated successfully')
                 try:
-                    cache.set(cache_key, context, timeout=MEMBER_CONTEXT_CACHE_TTL)
+                    cls._cache_context(cache_key, context, complete)
                 except Exception as e:
                     logger.warning(f'[CONTEXT] Cache set failed: {e}')
                 return context
@@ -385,9 +426,9 @@ class MemberContextService:
             # Still no cache - compute anyway (lock may have expired)
             logger.info('[CONTEXT] Computing after wait...')
             try:
-                context = await asyncio.wait_for(cls._aggregate_context_async(user_id), timeout=10.0)
+                context, complete = await asyncio.wait_for(cls._aggregate_context_async(user_id), timeout=10.0)
                 try:
-                    cache.set(cache_key, context, timeout=MEMBER_CONTEXT_CACHE_TTL)
+                    cls._cache_context(cache_key, context, complete)
                 except Exception as e:
                     logger.debug(f'[CONTEXT] Cache set after wait failed: {e}')
                 return context
@@ -473,41 +514,130 @@ class MemberContextService:
             },
         }
 
+    # Context sources: name -> loader method (see CONTEXT_SOURCE_SETTINGS for TTL/timeout)
+    CONTEXT_SOURCES = {
+        'learning': '_get_learning_context',
+        'personalization': '_get_personalization_context',
+        'profile': '_get_profile_context',
+        'preferences': '_get_user_preferences',
+        'semantic': '_get_semantic_intelligence',
+        'feedback': '_get_feedback_context',
+    }
+
     @classmethod
     def _aggregate_context(cls, user_id: int) -> MemberContext:
-        """Aggregate member context from database (sync)."""
-        from datetime import timedelta
+        """Aggregate member context from cached sources, loading misses in series (sync)."""
+        sources = cls._get_cached_sources(user_id)
+        fresh = {name: cls._load_source(name, user_id) for name in cls.CONTEXT_SOURCES if name not in sources}
+        cls._cache_sources(user_id, fresh)
+        return cls._build_context({**sources, **fresh})
 
-        from django.utils import timezone
+    @classmethod
+    async def _aggregate_context_async(cls, user_id: int) -> tuple[MemberContext, bool]:
+        """Aggregate member context from cached sources, loading misses concurrently (async).
 
-        # Get learning context
-        learning_data = cls._get_learning_context(user_id)
+        Each missing source runs in its own worker thread (thread_sensitive=False)
+        under its own timeout, so a cold miss costs the slowest source rather than
+        the sum. A source that fails or times out falls back to its defaults and is
+        not cached.
 
-        # Get personalization context (auto-detected from behavior)
-        personalization_data = cls._get_personalization_context(user_id)
+        Returns:
+            (context, complete) - complete is False if any source fell back to defaults.
+        """
+        sources = cls._get_cached_sources(user_id)
+        missing = [name for name in cls.CONTEXT_SOURCES if name not in sources]
+        logger.info(f'[CONTEXT] Loading {len(missing)} context sources for user {user_id}...')
+
+        results = await asyncio.gather(*(cls._load_source_async(name, user_id) for name in missing))
+
+        fresh = {}
+        complete = True
+        for name, result in zip(missing, results, strict=True):
+            if result is _UNAVAILABLE:
+                complete = False
+                sources[name] = cls._get_source_default(name)
+            else:
+                fresh[name] = result
+        cls._cache_sources(user_id, fresh)
 
-        # Get profile context
-        profile_data = cls._get_profile_context(user_id)
+        return cls._build_context({**sources, **fresh}), complete
 
-        # Get user-configured preferences (taxonomy + feature interests)
-        user_preferences = cls._get_user_preferences(user_id)
+    @classmethod
+    def _load_source(cls, source: str, user_id: int):
+        """Compute one context source from the database."""
+        return getattr(cls, cls.CONTEXT_SOURCES[source])(user_id)
 
-        # Get semantic intelligence from Weaviate
-        semantic_data = cls._get_semantic_intelligence(user_id)
+    @classmethod
+    async def _load_source_async(cls, source: str, user_id: int):
+        """Compute one context source in a worker thread, or _UNAVAILABLE on error/timeout."""
 
-        # Get feedback context (human feedback loop)
-        feedback_data = cls._get_feedback_context(user_id)
+        def load():
+            try:
+                return cls._load_source(source, user_id)
+            finally:
+                # Worker threads open their own DB connection; don't leak it
+                close_old_connections()
 
-        # Check if new member (created within last 7 days)
-        from django.contrib.auth import get_user_model
+        timeout = CONTEXT_SOURCE_SETTINGS[source]['timeout']
+        try:
+            return await asyncio.wait_for(sync_to_async(load, thread_sensitive=False)(), timeout=timeout)
+        except TimeoutError:
+            logger.warning(f'[CONTEXT] Source {source} timed out after {timeout}s for user {user_id}')
+        except Exception as e:
+            logger.warning(
+                f'[CONTEXT] Source {source} failed for user {user_id}: {e}',
+                extra={'user_id': user_id, 'source': source},
+            )
+        return _UNAVAILABLE
 
-        User = get_user_model()
+    @classmethod
+    def _get_cached_sources(cls, user_id: int) -> dict:
+        """Return the cached context sources for a member, keyed by source name."""
+        keys = {cls.get_source_cache_key(user_id, name): name for name in cls.CONTEXT_SOURCES}
         try:
-            user = User.objects.only('date_joined').get(id=user_id)
-            is_new = user.date_joined > timezone.now() - timedelta(days=7)
-        except User.DoesNotExist:
-            logger.debug(f'User not found when checking new member status: user_id={user_id}')
-            is_new = True
+            cached = cache.get_many(list(keys))
+        except Exception as e:
+            logger.warning(f'[CONTEXT] Source cache get failed: {e}')
+            return {}
+        # Entries are wrapped so a cached None (no feedback yet) is still a hit
+        return {keys[key]: entry['data'] for key, entry in cached.items()}
+
+    @classmethod
+    def _cache_sources(cls, user_id: int, sources: dict) -> None:
+        """Cache freshly loaded sources, each with its own TTL."""
+        for name, data in sources.items():
+            try:
+                cache.set(
+                    cls.get_source_cache_key(user_id, name),
+                    {'data': data},
+                    timeout=CONTEXT_SOURCE_SETTINGS[name]['ttl'],
+                )
+            except Exception as e:
+                logger.warning(f'[CONTEXT] Source cache set failed for {name}: {e}')
+
+    @classmethod
+    def _get_source_default(cls, source: str):
+        """Default value for a source that could not be loaded."""
+        default = cls._get_default_context()
+        fields = {
+            'learning': ('learning', 'stats', 'progress', 'suggestions', 'project_topics'),
+            'personalization': ('tool_preferences', 'interests', 'recent_queries'),
+            'profile': ('has_projects', 'project_count', 'is_new_member'),
+            'preferences': ('taxonomy_preferences', 'feature_interests'),
+            'semantic': ('detected_gaps', 'semantic_suggestions'),
+        }
+        if source == 'feedback':
+            return default['feedback']
+        return {field: default[field] for field in fields[source]}
+
+    @classmethod
+    def _build_context(cls, sources: dict) -> MemberContext:
+        """Assemble the member context from loaded sources."""
+        learning_data = sources['learning']
+        personalization_data = sources['personalization']
+        profile_data = sources['profile']
+        user_preferences = sources['preferences']
+        semantic_data = sources['semantic']
 
         return {
             # Top-level skill level for easy access
@@ -524,14 +654,14 @@ class MemberContextService:
             'feature_interests': user_preferences['feature_interests'],
             'has_projects': profile_data['has_projects'],
             'project_count': profile_data['project_count'],
-            'is_new_member': is_new,
+            'is_new_member': profile_data['is_new_member'],
             # Learning Intelligence (Weaviate-powered)
             'detected_gaps': semantic_data['detected_gaps'],
             'current_struggle': None,  # Set by agent at runtime
             'proactive_offer': None,  # Set by agent at runtime
             'semantic_suggestions': semantic_data['semantic_suggestions'],
             # Human feedback loop
-            'feedback': feedback_data,
+            'feedback': sources['feedback'],
             # Profile completion (for profile questions)
             'profile_completion': cls._get_profile_completion(
                 learning=learning_data['learning'],
@@ -541,22 +671,6 @@ class MemberContextService:
             ),
         }
 
-    @classmethod
-    async def _aggregate_context_async(cls, user_id: int) -> MemberContext:
-        """Aggregate member context from database (async).
-
-        Uses thread_sensitive=False to allow parallel execution of DB queries
-        across multiple threads, avoiding event loop blocking.
-        """
-        from asgiref.sync import sync_to_async
-
-        logger.info(f'[CONTEXT] Starting sync_to_async aggregation for user {user_id}...')
-        # thread_sensitive=False allows this to run in a thread pool
-        # rather than blocking the main thread
-        result = await sync_to_async(cls._aggregate_context, thread_sensitive=False)(user_id)
-        logger.info(f'[CONTEXT] sync_to_async aggregation complete for user {user_id}')
-        return result
-
     @classmethod
     def _get_learning_context(cls, user_id: int) -> dict:
         """Get learning-related context."""
@@ -717,13 +831,28 @@ class MemberContextService:
     @classmethod
     def _get_profile_context(cls, user_id: int) -> dict:
         """Get profile-related context."""
+        from datetime import timedelta
+
+        from django.contrib.auth import get_user_model
+        from django.utils import timezone
+
         from core.projects.models import Project
 
         project_count = Project.objects.filter(user_id=user_id, is_archived=False).count()
 
+        # Check if new member (created within last 7 days)
+        User = get_user_model()
+        try:
+            user = User.objects.only('date_joined').get(id=user_id)
+            is_new = user.date_joined > timezone.now() - timedelta(days=7)
+        except User.DoesNotExist:
+            logger.debug(f'User not found when checking new member status: user_id={user_id}')
+            is_new = True
+
         return {
             'has_projects': project_count > 0,
             'project_count': project_count,
+            'is_new_member': is_new,
         }
 
     @classmethod
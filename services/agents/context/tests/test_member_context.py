@@ -4,8 +4,12 @@ Tests for MemberContextService.
 Run with: pytest services/agents/context/tests/ -v
 """
 
+import time
+from unittest.mock import patch
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 
 from core.projects.models import Project
 from core.taxonomy.models import Taxonomy
@@ -177,3 +181,65 @@ class TestGetContextNullUser:
         """get_context should return None for null user_id."""
         context = MemberContextService.get_context(None)
         assert context is None
+
+
+# Known per-source delays (seconds) for the stubbed loaders below
+SOURCE_DELAYS = {
+    'learning': 0.2,
+    'personalization': 0.1,
+    'profile': 0.05,
+    'preferences': 0.05,
+    'semantic': 0.3,
+    'feedback': 0.1,
+}
+
+
+class TestSourceGathering:
+    """Tests for per-source caching and concurrent gathering (loaders stubbed, no DB)."""
+
+    @pytest.fixture(autouse=True)
+    def stub_sources(self):
+        cache.clear()
+        self.loaded = []
+
+        def load(source, user_id):
+            self.loaded.append(source)
+            time.sleep(SOURCE_DELAYS[source])
+            return MemberContextService._get_source_default(source)
+
+        with patch.object(MemberContextService, '_load_source', side_effect=load):
+            yield
+        cache.clear()
+
+    async def test_cold_miss_costs_the_slowest_source(self):
+        """Sources load concurrently, so a cold miss is ~max(delay), not sum(delays)."""
+        start = time.perf_counter()
+        context, complete = await MemberContextService._aggregate_context_async(42)
+        elapsed = time.perf_counter() - start
+
+        assert complete is True
+        assert context['skill_level'] == 'beginner'
+        assert elapsed < sum(SOURCE_DELAYS.values()) - 0.2  # max is 0.3s, sum is 0.8s
+
+    async def test_timed_out_source_degrades_to_defaults(self):
+        """A slow source falls back to defaults and is retried on the next miss."""
+        with patch.dict(
+            'services.agents.context.member_context.CONTEXT_SOURCE_SETTINGS',
+            {'semantic': {'ttl': 900, 'timeout': 0.05}},
+        ):
+            context, complete = await MemberContextService._aggregate_context_async(42)
+
+        assert complete is False
+        assert context['detected_gaps'] == []
+        assert 'semantic' not in MemberContextService._get_cached_sources(42)
+        assert 'learning' in MemberContextService._get_cached_sources(42)
+
+    def test_invalidating_one_source_reloads_only_that_source(self):
+        """invalidate_cache(sources=[...]) keeps the other sources cached."""
+        MemberContextService._aggregate_context(42)
+        self.loaded.clear()
+
+        MemberContextService.invalidate_cache(42, sources=['preferences'])
+        MemberContextService._aggregate_context(42)
+
+        assert self.loaded == ['preferences']
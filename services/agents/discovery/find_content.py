@@ -27,6 +27,8 @@ from django.db.models import Case, Count, Q, Value, When
 from langchain.tools import tool
 from pydantic import BaseModel, Field
 
+from core.utils.rate_limit import RateLimit, rate_limiter
+
 logger = logging.getLogger(__name__)
 
 # =============================================================================
@@ -1293,7 +1295,7 @@ def _check_rate_limit(user_id: int | None) -> tuple[bool, int]:
     """
     Check if user has exceeded the search rate limit.
 
-    Uses a sliding window counter in Redis/cache.
+    Uses the shared sliding-window limiter (atomic Redis script).
 
     Args:
         user_id: User ID to check (None = anonymous, skip rate limit)
@@ -1305,26 +1307,16 @@ def _check_rate_limit(user_id: int | None) -> tuple[bool, int]:
         # Anonymous users skip rate limiting (they have limited functionality anyway)
         return (True, 0)
 
-    rate_limit_key = f'find_content:rate_limit:{user_id}'
-    current_count = cache.get(rate_limit_key, 0)
+    result = rate_limiter.check(
+        RateLimit('find_content', user_id, RATE_LIMIT_SEARCHES_PER_MINUTE, RATE_LIMIT_WINDOW_SECONDS)
+    )
+    current_count = RATE_LIMIT_SEARCHES_PER_MINUTE - result.remaining
 
-    if current_count >= RATE_LIMIT_SEARCHES_PER_MINUTE:
+    if not result.allowed:
         logger.warning(f'Rate limit exceeded for user {user_id}: {current_count}/{RATE_LIMIT_SEARCHES_PER_MINUTE}')
         return (False, current_count)
 
-    # Increment counter
-    try:
-        # Use cache.incr if available (atomic increment)
-        new_count = cache.incr(rate_limit_key)
-        if new_count == 1:
-            # First request in window, set TTL
-            cache.expire(rate_limit_key, RATE_LIMIT_WINDOW_SECONDS)
-    except (ValueError, TypeError):
-        # Key doesn't exist or incr not supported, set with default TTL
-        cache.set(rate_limit_key, 1, timeout=RATE_LIMIT_WINDOW_SECONDS)
-        new_count = 1
-
-    return (True, new_count)
+    return (True, current_count)
 
 
 @tool(args_schema=FindContentInput)
@@ -9,8 +9,17 @@ but real learning material that can be supplemented or replaced with community
 projects and curated content over time.
 """
 
+import hashlib
+import json
 import logging
-
+import math
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
 from django.db.models import F
 from django.utils.text import slugify
 
@@ -52,6 +61,9 @@ from .validators import (
 
 logger = logging.getLogger(__name__)
 
+# Bump when lesson prompts change so cached lessons are regenerated
+LESSON_CACHE_VERSION = 1
+
 # Re-export types for backwards compatibility
 __all__ = [
     'AILessonContent',
@@ -557,41 +569,135 @@ Remember:
             # Fall back to simple heuristic breakdown
             concepts = cls._break_down_topic(topic, lessons_to_generate)
 
-        for _i, concept in enumerate(concepts):
+        contents = cls._get_lesson_contents(concepts, topic, learning_style, difficulty, user_id)
+
+        for concept, lesson_content in zip(concepts, contents, strict=True):
+            if lesson_content:
+                # Estimate time based on content length
+                explanation_length = len(lesson_content.get('explanation', ''))
+                estimated_minutes = max(5, min(20, explanation_length // 200))
+
+                lessons.append(
+                    CurriculumItem(
+                        order=0,  # Will be set by caller
+                        type='ai_lesson',
+                        title=concept,
+                        content=lesson_content,
+                        estimated_minutes=estimated_minutes,
+                        difficulty=difficulty,
+                        generated=True,
+                    )
+                )
+
+        return lessons
+
+    @classmethod
+    def _get_lesson_contents(
+        cls,
+        concepts: list[str],
+        topic: str,
+        learning_style: str,
+        difficulty: str,
+        user_id: int | None = None,
+    ) -> list[AILessonContent | None]:
+        """Return lesson content for each concept, in order, from the cache or the LLM.
+
+        Lessons depend only on (topic, concept, style, difficulty), so one generated
+        for a user is reused for the next user who asks for the same path.
+        """
+        keys = [cls._lesson_cache_key(topic, concept, learning_style, difficulty) for concept in concepts]
+        try:
+            cached = cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f'Lesson cache read failed: {e}')
+            cached = {}
+
+        contents = [cached.get(key) for key in keys]
+        missing = [i for i, content in enumerate(contents) if content is None]
+        if not missing:
+            return contents
+
+        generated = cls._generate_lessons_concurrently(
+            [concepts[i] for i in missing], topic, learning_style, difficulty, user_id
+        )
+        for i, content in zip(missing, generated, strict=True):
+            contents[i] = content
+
+        to_cache = {keys[i]: contents[i] for i in missing if contents[i]}
+        if to_cache:
             try:
-                lesson_content = cls._generate_single_lesson(
+                cache.set_many(to_cache, timeout=settings.LESSON_CACHE_TTL)
+            except Exception as e:
+                logger.warning(f'Lesson cache write failed: {e}')
+
+        return contents
+
+    @classmethod
+    def _generate_lessons_concurrently(
+        cls,
+        concepts: list[str],
+        topic: str,
+        learning_style: str,
+        difficulty: str,
+        user_id: int | None = None,
+    ) -> list[AILessonContent | None]:
+        """Generate lessons in parallel, keeping concept order.
+
+        At most LESSON_GENERATION_CONCURRENCY calls run at once and each is bounded by
+        LESSON_GENERATION_TIMEOUT. A concept that fails or times out yields None, so the
+        other lessons still make it into the path.
+        """
+        timeout = settings.LESSON_GENERATION_TIMEOUT
+        workers = max(1, min(settings.LESSON_GENERATION_CONCURRENCY, len(concepts)))
+
+        def generate(concept: str) -> AILessonContent | None:
+            try:
+                return cls._generate_single_lesson(
                     concept=concept,
                     topic=topic,
                     learning_style=learning_style,
                     difficulty=difficulty,
                     user_id=user_id,
+                    timeout=timeout,
                 )
-
-                if lesson_content:
-                    # Estimate time based on content length
-                    explanation_length = len(lesson_content.get('explanation', ''))
-                    estimated_minutes = max(5, min(20, explanation_length // 200))
-
-                    lessons.append(
-                        CurriculumItem(
-                            order=0,  # Will be set by caller
-                            type='ai_lesson',
-                            title=concept,
-                            content=lesson_content,
-                            estimated_minutes=estimated_minutes,
-                            difficulty=difficulty,
-                            generated=True,
-                        )
+            finally:
+                # Usage tracking opens a DB connection in this worker thread
+                connections.close_all()
+
+        # The provider enforces the per-call timeout; the deadline is a backstop for calls
+        # that hang past it, allowing one timeout per wave of queued calls
+        deadline = time.monotonic() + timeout * math.ceil(len(concepts) / workers) + 1
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='lesson-gen')
+        try:
+            futures = [executor.submit(generate, concept) for concept in concepts]
+            contents = []
+            for concept, future in zip(concepts, futures, strict=True):
+                try:
+                    contents.append(future.result(timeout=max(0, deadline - time.monotonic())))
+                except FuturesTimeoutError:
+                    logger.warning(
+                        f'Lesson generation timed out for concept: {concept}',
+                        extra={'concept': concept, 'topic': topic, 'timeout': timeout},
                     )
-
-            except Exception as e:
-                logger.error(
-                    f'Failed to generate lesson for concept: {concept}',
-                    extra={'concept': concept, 'topic': topic, 'error': str(e)},
-                    exc_info=True,
-                )
-
-        return lessons
+                    contents.append(None)
+                except Exception as e:
+                    logger.error(
+                        f'Failed to generate lesson for concept: {concept}',
+                        extra={'concept': concept, 'topic': topic, 'error': str(e)},
+                        exc_info=True,
+                    )
+                    contents.append(None)
+            return contents
+        finally:
+            # Don't block the request on a hung call; its result is discarded
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _lesson_cache_key(topic: str, concept: str, learning_style: str, difficulty: str) -> str:
+        """Content-hash cache key for a generated lesson."""
+        parts = [LESSON_CACHE_VERSION, topic.strip().lower(), concept.strip().lower(), learning_style, difficulty]
+        digest = hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+        return f'ai_lesson:{digest}'
 
     @classmethod
     def _break_down_topic(cls, topic: str, num_concepts: int) -> list[str]:
@@ -620,6 +726,7 @@ Remember:
         learning_style: str,
         difficulty: str,
         user_id: int | None = None,
+        timeout: int | None = None,
     ) -> AILessonContent | None:
         """Generate a single AI lesson for a concept."""
         from django.contrib.auth import get_user_model
@@ -650,6 +757,7 @@ Remember to return valid JSON matching the required structure."""
                 system_message=cls.SYSTEM_PROMPT,
                 temperature=0.7,
                 max_tokens=2000,
+                timeout=timeout,
             )
 
             # Track AI usage for billing and analytics
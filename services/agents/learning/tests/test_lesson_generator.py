@@ -0,0 +1,91 @@
+"""
+Tests for concurrent AI lesson generation.
+
+Run with: pytest services/agents/learning/tests/ -v
+"""
+
+import json
+import threading
+import time
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from services.agents.learning.lesson_generator import AILessonGenerator
+
+CALL_SECONDS = {'Prompts': 0.3, 'Agents': 0.1, 'Evals': 0.2}
+
+
+class StubProvider:
+    """Stands in for AIProvider: sleeps per concept, then returns a lesson."""
+
+    calls = []
+    lock = threading.Lock()
+
+    def __init__(self, user_id=None):
+        self.last_usage = None
+
+    def complete(self, prompt, timeout=None, **kwargs):
+        concept = prompt.split('Generate a lesson about: ')[1].split('\n')[0]
+        with self.lock:
+            self.calls.append((concept, timeout))
+        if concept == 'Broken':
+            raise RuntimeError('provider error')
+        time.sleep(CALL_SECONDS.get(concept, 0.1))
+        return json.dumps({'summary': concept, 'key_concepts': [concept], 'explanation': f'About {concept}'})
+
+
+@override_settings(LESSON_GENERATION_CONCURRENCY=5, LESSON_GENERATION_TIMEOUT=30)
+class ConcurrentLessonGenerationTest(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        StubProvider.calls = []
+        patcher = patch('services.ai.provider.AIProvider', StubProvider)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _generate(self, concepts):
+        return AILessonGenerator._generate_ai_lessons(
+            topic='AI Engineering',
+            learning_style='mixed',
+            difficulty='beginner',
+            session_length=15,
+            existing_count=0,
+            analyzed_concepts=concepts,
+        )
+
+    def test_total_time_is_the_slowest_call_not_the_sum(self):
+        """Test that lessons are generated concurrently and keep their order"""
+        start = time.perf_counter()
+        lessons = self._generate(['Prompts', 'Agents', 'Evals'])
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual([lesson['title'] for lesson in lessons], ['Prompts', 'Agents', 'Evals'])
+        self.assertLess(elapsed, 0.5)  # max(call) = 0.3s, sum(calls) = 0.6s
+        self.assertTrue(all(timeout == 30 for _, timeout in StubProvider.calls))
+
+    def test_failed_concept_keeps_the_other_lessons(self):
+        """Test that one provider error drops only its own lesson"""
+        lessons = self._generate(['Prompts', 'Broken', 'Evals'])
+
+        self.assertEqual([lesson['title'] for lesson in lessons], ['Prompts', 'Evals'])
+
+    @override_settings(LESSON_GENERATION_TIMEOUT=0.05)
+    def test_hung_call_is_dropped_after_the_timeout(self):
+        """Test that a call past the deadline is skipped instead of blocking the path"""
+        with patch.dict(CALL_SECONDS, {'Prompts': 1.5}):
+            start = time.perf_counter()
+            lessons = self._generate(['Prompts', 'Agents'])
+            elapsed = time.perf_counter() - start
+
+        self.assertEqual([lesson['title'] for lesson in lessons], ['Agents'])
+        self.assertLess(elapsed, 1.5)
+
+    def test_lessons_are_reused_across_users(self):
+        """Test that the same topic/concept/style/difficulty is generated once"""
+        self._generate(['Prompts', 'Agents'])
+        lessons = self._generate(['Agents', 'Evals'])
+
+        self.assertEqual([lesson['title'] for lesson in lessons], ['Agents', 'Evals'])
+        self.assertEqual(sorted(concept for concept, _ in StubProvider.calls), ['Agents', 'Evals', 'Prompts'])
@@ -331,10 +331,10 @@ def create_learning_path(
         profile.current_focus_topic = query
         profile.save(update_fields=['generated_path', 'current_focus_topic', 'updated_at'])
 
-        # Invalidate member context cache
+        # Invalidate the learning source of the member context cache
         from services.agents.context import MemberContextService
 
-        MemberContextService.invalidate_cache(user_id)
+        MemberContextService.invalidate_cache(user_id, sources=['learning'])
 
         logger.info(
             f'Learning path created: {len(curriculum)} items ({curated_count} curated, {ai_lesson_count} AI-generated)',
@@ -563,10 +563,10 @@ def update_learner_profile(
         # Save profile
         profile.save()
 
-        # Invalidate member context cache
+        # Invalidate the learning source of the member context cache
         from services.agents.context import MemberContextService
 
-        MemberContextService.invalidate_cache(user_id)
+        MemberContextService.invalidate_cache(user_id, sources=['learning'])
 
         return {
             'success': True,
@@ -2,6 +2,7 @@
 Image content moderation service using OpenAI's GPT-4 Vision API.
 """
 
+import json
 import logging
 import time
 from typing import Any
@@ -10,6 +11,14 @@ from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from core.ai_usage.tracker import AIUsageTracker
+from services.agents.moderation.verdict_cache import (
+    image_bytes_from,
+    image_cache_key,
+    image_flag_key,
+    image_verdict_ttl,
+    single_flight,
+    verdict_cache,
+)
 from services.ai import AIProvider
 
 logger = logging.getLogger(__name__)
@@ -54,20 +63,22 @@ class ImageModerator:
         else:
             return 'gpt-4o'  # Default fallback
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=20),
-        retry=retry_if_exception_type((APIConnectionError, APITimeoutError, RateLimitError)),
-        reraise=True,
-    )
-    def moderate_image(self, image_url: str, context: str = '', user=None) -> dict[str, Any]:
+    def moderate_image(
+        self, image_url: str, context: str = '', user=None, image_bytes: bytes | None = None
+    ) -> dict[str, Any]:
         """
         Moderate an image using GPT-4 Vision API.
 
+        Verdicts are cached per model and context by the sha256 of the image
+        bytes when known (image_bytes or a data URL) and briefly by URL
+        otherwise. Flagged verdicts also cover near-duplicates via a
+        perceptual hash. Concurrent checks of the same image share one API call.
+
         Args:
             image_url: URL of the image to moderate
             context: Optional context about the image source
             user: Optional user for usage tracking
+            image_bytes: Optional image content already in memory (e.g. an upload), used for the cache key
 
         Returns:
             Dictionary with moderation results
@@ -93,123 +104,23 @@ class ImageModerator:
                 'skipped': True,
             }
 
+        model_used = self._get_vision_model()
+        image_bytes = image_bytes_from(image_url, image_bytes)
+        key = image_cache_key(image_url, model_used, context, image_bytes)
+        flag_key = image_flag_key(model_used, context, image_bytes)
+        cached = verdict_cache.get_many([k for k in (key, flag_key) if k])
+        verdict = cached.get(key) or cached.get(flag_key)
+        if verdict is not None:
+            return self._build_result(verdict, image_url, context, cached=True)
+
         try:
-            # Use vision model from AI gateway to analyze the image
-            start_time = time.time()
-            model_used = self._get_vision_model()
-            response = self.client.chat.completions.create(
-                model=model_used,
-                messages=[
-                    {
-                        'role': 'system',
-                        'content': (
-                            'You are a content moderation AI. Analyze images for '
-                            'inappropriate content including:\n'
-                            '- Explicit sexual content or nudity\n'
-                            '- Graphic violence or gore\n'
-                            '- Hate symbols or extremist imagery\n'
-                            '- Self-harm content\n'
-                            '- Content exploiting or harming children\n'
-                            '- Disturbing or shocking imagery\n\n'
-                            'Respond in JSON format with:\n'
-                            '{\n'
-                            '  "flagged": boolean,\n'
-                            '  "categories": ["category1", "category2"],\n'
-                            '  "severity": "low|medium|high",\n'
-                            '  "explanation": "brief explanation"\n'
-                            '}\n\n'
-                            'Be strict with NSFW content, violence, and hate symbols. '
-                            'Context matters for artistic/educational content.'
-                        ),
-                    },
-                    {
-                        'role': 'user',
-                        'content': [
-                            {
-                                'type': 'text',
-                                'text': (
-                                    f'Analyze this image for inappropriate content. '
-                                    f'Context: {context or "general content"}'
-                                ),
-                            },
-                            {
-                                'type': 'image_url',
-                                'image_url': {'url': image_url, 'detail': 'low'},  # Low detail for faster processing
-                            },
-                        ],
-                    },
-                ],
-                max_tokens=300,
-                response_format={'type': 'json_object'},
+            verdict = single_flight.do(
+                key, lambda: self._fetch_verdict(key, flag_key, image_url, context, user, model_used, image_bytes)
             )
-            latency_ms = int((time.time() - start_time) * 1000)
-
-            # Track usage - vision API is expensive
-            if user:
-                try:
-                    # Get actual token usage from response
-                    usage = response.usage
-                    provider = self.ai_provider.current_provider if self.ai_provider else 'openai'
-                    AIUsageTracker.track_usage(
-                        user=user,
-                        feature='image_moderation',
-                        provider=provider,
-                        model=model_used,
-                        input_tokens=usage.prompt_tokens if usage else 0,
-                        output_tokens=usage.completion_tokens if usage else 0,
-                        latency_ms=latency_ms,
-                        status='success',
-                        request_metadata={'context': context, 'image_url': image_url[:100]},
-                    )
-                except Exception as tracking_error:
-                    logger.warning(f'Failed to track image moderation usage: {tracking_error}')
-
-            # Parse the response
-            import json
-
-            result_text = response.choices[0].message.content
-            result = json.loads(result_text)
-
-            is_flagged = result.get('flagged', False)
-            categories = result.get('categories', [])
-            severity = result.get('severity', 'medium')
-            explanation = result.get('explanation', '')
-
-            # Convert categories list to dict with confidence scores
-            categories_dict = {cat: self._severity_to_score(severity) for cat in categories}
-
-            # Determine approval status
-            approved = not is_flagged
-
-            # Generate human-readable reason
-            reason = self._generate_reason(is_flagged, categories, severity, explanation, context)
-
-            # Calculate confidence
-            confidence = self._severity_to_score(severity) if is_flagged else 0.0
-
-            # Log moderation result
-            if is_flagged:
-                logger.warning(
-                    f'Image flagged by moderation: context={context}, '
-                    f'categories={categories}, severity={severity}, url={image_url}'
-                )
-
-            return {
-                'approved': approved,
-                'flagged': is_flagged,
-                'categories': categories_dict,
-                'reason': reason,
-                'confidence': confidence,
-                'moderation_data': {
-                    'categories': categories,
-                    'severity': severity,
-                    'explanation': explanation,
-                    'image_url': image_url,
-                },
-            }
+            return self._build_result(verdict, image_url, context)
 
         except (APIConnectionError, APITimeoutError, RateLimitError) as e:
-            # These will be retried by the decorator
+            # Already retried by _create_completion
             logger.warning(f'Retryable image moderation error: {type(e).__name__}: {e}')
             raise
 
@@ -238,6 +149,152 @@ class ImageModerator:
                 'error': str(e),
             }
 
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=2, max=20),
+        retry=retry_if_exception_type((APIConnectionError, APITimeoutError, RateLimitError)),
+        reraise=True,
+    )
+    def _create_completion(self, image_url: str, context: str, model: str):
+        return self.client.chat.completions.create(
+            model=model,
+            messages=[
+                {
+                    'role': 'system',
+                    'content': (
+                        'You are a content moderation AI. Analyze images for '
+                        'inappropriate content including:\n'
+                        '- Explicit sexual content or nudity\n'
+                        '- Graphic violence or gore\n'
+                        '- Hate symbols or extremist imagery\n'
+                        '- Self-harm content\n'
+                        '- Content exploiting or harming children\n'
+                        '- Disturbing or shocking imagery\n\n'
+                        'Respond in JSON format with:\n'
+                        '{\n'
+                        '  "flagged": boolean,\n'
+                        '  "categories": ["category1", "category2"],\n'
+                        '  "severity": "low|medium|high",\n'
+                        '  "explanation": "brief explanation"\n'
+                        '}\n\n'
+                        'Be strict with NSFW content, violence, and hate symbols. '
+                        'Context matters for artistic/educational content.'
+                    ),
+                },
+                {
+                    'role': 'user',
+                    'content': [
+                        {
+                            'type': 'text',
+                            'text': (
+                                f'Analyze this image for inappropriate content. Context: {context or "general content"}'
+                            ),
+                        },
+                        {
+                            'type': 'image_url',
+                            'image_url': {'url': image_url, 'detail': 'low'},  # Low detail for faster processing
+                        },
+                    ],
+                },
+            ],
+            max_tokens=300,
+            response_format={'type': 'json_object'},
+        )
+
+    def _fetch_verdict(
+        self,
+        key: str,
+        flag_key: str | None,
+        image_url: str,
+        context: str,
+        user,
+        model_used: str,
+        image_bytes: bytes | None,
+    ) -> dict[str, Any]:
+        """Call the vision model for one uncached image and store its verdict."""
+        # Use vision model from AI gateway to analyze the image
+        start_time = time.time()
+        response = self._create_completion(image_url, context, model_used)
+        latency_ms = int((time.time() - start_time) * 1000)
+
+        # Track usage - vision API is expensive
+        if user:
+            try:
+                # Get actual token usage from response
+                usage = response.usage
+                provider = self.ai_provider.current_provider if self.ai_provider else 'openai'
+                AIUsageTracker.track_usage(
+                    user=user,
+                    feature='image_moderation',
+                    provider=provider,
+                    model=model_used,
+                    input_tokens=usage.prompt_tokens if usage else 0,
+                    output_tokens=usage.completion_tokens if usage else 0,
+                    latency_ms=latency_ms,
+                    status='success',
+                    request_metadata={'context': context, 'image_url': image_url[:100]},
+                )
+            except Exception as tracking_error:
+                logger.warning(f'Failed to track image moderation usage: {tracking_error}')
+
+        # Parse the response; unparseable output raises and is not cached
+        result = json.loads(response.choices[0].message.content)
+        verdict = {
+            'flagged': result.get('flagged', False),
+            'categories': result.get('categories', []),
+            'severity': result.get('severity', 'medium'),
+            'explanation': result.get('explanation', ''),
+        }
+        verdicts = {key: verdict}
+        if verdict['flagged'] and flag_key:
+            # Near-duplicates of a rejected image are rejected too; approvals need an exact match
+            verdicts[flag_key] = verdict
+        verdict_cache.set_many(verdicts, timeout=image_verdict_ttl(image_bytes))
+        return verdict
+
+    def _build_result(self, verdict: dict[str, Any], image_url: str, context: str, cached: bool = False):
+        """Turn a stored vision verdict into the moderation response for this image and context."""
+        is_flagged = verdict['flagged']
+        categories = verdict['categories']
+        severity = verdict['severity']
+        explanation = verdict['explanation']
+
+        # Convert categories list to dict with confidence scores
+        categories_dict = {cat: self._severity_to_score(severity) for cat in categories}
+
+        # Determine approval status
+        approved = not is_flagged
+
+        # Generate human-readable reason
+        reason = self._generate_reason(is_flagged, categories, severity, explanation, context)
+
+        # Calculate confidence
+        confidence = self._severity_to_score(severity) if is_flagged else 0.0
+
+        # Log moderation result
+        if is_flagged:
+            logger.warning(
+                f'Image flagged by moderation: context={context}, '
+                f'categories={categories}, severity={severity}, url={image_url}'
+            )
+
+        result = {
+            'approved': approved,
+            'flagged': is_flagged,
+            'categories': categories_dict,
+            'reason': reason,
+            'confidence': confidence,
+            'moderation_data': {
+                'categories': categories,
+                'severity': severity,
+                'explanation': explanation,
+                'image_url': image_url,
+            },
+        }
+        if cached:
+            result['cached'] = True
+        return result
+
     def _severity_to_score(self, severity: str) -> float:
         """Convert severity level to confidence score."""
         severity_map = {'low': 0.4, 'medium': 0.7, 'high': 0.95}
@@ -3,14 +3,133 @@ Keyword-based content filter for pre-screening NSFW content.
 
 This provides a fast, local filter to catch obviously inappropriate content
 before making API calls to external moderation services.
+
+Keyword patterns start at a word boundary, so rather than running each regex
+over the whole message, patterns are indexed by their literal leading word
+(e.g. 'execut' for execut(e|ion)). One scan over the words of the message
+looks up candidates in that index and runs a pattern's regex only at word
+starts where it can match. Patterns that cannot be indexed fall back to a
+regular search. Verdicts are identical to searching with every pattern.
 """
 
 import logging
 import re
+import threading
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Non-ASCII characters that re.IGNORECASE treats as equal to an ASCII letter/digit.
+# Applied before lower() so candidate lookup never misses a match the regex would find.
+_IGNORECASE_FOLDS = str.maketrans({'\u0130': 'i', '\u0131': 'i', '\u017f': 's', '\u212a': 'k'})
+
+_WORD = re.compile(r'\w+')
+_LITERAL = re.compile(r'[A-Za-z0-9]+')
+
+# Index keys are the first few characters of a pattern's literal prefix
+_INDEX_KEY_CHARS = 3
+
+
+def _has_top_level_alternation(pattern: str) -> bool:
+    depth = 0
+    in_class = False
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == '\\':
+            escaped = True
+        elif in_class:
+            in_class = char != ']'
+        elif char == '[':
+            in_class = True
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == '|' and depth == 0:
+            return True
+    return False
+
+
+def literal_prefixes(pattern: str) -> list[str] | None:
+    r"""
+    Literal words that every match of a keyword pattern starts with.
+
+    r'\bnude' -> ['nude'], r'\bexecut(e|ion)' -> ['execut'],
+    r'\b(food|data)\s+porn' -> ['food', 'data']. Returns None for patterns
+    that do not start at a word boundary with a literal, which are searched
+    in full instead.
+    """
+    if not pattern.startswith(r'\b') or _has_top_level_alternation(pattern):
+        return None
+    body = pattern[2:]
+
+    if body.startswith('('):
+        end = body.find(')')
+        alternatives = body[1:end].split('|') if end > 0 else []
+        if not alternatives or body[end + 1 : end + 2] in ('?', '*', '{'):
+            return None
+        if not all(_LITERAL.fullmatch(alternative) for alternative in alternatives):
+            return None
+        return [alternative.lower() for alternative in alternatives]
+
+    match = _LITERAL.match(body)
+    if not match:
+        return None
+    prefix = match.group()
+    if body[len(prefix) : len(prefix) + 1] in ('?', '*', '{'):
+        prefix = prefix[:-1]  # The last literal character is optional
+    return [prefix.lower()] if prefix else None
+
+
+class KeywordMatcher:
+    """Finds the first match of each of a list of patterns in a single scan of the text."""
+
+    def __init__(self, patterns: list[str]):
+        self.patterns = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        self._index: dict[str, list[tuple[str, int]]] = {}
+        self._unindexed: list[int] = []
+
+        for i, pattern in enumerate(patterns):
+            prefixes = literal_prefixes(pattern)
+            if prefixes is None:
+                self._unindexed.append(i)
+                continue
+            for prefix in prefixes:
+                self._index.setdefault(prefix[:_INDEX_KEY_CHARS], []).append((prefix, i))
+
+    def first_matches(self, text: str) -> dict[int, str]:
+        """Map pattern index -> text of its leftmost match, for every pattern that matches."""
+        found: dict[int, str] = {}
+        for i in self._unindexed:
+            match = self.patterns[i].search(text)
+            if match:
+                found[i] = match.group(0)
+
+        # Same length as text: the only lowercase mapping that expands (U+0130) is folded first
+        folded = text.translate(_IGNORECASE_FOLDS).lower()
+        index = self._index
+        for word_match in _WORD.finditer(text):
+            start, end = word_match.span()
+            word = folded[start:end]
+            for key_length in range(min(len(word), _INDEX_KEY_CHARS), 0, -1):
+                for prefix, i in index.get(word[:key_length], ()):
+                    if i in found or not word.startswith(prefix):
+                        continue
+                    # Words are scanned left to right, so the first hit is the leftmost match
+                    match = self.patterns[i].match(text, start)
+                    if match:
+                        found[i] = match.group(0)
+        return found
+
+
+@lru_cache(maxsize=8)
+def _build_matcher(patterns: tuple[str, ...]) -> KeywordMatcher:
+    # Shared across filter instances with the same lists; compiling large lists is not free
+    return KeywordMatcher(list(patterns))
+
 
 class KeywordFilter:
     """
@@ -104,6 +223,16 @@ class KeywordFilter:
     # This helps reduce false positives for legitimate content
     COMBINATION_THRESHOLD = 2  # Number of categories that must match
 
+    # Keyword lists, in the order their matches are reported
+    KEYWORD_LISTS = (
+        'PORN_EXCEPTIONS',
+        'EXPLICIT_SEXUAL',
+        'EXPLICIT_PORN_PATTERNS',
+        'VIOLENT_GRAPHIC',
+        'HATE_SPEECH',
+        'CHILD_SAFETY',
+    )
+
     def __init__(self, strict_mode: bool = False):
         """
         Initialize the keyword filter.
@@ -112,14 +241,63 @@ class KeywordFilter:
             strict_mode: If True, flags content more aggressively (lower threshold)
         """
         self.strict_mode = strict_mode
+        self._reload_lock = threading.Lock()
+        self.reload()
+
+    def reload(self, keyword_lists: dict[str, list[str]] | None = None) -> None:
+        """
+        Rebuild the matcher after keyword lists change (hot reload).
+
+        Args:
+            keyword_lists: Replacement lists keyed by list name (e.g. {'HATE_SPEECH': [...]}).
+                Lists not given keep their current value. Checks running concurrently keep
+                using the previous matcher until the new one is swapped in.
+        """
+        with self._reload_lock:
+            for name, patterns in (keyword_lists or {}).items():
+                if name not in self.KEYWORD_LISTS:
+                    raise ValueError(f'Unknown keyword list: {name}')
+                setattr(self, name, list(patterns))
+
+            ranges = {}
+            patterns: list[str] = []
+            for name in self.KEYWORD_LISTS:
+                start = len(patterns)
+                patterns.extend(getattr(self, name))
+                ranges[name] = range(start, len(patterns))
+
+            # One assignment, so check() never sees a half-built state
+            self._compiled = (_build_matcher(tuple(patterns)), ranges)
+
+        logger.debug(f'Keyword filter loaded {len(patterns)} patterns')
+
+    def _patterns_for(self, name: str) -> list[re.Pattern]:
+        matcher, ranges = self._compiled
+        return [matcher.patterns[i] for i in ranges[name]]
+
+    @property
+    def sexual_patterns(self) -> list[re.Pattern]:
+        return self._patterns_for('EXPLICIT_SEXUAL')
 
-        # Compile regex patterns for performance
-        self.sexual_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.EXPLICIT_SEXUAL]
-        self.violent_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.VIOLENT_GRAPHIC]
-        self.hate_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.HATE_SPEECH]
-        self.child_safety_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.CHILD_SAFETY]
-        self.porn_exception_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.PORN_EXCEPTIONS]
-        self.explicit_porn_patterns = [re.compile(pattern, re.IGNORECASE) for pattern in self.EXPLICIT_PORN_PATTERNS]
+    @property
+    def violent_patterns(self) -> list[re.Pattern]:
+        return self._patterns_for('VIOLENT_GRAPHIC')
+
+    @property
+    def hate_patterns(self) -> list[re.Pattern]:
+        return self._patterns_for('HATE_SPEECH')
+
+    @property
+    def child_safety_patterns(self) -> list[re.Pattern]:
+        return self._patterns_for('CHILD_SAFETY')
+
+    @property
+    def porn_exception_patterns(self) -> list[re.Pattern]:
+        return self._patterns_for('PORN_EXCEPTIONS')
+
+    @property
+    def explicit_porn_patterns(self) -> list[re.Pattern]:
+        return self._patterns_for('EXPLICIT_PORN_PATTERNS')
 
     def check(self, content: str, context: str = '') -> dict[str, Any]:
         """
@@ -144,64 +322,41 @@ class KeywordFilter:
                 'reason': 'No content to check',
             }
 
+        matcher, ranges = self._compiled
+        found = matcher.first_matches(content)
+
+        def matches_in(name: str) -> list[str]:
+            return [found[i] for i in ranges[name] if i in found]
+
         matched_categories = []
         matched_keywords = []
 
-        # First, check if content contains legitimate "porn" metaphors
-        # If it does, we'll skip porn-specific checks
-        has_porn_exception = False
-        for pattern in self.porn_exception_patterns:
-            if pattern.search(content):
-                has_porn_exception = True
-                break
+        # Legitimate "porn" metaphors (e.g. "food porn") skip the porn-specific checks
+        has_porn_exception = bool(matches_in('PORN_EXCEPTIONS'))
 
         # Check sexual content
-        sexual_matches = []
-        for pattern in self.sexual_patterns:
-            match = pattern.search(content)
-            if match:
-                sexual_matches.append(match.group(0))
-
-        # Check explicit porn patterns (only if no exception found)
+        sexual_matches = matches_in('EXPLICIT_SEXUAL')
         if not has_porn_exception:
-            for pattern in self.explicit_porn_patterns:
-                match = pattern.search(content)
-                if match:
-                    sexual_matches.append(match.group(0))
+            sexual_matches.extend(matches_in('EXPLICIT_PORN_PATTERNS'))
 
         if sexual_matches:
             matched_categories.append('sexual')
             matched_keywords.extend(sexual_matches)
 
         # Check violent content
-        violent_matches = []
-        for pattern in self.violent_patterns:
-            match = pattern.search(content)
-            if match:
-                violent_matches.append(match.group(0))
-
+        violent_matches = matches_in('VIOLENT_GRAPHIC')
         if violent_matches:
             matched_categories.append('violence')
             matched_keywords.extend(violent_matches)
 
         # Check hate speech
-        hate_matches = []
-        for pattern in self.hate_patterns:
-            match = pattern.search(content)
-            if match:
-                hate_matches.append(match.group(0))
-
+        hate_matches = matches_in('HATE_SPEECH')
         if hate_matches:
             matched_categories.append('hate')
             matched_keywords.extend(hate_matches)
 
         # Check child safety (CRITICAL - zero tolerance)
-        child_safety_matches = []
-        for pattern in self.child_safety_patterns:
-            match = pattern.search(content)
-            if match:
-                child_safety_matches.append(match.group(0))
-
+        child_safety_matches = matches_in('CHILD_SAFETY')
         if child_safety_matches:
             matched_categories.append('child_safety')
             matched_keywords.extend(child_safety_matches)
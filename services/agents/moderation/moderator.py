@@ -6,10 +6,12 @@ import logging
 import time
 from typing import Any
 
+from django.conf import settings
 from openai import APIConnectionError, APIError, APITimeoutError, RateLimitError
 from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
 from core.ai_usage.tracker import AIUsageTracker
+from services.agents.moderation.verdict_cache import single_flight, text_cache_key, verdict_cache
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +27,6 @@ class ContentModerator:
     def __init__(self):
         # Always use OpenAI for moderation (Azure OpenAI doesn't support moderations endpoint)
         # Even if DEFAULT_AI_PROVIDER is 'azure', we need OpenAI for this specific API
-        from django.conf import settings
         from openai import OpenAI
 
         self.has_api_key = bool(settings.OPENAI_API_KEY and not settings.OPENAI_API_KEY.startswith('your-'))
@@ -39,16 +40,13 @@ class ContentModerator:
             )
             self.client = None
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        retry=retry_if_exception_type((APIConnectionError, APITimeoutError, RateLimitError)),
-        reraise=True,
-    )
     def moderate(self, content: str, context: str = '', user=None) -> dict[str, Any]:
         """
         Moderate content using OpenAI's Moderation API.
 
+        Verdicts are cached by normalized content hash, and concurrent checks of
+        the same content share one API call.
+
         Args:
             content: The text content to moderate
             context: Optional context about the content source
@@ -69,103 +67,199 @@ class ContentModerator:
         # If no API key configured, approve all content with warning
         if not self.has_api_key or not self.client:
             logger.debug(f'Skipping moderation (no API key) for context: {context}')
-            return {
-                'approved': True,
-                'flagged': False,
-                'reason': 'Moderation skipped - no API key configured',
-                'categories': {},
-                'confidence': 0.0,
-                'skipped': True,
-            }
-
-        try:
-            # Use OpenAI's Moderation API
-            start_time = time.time()
-            response = self.client.moderations.create(input=content)
-            latency_ms = int((time.time() - start_time) * 1000)
-            result = response.results[0]
-
-            # Track usage (moderation API is free but we track for visibility)
-            if user:
-                try:
-                    # Estimate tokens from input (moderation has no output tokens)
-                    estimated_input_tokens = len(content) // 4
-                    AIUsageTracker.track_usage(
-                        user=user,
-                        feature='content_moderation',
-                        provider='openai',
-                        model='text-moderation-latest',
-                        input_tokens=estimated_input_tokens,
-                        output_tokens=0,
-                        latency_ms=latency_ms,
-                        status='success',
-                        request_metadata={'context': context},
-                    )
-                except Exception as tracking_error:
-                    logger.warning(f'Failed to track moderation usage: {tracking_error}')
-
-            # Check if content is flagged
-            is_flagged = result.flagged
-            categories_flagged = {
-                category: score
-                for category, score in result.category_scores.model_dump().items()
-                if getattr(result.categories, category)
-            }
-
-            # Determine approval status
-            approved = not is_flagged
+            return self._skipped_result()
 
-            # Generate human-readable reason
-            reason = self._generate_reason(is_flagged, categories_flagged, context)
+        key = text_cache_key(content)
+        verdict = verdict_cache.get(key)
+        if verdict is not None:
+            return self._build_result(verdict, context, cached=True)
 
-            # Calculate average confidence from flagged categories
-            confidence = sum(categories_flagged.values()) / len(categories_flagged) if categories_flagged else 0.0
-
-            # Log moderation result
-            if is_flagged:
-                logger.warning(
-                    f'Content flagged by moderation: context={context}, '
-                    f'categories={list(categories_flagged.keys())}, confidence={confidence:.2f}'
-                )
-
-            return {
-                'approved': approved,
-                'flagged': is_flagged,
-                'categories': categories_flagged,
-                'reason': reason,
-                'confidence': confidence,
-                'moderation_data': result.model_dump(),
-            }
+        try:
+            verdict = single_flight.do(key, lambda: self._fetch_verdict(key, content, context, user))
+            return self._build_result(verdict, context)
 
         except (APIConnectionError, APITimeoutError, RateLimitError) as e:
-            # These will be retried by the decorator
+            # Already retried by _create_moderations
             logger.warning(f'Retryable moderation error: {type(e).__name__}: {e}')
             raise
 
         except APIError as e:
             # OpenAI API error (non-retryable)
             logger.error(f'OpenAI API error in moderation: {e}', exc_info=True)
-            return {
-                'approved': False,
-                'flagged': True,
-                'reason': 'Content moderation service temporarily unavailable. Please try again.',
-                'categories': {'api_error': 1.0},
-                'confidence': 1.0,
-                'error': str(e),
-            }
+            return self._api_error_result(e)
 
         except Exception as e:
             # Unexpected error
             logger.error(f'Unexpected error in content moderation: {e}', exc_info=True)
             # Fail closed - reject content if moderation fails
-            return {
-                'approved': False,
-                'flagged': True,
-                'reason': 'Unable to moderate content - please try again or contact support',
-                'categories': {'system_error': 1.0},
-                'confidence': 1.0,
-                'error': str(e),
-            }
+            return self._system_error_result(e)
+
+    def moderate_batch(self, contents: list[str], context: str = '', user=None) -> list[dict[str, Any]]:
+        """
+        Moderate many pieces of content for bulk jobs.
+
+        Cached verdicts are reused, duplicates within the batch are checked once,
+        and the rest go to the Moderation API in multi-input requests of
+        MODERATION_BATCH_SIZE items.
+
+        Args:
+            contents: Text contents to moderate
+            context: Optional context about the content source
+            user: Optional user for usage tracking
+
+        Returns:
+            Moderation results in the same order as contents
+        """
+        results: list[dict[str, Any] | None] = [None] * len(contents)
+        keys: dict[int, str] = {}
+        for index, content in enumerate(contents):
+            if not content or not content.strip() or not self.has_api_key or not self.client:
+                # Empty content and missing API keys are answered without an API call
+                results[index] = self.moderate(content, context=context)
+            else:
+                keys[index] = text_cache_key(content)
+
+        verdicts = verdict_cache.get_many(list(set(keys.values())))
+        pending = {key: contents[index] for index, key in keys.items() if key not in verdicts}
+        errors: dict[str, dict[str, Any]] = {}
+
+        pending_items = list(pending.items())
+        for start in range(0, len(pending_items), settings.MODERATION_BATCH_SIZE):
+            chunk = pending_items[start : start + settings.MODERATION_BATCH_SIZE]
+            try:
+                fetched = self._fetch_verdicts(chunk, context, user)
+                verdicts.update(fetched)
+            except APIError as e:
+                # Includes retryable errors that exhausted their retries; fail closed for this chunk only
+                logger.error(f'OpenAI API error in batch moderation: {e}', exc_info=True)
+                errors.update(dict.fromkeys((key for key, _ in chunk), self._api_error_result(e)))
+            except Exception as e:
+                logger.error(f'Unexpected error in batch moderation: {e}', exc_info=True)
+                errors.update(dict.fromkeys((key for key, _ in chunk), self._system_error_result(e)))
+
+        for index, key in keys.items():
+            if key in verdicts:
+                results[index] = self._build_result(verdicts[key], context, cached=key not in pending)
+            else:
+                results[index] = dict(errors[key])
+        return results
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=1, min=1, max=10),
+        retry=retry_if_exception_type((APIConnectionError, APITimeoutError, RateLimitError)),
+        reraise=True,
+    )
+    def _create_moderations(self, inputs: str | list[str]):
+        return self.client.moderations.create(input=inputs)
+
+    def _fetch_verdict(self, key: str, content: str, context: str, user) -> dict[str, Any]:
+        """Call the API for one uncached content and store its verdict."""
+        return self._fetch_verdicts([(key, content)], context, user)[key]
+
+    def _fetch_verdicts(self, items: list[tuple[str, str]], context: str, user) -> dict[str, dict[str, Any]]:
+        """Moderate (cache key, content) pairs in one request and cache the verdicts by key."""
+        start_time = time.time()
+        texts = [content for _, content in items]
+        response = self._create_moderations(texts[0] if len(texts) == 1 else texts)
+        latency_ms = int((time.time() - start_time) * 1000)
+
+        # Track usage (moderation API is free but we track for visibility)
+        if user:
+            try:
+                # Estimate tokens from input (moderation has no output tokens)
+                estimated_input_tokens = sum(len(text) for text in texts) // 4
+                request_metadata = {'context': context}
+                if len(texts) > 1:
+                    request_metadata['batch_size'] = len(texts)
+                AIUsageTracker.track_usage(
+                    user=user,
+                    feature='content_moderation',
+                    provider='openai',
+                    model='text-moderation-latest',
+                    input_tokens=estimated_input_tokens,
+                    output_tokens=0,
+                    latency_ms=latency_ms,
+                    status='success',
+                    request_metadata=request_metadata,
+                )
+            except Exception as tracking_error:
+                logger.warning(f'Failed to track moderation usage: {tracking_error}')
+
+        verdicts = {key: result.model_dump() for (key, _), result in zip(items, response.results, strict=True)}
+        verdict_cache.set_many(verdicts)
+        return verdicts
+
+    def _build_result(self, verdict: dict[str, Any], context: str, cached: bool = False) -> dict[str, Any]:
+        """Turn a raw Moderation API result into the moderation response for this context."""
+        # Check if content is flagged
+        is_flagged = verdict['flagged']
+        categories_flagged = {
+            category: score
+            for category, score in verdict['category_scores'].items()
+            if verdict['categories'].get(category)
+        }
+
+        # Determine approval status
+        approved = not is_flagged
+
+        # Generate human-readable reason
+        reason = self._generate_reason(is_flagged, categories_flagged, context)
+
+        # Calculate average confidence from flagged categories
+        confidence = sum(categories_flagged.values()) / len(categories_flagged) if categories_flagged else 0.0
+
+        # Log moderation result
+        if is_flagged:
+            logger.warning(
+                f'Content flagged by moderation: context={context}, '
+                f'categories={list(categories_flagged.keys())}, confidence={confidence:.2f}'
+            )
+
+        result = {
+            'approved': approved,
+            'flagged': is_flagged,
+            'categories': categories_flagged,
+            'reason': reason,
+            'confidence': confidence,
+            'moderation_data': verdict,
+        }
+        if cached:
+            result['cached'] = True
+        return result
+
+    @staticmethod
+    def _skipped_result() -> dict[str, Any]:
+        return {
+            'approved': True,
+            'flagged': False,
+            'reason': 'Moderation skipped - no API key configured',
+            'categories': {},
+            'confidence': 0.0,
+            'skipped': True,
+        }
+
+    @staticmethod
+    def _api_error_result(error: Exception) -> dict[str, Any]:
+        return {
+            'approved': False,
+            'flagged': True,
+            'reason': 'Content moderation service temporarily unavailable. Please try again.',
+            'categories': {'api_error': 1.0},
+            'confidence': 1.0,
+            'error': str(error),
+        }
+
+    @staticmethod
+    def _system_error_result(error: Exception) -> dict[str, Any]:
+        return {
+            'approved': False,
+            'flagged': True,
+            'reason': 'Unable to moderate content - please try again or contact support',
+            'categories': {'system_error': 1.0},
+            'confidence': 1.0,
+            'error': str(error),
+        }
 
     def _generate_reason(self, is_flagged: bool, categories: dict[str, float], context: str) -> str:
         """Generate a human-readable reason for the moderation result."""
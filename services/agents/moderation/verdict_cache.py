@@ -0,0 +1,189 @@
+"""
+Verdict cache and single-flight deduplication for moderation API calls.
+
+Moderation verdicts depend only on the content and the moderation policy, so
+identical re-submissions (edits without text changes, reposts, retried tasks)
+reuse the stored verdict instead of calling the API again:
+- text is keyed by a hash of its normalized form (NFC, collapsed whitespace)
+- images are keyed by the sha256 of their bytes, the vision model and the
+  prompt context. Flagged verdicts are also stored under a perceptual hash so
+  re-encoded or resized copies of a rejected image stay rejected; a
+  perceptual match never approves an image. Images known only by URL are
+  cached for MODERATION_URL_VERDICT_CACHE_TTL, since the URL's content can change.
+Keys include MODERATION_POLICY_VERSION; bump it when prompts, models or
+thresholds change and old verdicts stop applying.
+
+Only raw API verdicts are stored. Results (reason text, approval) are rebuilt
+per call.
+"""
+
+import base64
+import binascii
+import hashlib
+import io
+import logging
+import re
+import threading
+import unicodedata
+from collections.abc import Callable
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = 'moderation:verdict'
+
+_WHITESPACE_RE = re.compile(r'\s+')
+_DATA_URL_RE = re.compile(r'^data:image/[\w.+-]+;base64,(?P<data>.+)$', re.DOTALL)
+
+
+def normalize_text(text: str) -> str:
+    """Canonical form of text for verdict lookups: NFC, trimmed, whitespace runs collapsed."""
+    return _WHITESPACE_RE.sub(' ', unicodedata.normalize('NFC', text)).strip()
+
+
+def text_cache_key(text: str) -> str:
+    digest = hashlib.sha256(normalize_text(text).encode('utf-8', 'surrogatepass')).hexdigest()
+    return f'{CACHE_KEY_PREFIX}:{settings.MODERATION_POLICY_VERSION}:text:{digest}'
+
+
+def image_bytes_from(image_url: str, image_bytes: bytes | None = None) -> bytes | None:
+    """The image content if it is in memory: the given bytes, or the payload of a base64 data URL."""
+    if image_bytes is None and (match := _DATA_URL_RE.match(image_url)):
+        try:
+            image_bytes = base64.b64decode(match.group('data'), validate=False)
+        except (binascii.Error, ValueError):
+            image_bytes = None
+    return image_bytes or None
+
+
+def image_cache_key(image_url: str, model: str, context: str = '', image_bytes: bytes | None = None) -> str:
+    """
+    Exact verdict key for an image checked by `model` with prompt `context`.
+
+    Keyed by the sha256 of the image bytes when known, otherwise by the URL
+    (see image_verdict_ttl). The image is never fetched here.
+    """
+    if image_bytes:
+        identity = 'sha256:' + hashlib.sha256(image_bytes).hexdigest()
+    else:
+        identity = 'url:' + hashlib.sha256(image_url.strip().encode('utf-8')).hexdigest()
+    return f'{_image_key_prefix(model, context)}:{identity}'
+
+
+def image_flag_key(model: str, context: str, image_bytes: bytes | None) -> str | None:
+    """Perceptual key under which flagged verdicts are shared with near-duplicate images, if one can be computed."""
+    phash = perceptual_hash(image_bytes) if image_bytes else None
+    return f'{_image_key_prefix(model, context)}:phash:{phash}' if phash else None
+
+
+def image_verdict_ttl(image_bytes: bytes | None) -> int:
+    """URL-only verdicts expire sooner: the content behind a URL can be swapped after it was checked."""
+    return settings.MODERATION_VERDICT_CACHE_TTL if image_bytes else settings.MODERATION_URL_VERDICT_CACHE_TTL
+
+
+def _image_key_prefix(model: str, context: str) -> str:
+    context_digest = hashlib.sha256(normalize_text(context).encode('utf-8', 'surrogatepass')).hexdigest()[:16]
+    return f'{CACHE_KEY_PREFIX}:{settings.MODERATION_POLICY_VERSION}:image:{model}:{context_digest}'
+
+
+def perceptual_hash(image_bytes: bytes) -> str | None:
+    """
+    64-bit difference hash (dHash) of an image, as 16 hex digits.
+
+    The image is shrunk to 9x8 grayscale and each bit records whether a pixel
+    is brighter than its right neighbour. Returns None if Pillow can't decode it.
+    """
+    try:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(image_bytes)) as image:
+            pixels = list(image.convert('L').resize((9, 8), Image.Resampling.LANCZOS).getdata())
+    except Exception as e:
+        logger.debug(f'Could not compute perceptual hash: {e}')
+        return None
+
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return f'{bits:016x}'
+
+
+class VerdictCache:
+    """Stores raw moderation verdicts in the Django cache."""
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        try:
+            return cache.get(key)
+        except Exception as e:
+            logger.warning(f'Moderation verdict cache read failed: {e}')
+            return None
+
+    def get_many(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        try:
+            return cache.get_many(keys)
+        except Exception as e:
+            logger.warning(f'Moderation verdict cache read failed: {e}')
+            return {}
+
+    def set(self, key: str, verdict: dict[str, Any], timeout: int | None = None) -> None:
+        self.set_many({key: verdict}, timeout=timeout)
+
+    def set_many(self, verdicts: dict[str, dict[str, Any]], timeout: int | None = None) -> None:
+        try:
+            cache.set_many(verdicts, timeout=timeout or settings.MODERATION_VERDICT_CACHE_TTL)
+        except Exception as e:
+            logger.warning(f'Moderation verdict cache write failed: {e}')
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Collapses concurrent calls with the same key into one.
+
+    The first caller for a key runs the function; callers arriving while it is
+    in flight wait and receive its result (or its exception). Deduplication is
+    per process; the verdict cache covers repeats across processes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Any:
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+# Shared by every moderator instance in the process
+verdict_cache = VerdictCache()
+single_flight = SingleFlight()
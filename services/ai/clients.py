@@ -0,0 +1,84 @@
+"""
+Per-process registry of LLM SDK clients.
+
+Each OpenAI/AzureOpenAI/Anthropic client owns an httpx connection pool, so
+building one per AIProvider instance threw away keep-alive connections and
+TLS sessions on every service call. The registry builds one client per
+(client class, provider, credentials, base URL) and shares it between all
+AIProvider instances in the process. The SDK clients are thread-safe.
+
+After a fork (Celery prefork) the child drops the inherited clients without
+closing them - their sockets belong to the parent - and builds its own.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+# Pool tuning shared by every LLM client
+MAX_CONNECTIONS = int(os.environ.get('AI_HTTP_MAX_CONNECTIONS', '50'))
+MAX_KEEPALIVE_CONNECTIONS = int(os.environ.get('AI_HTTP_MAX_KEEPALIVE_CONNECTIONS', '20'))
+KEEPALIVE_EXPIRY = 60.0  # seconds an idle connection is kept open
+
+
+def pool_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+class ClientRegistry:
+    """Thread-safe, fork-safe cache of SDK clients."""
+
+    def __init__(self):
+        self._clients: dict[tuple, Any] = {}
+        self._lock = threading.Lock()
+        os.register_at_fork(after_in_child=self._forget_clients)
+
+    def get(self, key: tuple, factory: Callable[[], Any]) -> Any:
+        """Return the client for key, building it with factory on first use.
+
+        The key starts with the client class, so patching the SDK class (tests)
+        yields a fresh entry rather than a previously built real client.
+        """
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = factory()
+                self._clients[key] = client
+                logger.debug(f'Created pooled AI client: {getattr(key[0], "__name__", key[0])}')
+            return client
+
+    def clear(self):
+        """Close and drop every client (tests, worker shutdown)."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            close = getattr(client, 'close', None)
+            if callable(close):
+                try:
+                    close()
+                except Exception as e:
+                    logger.warning(f'Failed to close AI client: {e}')
+
+    def __len__(self):
+        return len(self._clients)
+
+    def _forget_clients(self):
+        self._clients = {}
+        self._lock = threading.Lock()
+
+
+# Singleton instance (one per process)
+client_registry = ClientRegistry()
@@ -11,6 +11,8 @@ from enum import Enum
 from django.conf import settings
 
 from core.logging_utils import StructuredLogger
+from services.ai.clients import client_registry, pool_limits
+from services.ai.tokenizer import count_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -79,24 +81,19 @@ class TokenLimitExceededError(Exception):
 
 def estimate_token_count(text: str) -> int:
     """
-    Estimate token count for a text string.
+    Count tokens for a text string.
 
-    Uses a simple heuristic: ~4 characters per token for English text.
-    This is conservative (tends to overestimate) which is safer for limits.
-
-    For more accurate counting, use tiktoken, but this is fast and sufficient
-    for limit checking.
+    Uses the shared tokenizer (local o200k_base BPE table, cached by content
+    hash for long strings), falling back to a script-aware estimate when the
+    table isn't available. See services.ai.tokenizer.
 
     Args:
-        text: The text to estimate tokens for
+        text: The text to count tokens for
 
     Returns:
-        Estimated token count
+        Token count
     """
-    if not text:
-        return 0
-    # Conservative estimate: ~3.5 chars per token (rounds up)
-    return max(1, len(text) // 3)
+    return count_tokens(text)
 
 
 def get_token_limits() -> tuple[int, int, int]:
@@ -129,7 +126,7 @@ def check_token_limits(prompt: str, system_message: str = None, user_id: int = N
     """
     soft_limit, hard_limit, _ = get_token_limits()
 
-    # Estimate total input tokens
+    # Count total input tokens
     estimated_tokens = estimate_token_count(prompt)
     if system_message:
         estimated_tokens += estimate_token_count(system_message)
@@ -380,7 +377,7 @@ class AIProvider:
         Supports using an AI gateway (OpenRouter, etc.) by setting OPENAI_BASE_URL.
         """
         try:
-            from openai import OpenAI
+            from openai import DefaultHttpxClient, OpenAI
         except ImportError as e:
             raise ImportError('OpenAI library not installed. Install with: pip install openai') from e
 
@@ -390,18 +387,20 @@ class AIProvider:
         if not api_key:
             raise ValueError('OpenAI API key not configured. Set OPENAI_API_KEY in settings.')
 
-        # If base_url is set, use it for AI gateway; otherwise use default OpenAI API
-        client_kwargs = {'api_key': api_key}
-        if base_url:
-            client_kwargs['base_url'] = base_url
-            logger.info(f'Using AI gateway at: {base_url}')
+        def build():
+            # If base_url is set, use it for AI gateway; otherwise use default OpenAI API
+            client_kwargs = {'api_key': api_key, 'http_client': DefaultHttpxClient(http2=True, limits=pool_limits())}
+            if base_url:
+                client_kwargs['base_url'] = base_url
+                logger.info(f'Using AI gateway at: {base_url}')
+            return OpenAI(**client_kwargs)
 
-        return OpenAI(**client_kwargs)
+        return client_registry.get((OpenAI, 'openai', api_key, base_url), build)
 
     def _initialize_azure_client(self):
         """Initialize Azure OpenAI client."""
         try:
-            from openai import AzureOpenAI
+            from openai import AzureOpenAI, DefaultHttpxClient
         except ImportError as e:
             raise ImportError('OpenAI library not installed. Install with: pip install openai') from e
 
@@ -414,17 +413,21 @@ class AIProvider:
         if not endpoint:
             raise ValueError('Azure OpenAI endpoint not configured. Set AZURE_OPENAI_ENDPOINT in settings.')
 
-        logger.info(f'Using Azure OpenAI at: {endpoint}')
-        return AzureOpenAI(
-            api_key=api_key,
-            azure_endpoint=endpoint,
-            api_version=api_version,
-        )
+        def build():
+            logger.info(f'Using Azure OpenAI at: {endpoint}')
+            return AzureOpenAI(
+                api_key=api_key,
+                azure_endpoint=endpoint,
+                api_version=api_version,
+                http_client=DefaultHttpxClient(http2=True, limits=pool_limits()),
+            )
+
+        return client_registry.get((AzureOpenAI, 'azure', api_key, endpoint, api_version), build)
 
     def _initialize_anthropic_client(self):
         """Initialize Anthropic client."""
         try:
-            from anthropic import Anthropic
+            from anthropic import Anthropic, DefaultHttpxClient
         except ImportError as e:
             raise ImportError('Anthropic library not installed. Install with: pip install anthropic') from e
 
@@ -433,7 +436,10 @@ class AIProvider:
         if not api_key:
             raise ValueError('Anthropic API key not configured. Set ANTHROPIC_API_KEY in settings.')
 
-        return Anthropic(api_key=api_key)
+        return client_registry.get(
+            (Anthropic, 'anthropic', api_key),
+            lambda: Anthropic(api_key=api_key, http_client=DefaultHttpxClient(http2=True, limits=pool_limits())),
+        )
 
     def _initialize_gemini_client(self):
         """Initialize Google Gemini client."""
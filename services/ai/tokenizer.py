@@ -0,0 +1,167 @@
+"""
+Token counting and truncation with local BPE tables.
+
+Uses tiktoken's o200k_base encoding (GPT-4o/GPT-5 family; a close proxy for
+the other providers, whose tokenizers are not public). The BPE table is
+loaded lazily from TIKTOKEN_CACHE_DIR, which the Docker images fill at build
+time, and is never downloaded at runtime. If the table or tiktoken is
+missing, counts fall back to a script-aware heuristic: ~4 ASCII characters
+per token, and one token per non-ASCII character, which covers CJK text.
+
+Counts of long strings are cached by content hash, because the same
+system prompts are counted on every request. Short strings skip the cache,
+since hashing them costs about as much as encoding them.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+
+logger = logging.getLogger(__name__)
+
+ENCODING_NAME = 'o200k_base'
+ENCODING_URL = f'https://openaipublic.blob.core.windows.net/encodings/{ENCODING_NAME}.tiktoken'
+
+# Strings shorter than this are encoded directly (no hashing, no cache)
+CACHE_MIN_CHARS = 256
+CACHE_SIZE = 1024
+
+
+class Tokenizer:
+    """Counts and truncates text in model tokens."""
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self.cache_size = cache_size
+        self._counts: OrderedDict[bytes, int] = OrderedDict()
+        self._lock = threading.Lock()
+        self._encoding = None
+        self._loaded = False
+
+    @property
+    def encoding(self):
+        """The tiktoken Encoding, or None when the local BPE table is unavailable."""
+        if not self._loaded:
+            with self._lock:
+                if not self._loaded:
+                    self._encoding = self._load_encoding()
+                    self._loaded = True
+        return self._encoding
+
+    @property
+    def is_exact(self) -> bool:
+        return self.encoding is not None
+
+    def count_tokens(self, text: str | None) -> int:
+        """Number of tokens in text (0 for empty)."""
+        if not text:
+            return 0
+        if len(text) < CACHE_MIN_CHARS:
+            return self._count(text)
+
+        key = hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        with self._lock:
+            count = self._counts.get(key)
+            if count is not None:
+                self._counts.move_to_end(key)
+                return count
+
+        count = self._count(text)
+        with self._lock:
+            self._counts[key] = count
+            while len(self._counts) > self.cache_size:
+                self._counts.popitem(last=False)
+        return count
+
+    def truncate_to_tokens(self, text: str | None, max_tokens: int, keep: str = 'start') -> str:
+        """
+        Cut text to at most max_tokens tokens.
+
+        Args:
+            text: Text to truncate
+            max_tokens: Token budget
+            keep: 'start' keeps the beginning, 'end' keeps the most recent text (history trimming)
+
+        Returns:
+            The text itself if it fits, otherwise the kept slice
+        """
+        if not text or max_tokens <= 0:
+            return ''
+
+        encoding = self.encoding
+        if encoding is None:
+            return self._truncate_heuristic(text, max_tokens, keep)
+
+        tokens = encoding.encode_ordinary(text)
+        if len(tokens) <= max_tokens:
+            return text
+        kept = tokens[-max_tokens:] if keep == 'end' else tokens[:max_tokens]
+        # A cut can land inside a multi-byte character; drop the partial bytes
+        return encoding.decode_bytes(kept).decode('utf-8', errors='ignore')
+
+    def _count(self, text: str) -> int:
+        encoding = self.encoding
+        if encoding is None:
+            return heuristic_token_count(text)
+        return len(encoding.encode_ordinary(text))
+
+    @staticmethod
+    def _truncate_heuristic(text: str, max_tokens: int, keep: str) -> str:
+        if heuristic_token_count(text) <= max_tokens:
+            return text
+        if text.isascii():
+            return text[-max_tokens * 4 :] if keep == 'end' else text[: max_tokens * 4]
+        # Walk characters until the budget is spent, using the same weights as the count
+        budget = max_tokens * 4
+        chars = reversed(text) if keep == 'end' else text
+        taken = 0
+        for char in chars:
+            budget -= 1 if char.isascii() else 4
+            if budget < 0:
+                break
+            taken += 1
+        return text[len(text) - taken :] if keep == 'end' else text[:taken]
+
+    @staticmethod
+    def _load_encoding():
+        try:
+            import tiktoken
+        except ImportError:
+            logger.warning('tiktoken not installed; token counts use the heuristic estimate')
+            return None
+
+        # tiktoken stores downloads under the SHA-1 of the source URL; only use a table already on disk
+        cache_dir = os.environ.get('TIKTOKEN_CACHE_DIR') or os.environ.get('DATA_GYM_CACHE_DIR')
+        cached_file = cache_dir and os.path.join(cache_dir, hashlib.sha1(ENCODING_URL.encode()).hexdigest())  # noqa: S324
+        if not cached_file or not os.path.exists(cached_file):
+            logger.warning(f'{ENCODING_NAME} BPE table not found in TIKTOKEN_CACHE_DIR; token counts use the heuristic')
+            return None
+
+        try:
+            return tiktoken.get_encoding(ENCODING_NAME)
+        except Exception as e:
+            logger.warning(f'Failed to load {ENCODING_NAME}: {e}')
+            return None
+
+
+def heuristic_token_count(text: str) -> int:
+    """Rough token count without BPE tables: ~4 ASCII chars per token, 1 per non-ASCII char."""
+    if not text:
+        return 0
+    ascii_chars = sum(1 for char in text if char.isascii()) if not text.isascii() else len(text)
+    return max(1, -(-ascii_chars // 4) + (len(text) - ascii_chars))
+
+
+# Singleton instance (one per process)
+tokenizer = Tokenizer()
+
+
+def count_tokens(text: str | None) -> int:
+    """Number of model tokens in text."""
+    return tokenizer.count_tokens(text)
+
+
+def truncate_to_tokens(text: str | None, max_tokens: int, keep: str = 'start') -> str:
+    """Cut text to at most max_tokens model tokens (see Tokenizer.truncate_to_tokens)."""
+    return tokenizer.truncate_to_tokens(text, max_tokens, keep)
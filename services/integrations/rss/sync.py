@@ -3,17 +3,25 @@
 import html as html_module
 import logging
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from urllib.parse import urlparse
 
 import defusedxml.ElementTree as ET
 import requests
 from django.conf import settings as django_settings
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
 from django.db import transaction
+from django.db.models import Exists, OuterRef
 from django.utils import timezone
 
 from core.integrations.rss_models import RSSFeedAgent, RSSFeedItem
+from core.integrations.utils import normalize_slug
 from core.projects.models import Project
-from core.projects.topic_utils import get_project_topic_names, project_has_topics, set_project_topics
+from core.projects.topic_utils import get_project_topic_names, set_project_topics
 from core.taxonomy.models import Taxonomy
 from services.ai import AIProvider
 from services.ai.topic_extraction import TopicExtractionService
@@ -21,6 +29,9 @@ from services.integrations.storage.storage_service import get_storage_service
 
 logger = logging.getLogger(__name__)
 
+# rss_metadata keys set by enrich_feed_item; preserved when a re-sync rewrites the metadata
+ENRICHMENT_MARKERS = ('enriched_at', 'expert_review_at')
+
 # Category mapping from common variations to canonical taxonomy names
 CATEGORY_MAPPING = {
     'web development': 'Web Development',
@@ -435,41 +446,91 @@ def format_article_date(dt: datetime | None) -> str:
     return dt.strftime('%B %d, %Y')
 
 
+@dataclass
+class FeedFetchResult:
+    """Outcome of a (conditional) feed download."""
+
+    not_modified: bool = False
+    text: str = ''
+    etag: str = ''
+    last_modified: str = ''
+    error: Exception | None = None
+
+
 class RSSFeedSyncService:
     """Service for syncing RSS feed agents."""
 
     USER_AGENT = 'Mozilla/5.0 (compatible; AllThrive/1.0; +https://allthrive.ai)'
     REQUEST_TIMEOUT = 30  # seconds
+    MAX_CONCURRENT_FETCHES = 8
+    MAX_FETCHES_PER_HOST = 2  # Be polite to hosts that serve several of our feeds
+    # Feed-supplied values checked before bulk_create
+    FEED_PROJECT_FIELDS = ('slug', 'title', 'external_url', 'featured_image_url')
+    FEED_ITEM_FIELDS = ('feed_item_id', 'author', 'permalink', 'thumbnail_url')
+
+    @classmethod
+    def fetch_feed(cls, agent: RSSFeedAgent, session: requests.Session | None = None) -> FeedFetchResult:
+        """Download an agent's feed, sending the stored ETag/Last-Modified validators.
+
+        Safe to call from worker threads (no database access).
+        """
+        headers = {'User-Agent': cls.USER_AGENT}
+        if agent.feed_etag:
+            headers['If-None-Match'] = agent.feed_etag
+        if agent.feed_last_modified:
+            headers['If-Modified-Since'] = agent.feed_last_modified
+
+        try:
+            logger.info(f'Fetching RSS feed: {agent.feed_url}')
+            response = (session or requests).get(agent.feed_url, headers=headers, timeout=cls.REQUEST_TIMEOUT)
+            if response.status_code == 304:
+                return FeedFetchResult(not_modified=True, etag=agent.feed_etag, last_modified=agent.feed_last_modified)
+            response.raise_for_status()
+            return FeedFetchResult(
+                text=response.text,
+                etag=response.headers.get('ETag', ''),
+                last_modified=response.headers.get('Last-Modified', ''),
+            )
+        except Exception as e:
+            return FeedFetchResult(error=e)
 
     @classmethod
-    def sync_agent(cls, agent: RSSFeedAgent) -> dict:
+    def sync_agent(cls, agent: RSSFeedAgent, fetched: FeedFetchResult | None = None) -> dict:
         """Sync a single RSS feed agent.
 
         Args:
             agent: RSSFeedAgent instance to sync
+            fetched: Already-downloaded feed (from sync_all_active_agents); fetched here if omitted
 
         Returns:
-            Dictionary with sync results: created, updated, errors, error_messages
+            Dictionary with sync results: created, updated, errors, error_messages, not_modified
         """
         results = {
             'created': 0,
             'updated': 0,
             'errors': 0,
             'error_messages': [],
+            'not_modified': False,
         }
 
         try:
-            # Fetch RSS feed
-            logger.info(f'Fetching RSS feed: {agent.feed_url}')
-            response = requests.get(
-                agent.feed_url,
-                headers={'User-Agent': cls.USER_AGENT},
-                timeout=cls.REQUEST_TIMEOUT,
-            )
-            response.raise_for_status()
+            if fetched is None:
+                fetched = cls.fetch_feed(agent)
+            if fetched.error:
+                raise fetched.error
+
+            if fetched.not_modified:
+                # Conditional request hit: nothing to download, parse or write
+                logger.info(f'RSS feed not modified: {agent.source_name}')
+                results['not_modified'] = True
+                agent.last_synced_at = timezone.now()
+                agent.last_sync_status = 'Not modified'
+                agent.last_sync_error = ''
+                agent.save(update_fields=['last_synced_at', 'last_sync_status', 'last_sync_error', 'updated_at'])
+                return results
 
             # Parse feed
-            feed_items = RSSFeedParser.parse_feed(response.text)
+            feed_items = RSSFeedParser.parse_feed(fetched.text)
             logger.info(f'Parsed {len(feed_items)} items from {agent.source_name}')
 
             # Get max items from settings
@@ -486,23 +547,26 @@ class RSSFeedSyncService:
                 skipped = original_count - len(feed_items)
                 logger.info(f'Skipped {skipped} items published before {min_year}')
 
-            # Process each item
-            for item_data in feed_items:
-                try:
-                    created = cls._create_or_update_item(agent, item_data)
-                    if created:
-                        results['created'] += 1
-                    else:
-                        results['updated'] += 1
-                except Exception as e:
-                    logger.error(f'Error processing feed item: {e}', exc_info=True)
-                    results['errors'] += 1
-                    results['error_messages'].append(str(e))
+            # Diff against known items and write new/changed ones in bulk
+            agent.last_synced_at = timezone.now()
+            try:
+                cls._sync_items(agent, feed_items, results)
+            except Exception as e:
+                logger.error(f'Error processing feed items: {e}', exc_info=True)
+                results['errors'] += 1
+                results['error_messages'].append(str(e))
+                # Keep the old validators so the next run downloads and processes the feed in full
+                agent.last_sync_status = 'Failed: error processing feed items'
+                agent.last_sync_error = str(e)
+                agent.save(update_fields=['last_synced_at', 'last_sync_status', 'last_sync_error', 'updated_at'])
+                return results
 
             # Update agent sync status
-            agent.last_synced_at = timezone.now()
             agent.last_sync_status = f'Success: {results["created"]} created, {results["updated"]} updated'
             agent.last_sync_error = ''
+            # Store validators only after the items were processed, so a failed run is retried in full
+            agent.feed_etag = fetched.etag
+            agent.feed_last_modified = fetched.last_modified
             agent.save()
 
         except Exception as e:
@@ -516,90 +580,98 @@ class RSSFeedSyncService:
         return results
 
     @classmethod
-    def _create_or_update_item(cls, agent: RSSFeedAgent, item_data: dict) -> bool:
-        """Create or update a feed item project.
+    def _sync_items(cls, agent: RSSFeedAgent, feed_items: list[dict], results: dict):
+        """Create new feed items and refresh known ones with set-based queries.
 
-        Returns:
-            True if created, False if updated
+        Known GUIDs are loaded in one query and diffed in memory. New items are
+        bulk-created in a minimal state (feed description, no AI fields) and
+        their AI enrichment is queued on the rss_enrichment queue, so no AI
+        call happens on the sync path.
         """
-        feed_item_id = item_data['feed_item_id']
-
-        # Check if item already exists
-        try:
-            feed_item = RSSFeedItem.objects.get(feed_item_id=feed_item_id)
-            # Item exists, update it
-            cls._update_feed_item(feed_item, item_data)
-            return False
-        except RSSFeedItem.DoesNotExist:
-            # Create new item
-            cls._create_feed_item(agent, item_data)
-            return True
-
-    @classmethod
-    def _create_feed_item(cls, agent: RSSFeedAgent, item_data: dict):
-        """Create a new RSS feed item and project with expert review."""
+        items_by_id = {}
+        for item_data in feed_items:
+            items_by_id.setdefault(item_data['feed_item_id'], item_data)
+
+        existing = {
+            feed_item.feed_item_id: feed_item
+            for feed_item in RSSFeedItem.objects.filter(feed_item_id__in=items_by_id)
+            .select_related('project', 'agent')
+            .annotate(
+                has_topics=Exists(Project.topics.through.objects.filter(project_id=OuterRef('project_id'))),
+                has_tools=Exists(Project.tools.through.objects.filter(project_id=OuterRef('project_id'))),
+            )
+        }
+        new_items = [item_data for feed_item_id, item_data in items_by_id.items() if feed_item_id not in existing]
+        known_items = [
+            (existing[feed_item_id], item_data)
+            for feed_item_id, item_data in items_by_id.items()
+            if feed_item_id in existing
+        ]
+
+        to_enrich = []  # (RSSFeedItem pk, generate_review)
         with transaction.atomic():
-            # Generate expert review using agent's persona
-            expert_review = cls._generate_expert_review(agent, item_data)
-
-            # Build content structure with expert review
-            content = cls._build_rss_article_content(item_data, agent, expert_review)
-
-            # Extract topics from article content
-            topics = cls._extract_topics_from_article(item_data)
+            if new_items:
+                created = cls._create_feed_items(agent, new_items, results)
+                results['created'] += len(created)
+                to_enrich += [(feed_item.pk, True) for feed_item in created]
+            if known_items:
+                to_enrich += [(feed_item.pk, False) for feed_item in cls._update_feed_items(known_items)]
+                results['updated'] += len(known_items)
 
-            # Detect difficulty level
-            difficulty = cls._detect_difficulty_level(item_data)
+            if to_enrich:
+                transaction.on_commit(lambda: cls._queue_enrichment(to_enrich))
 
-            # Determine featured image - use RSS thumbnail or generate with Gemini
-            featured_image_url = item_data.get('thumbnail_url') or ''
-            if not featured_image_url and django_settings.RSS_GENERATE_HERO_IMAGES:
-                # Generate a beautiful hero image using Gemini with curator's visual style
-                generated_url = cls._generate_hero_image(item_data, topics, agent.visual_style)
-                if generated_url:
-                    featured_image_url = generated_url
-                    logger.info(
-                        f'Using AI-generated hero for "{item_data["title"][:40]}..." ' f'(style: {agent.visual_style})'
-                    )
+    @classmethod
+    def _create_feed_items(cls, agent: RSSFeedAgent, items_data: list[dict], results: dict) -> list[RSSFeedItem]:
+        """Bulk-create projects and feed items for new articles, without AI enrichment.
 
-            # Use expert review as project description, fallback to original
-            project_description = expert_review or (item_data['description'][:500] if item_data['description'] else '')
+        Project.save() and its post_save receivers are bypassed, so slugs are
+        made unique in memory and the receivers' side effects that matter here
+        (learning metadata, profile cache) are applied once for the batch.
+        Weaviate sync and auto-tagging run when enrichment saves the project.
+        """
+        from core.learning_paths.models import ProjectLearningMetadata
 
-            # Create project
-            project = Project.objects.create(
-                user=agent.agent_user,
+        user = agent.agent_user
+        slug_max_length = Project._meta.get_field('slug').max_length
+        taken_slugs = set()
+        taken_urls = set()
+        for slug, external_url in Project.objects.filter(user=user).values_list('slug', 'external_url'):
+            taken_slugs.add(slug)
+            taken_urls.add(external_url)
+
+        projects = []
+        feed_items = []
+        published = []
+        for item_data in items_data:
+            if item_data['permalink'] and item_data['permalink'] in taken_urls:
+                # Same article under a different GUID; the project would violate unique (user, external_url)
+                logger.warning(f'Skipping RSS item {item_data["feed_item_id"]}: {item_data["permalink"]} exists')
+                results['errors'] += 1
+                results['error_messages'].append(f'Duplicate permalink: {item_data["permalink"]}')
+                continue
+
+            base_slug = normalize_slug(item_data['title'] or 'project')[:slug_max_length].rstrip('-') or 'project'
+            slug = base_slug
+            counter = 2
+            while slug in taken_slugs:
+                suffix = f'-{counter}'
+                slug = f'{base_slug[: slug_max_length - len(suffix)]}{suffix}'
+                counter += 1
+
+            project = Project(
+                user=user,
+                slug=slug,
                 title=item_data['title'],
-                description=project_description,
+                description=item_data['description'][:500] if item_data['description'] else '',
                 type=Project.ProjectType.RSS_ARTICLE,
                 external_url=item_data['permalink'],
-                featured_image_url=featured_image_url,
-                content=content,
-                topics=topics,
-                difficulty_level=difficulty,
+                featured_image_url=item_data.get('thumbnail_url') or '',
+                content=cls._build_rss_article_content(item_data, agent),
                 is_showcased=True,
                 is_private=False,
             )
-            project.ensure_unique_slug()
-            project.save()
-
-            # Set created_at to the RSS published date so articles appear in correct order
-            if item_data.get('published_at'):
-                Project.objects.filter(pk=project.pk).update(created_at=item_data['published_at'])
-
-            # Add categories from RSS feed categories (with AI fallback)
-            cls._add_categories_to_project(project, item_data.get('categories', []), item_data)
-
-            # Extract and add tools mentioned in article
-            cls._add_tools_to_project(project, item_data)
-
-            # Prepare metadata with serializable datetime
-            metadata = dict(item_data)
-            if metadata.get('published_at'):
-                metadata['published_at'] = metadata['published_at'].isoformat()
-
-            # Create feed item metadata
-            feed_item = RSSFeedItem.objects.create(
-                project=project,
+            feed_item = RSSFeedItem(
                 agent=agent,
                 feed_item_id=item_data['feed_item_id'],
                 source_name=agent.source_name,
@@ -608,97 +680,223 @@ class RSSFeedSyncService:
                 thumbnail_url=item_data['thumbnail_url'],
                 categories=item_data['categories'],
                 published_at=item_data['published_at'] or timezone.now(),
-                rss_metadata=metadata,
+                rss_metadata=cls._serialize_metadata(item_data),
             )
 
-            logger.info(f'Created RSS feed item: {project.title} ({feed_item.feed_item_id})')
+            # One over-long or malformed value would make the database reject the whole batch
+            error = cls._field_errors(project, cls.FEED_PROJECT_FIELDS) or cls._field_errors(
+                feed_item, cls.FEED_ITEM_FIELDS
+            )
+            if error:
+                logger.warning(f'Skipping invalid RSS item {item_data["feed_item_id"][:100]}: {error}')
+                results['errors'] += 1
+                results['error_messages'].append(f'Invalid item {item_data["feed_item_id"][:100]}: {error}')
+                continue
+
+            taken_urls.add(item_data['permalink'])
+            taken_slugs.add(slug)
+            projects.append(project)
+            feed_items.append(feed_item)
+            published.append(item_data.get('published_at'))
+
+        if not projects:
+            return []
 
-            # Queue async AI taxonomy tagging for richer classification
-            try:
-                from services.tagging.tasks import tag_content_task
+        Project.objects.bulk_create(projects)
 
-                tag_content_task.delay(
-                    content_type='project',
-                    content_id=project.id,
-                    tier='bulk',  # Use cheap model for imported content
-                    force=False,
-                )
-                logger.debug(f'Queued AI tagging for RSS project {project.id}')
+        # Set created_at to the RSS published date so articles appear in correct order
+        dated = []
+        for project, published_at in zip(projects, published, strict=True):
+            if published_at:
+                project.created_at = published_at
+                dated.append(project)
+        if dated:
+            Project.objects.bulk_update(dated, ['created_at'])
+
+        ProjectLearningMetadata.objects.bulk_create(
+            [ProjectLearningMetadata(project=project, is_learning_eligible=True) for project in projects],
+            ignore_conflicts=True,
+        )
+
+        for project, feed_item in zip(projects, feed_items, strict=True):
+            feed_item.project = project
+        feed_items = RSSFeedItem.objects.bulk_create(feed_items)
+
+        username = user.username.lower()
+        cache.delete_many([f'projects:{username}:public', f'projects:{username}:own'])
+
+        logger.info(f'Created {len(feed_items)} RSS feed items for {agent.source_name}')
+        return feed_items
+
+    @classmethod
+    def _update_feed_items(cls, pairs: list[tuple[RSSFeedItem, dict]]) -> list[RSSFeedItem]:
+        """Refresh existing feed items from the feed.
+
+        Only projects whose title, description, image or content actually
+        changed are saved; feed item metadata is written in one bulk update.
+
+        Returns:
+            Feed items that were never enriched and are still missing AI fields
+        """
+        needs_enrichment = []
+        now = timezone.now()
+
+        for feed_item, item_data in pairs:
+            project = feed_item.project
+            update_fields = []
+
+            if project.title != item_data['title']:
+                project.title = item_data['title']
+                update_fields.append('title')
+
+            if item_data['description'] and project.description != item_data['description'][:500]:
+                project.description = item_data['description'][:500]
+                update_fields.append('description')
+
+            if item_data['thumbnail_url'] and project.featured_image_url != item_data['thumbnail_url']:
+                project.featured_image_url = item_data['thumbnail_url']
+                update_fields.append('featured_image_url')
+
+            # Update content structure if empty
+            if not project.content or not project.content.get('sections'):
+                project.content = cls._build_rss_article_content(item_data, feed_item.agent)
+                update_fields.append('content')
+
+            if update_fields:
+                project.save(update_fields=[*update_fields, 'updated_at'])
+
+            metadata = feed_item.rss_metadata or {}
+            enriched_at = metadata.get('enriched_at')
+            missing_image = not project.featured_image_url and django_settings.RSS_GENERATE_HERO_IMAGES
+            if not enriched_at and (
+                missing_image or not feed_item.has_topics or not feed_item.has_tools or not project.difficulty_level
+            ):
+                needs_enrichment.append(feed_item)
+
+            feed_item.categories = item_data['categories']
+            feed_item.rss_metadata = cls._serialize_metadata(item_data)
+            # Keep the enrichment markers, so re-syncs never repeat paid AI calls
+            for marker in ENRICHMENT_MARKERS:
+                if metadata.get(marker):
+                    feed_item.rss_metadata[marker] = metadata[marker]
+            feed_item.last_synced_at = feed_item.updated_at = now
+
+        RSSFeedItem.objects.bulk_update(
+            [feed_item for feed_item, _ in pairs], ['categories', 'rss_metadata', 'last_synced_at', 'updated_at']
+        )
+
+        return needs_enrichment
+
+    @staticmethod
+    def _field_errors(instance, fields: tuple[str, ...]) -> str:
+        """Validation errors (max length, URL format) of the given non-empty fields, as one message."""
+        checked = {name for name in fields if getattr(instance, name)}
+        try:
+            instance.clean_fields(exclude=[field.name for field in instance._meta.fields if field.name not in checked])
+        except ValidationError as e:
+            return '; '.join(f'{field}: {" ".join(messages)}' for field, messages in e.message_dict.items())
+        return ''
+
+    @staticmethod
+    def _serialize_metadata(item_data: dict) -> dict:
+        """Copy parsed item data with a JSON-serializable published_at."""
+        metadata = dict(item_data)
+        if metadata.get('published_at'):
+            metadata['published_at'] = metadata['published_at'].isoformat()
+        return metadata
+
+    @staticmethod
+    def _queue_enrichment(items: list[tuple[int, bool]]):
+        """Queue AI enrichment for (feed item pk, generate_review) pairs."""
+        from core.integrations.rss_tasks import enrich_rss_item_task
+
+        for feed_item_pk, generate_review in items:
+            try:
+                enrich_rss_item_task.delay(feed_item_pk, generate_review=generate_review)
             except Exception as e:
-                # Don't fail project creation if tagging queue fails
-                logger.warning(f'Failed to queue AI tagging for project {project.id}: {e}')
+                logger.warning(f'Failed to queue enrichment for RSS feed item {feed_item_pk}: {e}')
 
     @classmethod
-    def _update_feed_item(cls, feed_item: RSSFeedItem, item_data: dict):
-        """Update an existing RSS feed item."""
-        # Update project if needed
+    def enrich_feed_item(cls, feed_item: RSSFeedItem, generate_review: bool = False):
+        """Fill in the AI-derived fields of a feed item's project.
+
+        Runs on the rss_enrichment queue. Each step only runs if its field is
+        still empty, so retries and re-queues don't repeat paid AI calls. The
+        expert review overwrites the description, so it is tracked by the
+        'expert_review_at' marker instead and skipped once that or
+        'enriched_at' is set.
+
+        Args:
+            feed_item: RSSFeedItem with project and agent
+            generate_review: Generate the expert review (new items only)
+        """
         project = feed_item.project
         agent = feed_item.agent
-        updated = False
-
-        if project.title != item_data['title']:
-            project.title = item_data['title']
-            updated = True
-
-        if item_data['description'] and project.description != item_data['description'][:500]:
-            project.description = item_data['description'][:500]
-            updated = True
-
-        # Update featured image - use RSS thumbnail, or generate if missing
-        if item_data['thumbnail_url'] and project.featured_image_url != item_data['thumbnail_url']:
-            project.featured_image_url = item_data['thumbnail_url']
-            updated = True
-        elif not project.featured_image_url and django_settings.RSS_GENERATE_HERO_IMAGES:
-            # No image - try to generate one with curator's visual style
-            topics = get_project_topic_names(project) or cls._extract_topics_from_article(item_data)
-            generated_url = cls._generate_hero_image(item_data, topics, agent.visual_style)
-            if generated_url:
-                project.featured_image_url = generated_url
-                updated = True
-                logger.info(
-                    f'Generated hero image for existing article: {project.title[:40]}... '
-                    f'(style: {agent.visual_style})'
-                )
-
-        # Update content structure if empty or content changed
-        if not project.content or not project.content.get('sections'):
-            project.content = cls._build_rss_article_content(item_data, agent)
-            updated = True
+        metadata = feed_item.rss_metadata or {}
+        item_data = dict(metadata)
+        if item_data.get('published_at'):
+            item_data['published_at'] = datetime.fromisoformat(item_data['published_at'])
+        item_data.setdefault('title', project.title)
+        item_data.setdefault('description', '')
+        item_data.setdefault('permalink', feed_item.permalink)
 
-        # Update topics if empty
-        if not project_has_topics(project):
+        if generate_review and not any(metadata.get(marker) for marker in ENRICHMENT_MARKERS):
+            # Use expert review as project description, fallback to original
+            expert_review = cls._generate_expert_review(agent, item_data)
+            if expert_review:
+                project.description = expert_review
+                project.content = cls._build_rss_article_content(item_data, agent, expert_review)
+                project.save(update_fields=['description', 'content', 'updated_at'])
+            # Recorded right away, so a retry after a later step fails doesn't pay for the review again
+            feed_item.rss_metadata = {**metadata, 'expert_review_at': timezone.now().isoformat()}
+            feed_item.save(update_fields=['rss_metadata', 'updated_at'])
+
+        topics = get_project_topic_names(project)
+        if not topics:
             topics = cls._extract_topics_from_article(item_data)
             set_project_topics(project, topics)
-            updated = True
 
-            # Add categories if not already set (with AI fallback)
-            if not project.categories.exists():
-                cls._add_categories_to_project(project, item_data.get('categories', []), item_data)
+        if not project.difficulty_level:
+            project.difficulty_level = cls._detect_difficulty_level(item_data)
+
+        if not project.featured_image_url and django_settings.RSS_GENERATE_HERO_IMAGES:
+            # Generate a hero image using Gemini with curator's visual style
+            generated_url = cls._generate_hero_image(item_data, topics, agent.visual_style)
+            if generated_url:
+                project.featured_image_url = generated_url
+                logger.info(f'Using AI-generated hero for "{project.title[:40]}..." (style: {agent.visual_style})')
+
+        # Add categories from RSS feed categories (with AI fallback)
+        if not project.categories.exists():
+            cls._add_categories_to_project(project, item_data.get('categories', []), item_data)
 
-        # Add tools if not already set
+        # Extract and add tools mentioned in article
         if not project.tools.exists():
             cls._add_tools_to_project(project, item_data)
 
-        # Update difficulty if empty
-        if not project.difficulty_level:
-            difficulty = cls._detect_difficulty_level(item_data)
-            project.difficulty_level = difficulty
-            updated = True
+        # Full save so Weaviate sync and auto-tagging see the enriched project
+        project.save()
 
-        if updated:
-            project.save()
+        feed_item.rss_metadata = {**(feed_item.rss_metadata or {}), 'enriched_at': timezone.now().isoformat()}
+        feed_item.save(update_fields=['rss_metadata', 'updated_at'])
 
-        # Prepare metadata with serializable datetime
-        metadata = dict(item_data)
-        if metadata.get('published_at'):
-            metadata['published_at'] = metadata['published_at'].isoformat()
+        logger.info(f'Enriched RSS feed item: {project.title} ({feed_item.feed_item_id})')
 
-        # Update feed item metadata
-        feed_item.categories = item_data['categories']
-        feed_item.rss_metadata = metadata
-        feed_item.save()
+        if generate_review:
+            # Queue async AI taxonomy tagging for richer classification
+            try:
+                from services.tagging.tasks import tag_content_task
 
-        logger.debug(f'Updated RSS feed item: {project.title}')
+                tag_content_task.delay(
+                    content_type='project',
+                    content_id=project.id,
+                    tier='bulk',  # Use cheap model for imported content
+                    force=False,
+                )
+                logger.debug(f'Queued AI tagging for RSS project {project.id}')
+            except Exception as e:
+                # Don't fail enrichment if tagging queue fails
+                logger.warning(f'Failed to queue AI tagging for project {project.id}: {e}')
 
     @classmethod
     def _generate_expert_review(cls, agent: RSSFeedAgent, item_data: dict) -> str | None:
@@ -1322,23 +1520,54 @@ CRITICAL REQUIREMENTS:
     def sync_all_active_agents(cls) -> dict:
         """Sync all active RSS feed agents.
 
+        Feeds are downloaded concurrently (bounded pool, per-host cap) with
+        conditional requests; items are then processed one agent at a time.
+
         Returns:
             Dictionary with overall sync results
         """
-        agents = RSSFeedAgent.objects.filter(status=RSSFeedAgent.Status.ACTIVE)
+        agents = list(RSSFeedAgent.objects.filter(status=RSSFeedAgent.Status.ACTIVE))
 
         total_results = {
             'agents_synced': 0,
+            'agents_not_modified': 0,
             'total_created': 0,
             'total_updated': 0,
             'total_errors': 0,
         }
 
+        fetched = cls.fetch_feeds(agents)
         for agent in agents:
-            results = cls.sync_agent(agent)
+            results = cls.sync_agent(agent, fetched=fetched[agent.id])
             total_results['agents_synced'] += 1
+            total_results['agents_not_modified'] += int(results['not_modified'])
             total_results['total_created'] += results['created']
             total_results['total_updated'] += results['updated']
             total_results['total_errors'] += results['errors']
 
         return total_results
+
+    @classmethod
+    def fetch_feeds(cls, agents: list[RSSFeedAgent]) -> dict[int, FeedFetchResult]:
+        """Download many feeds concurrently.
+
+        Returns:
+            Mapping of agent id -> FeedFetchResult
+        """
+        # One semaphore per host, created up front so worker threads only read the dict
+        host_slots = {
+            urlparse(agent.feed_url).netloc.lower(): threading.BoundedSemaphore(cls.MAX_FETCHES_PER_HOST)
+            for agent in agents
+        }
+
+        def fetch(agent, session):
+            with host_slots[urlparse(agent.feed_url).netloc.lower()]:
+                return cls.fetch_feed(agent, session)
+
+        with requests.Session() as session:
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=cls.MAX_CONCURRENT_FETCHES)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            with ThreadPoolExecutor(max_workers=cls.MAX_CONCURRENT_FETCHES) as pool:
+                futures = {agent.id: pool.submit(fetch, agent, session) for agent in agents}
+                return {agent_id: future.result() for agent_id, future in futures.items()}
@@ -3,10 +3,12 @@ Service for handling file uploads to MinIO/S3 storage.
 """
 
 import logging
+import os
 import threading
 import uuid
 from datetime import timedelta
 from io import BytesIO
+from typing import BinaryIO
 
 from django.conf import settings
 from minio import Minio
@@ -19,6 +21,14 @@ logger = logging.getLogger(__name__)
 class StorageService:
     """Service for uploading and managing files in MinIO."""
 
+    # Streams larger than one part are sent as a multipart upload, reading one part at a
+    # time, so worker memory stays around MULTIPART_PART_SIZE regardless of file size
+    MULTIPART_PART_SIZE = 16 * 1024 * 1024  # 16MB (S3 minimum is 5MB)
+
+    # Buckets already verified in this process, shared by every StorageService instance
+    _verified_buckets: set[str] = set()
+    _bucket_lock = threading.Lock()
+
     def __init__(self):
         """Initialize MinIO client."""
         endpoint = settings.MINIO_ENDPOINT
@@ -49,19 +59,17 @@ class StorageService:
             )
 
         self.bucket_name = settings.MINIO_BUCKET_NAME
-        self._bucket_verified = False
-        self._bucket_lock = threading.Lock()
         # Track if we're using AWS S3 (skip bucket creation - managed by CloudFormation)
         self._is_aws = 'amazonaws.com' in endpoint
 
     def _ensure_bucket_exists(self):
-        """Create bucket if it doesn't exist (lazy initialization)."""
-        if self._bucket_verified:
+        """Create bucket if it doesn't exist (lazy initialization, once per process)."""
+        if self.bucket_name in self._verified_buckets:
             return
 
         with self._bucket_lock:
             # Double-check after acquiring lock
-            if self._bucket_verified:
+            if self.bucket_name in self._verified_buckets:
                 return
 
             try:
@@ -70,7 +78,7 @@ class StorageService:
                     # For AWS, assume bucket exists (created by CloudFormation)
                     # Calling bucket_exists requires s3:ListBucket which IAM role may not have
                     logger.info(f'Using AWS S3 bucket (managed by CloudFormation): {self.bucket_name}')
-                    self._bucket_verified = True
+                    self._verified_buckets.add(self.bucket_name)
                     return
 
                 # For local MinIO, check and create bucket if needed
@@ -79,7 +87,7 @@ class StorageService:
                     self._set_public_read_policy()
                     logger.info(f'Created bucket: {self.bucket_name}')
 
-                self._bucket_verified = True
+                self._verified_buckets.add(self.bucket_name)
 
             except S3Error as e:
                 logger.error(f'Failed to ensure bucket exists: {e}')
@@ -107,23 +115,27 @@ class StorageService:
 
     def upload_file(
         self,
-        file_data: bytes,
+        file_data: bytes | BinaryIO,
         filename: str,
         content_type: str = 'application/octet-stream',
         user_id: int | None = None,
         folder: str = 'uploads',
         is_public: bool = False,
+        object_name: str | None = None,
     ) -> tuple[str | None, str | None]:
         """
         Upload a file to MinIO.
 
         Args:
-            file_data: File content as bytes
+            file_data: File content as bytes, or a readable binary file (e.g. a Django
+                UploadedFile), which is streamed in parts instead of loaded into memory
             filename: Original filename
             content_type: MIME type of the file
             user_id: User ID for organizing files (optional)
             folder: Folder/prefix for organizing files
             is_public: If True, file is publicly accessible. If False, use presigned URLs.
+            object_name: Fixed name within folder (e.g. a content hash), overwriting any
+                existing object; by default a unique name is generated
 
         Returns:
             (url, error_message)
@@ -138,14 +150,19 @@ class StorageService:
 
             # Construct object path - public files go in public/ prefix
             visibility = 'public' if is_public else 'private'
-            if user_id:
+            if object_name:
+                object_name = f'{visibility}/{folder}/{object_name}'
+            elif user_id:
                 object_name = f'{visibility}/{folder}/user_{user_id}/{unique_id}.{file_ext}'
             else:
                 object_name = f'{visibility}/{folder}/{unique_id}.{file_ext}'
 
-            # Upload file
-            file_stream = BytesIO(file_data)
-            file_size = len(file_data)
+            if isinstance(file_data, bytes | bytearray):
+                file_stream = BytesIO(file_data)
+                file_size = len(file_data)
+            else:
+                file_stream = file_data
+                file_size = self._stream_size(file_data)
 
             # Set Content-Disposition to prevent browser from executing uploaded files
             # Inline for safe types (images, videos, audio), attachment for others
@@ -155,6 +172,7 @@ class StorageService:
                 'image/png',
                 'image/gif',
                 'image/webp',
+                'image/avif',
                 'image/svg+xml',
                 # Videos - must be inline for HTML5 video player to work
                 'video/mp4',
@@ -181,6 +199,7 @@ class StorageService:
                 length=file_size,
                 content_type=content_type,
                 metadata={'Content-Disposition': content_disposition},
+                part_size=self.MULTIPART_PART_SIZE,
             )
 
             # Construct URL - use public endpoint for browser access
@@ -204,6 +223,68 @@ class StorageService:
             logger.error(f'Unexpected error uploading file: {e}', exc_info=True)
             return None, f'Unexpected error: {str(e)}'
 
+    @staticmethod
+    def _stream_size(stream: BinaryIO) -> int:
+        """Rewind a file-like object and return its total size, or -1 if unknown.
+
+        Callers may have read part of the stream already (e.g. PDF text
+        extraction), so the whole file is always uploaded from the start.
+        Uses UploadedFile.size when present, otherwise seeks to the end.
+        """
+        try:
+            stream.seek(0)
+        except (AttributeError, OSError):
+            return -1  # Unseekable stream: minio uploads parts until EOF
+
+        size = getattr(stream, 'size', None)
+        if size is not None:
+            return size
+        size = stream.seek(0, os.SEEK_END)
+        stream.seek(0)
+        return size
+
+    def object_name_from_url(self, url: str) -> str | None:
+        """Extract the object name from a URL returned by upload_file (http://endpoint/bucket/object_name)."""
+        parts = url.split(f'/{self.bucket_name}/', 1)
+        return parts[1] if len(parts) == 2 else None
+
+    def file_exists(self, object_name: str) -> bool:
+        """Check whether an object exists (a HEAD request, no download)."""
+        try:
+            self.client.stat_object(bucket_name=self.bucket_name, object_name=object_name)
+            return True
+        except S3Error as e:
+            if e.code in ('NoSuchKey', 'NoSuchObject', 'ResourceNotFound'):
+                return False
+            raise
+
+    def download_file(self, object_name: str) -> bytes:
+        """
+        Read an object into memory.
+
+        Args:
+            object_name: Path/name of object in bucket
+
+        Returns:
+            Object content as bytes
+        """
+        response = self.client.get_object(bucket_name=self.bucket_name, object_name=object_name)
+        try:
+            return response.read()
+        finally:
+            response.close()
+            response.release_conn()
+
+    def delete_object(self, object_name: str) -> bool:
+        """Delete an object by name (e.g. a private file, whose upload_file URL is its object name)."""
+        try:
+            self.client.remove_object(bucket_name=self.bucket_name, object_name=object_name)
+            logger.info(f'Deleted file: {object_name}')
+            return True
+        except Exception as e:
+            logger.error(f'Error deleting file {object_name}: {e}')
+            return False
+
     def delete_file(self, url: str) -> tuple[bool, str | None]:
         """
         Delete a file from MinIO using its URL.
@@ -215,14 +296,10 @@ class StorageService:
             (success, error_message)
         """
         try:
-            # Extract object name from URL
-            # URL format: http://endpoint/bucket/object_name
-            parts = url.split(f'/{self.bucket_name}/', 1)
-            if len(parts) != 2:
+            object_name = self.object_name_from_url(url)
+            if object_name is None:
                 return False, 'Invalid URL format'
 
-            object_name = parts[1]
-
             self.client.remove_object(bucket_name=self.bucket_name, object_name=object_name)
             logger.info(f'Deleted file: {object_name}')
             return True, None
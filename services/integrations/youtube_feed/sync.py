@@ -94,7 +94,7 @@ class YouTubeFeedSyncService:
         Uses RSS-first approach to minimize API quota usage:
         1. Check FREE RSS feed for new videos (no quota cost)
         2. Only call YouTube API if RSS shows new videos
-        3. Fetch video details only for videos we don't already have
+        3. Fetch video details only for videos we don't already have, 50 per request
 
         Args:
             agent: YouTubeFeedAgent instance to sync
@@ -151,50 +151,38 @@ class YouTubeFeedSyncService:
                 video_ids = new_video_ids
                 logger.info(f'RSS feed shows {len(video_ids)} new video(s) for {agent.channel_name}')
 
-            # Process each video - only fetch details for new videos
-            for video_id in video_ids:
+            # One existence query for all candidates (a video may belong to another agent),
+            # then one videos.list call per 50 new IDs instead of a lookup per video
+            existing_ids = set(
+                YouTubeFeedVideo.objects.filter(video_id__in=video_ids).values_list('video_id', flat=True)
+            )
+            candidate_ids = [video_id for video_id in dict.fromkeys(video_ids) if video_id not in existing_ids]
+            results['skipped'] += len(video_ids) - len(candidate_ids)
+
+            videos_info = {}
+            if candidate_ids:
                 try:
-                    # Check if video already exists - skip if so (saves API quota)
-                    if YouTubeFeedVideo.objects.filter(video_id=video_id).exists():
-                        logger.debug(f'Skipping existing video: {video_id}')
-                        results['skipped'] += 1
-                        continue
-
-                    # Fetch video details and create project
-                    video_info = service.get_video_info(video_id)
-
-                    # Check shorts_only filter if enabled
-                    if agent.settings.get('shorts_only', False):
-                        duration_iso = video_info.get('duration', 'PT0S')
-                        duration_seconds = parse_iso_duration_to_seconds(duration_iso)
-
-                        # Apply same heuristics as is_short property
-                        is_short = False
-                        if duration_seconds <= 90:
-                            is_short = True
-                        elif duration_seconds <= 180:
-                            description = video_info.get('description', '')
-                            if len(description.strip()) < 50:
-                                is_short = True
-
-                        if not is_short:
-                            logger.debug(f'Skipping non-Short video: {video_id} (duration: {duration_seconds}s)')
-                            results['skipped'] += 1
-                            continue
-
-                    # Skip videos older than min_publish_year (default 2025)
-                    min_year = agent.settings.get('min_publish_year', 2025)
-                    published_at_str = video_info.get('published_at', '')
-                    if published_at_str:
-                        try:
-                            published_year = int(published_at_str[:4])
-                            if published_year < min_year:
-                                logger.debug(f'Skipping old video: {video_id} (published: {published_year})')
-                                results['skipped'] += 1
-                                continue
-                        except (ValueError, IndexError):
-                            pass  # If we can't parse the date, allow the video
+                    videos_info = service.get_videos_info(candidate_ids)
+                except Exception as e:
+                    logger.error(f'Error fetching video details for {agent.channel_name}: {e}', exc_info=True)
+                    results['errors'] += 1
+                    results['error_messages'].append(f'videos.list: {str(e)}')
+                    candidate_ids = []
 
+            for video_id in candidate_ids:
+                video_info = videos_info.get(video_id)
+                if video_info is None:
+                    results['errors'] += 1
+                    results['error_messages'].append(f'{video_id}: Video {video_id} not found')
+                    continue
+
+                skip_reason = cls._get_skip_reason(agent, video_info)
+                if skip_reason:
+                    logger.debug(f'Skipping video {video_id}: {skip_reason}')
+                    results['skipped'] += 1
+                    continue
+
+                try:
                     # Use a savepoint so failures don't corrupt the entire transaction
                     # This allows other videos to continue processing even if one fails
                     with transaction.atomic():
@@ -226,6 +214,42 @@ class YouTubeFeedSyncService:
 
         return results
 
+    @staticmethod
+    def _get_skip_reason(agent: YouTubeFeedAgent, video_info: dict) -> str | None:
+        """Apply the agent's shorts_only and min_publish_year filters to fetched video details.
+
+        Returns:
+            Why the video should be skipped, or None to import it
+        """
+        # Check shorts_only filter if enabled
+        if agent.settings.get('shorts_only', False):
+            duration_seconds = parse_iso_duration_to_seconds(video_info.get('duration', 'PT0S'))
+
+            # Apply same heuristics as is_short property
+            is_short = False
+            if duration_seconds <= 90:
+                is_short = True
+            elif duration_seconds <= 180:
+                description = video_info.get('description', '')
+                if len(description.strip()) < 50:
+                    is_short = True
+
+            if not is_short:
+                return f'not a Short (duration: {duration_seconds}s)'
+
+        # Skip videos older than min_publish_year (default 2025)
+        min_year = agent.settings.get('min_publish_year', 2025)
+        published_at_str = video_info.get('published_at', '')
+        if published_at_str:
+            try:
+                published_year = int(published_at_str[:4])
+                if published_year < min_year:
+                    return f'published {published_year}'
+            except (ValueError, IndexError):
+                pass  # If we can't parse the date, allow the video
+
+        return None
+
     @classmethod
     def _create_video_project(cls, agent: YouTubeFeedAgent, video_info: dict):
         """Create a new video project from YouTube data.
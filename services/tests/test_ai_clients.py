@@ -0,0 +1,100 @@
+"""
+Tests for the per-process LLM client registry against a local OpenAI-compatible endpoint.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from services.ai.clients import ClientRegistry, client_registry
+from services.ai.provider import AIProvider
+
+COMPLETION = {
+    'id': 'chatcmpl-1',
+    'object': 'chat.completion',
+    'created': 0,
+    'model': 'gpt-4o-mini',
+    'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': 'pong'}, 'finish_reason': 'stop'}],
+    'usage': {'prompt_tokens': 1, 'completion_tokens': 1, 'total_tokens': 2},
+}
+
+
+class MockOpenAIHandler(BaseHTTPRequestHandler):
+    """Answers chat completions; one handler instance per TCP connection."""
+
+    protocol_version = 'HTTP/1.1'
+    disable_nagle_algorithm = True  # Headers and body go out in separate writes
+
+    def setup(self):
+        super().setup()
+        with self.server.lock:
+            self.server.connections += 1
+
+    def do_POST(self):  # noqa: N802
+        self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        with self.server.lock:
+            self.server.requests += 1
+        body = json.dumps(COMPLETION).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class PooledAIClientTest(SimpleTestCase):
+    def setUp(self):
+        client_registry.clear()
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), MockOpenAIHandler)
+        self.server.lock = threading.Lock()
+        self.server.connections = self.server.requests = 0
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        for name, value in (
+            ('OPENAI_API_KEY', 'test-key'),
+            ('OPENAI_BASE_URL', f'http://127.0.0.1:{self.server.server_port}/v1'),
+        ):
+            patcher = patch.object(settings, name, value, create=True)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        client_registry.clear()
+        self.server.shutdown()
+        self.server.server_close()
+
+    def test_thousand_providers_share_one_connection(self):
+        """Test that every new AIProvider reuses the pooled client and its keep-alive connection"""
+        for _ in range(1000):
+            self.assertEqual(AIProvider(provider='openai').complete('ping'), 'pong')
+
+        self.assertEqual(self.server.requests, 1000)
+        self.assertEqual(self.server.connections, 1)
+        self.assertEqual(len(client_registry), 1)
+
+    def test_clients_are_keyed_by_credentials(self):
+        """Test that a different API key gets its own client"""
+        first = AIProvider(provider='openai').client
+        with patch.object(settings, 'OPENAI_API_KEY', 'other-key'):
+            other = AIProvider(provider='openai').client
+
+        self.assertIs(AIProvider(provider='openai').client, first)
+        self.assertIsNot(other, first)
+
+
+class ClientRegistryForkTest(SimpleTestCase):
+    def test_child_forgets_inherited_clients(self):
+        """Test that the after-fork hook drops the parent's clients without closing them"""
+        registry = ClientRegistry()
+        parent_client = registry.get(('client', 'key'), object)
+
+        registry._forget_clients()
+
+        self.assertEqual(len(registry), 0)
+        self.assertIsNot(registry.get(('client', 'key'), object), parent_client)
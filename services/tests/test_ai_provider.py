@@ -341,8 +341,8 @@ class TokenLimitTestCase(TestCase):
         self.assertEqual(estimate_token_count('Hi'), 1)
         self.assertGreaterEqual(estimate_token_count('Hello'), 1)
 
-        # Longer text - ~1 token per 3 chars
-        self.assertEqual(estimate_token_count('a' * 300), 100)
+        # Longer text counts proportionally more tokens
+        self.assertGreater(estimate_token_count('word ' * 300), estimate_token_count('word ' * 30))
 
     def test_get_token_limits(self):
         """Test get_token_limits returns valid configuration."""
@@ -393,7 +393,7 @@ class TokenLimitTestCase(TestCase):
         with patch.object(settings, 'AI_TOKEN_SOFT_LIMIT', 10):
             with patch.object(settings, 'AI_TOKEN_HARD_LIMIT', 100000):
                 with self.assertLogs('services.ai.provider', level='WARNING') as logs:
-                    allowed, _ = check_token_limits('a' * 100)
+                    allowed, _ = check_token_limits('hello world ' * 20)
 
                 self.assertTrue(allowed)
                 self.assertTrue(any('approaching token limit' in log for log in logs.output))
@@ -405,7 +405,7 @@ class TokenLimitTestCase(TestCase):
         with patch.object(settings, 'AI_TOKEN_SOFT_LIMIT', 5):
             with patch.object(settings, 'AI_TOKEN_HARD_LIMIT', 10):
                 with self.assertRaises(TokenLimitExceededError) as context:
-                    check_token_limits('a' * 100)
+                    check_token_limits('hello world ' * 20)
 
                 self.assertGreater(context.exception.estimated_tokens, 10)
                 self.assertEqual(context.exception.limit, 10)
@@ -456,7 +456,7 @@ class TokenLimitIntegrationTestCase(TestCase):
                 ai = AIProvider(provider='openai')
 
                 with self.assertRaises(TokenLimitExceededError):
-                    ai.complete('a' * 100)
+                    ai.complete('hello world ' * 20)
 
                 mock_client_instance.chat.completions.create.assert_not_called()
 
@@ -487,6 +487,6 @@ class TokenLimitIntegrationTestCase(TestCase):
                 ai = AIProvider(provider='openai')
 
                 with self.assertRaises(TokenLimitExceededError):
-                    list(ai.stream_complete('a' * 100))
+                    list(ai.stream_complete('hello world ' * 20))
 
                 mock_client_instance.chat.completions.create.assert_not_called()
@@ -0,0 +1,132 @@
+"""
+Tests for the per-worker browser pool's thread ownership rules.
+
+Playwright is replaced by fakes, so these run without a browser.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from services.url_import.browser_pool import BrowserPool
+from services.url_import.scraper import capture_figma_screenshot
+
+FIGMA_URL = 'https://www.figma.com/design/abc123/Example'
+
+
+@contextmanager
+def fake_one_off_page(block_resources, context_options):
+    yield 'one-off page'
+
+
+class TestBrowserPoolOwnership:
+    """Pages are served from the pooled browser only on the thread that launched it."""
+
+    def setup_method(self):
+        self.pool = BrowserPool()
+        self.browser = MagicMock()
+        self.browser.new_context.return_value.new_page.return_value = 'pooled page'
+
+    def launch(self):
+        self.pool._owner_thread = threading.get_ident()
+        self.pool._browser = self.browser
+        return self.browser
+
+    def test_owner_thread_gets_pooled_page(self):
+        with patch.object(self.pool, '_ensure_browser', side_effect=self.launch):
+            with self.pool.page() as page:
+                assert page == 'pooled page'
+
+    def test_thread_waiting_on_lock_falls_back_when_another_thread_launched(self):
+        """A thread that saw no owner, then waited on the lock, must not drive the winner's browser."""
+        pages = []
+
+        def open_page():
+            with self.pool.page() as page:
+                pages.append(page)
+
+        with (
+            patch.object(self.pool, '_ensure_browser', side_effect=AssertionError('used browser of another thread')),
+            patch.object(BrowserPool, '_one_off_page', side_effect=fake_one_off_page),
+        ):
+            self.pool._lock.acquire()
+            waiter = threading.Thread(target=open_page)
+            waiter.start()
+            time.sleep(0.05)  # Let the waiter pass the unlocked owner check and block on the lock
+
+            # This thread launches the browser while the waiter is blocked
+            self.launch()
+            self.pool._lock.release()
+            waiter.join(timeout=5)
+
+        assert pages == ['one-off page']
+        self.browser.new_context.assert_not_called()
+
+    def test_close_from_other_thread_leaves_browser(self):
+        self.launch()
+
+        closer = threading.Thread(target=self.pool.close)
+        closer.start()
+        closer.join(timeout=5)
+
+        self.browser.close.assert_not_called()
+        assert self.pool._browser is self.browser
+
+
+class TestFigmaScreenshotPooling:
+    """capture_figma_screenshot uses the pooled browser only on its owner thread, and never blocks images."""
+
+    def setup_method(self):
+        self.pool = BrowserPool()
+        self.browser = MagicMock()
+        self.pooled_page = self.browser.new_context.return_value.new_page.return_value
+        self.pooled_page.screenshot.return_value = b'pooled png'
+
+        self.storage = MagicMock()
+        self.storage.upload_file.return_value = ('https://cdn.example.com/figma.png', None)
+
+    def launch(self):
+        self.pool._owner_thread = threading.get_ident()
+        self.pool._browser = self.browser
+        return self.browser
+
+    def capture(self):
+        with (
+            patch('services.url_import.scraper.browser_pool', self.pool),
+            patch('services.integrations.storage.get_storage_service', return_value=self.storage),
+        ):
+            return capture_figma_screenshot(FIGMA_URL, user_id=1)
+
+    def test_owner_thread_screenshots_in_pooled_context_with_images(self):
+        with patch.object(self.pool, '_ensure_browser', side_effect=self.launch):
+            assert self.capture() == 'https://cdn.example.com/figma.png'
+
+        self.browser.new_context.assert_called_once_with(
+            viewport={'width': 1920, 'height': 1080}, device_scale_factor=2
+        )
+        self.browser.new_context.return_value.route.assert_not_called()
+        self.browser.new_context.return_value.close.assert_called_once()
+        assert self.storage.upload_file.call_args.kwargs['file_data'] == b'pooled png'
+
+    def test_other_thread_gets_one_off_browser_with_same_options(self):
+        self.launch()
+        one_off_page = MagicMock()
+        one_off_page.screenshot.return_value = b'one-off png'
+        calls = []
+
+        @contextmanager
+        def one_off(block_resources, context_options):
+            calls.append((block_resources, context_options))
+            yield one_off_page
+
+        results = []
+        with patch.object(BrowserPool, '_one_off_page', side_effect=one_off):
+            worker = threading.Thread(target=lambda: results.append(self.capture()))
+            worker.start()
+            worker.join(timeout=5)
+
+        assert results == ['https://cdn.example.com/figma.png']
+        assert calls == [(False, {'viewport': {'width': 1920, 'height': 1080}, 'device_scale_factor': 2})]
+        assert self.storage.upload_file.call_args.kwargs['file_data'] == b'one-off png'
+        self.browser.new_context.assert_not_called()
@@ -2,7 +2,16 @@
 Tests for the keyword-based content filter.
 """
 
-from services.agents.moderation.keyword_filter import KeywordFilter
+import json
+import re
+from pathlib import Path
+
+import pytest
+
+from services.agents.moderation.keyword_filter import _IGNORECASE_FOLDS, KeywordFilter, literal_prefixes
+
+# Verdicts recorded from the previous implementation (one regex search per pattern)
+GOLDEN_CASES = json.loads((Path(__file__).parent / 'data' / 'keyword_filter_golden.json').read_text())
 
 
 class TestKeywordFilter:
@@ -345,3 +354,45 @@ class TestKeywordFilterIntegration:
 
         assert filter_chatgpt.strict_mode
         assert not filter_programming.strict_mode
+
+
+class TestKeywordMatcher:
+    """Tests for the single-scan keyword index."""
+
+    @pytest.mark.parametrize('mode', ['normal', 'strict'])
+    def test_golden_verdicts(self, mode):
+        """Test that verdicts match the per-pattern regex implementation exactly"""
+        filter = KeywordFilter(strict_mode=mode == 'strict')
+
+        for case in GOLDEN_CASES:
+            result = filter.check(case['text'], context='golden')
+            assert {key: result[key] for key in case[mode]} == case[mode], case['text']
+
+    def test_literal_prefixes(self):
+        """Test prefix extraction, including patterns that must fall back to a full search"""
+        assert literal_prefixes(r'\bnude') == ['nude']
+        assert literal_prefixes(r'\bexecut(e|ion)') == ['execut']
+        assert literal_prefixes(r'\bkids?\s+porn') == ['kid']
+        assert literal_prefixes(r'\b(food|Data)\s+porn\b') == ['food', 'data']
+        assert literal_prefixes(r'\bfoo|bar') is None
+        assert literal_prefixes(r'porn\b') is None
+        assert literal_prefixes(r'\b(?:foo|bar)') is None
+
+    def test_ignorecase_folds_are_complete(self):
+        """Test that every non-ASCII character re.IGNORECASE equates with [a-z0-9] is folded"""
+        ascii_alnum = re.compile('[a-z0-9]', re.IGNORECASE)
+        equivalents = {code_point for code_point in range(128, 0x110000) if ascii_alnum.fullmatch(chr(code_point))}
+        assert equivalents == set(_IGNORECASE_FOLDS)
+
+    def test_hot_reload(self):
+        """Test that reloading swaps in new lists and leaves other instances alone"""
+        filter = KeywordFilter(strict_mode=True)
+        other = KeywordFilter(strict_mode=True)
+        assert not filter.check('a phishing kit')['flagged']
+
+        filter.reload({'VIOLENT_GRAPHIC': [*KeywordFilter.VIOLENT_GRAPHIC, r'\bphish(ing)?\b']})
+
+        assert filter.check('a phishing kit')['categories'] == ['violence']
+        assert not other.check('a phishing kit')['flagged']
+        with pytest.raises(ValueError):
+            filter.reload({'NOT_A_LIST': []})
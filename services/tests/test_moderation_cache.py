@@ -0,0 +1,251 @@
+"""
+Tests for moderation verdict caching, batching and single-flight deduplication.
+
+The moderation clients are stubbed and count the external calls they receive.
+"""
+
+import base64
+import io
+import json
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from PIL import Image
+
+from services.agents.moderation.image_moderator import ImageModerator
+from services.agents.moderation.moderator import ContentModerator
+from services.agents.moderation.verdict_cache import normalize_text, perceptual_hash, text_cache_key
+
+CATEGORIES = ('harassment', 'hate', 'violence')
+
+
+class _ModerationResult:
+    def __init__(self, text):
+        flagged = 'attack' in text
+        self._data = {
+            'flagged': flagged,
+            'categories': {category: flagged and category == 'violence' for category in CATEGORIES},
+            'category_scores': {
+                category: 0.9 if flagged and category == 'violence' else 0.01 for category in CATEGORIES
+            },
+        }
+
+    def model_dump(self):
+        return dict(self._data)
+
+
+class StubModerations:
+    """Stands in for client.moderations, recording every request."""
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.inputs = []
+        self.lock = threading.Lock()
+
+    @property
+    def calls(self):
+        return len(self.inputs)
+
+    def create(self, input):  # noqa: A002 - matches the OpenAI SDK signature
+        with self.lock:
+            self.inputs.append(input)
+        time.sleep(self.delay)
+        texts = input if isinstance(input, list) else [input]
+        return SimpleNamespace(results=[_ModerationResult(text) for text in texts])
+
+
+class StubCompletions:
+    """Stands in for client.chat.completions, answering every image with the same verdict (clean by default)."""
+
+    def __init__(self, flagged=False):
+        self.calls = 0
+        self.flagged = flagged
+
+    def create(self, **kwargs):
+        self.calls += 1
+        categories = ['violence'] if self.flagged else []
+        content = json.dumps(
+            {'flagged': self.flagged, 'categories': categories, 'severity': 'high', 'explanation': 'ok'}
+        )
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))], usage=None)
+
+
+def _data_url(size, image_format):
+    # A 9x8 grid of well-separated shades, scaled up, survives resizing and JPEG noise
+    grid = Image.new('L', (9, 8))
+    grid.putdata([(cell * 97) % 251 for cell in range(72)])
+    image = grid.resize(size, Image.Resampling.NEAREST)
+    buffer = io.BytesIO()
+    image.convert('RGB').save(buffer, format=image_format)
+    mime = 'jpeg' if image_format == 'JPEG' else image_format.lower()
+    return f'data:image/{mime};base64,{base64.b64encode(buffer.getvalue()).decode()}'
+
+
+@override_settings(
+    OPENAI_API_KEY='test-key',
+    MODERATION_POLICY_VERSION='test',
+    MODERATION_BATCH_SIZE=3,
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'moderation-tests'}},
+)
+class TestContentModeratorCache(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.moderations = StubModerations()
+        self.moderator = ContentModerator()
+        self.moderator.client = SimpleNamespace(moderations=self.moderations)
+
+    def test_repeated_content_calls_api_once(self):
+        first = self.moderator.moderate('Great project!', context='project comment')
+        second = ContentModerator.__new__(ContentModerator)
+        second.has_api_key, second.client = True, self.moderator.client
+
+        repeat = second.moderate('  Great   project!\n', context='project comment')
+
+        assert self.moderations.calls == 1
+        assert first['approved'] and repeat['approved']
+        assert repeat['cached'] is True
+        assert 'cached' not in first
+
+    def test_cached_verdict_is_rebuilt_for_each_context(self):
+        self.moderator.moderate('I will attack you', context='project comment')
+        result = self.moderator.moderate('I will attack you', context='battle prompt')
+
+        assert self.moderations.calls == 1
+        assert result['flagged'] is True
+        assert result['categories'] == {'violence': 0.9}
+        assert result['reason'].endswith('in battle prompt. Please revise and try again.')
+
+    def test_policy_version_change_misses_cache(self):
+        self.moderator.moderate('Great project!')
+        with override_settings(MODERATION_POLICY_VERSION='test-2'):
+            self.moderator.moderate('Great project!')
+
+        assert self.moderations.calls == 2
+
+    def test_errors_are_not_cached(self):
+        self.moderator.client = SimpleNamespace(moderations=SimpleNamespace(create=lambda input: 1 / 0))
+        assert self.moderator.moderate('Great project!')['categories'] == {'system_error': 1.0}
+
+        self.moderator.client = SimpleNamespace(moderations=self.moderations)
+        assert self.moderator.moderate('Great project!')['approved'] is True
+        assert self.moderations.calls == 1
+
+    def test_concurrent_identical_checks_share_one_call(self):
+        self.moderations.delay = 0.2
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.moderator.moderate('I will attack you')))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert self.moderations.calls == 1
+        assert len(results) == 8
+        assert all(result['flagged'] for result in results)
+
+    def test_batch_uses_multi_input_requests_and_cache(self):
+        self.moderator.moderate('cached already')
+        contents = ['one', 'two', 'I will attack you', 'cached already', 'four', 'two', '', 'five']
+
+        results = self.moderator.moderate_batch(contents, context='bulk import')
+
+        # 'cached already' is reused, 'two' is sent once and '' never leaves the process
+        assert self.moderations.inputs[1:] == [['one', 'two', 'I will attack you'], ['four', 'five']]
+        assert [result['approved'] for result in results] == [True, True, False, True, True, True, False, True]
+        assert results[3]['cached'] is True
+        assert results[6]['reason'] == 'Content cannot be empty'
+
+        self.moderator.moderate_batch(contents)
+        assert self.moderations.calls == 3
+
+    def test_batch_failure_fails_closed_for_that_chunk_only(self):
+        def create(input):  # noqa: A002
+            if 'bad' in input:
+                raise RuntimeError('boom')
+            return SimpleNamespace(results=[_ModerationResult(text) for text in input])
+
+        self.moderator.client = SimpleNamespace(moderations=SimpleNamespace(create=create))
+        results = self.moderator.moderate_batch(['a', 'b', 'c', 'bad', 'e'])
+
+        assert [result['approved'] for result in results] == [True, True, True, False, False]
+        assert results[4]['categories'] == {'system_error': 1.0}
+
+    def test_normalization_keeps_case_and_unifies_unicode_forms(self):
+        assert normalize_text(' Café \t time ') == 'Café time'
+        assert text_cache_key('Café') == text_cache_key('Café')
+        assert text_cache_key('kill') != text_cache_key('KILL')
+
+
+@override_settings(
+    MODERATION_POLICY_VERSION='test',
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache', 'LOCATION': 'moderation-tests'}},
+)
+class TestImageModeratorCache(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.completions = StubCompletions()
+        self.moderator = ImageModerator.__new__(ImageModerator)
+        self.moderator.ai_provider = None
+        self.moderator.has_client = True
+        self.moderator.client = SimpleNamespace(chat=SimpleNamespace(completions=self.completions))
+
+    def test_repeated_url_calls_api_once(self):
+        self.moderator.moderate_image('https://cdn.example.com/a.png', context='project banner')
+        result = self.moderator.moderate_image('https://cdn.example.com/a.png', context='project banner')
+
+        assert self.completions.calls == 1
+        assert result['cached'] is True
+        assert result['moderation_data']['image_url'] == 'https://cdn.example.com/a.png'
+
+    def test_reencoded_copy_of_flagged_image_shares_verdict(self):
+        self.completions.flagged = True
+        original = _data_url((256, 192), 'PNG')
+        resized = _data_url((128, 96), 'JPEG')
+
+        self.moderator.moderate_image(original)
+        result = self.moderator.moderate_image(resized)
+
+        assert self.completions.calls == 1
+        assert result['cached'] is True
+        assert result['approved'] is False
+
+    def test_approval_is_not_shared_by_perceptual_hash(self):
+        self.moderator.moderate_image(_data_url((256, 192), 'PNG'))
+        result = self.moderator.moderate_image(_data_url((128, 96), 'JPEG'))
+
+        assert self.completions.calls == 2
+        assert 'cached' not in result
+
+    def test_context_is_part_of_the_key(self):
+        self.moderator.moderate_image('https://cdn.example.com/a.png', context='project banner')
+        self.moderator.moderate_image('https://cdn.example.com/a.png', context='avatar')
+
+        assert self.completions.calls == 2
+
+    @override_settings(MODERATION_URL_VERDICT_CACHE_TTL=60, MODERATION_VERDICT_CACHE_TTL=3600)
+    def test_url_only_verdict_uses_short_ttl(self):
+        image_bytes = base64.b64decode(_data_url((64, 64), 'PNG').split(',', 1)[1])
+
+        with patch('django.core.cache.cache.set_many') as set_many:
+            self.moderator.moderate_image('https://cdn.example.com/a.png')
+            self.moderator.moderate_image('https://cdn.example.com/b.png', image_bytes=image_bytes)
+
+        assert [c.kwargs['timeout'] for c in set_many.call_args_list] == [60, 3600]
+
+    def test_image_bytes_key_upload_independent_of_url(self):
+        image_bytes = base64.b64decode(_data_url((64, 64), 'PNG').split(',', 1)[1])
+
+        self.moderator.moderate_image('https://cdn.example.com/v1.png', image_bytes=image_bytes)
+        self.moderator.moderate_image('https://cdn.example.com/v2.png', image_bytes=image_bytes)
+
+        assert self.completions.calls == 1
+
+    def test_perceptual_hash_of_undecodable_bytes_is_none(self):
+        assert perceptual_hash(b'not an image') is None
@@ -0,0 +1,152 @@
+"""
+Tests for streaming uploads in StorageService against a local S3-compatible stub.
+"""
+
+import re
+import tempfile
+import threading
+import tracemalloc
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile, TemporaryUploadedFile
+from minio import Minio
+
+from services.integrations.storage.storage_service import StorageService
+
+PART_SIZE = 5 * 1024 * 1024  # S3/MinIO minimum part size
+
+
+class S3StubHandler(BaseHTTPRequestHandler):
+    """Just enough of the S3 API for put_object: single PUT and multipart upload."""
+
+    protocol_version = 'HTTP/1.1'
+
+    def _read_body(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        remaining = length
+        while remaining:
+            remaining -= len(self.rfile.read(min(remaining, 1024 * 1024)))
+        return length
+
+    def _reply(self, status=200, body=b'', headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_PUT(self):  # noqa: N802
+        size = self._read_body()
+        part = re.search(r'partNumber=(\d+)', self.path)
+        with self.server.lock:
+            if part:
+                self.server.parts.append((int(part.group(1)), size))
+            else:
+                self.server.single_puts.append(size)
+        self._reply(headers={'ETag': '"stub-etag"'})
+
+    def do_POST(self):  # noqa: N802
+        self._read_body()
+        if 'uploadId=' not in self.path:  # Initiate; completion carries the upload id
+            body = (
+                '<InitiateMultipartUploadResult><Bucket>b</Bucket><Key>k</Key>'
+                '<UploadId>upload-1</UploadId></InitiateMultipartUploadResult>'
+            )
+        else:
+            self.server.completed += 1
+            body = (
+                '<CompleteMultipartUploadResult><Location>l</Location><Bucket>b</Bucket><Key>k</Key>'
+                '<ETag>"stub-etag"</ETag></CompleteMultipartUploadResult>'
+            )
+        self._reply(body=body.encode(), headers={'Content-Type': 'application/xml'})
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def s3_stub():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), S3StubHandler)
+    server.lock = threading.Lock()
+    server.parts, server.single_puts, server.completed = [], [], 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def storage(s3_stub, settings):
+    settings.MINIO_ENDPOINT = 'localhost:9000'
+    settings.MINIO_USE_SSL = False
+    service = StorageService()
+    service.client = Minio(
+        f'127.0.0.1:{s3_stub.server_port}',
+        access_key='test',
+        secret_key='test-secret',  # noqa: S106
+        secure=False,
+        region='us-east-1',
+    )
+    StorageService._verified_buckets.add(service.bucket_name)
+    with patch.object(StorageService, 'MULTIPART_PART_SIZE', PART_SIZE):
+        yield service
+    StorageService._verified_buckets.discard(service.bucket_name)
+
+
+def _temporary_upload(size):
+    upload = TemporaryUploadedFile('talk.mp4', 'video/mp4', size, None)
+    chunk = b'\x01' * (1024 * 1024)
+    for _ in range(size // len(chunk)):
+        upload.write(chunk)
+    upload.write(b'\x01' * (size % len(chunk)))
+    upload.seek(0)
+    return upload
+
+
+class TestStreamingUpload:
+    def test_large_upload_is_streamed_in_parts(self, storage, s3_stub):
+        size = 12 * PART_SIZE + 123
+        upload = _temporary_upload(size)
+        upload.read(1000)  # e.g. a caller sniffed the header; the whole file must still be sent
+
+        with patch.object(storage.client, 'put_object', wraps=storage.client.put_object) as put_object:
+            tracemalloc.start()
+            url, error = storage.upload_file(upload, 'talk.mp4', content_type='video/mp4', is_public=True)
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        upload.close()
+
+        assert error is None and url
+        kwargs = put_object.call_args.kwargs
+        assert kwargs['data'] is upload
+        assert kwargs['length'] == size
+        assert sorted(number for number, _ in s3_stub.parts) == list(range(1, 14))
+        assert sum(part_size for _, part_size in s3_stub.parts) == size
+        assert s3_stub.completed == 1 and s3_stub.single_puts == []
+        # Parts in flight (3 uploader threads + the one being read) bound memory, not the file size
+        assert peak < 6 * PART_SIZE
+
+    def test_small_upload_is_a_single_put(self, storage, s3_stub):
+        upload = SimpleUploadedFile('cv.pdf', b'%PDF-1.4 tiny', content_type='application/pdf')
+
+        url, error = storage.upload_file(upload, 'cv.pdf', content_type='application/pdf')
+
+        assert error is None and url.startswith('private/uploads/')
+        assert s3_stub.single_puts == [len(b'%PDF-1.4 tiny')]
+        assert s3_stub.parts == []
+
+    def test_bytes_still_supported(self, storage, s3_stub):
+        url, error = storage.upload_file(b'\x89PNG data', 'image.png', content_type='image/png')
+
+        assert error is None
+        assert s3_stub.single_puts == [len(b'\x89PNG data')]
+
+    def test_stream_size_rewinds_unsized_files(self):
+        with tempfile.TemporaryFile() as f:
+            f.write(b'x' * 100)  # Position is now at the end
+
+            assert StorageService._stream_size(f) == 100
+            assert f.tell() == 0
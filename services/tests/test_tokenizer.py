@@ -0,0 +1,91 @@
+"""
+Tests for the cached tokenizer used by token limit checks.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import tiktoken
+
+from services.ai.tokenizer import CACHE_MIN_CHARS, Tokenizer, heuristic_token_count
+
+
+def _byte_level_encoding():
+    # One token per byte - a real tiktoken Encoding that needs no downloaded table
+    return tiktoken.Encoding(
+        name='bytes',
+        pat_str=r'[\s\S]+',
+        mergeable_ranks={bytes([i]): i for i in range(256)},
+        special_tokens={},
+    )
+
+
+@pytest.fixture
+def exact():
+    tokenizer = Tokenizer(cache_size=2)
+    tokenizer._encoding, tokenizer._loaded = _byte_level_encoding(), True
+    return tokenizer
+
+
+@pytest.fixture
+def heuristic():
+    tokenizer = Tokenizer()
+    tokenizer._encoding, tokenizer._loaded = None, True
+    return tokenizer
+
+
+class TestHeuristic:
+    def test_cjk_counts_per_character(self):
+        assert heuristic_token_count('你好世界') == 4
+        assert heuristic_token_count('hello world!') == 3
+        assert heuristic_token_count('') == 0
+
+    def test_truncate_uses_the_same_weights(self, heuristic):
+        text = 'abcd' * 10 + '你好'
+
+        assert heuristic.truncate_to_tokens(text, 5) == 'abcd' * 5
+        assert heuristic.truncate_to_tokens(text, 2, keep='end') == '你好'
+        assert heuristic.truncate_to_tokens('short', 10) == 'short'
+
+
+class TestExactCounting:
+    def test_counts_with_the_encoding(self, exact):
+        assert exact.count_tokens('héllo') == 6  # é is two UTF-8 bytes
+        assert exact.count_tokens(None) == 0
+
+    def test_truncate_never_splits_a_character(self, exact):
+        assert exact.truncate_to_tokens('hé', 2) == 'h'
+        assert exact.truncate_to_tokens('abcdef', 3, keep='end') == 'def'
+        assert exact.truncate_to_tokens('abc', 10) == 'abc'
+
+    def test_long_strings_are_cached_by_content_hash(self, exact):
+        system_prompt = 'You are a helpful assistant. ' * 20
+        assert len(system_prompt) >= CACHE_MIN_CHARS
+
+        with patch.object(exact, '_count', wraps=exact._count) as count:
+            assert exact.count_tokens(system_prompt) == len(system_prompt)
+            assert exact.count_tokens(system_prompt) == len(system_prompt)
+            exact.count_tokens('short turn')
+            exact.count_tokens('short turn')
+
+        # One encode for the repeated long prompt, short strings always take the direct path
+        assert [call.args[0] for call in count.call_args_list] == [system_prompt, 'short turn', 'short turn']
+
+    def test_cache_is_bounded(self, exact):
+        texts = [str(i) * CACHE_MIN_CHARS for i in range(3)]
+        for text in texts:
+            exact.count_tokens(text)
+
+        assert len(exact._counts) == 2
+
+
+def test_missing_table_falls_back_without_network(tmp_path, monkeypatch):
+    """Test that an empty TIKTOKEN_CACHE_DIR means the heuristic, never a download"""
+    monkeypatch.setenv('TIKTOKEN_CACHE_DIR', str(tmp_path))
+
+    with patch('tiktoken.get_encoding') as get_encoding:
+        tokenizer = Tokenizer()
+        assert tokenizer.count_tokens('你好') == 2
+
+    get_encoding.assert_not_called()
+    assert tokenizer.is_exact is False
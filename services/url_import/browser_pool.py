@@ -0,0 +1,207 @@
+"""Per-worker pool for a long-lived headless Chromium.
+
+Launching Chromium costs seconds and hundreds of MB, so each worker process
+keeps one browser and hands out a fresh context per page instead. Contexts
+are cheap and isolated (cookies, storage, fingerprint), which keeps the
+per-request randomization of the scraper intact.
+
+The browser is recycled after MAX_PAGES pages or once the browser processes
+have grown by MAX_MEMORY_GROWTH_MB since launch, and closed on worker
+shutdown.
+
+Playwright's sync API is bound to the thread that started it. Celery prefork
+workers run tasks on the process main thread, so the pool is used there; a
+call from any other thread gets a one-off browser instead.
+"""
+
+import logging
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from celery.signals import worker_process_shutdown
+
+logger = logging.getLogger(__name__)
+
+# Recycle limits - Chromium leaks memory across many navigations
+MAX_PAGES = int(os.environ.get('PLAYWRIGHT_POOL_MAX_PAGES', '100'))
+MAX_MEMORY_GROWTH_MB = int(os.environ.get('PLAYWRIGHT_POOL_MAX_MEMORY_GROWTH_MB', '512'))
+
+# Resource types that never affect the HTML we extract
+BLOCKED_RESOURCE_TYPES = frozenset({'image', 'font', 'media'})
+
+LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',  # Hide automation
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-web-security',  # Helps with some CORS issues
+    '--disable-features=VizDisplayCompositor',
+    '--window-size=1920,1080',
+]
+
+
+def _block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
+
+
+def _descendant_rss_mb() -> float | None:
+    """Resident memory of this process's descendants (Playwright driver + Chromium), in MB.
+
+    Reads /proc, so returns None on platforms without it.
+    """
+    try:
+        children: dict[int, list[int]] = {}
+        rss_pages: dict[int, int] = {}
+        for entry in os.listdir('/proc'):
+            if not entry.isdigit():
+                continue
+            try:
+                with open(f'/proc/{entry}/stat') as f:
+                    # Fields after the parenthesised command name: state, ppid, ... rss is field 24
+                    fields = f.read().rsplit(')', 1)[1].split()
+            except OSError:
+                continue  # Process exited while scanning
+            pid = int(entry)
+            children.setdefault(int(fields[1]), []).append(pid)
+            rss_pages[pid] = int(fields[21])
+    except OSError:
+        return None
+
+    total = 0
+    stack = list(children.get(os.getpid(), []))
+    while stack:
+        pid = stack.pop()
+        total += rss_pages.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+class BrowserPool:
+    """One long-lived Chromium per worker process, one context per page."""
+
+    def __init__(self, max_pages: int = MAX_PAGES, max_memory_growth_mb: int = MAX_MEMORY_GROWTH_MB):
+        self.max_pages = max_pages
+        self.max_memory_growth_mb = max_memory_growth_mb
+        self._lock = threading.Lock()
+        self._playwright = None
+        self._browser = None
+        self._owner_thread = None
+        self._pages_served = 0
+        self._baseline_rss_mb = None
+        os.register_at_fork(after_in_child=self._forget_browser)
+
+    @contextmanager
+    def page(self, block_resources: bool = True, **context_options) -> Iterator:
+        """Open a page in a fresh browser context.
+
+        Args:
+            block_resources: Abort image, font and media requests (for HTML-only fetches)
+            **context_options: Passed to browser.new_context (user agent, viewport, ...)
+
+        Yields:
+            Playwright Page; its context is closed on exit
+        """
+        if self._owner_thread in (None, threading.get_ident()):
+            with self._lock:
+                # Re-check under the lock: another thread may have launched the browser while we waited
+                if self._owner_thread in (None, threading.get_ident()):
+                    browser = self._ensure_browser()
+                    context = browser.new_context(**context_options)
+                    try:
+                        if block_resources:
+                            context.route('**/*', _block_heavy_resources)
+                        yield context.new_page()
+                    finally:
+                        try:
+                            context.close()
+                        except Exception as e:
+                            logger.warning(f'Failed to close browser context: {e}')
+                        self._pages_served += 1
+                        if self._should_recycle():
+                            self._close()
+                    return
+
+        # Sync Playwright objects can only be driven from the thread that started them
+        with self._one_off_page(block_resources, context_options) as page:
+            yield page
+
+    def close(self):
+        """Close the browser and stop Playwright (safe to call repeatedly)."""
+        if self._owner_thread not in (None, threading.get_ident()):
+            return  # Sync Playwright objects can only be touched from their own thread
+        with self._lock:
+            if self._owner_thread in (None, threading.get_ident()):
+                self._close()
+
+    def _ensure_browser(self):
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        self._close()
+        from playwright.sync_api import sync_playwright
+
+        self._playwright = sync_playwright().start()
+        self._owner_thread = threading.get_ident()
+        self._browser = self._playwright.chromium.launch(headless=True, args=LAUNCH_ARGS)
+        self._pages_served = 0
+        self._baseline_rss_mb = _descendant_rss_mb()
+        logger.info(f'Launched pooled Chromium (pid {os.getpid()})')
+        return self._browser
+
+    def _should_recycle(self) -> bool:
+        if self._pages_served >= self.max_pages:
+            logger.info(f'Recycling pooled Chromium after {self._pages_served} pages')
+            return True
+        if self._baseline_rss_mb is not None:
+            rss_mb = _descendant_rss_mb()
+            if rss_mb is not None and rss_mb - self._baseline_rss_mb > self.max_memory_growth_mb:
+                logger.info(f'Recycling pooled Chromium after memory grew to {rss_mb:.0f}MB')
+                return True
+        return False
+
+    def _forget_browser(self):
+        # A forked child can't drive its parent's browser; it launches its own on first use
+        self._lock = threading.Lock()
+        self._browser = self._playwright = self._owner_thread = None
+
+    def _close(self):
+        browser, playwright = self._browser, self._playwright
+        self._browser = self._playwright = self._owner_thread = None
+        if browser is not None:
+            try:
+                browser.close()
+            except Exception as e:
+                logger.warning(f'Failed to close pooled Chromium: {e}')
+        if playwright is not None:
+            try:
+                playwright.stop()
+            except Exception as e:
+                logger.warning(f'Failed to stop Playwright: {e}')
+
+    @staticmethod
+    @contextmanager
+    def _one_off_page(block_resources: bool, context_options: dict) -> Iterator:
+        from playwright.sync_api import sync_playwright
+
+        with sync_playwright() as p:
+            browser = p.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            try:
+                context = browser.new_context(**context_options)
+                if block_resources:
+                    context.route('**/*', _block_heavy_resources)
+                yield context.new_page()
+            finally:
+                browser.close()
+
+
+# Singleton instance (one per worker process)
+browser_pool = BrowserPool()
+
+
+@worker_process_shutdown.connect
+def _close_browser_pool(**kwargs):
+    browser_pool.close()
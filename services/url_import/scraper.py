@@ -39,9 +39,10 @@ from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
-from django.conf import settings
 
+from core.utils.rate_limit import RateLimit, rate_limiter
 from services.ai import AIProvider
+from services.url_import.browser_pool import browser_pool
 
 logger = logging.getLogger(__name__)
 
@@ -73,18 +74,6 @@ DOMAIN_RATE_LIMITS = {
 }
 
 
-def _get_redis_client():
-    """Get Redis client for rate limiting."""
-    try:
-        import redis
-
-        redis_url = getattr(settings, 'REDIS_URL', os.environ.get('REDIS_URL', 'redis://localhost:6379/0'))
-        return redis.from_url(redis_url)
-    except Exception as e:
-        logger.warning(f'Redis unavailable for rate limiting: {e}')
-        return None
-
-
 def _get_domain_key(url: str) -> str:
     """Extract domain from URL for rate limiting key."""
     parsed = urlparse(url)
@@ -99,7 +88,8 @@ def _check_rate_limit(url: str) -> tuple[bool, float]:
     """
     Check if we can make a request to this domain.
 
-    Uses Redis sliding window rate limiting for distributed workers.
+    Uses the shared sliding-window limiter (atomic Redis script), so the
+    per-domain limit holds across distributed workers.
 
     Args:
         url: The URL to check
@@ -109,11 +99,6 @@ def _check_rate_limit(url: str) -> tuple[bool, float]:
         - is_allowed: True if request can proceed
         - wait_time: Seconds to wait if not allowed (0 if allowed)
     """
-    redis_client = _get_redis_client()
-    if not redis_client:
-        # No Redis = no distributed rate limiting, allow request
-        return True, 0
-
     domain = _get_domain_key(url)
     rate_config = DOMAIN_RATE_LIMITS.get(
         domain,
@@ -123,69 +108,42 @@ def _check_rate_limit(url: str) -> tuple[bool, float]:
         },
     )
 
-    max_requests = rate_config['requests']
-    window_seconds = rate_config['window']
-    key = f'scraper:ratelimit:{domain}'
+    result = rate_limiter.check(RateLimit('scraper', domain, rate_config['requests'], rate_config['window']))
+    if not result.allowed:
+        logger.info(f'Rate limit hit for {domain}: {rate_config["requests"]} requests, wait {result.retry_after:.1f}s')
+        return False, result.retry_after
 
-    try:
-        current_time = time.time()
-        window_start = current_time - window_seconds
-
-        # Use Redis sorted set for sliding window
-        pipe = redis_client.pipeline()
-        # Remove old entries outside the window
-        pipe.zremrangebyscore(key, 0, window_start)
-        # Count requests in current window
-        pipe.zcard(key)
-        # Add current request (will be committed if allowed)
-        pipe.zadd(key, {f'{current_time}:{secrets.token_hex(8)}': current_time})
-        # Set expiry on the key
-        pipe.expire(key, window_seconds + 10)
-        results = pipe.execute()
-
-        request_count = results[1]
-
-        if request_count >= max_requests:
-            # Get oldest request time to calculate wait
-            oldest = redis_client.zrange(key, 0, 0, withscores=True)
-            if oldest:
-                oldest_time = oldest[0][1]
-                wait_time = (oldest_time + window_seconds) - current_time
-                # Remove the request we just added since we're not allowed
-                redis_client.zremrangebyscore(key, current_time - 0.1, current_time + 0.1)
-                logger.info(f'Rate limit hit for {domain}: {request_count}/{max_requests}, wait {wait_time:.1f}s')
-                return False, max(0, wait_time)
-
-        return True, 0
-
-    except Exception as e:
-        logger.warning(f'Rate limit check failed: {e}')
-        return True, 0  # Fail open
+    return True, 0
 
 
 def _wait_for_rate_limit(url: str, max_wait: float = 30.0) -> bool:
     """
     Wait until rate limit allows request, with max wait time.
 
+    Each rejected check returns the exact time until a slot frees up, so we
+    sleep that long and check again (the check admits atomically, so a worker
+    that wakes up to find the slot already taken simply gets a new wait time).
+
     Args:
         url: The URL to request
         max_wait: Maximum seconds to wait
 
     Returns:
-        True if we can proceed, False if max_wait exceeded
+        True once the request has been admitted, False if max_wait would be exceeded
     """
-    is_allowed, wait_time = _check_rate_limit(url)
+    deadline = time.monotonic() + max_wait
 
-    if is_allowed:
-        return True
+    while True:
+        is_allowed, wait_time = _check_rate_limit(url)
+        if is_allowed:
+            return True
 
-    if wait_time > max_wait:
-        logger.warning(f'Rate limit wait {wait_time:.1f}s exceeds max {max_wait}s for {url}')
-        return False
+        if wait_time > deadline - time.monotonic():
+            logger.warning(f'Rate limit wait {wait_time:.1f}s exceeds max {max_wait}s for {url}')
+            return False
 
-    logger.info(f'Rate limiting: waiting {wait_time:.1f}s for {_get_domain_key(url)}')
-    time.sleep(wait_time)
-    return True
+        logger.info(f'Rate limiting: waiting {wait_time:.1f}s for {_get_domain_key(url)}')
+        time.sleep(wait_time)
 
 
 # =============================================================================
@@ -603,7 +561,7 @@ def fetch_with_playwright(url: str) -> str:
         URLFetchError: If fetching fails
     """
     try:
-        from playwright.sync_api import sync_playwright
+        from playwright.sync_api import sync_playwright  # noqa: F401
     except ImportError as e:
         raise URLFetchError(
             'Playwright not installed. Install with: pip install playwright && playwright install chromium'
@@ -616,37 +574,22 @@ def fetch_with_playwright(url: str) -> str:
     user_agent = secrets.choice(USER_AGENTS)
 
     try:
-        with sync_playwright() as p:
-            # Launch with stealth settings
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',  # Hide automation
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--disable-web-security',  # Helps with some CORS issues
-                    '--disable-features=VizDisplayCompositor',
-                    '--window-size=1920,1080',
-                ],
-            )
-
-            # Create context with randomized fingerprint
-            context = browser.new_context(
-                user_agent=user_agent,
-                viewport=fingerprint['viewport'],
-                locale=fingerprint['locale'],
-                timezone_id=fingerprint['timezone_id'],
-                color_scheme=fingerprint['color_scheme'],
-                # Permissions that real browsers have
-                permissions=['geolocation'],
-                # Pretend we have WebGL, etc.
-                has_touch=False,
-                is_mobile=False,
-                device_scale_factor=secrets.choice([1, 1.25, 1.5, 2]),
-            )
-
-            page = context.new_page()
-
+        # Pooled browser (launched once per worker) with a fresh context carrying a
+        # randomized fingerprint; images, fonts and media are blocked since only HTML is used
+        with browser_pool.page(
+            block_resources=True,
+            user_agent=user_agent,
+            viewport=fingerprint['viewport'],
+            locale=fingerprint['locale'],
+            timezone_id=fingerprint['timezone_id'],
+            color_scheme=fingerprint['color_scheme'],
+            # Permissions that real browsers have
+            permissions=['geolocation'],
+            # Pretend we have WebGL, etc.
+            has_touch=False,
+            is_mobile=False,
+            device_scale_factor=secrets.choice([1, 1.25, 1.5, 2]),
+        ) as page:
             # Comprehensive stealth script
             page.add_init_script("""
                 // Remove webdriver flag
@@ -702,8 +645,6 @@ def fetch_with_playwright(url: str) -> str:
             # Get the rendered HTML
             html_content = page.content()
 
-            browser.close()
-
             if len(html_content) > MAX_CONTENT_LENGTH:
                 logger.warning(f'Playwright content truncated: {len(html_content)} bytes')
                 html_content = html_content[:MAX_CONTENT_LENGTH]
@@ -1071,7 +1012,7 @@ def capture_figma_screenshot(url: str, user_id: int | None = None) -> str | None
     logger.info(f'[Figma Screenshot] Starting capture for URL: {url}, user_id={user_id}')
 
     try:
-        from playwright.sync_api import sync_playwright
+        from playwright.sync_api import sync_playwright  # noqa: F401
 
         logger.info('[Figma Screenshot] Playwright import successful')
     except ImportError as e:
@@ -1079,28 +1020,14 @@ def capture_figma_screenshot(url: str, user_id: int | None = None) -> str | None
         return None
 
     try:
-        logger.info('[Figma Screenshot] Initializing Playwright...')
-        with sync_playwright() as p:
-            logger.info('[Figma Screenshot] Launching Chromium browser...')
-            browser = p.chromium.launch(
-                headless=True,
-                args=[
-                    '--disable-blink-features=AutomationControlled',
-                    '--disable-dev-shm-usage',
-                    '--no-sandbox',
-                    '--window-size=1920,1080',
-                ],
-            )
-            logger.info('[Figma Screenshot] Browser launched successfully')
-
-            context = browser.new_context(
-                viewport={'width': 1920, 'height': 1080},
-                device_scale_factor=2,
-            )
+        # Pooled browser; images must load for the screenshot, so nothing is blocked
+        with browser_pool.page(
+            block_resources=False,
+            viewport={'width': 1920, 'height': 1080},
+            device_scale_factor=2,
+        ) as page:
             logger.info('[Figma Screenshot] Browser context created')
 
-            page = context.new_page()
-
             page.add_init_script("""
                 Object.defineProperty(navigator, 'webdriver', {
                     get: () => undefined
@@ -1126,28 +1053,25 @@ def capture_figma_screenshot(url: str, user_id: int | None = None) -> str | None
             )
             logger.info(f'[Figma Screenshot] Screenshot captured, size: {len(screenshot_bytes)} bytes')
 
-            browser.close()
-            logger.info('[Figma Screenshot] Browser closed')
-
-            from services.integrations.storage import get_storage_service
-
-            logger.info('[Figma Screenshot] Uploading to S3...')
-            storage = get_storage_service()
-            s3_url, error = storage.upload_file(
-                file_data=screenshot_bytes,
-                filename='figma-screenshot.png',
-                content_type='image/png',
-                user_id=user_id,
-                folder='figma-screenshots',
-                is_public=True,
-            )
+        from services.integrations.storage import get_storage_service
+
+        logger.info('[Figma Screenshot] Uploading to S3...')
+        storage = get_storage_service()
+        s3_url, error = storage.upload_file(
+            file_data=screenshot_bytes,
+            filename='figma-screenshot.png',
+            content_type='image/png',
+            user_id=user_id,
+            folder='figma-screenshots',
+            is_public=True,
+        )
 
-            if error:
-                logger.error(f'[Figma Screenshot] S3 upload failed: {error}')
-                return None
+        if error:
+            logger.error(f'[Figma Screenshot] S3 upload failed: {error}')
+            return None
 
-            logger.info(f'[Figma Screenshot] Successfully uploaded to S3: {s3_url}')
-            return s3_url
+        logger.info(f'[Figma Screenshot] Successfully uploaded to S3: {s3_url}')
+        return s3_url
 
     except Exception as e:
         logger.error(f'[Figma Screenshot] Failed to capture: {e}', exc_info=True)